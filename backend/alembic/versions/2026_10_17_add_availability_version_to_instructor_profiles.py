@@ -0,0 +1,40 @@
+"""add_availability_version_to_instructor_profiles
+
+Revision ID: 6d2f8a4c1e7b
+Revises: 3e8b6f1a9c2d
+Create Date: 2026-10-17 19:00:00.000000+00:00
+
+Adiciona a versão da disponibilidade semanal ao perfil do instrutor. O
+repositório de disponibilidade a incrementa na mesma transação de cada
+criação, atualização ou remoção de slot; o cache da semana é indexado por ela
+e nunca precisa ser invalidado.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6d2f8a4c1e7b"
+down_revision: str | None = "3e8b6f1a9c2d"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Adiciona a coluna availability_version (0 para perfis existentes)."""
+    op.add_column(
+        "instructor_profiles",
+        sa.Column(
+            "availability_version",
+            sa.Integer(),
+            server_default=sa.text("0"),
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Remove a coluna availability_version."""
+    op.drop_column("instructor_profiles", "availability_version")
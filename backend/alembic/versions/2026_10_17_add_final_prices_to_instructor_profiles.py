@@ -0,0 +1,50 @@
+"""add_final_prices_to_instructor_profiles
+
+Revision ID: 9a4c2e7b1d5f
+Revises: 5b7e1d9c3a2f
+Create Date: 2026-10-17 17:00:00.000000+00:00
+
+Adiciona os preços finais para o aluno ao lado dos preços base do perfil do
+instrutor. As colunas nascem vazias (assinatura NULL); a task
+pricing.recompute_final_prices as preenche no primeiro ciclo e, até lá, a
+leitura calcula os preços na hora.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9a4c2e7b1d5f"
+down_revision: str | None = "5b7e1d9c3a2f"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+FINAL_PRICE_COLUMNS = (
+    "final_hourly_rate",
+    "final_price_cat_a_instructor_vehicle",
+    "final_price_cat_a_student_vehicle",
+    "final_price_cat_b_instructor_vehicle",
+    "final_price_cat_b_student_vehicle",
+)
+
+
+def upgrade() -> None:
+    """Adiciona as colunas de preço final e a assinatura das taxas."""
+    for column_name in FINAL_PRICE_COLUMNS:
+        op.add_column(
+            "instructor_profiles",
+            sa.Column(column_name, sa.Numeric(10, 2), nullable=True),
+        )
+    op.add_column(
+        "instructor_profiles",
+        sa.Column("final_prices_signature", sa.String(50), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Remove as colunas de preço final."""
+    op.drop_column("instructor_profiles", "final_prices_signature")
+    for column_name in reversed(FINAL_PRICE_COLUMNS):
+        op.drop_column("instructor_profiles", column_name)
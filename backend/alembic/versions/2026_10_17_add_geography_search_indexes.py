@@ -0,0 +1,38 @@
+"""add_geography_search_indexes
+
+Revision ID: 3c7e9a1f5b2d
+Revises: 65021c511c6f
+Create Date: 2026-10-17 10:00:00.000000+00:00
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c7e9a1f5b2d"
+down_revision: str | None = "65021c511c6f"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Cria índices para a busca por proximidade via geography + KNN."""
+    # Índice de expressão: ST_DWithin/ST_Distance/<-> sobre geography(location)
+    # usam este índice sem reprojetar a coluna (ST_Transform impedia o uso do GIST)
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_instructor_profiles_location_geog "
+        "ON instructor_profiles USING gist (geography(location))"
+    )
+    # Ramo "sem localização" da busca, ordenado por rating
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_instructor_profiles_no_location_rating "
+        "ON instructor_profiles (rating) "
+        "WHERE location IS NULL AND is_available"
+    )
+
+
+def downgrade() -> None:
+    """Remove os índices da busca por proximidade."""
+    op.execute("DROP INDEX IF EXISTS ix_instructor_profiles_no_location_rating")
+    op.execute("DROP INDEX IF EXISTS ix_instructor_profiles_location_geog")
@@ -0,0 +1,41 @@
+"""add_list_keyset_indexes
+
+Revision ID: 4f1b7d3e9a6c
+Revises: 8c3a5e1f7b2d
+Create Date: 2026-10-17 21:00:00.000000+00:00
+
+Índices para a paginação por cursor das listagens: histórico de pagamentos
+por (aluno | instrutor, created_at) e listagem de agendamentos do admin por
+(scheduled_datetime, id). As listagens de agendamentos por aluno/instrutor
+já usam ix_schedulings_student_date e ix_schedulings_instructor_date.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4f1b7d3e9a6c"
+down_revision: str | None = "8c3a5e1f7b2d"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Cria os índices das listagens paginadas por cursor."""
+    op.create_index(
+        "ix_payments_student_created", "payments", ["student_id", "created_at"]
+    )
+    op.create_index(
+        "ix_payments_instructor_created", "payments", ["instructor_id", "created_at"]
+    )
+    op.create_index(
+        "ix_schedulings_date_id", "schedulings", ["scheduled_datetime", "id"]
+    )
+
+
+def downgrade() -> None:
+    """Remove os índices das listagens paginadas por cursor."""
+    op.drop_index("ix_schedulings_date_id", table_name="schedulings")
+    op.drop_index("ix_payments_instructor_created", table_name="payments")
+    op.drop_index("ix_payments_student_created", table_name="payments")
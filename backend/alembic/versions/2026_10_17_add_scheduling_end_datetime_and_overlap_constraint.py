@@ -0,0 +1,86 @@
+"""add_scheduling_end_datetime_and_overlap_constraint
+
+Revision ID: 3e8b6f1a9c2d
+Revises: 9a4c2e7b1d5f
+Create Date: 2026-10-17 18:00:00.000000+00:00
+
+Persiste o término da aula (end_datetime) em schedulings e impede, no próprio
+banco, agendamentos não cancelados sobrepostos do mesmo instrutor com uma
+exclusion constraint GiST (btree_gist para a igualdade do instructor_id).
+
+O índice da constraint atende as verificações de conflito e o índice parcial
+ix_schedulings_confirmed_end atende a busca de aulas confirmadas vencidas.
+
+A constraint não é criada se já houver sobreposições entre agendamentos não
+cancelados; a migração falha listando a quantidade para correção manual.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3e8b6f1a9c2d"
+down_revision: str | None = "9a4c2e7b1d5f"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+OVERLAPPING_ROWS_SQL = """
+SELECT count(*)
+FROM schedulings a
+JOIN schedulings b
+  ON a.instructor_id = b.instructor_id
+ AND a.id < b.id
+ AND tstzrange(a.scheduled_datetime, a.end_datetime, '[)')
+     && tstzrange(b.scheduled_datetime, b.end_datetime, '[)')
+WHERE a.status <> 'cancelled' AND b.status <> 'cancelled'
+"""
+
+
+def upgrade() -> None:
+    """Adiciona end_datetime, a exclusion constraint e o índice de vencidas."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+
+    op.add_column(
+        "schedulings",
+        sa.Column(
+            "end_datetime",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment="Término da aula (scheduled_datetime + duration_minutes), mantido pelo repositório",
+        ),
+    )
+    op.execute(
+        "UPDATE schedulings "
+        "SET end_datetime = scheduled_datetime + make_interval(mins => duration_minutes)"
+    )
+    op.alter_column("schedulings", "end_datetime", nullable=False)
+
+    overlapping = op.get_bind().execute(sa.text(OVERLAPPING_ROWS_SQL)).scalar_one()
+    if overlapping:
+        raise RuntimeError(
+            f"{overlapping} pares de agendamentos não cancelados se sobrepõem; "
+            "cancele ou reagende-os antes de aplicar esta migração"
+        )
+
+    op.execute(
+        "ALTER TABLE schedulings ADD CONSTRAINT ex_schedulings_instructor_no_overlap "
+        "EXCLUDE USING gist ("
+        "instructor_id WITH =, "
+        "tstzrange(scheduled_datetime, end_datetime, '[)') WITH &&"
+        ") WHERE (status <> 'cancelled')"
+    )
+    op.create_index(
+        "ix_schedulings_confirmed_end",
+        "schedulings",
+        ["end_datetime"],
+        postgresql_where=sa.text("status = 'confirmed'"),
+    )
+
+
+def downgrade() -> None:
+    """Remove o índice, a constraint e a coluna end_datetime."""
+    op.drop_index("ix_schedulings_confirmed_end", table_name="schedulings")
+    op.drop_constraint("ex_schedulings_instructor_no_overlap", "schedulings")
+    op.drop_column("schedulings", "end_datetime")
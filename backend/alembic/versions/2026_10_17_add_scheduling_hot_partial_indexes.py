@@ -0,0 +1,61 @@
+"""add_scheduling_hot_partial_indexes
+
+Revision ID: 6d2e8b4a1c7f
+Revises: 4f1b7d3e9a6c
+Create Date: 2026-10-17 22:00:00.000000+00:00
+
+Índices parciais para os predicados mais frequentes sobre schedulings, que o
+genérico ix_schedulings_status não atende de forma seletiva:
+
+- ix_schedulings_student_active_date / ix_schedulings_instructor_active_date:
+  agenda em aberto (status NOT IN ('cancelled', 'completed')) por aluno ou
+  instrutor e data — próxima aula, calendário do mês e carrinho do aluno.
+- ix_schedulings_cart_created: limpeza de carrinhos expirados
+  (status IN ('pending', 'confirmed') e created_at).
+
+As aulas confirmadas vencidas já usam ix_schedulings_confirmed_end. O
+harness scripts/check_query_plans.py verifica que as consultas usam esses
+índices com volume de dados.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6d2e8b4a1c7f"
+down_revision: str | None = "4f1b7d3e9a6c"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+ACTIVE = sa.text("status NOT IN ('cancelled', 'completed')")
+
+
+def upgrade() -> None:
+    """Cria os índices parciais dos predicados quentes de schedulings."""
+    op.create_index(
+        "ix_schedulings_student_active_date",
+        "schedulings",
+        ["student_id", "scheduled_datetime"],
+        postgresql_where=ACTIVE,
+    )
+    op.create_index(
+        "ix_schedulings_instructor_active_date",
+        "schedulings",
+        ["instructor_id", "scheduled_datetime"],
+        postgresql_where=ACTIVE,
+    )
+    op.create_index(
+        "ix_schedulings_cart_created",
+        "schedulings",
+        ["created_at"],
+        postgresql_where=sa.text("status IN ('pending', 'confirmed')"),
+    )
+
+
+def downgrade() -> None:
+    """Remove os índices parciais dos predicados quentes de schedulings."""
+    op.drop_index("ix_schedulings_cart_created", table_name="schedulings")
+    op.drop_index("ix_schedulings_instructor_active_date", table_name="schedulings")
+    op.drop_index("ix_schedulings_student_active_date", table_name="schedulings")
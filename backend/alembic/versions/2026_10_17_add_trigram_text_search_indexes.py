@@ -0,0 +1,52 @@
+"""add_trigram_text_search_indexes
+
+Revision ID: 8d2f4b6a1c3e
+Revises: 3c7e9a1f5b2d
+Create Date: 2026-10-17 12:00:00.000000+00:00
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8d2f4b6a1c3e"
+down_revision: str | None = "3c7e9a1f5b2d"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Cria índices trigram (pg_trgm) para a busca de instrutores por nome/cidade."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # unaccent() é STABLE (depende do search_path) e não pode ser usado em
+    # índices; o wrapper fixa o dicionário e é declarado IMMUTABLE
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION public.f_unaccent(text)
+        RETURNS text
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+        AS $func$
+            SELECT public.unaccent('public.unaccent'::regdictionary, $1)
+        $func$
+        """
+    )
+
+    # gin_trgm_ops atende ILIKE '%termo%' (inclusive com curinga no início)
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_users_full_name_unaccent_trgm "
+        "ON users USING gin (public.f_unaccent(full_name) gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_instructor_profiles_city_unaccent_trgm "
+        "ON instructor_profiles USING gin (public.f_unaccent(city) gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Remove os índices trigram e o wrapper de unaccent."""
+    op.execute("DROP INDEX IF EXISTS ix_instructor_profiles_city_unaccent_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_users_full_name_unaccent_trgm")
+    op.execute("DROP FUNCTION IF EXISTS public.f_unaccent(text)")
+    op.execute("DROP EXTENSION IF EXISTS pg_trgm")
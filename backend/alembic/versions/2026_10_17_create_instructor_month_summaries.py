@@ -0,0 +1,79 @@
+"""create_instructor_month_summaries
+
+Revision ID: 8c3a5e1f7b2d
+Revises: 6d2f8a4c1e7b
+Create Date: 2026-10-17 20:00:00.000000+00:00
+
+Cria o resumo mensal do calendário da agenda (aulas não canceladas e não
+concluídas por dia, no horário de Brasília) e o preenche a partir dos
+agendamentos existentes. Depois da migração o repositório de agendamentos
+mantém o resumo a cada escrita; a leitura só passa a usá-lo com
+scheduling_month_summary_enabled.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "8c3a5e1f7b2d"
+down_revision: str | None = "6d2f8a4c1e7b"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+BACKFILL_SQL = """
+WITH per_day AS (
+    SELECT instructor_id,
+           (scheduled_datetime AT TIME ZONE 'America/Sao_Paulo')::date AS day,
+           count(*) AS lessons
+    FROM schedulings
+    WHERE status NOT IN ('cancelled', 'completed')
+    GROUP BY 1, 2
+),
+months AS (
+    SELECT DISTINCT instructor_id, date_trunc('month', day)::date AS month
+    FROM per_day
+)
+INSERT INTO instructor_month_summaries (instructor_id, month, day_counts, lesson_count)
+SELECT m.instructor_id,
+       m.month,
+       array_agg(coalesce(p.lessons, 0)::integer ORDER BY d.n),
+       coalesce(sum(p.lessons), 0)::integer
+FROM months m
+CROSS JOIN generate_series(1, 31) AS d(n)
+LEFT JOIN per_day p
+       ON p.instructor_id = m.instructor_id
+      AND date_trunc('month', p.day)::date = m.month
+      AND extract(day FROM p.day) = d.n
+GROUP BY m.instructor_id, m.month
+"""
+
+
+def upgrade() -> None:
+    """Cria instructor_month_summaries e preenche com os agendamentos atuais."""
+    op.create_table(
+        "instructor_month_summaries",
+        sa.Column(
+            "instructor_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("users.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("month", sa.Date(), primary_key=True),
+        sa.Column("day_counts", postgresql.ARRAY(sa.Integer()), nullable=False),
+        sa.Column("lesson_count", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+    )
+    op.execute(BACKFILL_SQL)
+
+
+def downgrade() -> None:
+    """Remove instructor_month_summaries."""
+    op.drop_table("instructor_month_summaries")
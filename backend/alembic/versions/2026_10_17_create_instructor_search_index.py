@@ -0,0 +1,109 @@
+"""create_instructor_search_index
+
+Revision ID: 5b7e1d9c3a2f
+Revises: 8d2f4b6a1c3e
+Create Date: 2026-10-17 15:00:00.000000+00:00
+
+Cria a projeção desnormalizada usada pela busca de instrutores. Depois da
+migração, habilitar a replicação das escritas
+(INSTRUCTOR_SEARCH_PROJECTION_SYNC_ENABLED), preencher a tabela com
+scripts/rebuild_instructor_search_index.py e só então habilitar a leitura
+(INSTRUCTOR_SEARCH_PROJECTION_ENABLED).
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from geoalchemy2 import Geography
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "5b7e1d9c3a2f"
+down_revision: str | None = "8d2f4b6a1c3e"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Cria a tabela instructor_search_index e seus índices."""
+    op.create_table(
+        "instructor_search_index",
+        sa.Column("profile_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("full_name", sa.String(255), nullable=False),
+        sa.Column("first_name", sa.String(255), nullable=True),
+        sa.Column("last_name", sa.String(255), nullable=True),
+        sa.Column("biological_sex", sa.String(10), nullable=True),
+        sa.Column("city", sa.String(255), nullable=True),
+        sa.Column("vehicle_type", sa.String(100), nullable=False),
+        sa.Column("license_category", sa.String(10), nullable=False),
+        sa.Column("is_available", sa.Boolean(), nullable=False),
+        sa.Column("has_mp_account", sa.Boolean(), nullable=False),
+        sa.Column("rating", sa.Numeric(3, 2), nullable=False),
+        sa.Column("total_reviews", sa.Integer(), nullable=False),
+        sa.Column(
+            "location",
+            Geography(geometry_type="POINT", srid=4326, spatial_index=False),
+            nullable=True,
+        ),
+        sa.Column("latitude", sa.Float(), nullable=True),
+        sa.Column("longitude", sa.Float(), nullable=True),
+        sa.Column("hourly_rate", sa.Numeric(10, 2), nullable=False),
+        sa.Column("price_cat_a_instructor_vehicle", sa.Numeric(10, 2), nullable=True),
+        sa.Column("price_cat_a_student_vehicle", sa.Numeric(10, 2), nullable=True),
+        sa.Column("price_cat_b_instructor_vehicle", sa.Numeric(10, 2), nullable=True),
+        sa.Column("price_cat_b_student_vehicle", sa.Numeric(10, 2), nullable=True),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.PrimaryKeyConstraint("profile_id"),
+        sa.ForeignKeyConstraint(
+            ["profile_id"],
+            ["instructor_profiles.id"],
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+            ondelete="CASCADE",
+        ),
+        sa.UniqueConstraint("user_id"),
+    )
+
+    op.create_index(
+        "ix_instructor_search_index_location",
+        "instructor_search_index",
+        ["location"],
+        postgresql_using="gist",
+    )
+    op.create_index(
+        "ix_instructor_search_index_unlocated_rating",
+        "instructor_search_index",
+        ["rating"],
+        postgresql_where=sa.text("location IS NULL AND is_available"),
+    )
+    # Busca textual: mesmos índices trigram de users/instructor_profiles
+    op.execute(
+        "CREATE INDEX ix_instructor_search_index_full_name_trgm "
+        "ON instructor_search_index USING gin (public.f_unaccent(full_name) gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX ix_instructor_search_index_city_trgm "
+        "ON instructor_search_index USING gin (public.f_unaccent(city) gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Remove a tabela instructor_search_index."""
+    op.execute("DROP INDEX IF EXISTS ix_instructor_search_index_city_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_instructor_search_index_full_name_trgm")
+    op.drop_index(
+        "ix_instructor_search_index_unlocated_rating",
+        table_name="instructor_search_index",
+    )
+    op.drop_index("ix_instructor_search_index_location", table_name="instructor_search_index")
+    op.drop_table("instructor_search_index")
@@ -0,0 +1,118 @@
+"""
+Benchmark: horários disponíveis (uma consulta por horário x consulta única)
+
+Executa o endpoint GET /instructors/{id}/available-slots contra repositórios
+em memória que contam as consultas e simulam a latência de ida e volta ao
+banco. Compara o cálculo anterior (um check_conflict por horário) com o atual
+(list_busy_intervals + varredura em memória) para janelas de disponibilidade
+de tamanhos crescentes.
+
+Não requer banco de dados nem rede.
+
+Uso (a partir de backend/):
+    python -m scripts.bench_available_slots
+    python -m scripts.bench_available_slots 2.0   # latência por consulta (ms)
+"""
+
+import asyncio
+import sys
+from datetime import date, datetime, time, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+from scripts.bench_common import measure, print_table
+from src.application.services.slot_engine import local_datetime
+from src.core.helpers.timezone_utils import DEFAULT_TIMEZONE
+from src.domain.entities.availability import Availability
+from src.interface.api.routers.student.availability import get_available_time_slots
+
+TARGET = date.today() + timedelta(days=7)
+
+
+class CountingRepos:
+    """Repositórios em memória: cada chamada conta como uma consulta."""
+
+    def __init__(self, availabilities: list[Availability], busy: list[tuple[datetime, datetime]], latency_ms: float):
+        self.queries = 0
+        self._availabilities = availabilities
+        self._busy = busy
+        self._latency = latency_ms / 1000
+
+    async def _query(self, result):
+        self.queries += 1
+        await asyncio.sleep(self._latency)
+        return result
+
+    async def get_by_id(self, user_id):
+        return await self._query(SimpleNamespace(is_instructor=True))
+
+    async def get_by_user_id(self, user_id):
+        return await self._query(SimpleNamespace(is_available=True))
+
+    async def get_by_instructor_and_day(self, instructor_id, day_of_week, only_active=True):
+        return await self._query(self._availabilities)
+
+    async def list_busy_intervals(self, instructor_id, start, end):
+        return await self._query([(s, e) for s, e in self._busy if s < end and e > start])
+
+    async def check_conflict(self, instructor_id, scheduled_datetime, duration_minutes, exclude_scheduling_id=None):
+        end = scheduled_datetime + timedelta(minutes=duration_minutes)
+        return await self._query(any(s < end and e > scheduled_datetime for s, e in self._busy))
+
+
+async def per_slot_queries(repos: CountingRepos, instructor_id, duration_minutes: int) -> None:
+    """Cálculo anterior: mesmas consultas iniciais e um check_conflict por horário."""
+    await repos.get_by_id(instructor_id)
+    await repos.get_by_user_id(instructor_id)
+    availabilities = await repos.get_by_instructor_and_day(instructor_id, TARGET.weekday())
+    for availability in availabilities:
+        current = datetime.combine(TARGET, availability.start_time, tzinfo=DEFAULT_TIMEZONE)
+        period_end = datetime.combine(TARGET, availability.end_time, tzinfo=DEFAULT_TIMEZONE)
+        while current + timedelta(minutes=duration_minutes) <= period_end:
+            await repos.check_conflict(instructor_id, current, duration_minutes)
+            current += timedelta(hours=1)
+
+
+async def single_query(repos: CountingRepos, instructor_id, duration_minutes: int) -> None:
+    await get_available_time_slots(
+        instructor_id=instructor_id,
+        current_user=None,
+        availability_repo=repos,
+        scheduling_repo=repos,
+        user_repo=repos,
+        instructor_repo=repos,
+        target_date=TARGET,
+        duration_minutes=duration_minutes,
+    )
+
+
+async def run(latency_ms: float) -> None:
+    instructor_id = uuid4()
+    rows = []
+    for hours in (4, 8, 12, 16):
+        availabilities = [
+            Availability(
+                instructor_id=instructor_id,
+                day_of_week=TARGET.weekday(),
+                start_time=time(6),
+                end_time=time(6 + hours),
+            )
+        ]
+        # Um agendamento a cada três horas da janela
+        busy = []
+        for offset in range(0, hours, 3):
+            start = local_datetime(TARGET, time(6 + offset))
+            busy.append((start, start + timedelta(hours=1)))
+
+        for label, strategy in (("por horário", per_slot_queries), ("consulta única", single_query)):
+            repos = CountingRepos(availabilities, busy, latency_ms)
+            await strategy(repos, instructor_id, 60)
+            queries = repos.queries
+            stats = await measure(lambda: strategy(repos, instructor_id, 60), repeat=20)
+            rows.append([label, hours, queries, stats["p50"], stats["p95"]])
+
+    print_table(["cálculo", "janela (h)", "consultas", "p50 ms", "p95 ms"], rows)
+
+
+if __name__ == "__main__":
+    asyncio.run(run(float(sys.argv[1]) if len(sys.argv) > 1 else 1.0))
@@ -0,0 +1,82 @@
+"""
+Benchmark: cálculo de distâncias em lote
+
+Compara o caminho escalar (Location.distance_to / is_within_radius ponto a
+ponto) com a API vetorizada (Location.distances_to_many e
+LocationServiceImpl.filter_within_radius) para 1k/10k/100k pontos.
+
+Não requer banco de dados.
+
+Uso (a partir de backend/):
+    python -m scripts.bench_distances
+    python -m scripts.bench_distances 1000 50000
+"""
+
+import random
+import sys
+from unittest.mock import MagicMock
+
+from scripts.bench_common import measure_sync, print_table
+from src.domain.entities.location import Location
+from src.infrastructure.services.location_service_impl import LocationServiceImpl
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+
+CENTER = Location(latitude=-23.5505, longitude=-46.6333)
+RADIUS_KM = 25.0
+
+
+def random_points(count: int) -> list[Location]:
+    """Pontos aleatórios ao redor do centro (±0,5°)."""
+    rng = random.Random(42)
+    return [
+        Location(
+            latitude=CENTER.latitude + rng.uniform(-0.5, 0.5),
+            longitude=CENTER.longitude + rng.uniform(-0.5, 0.5),
+        )
+        for _ in range(count)
+    ]
+
+
+def scalar_filter(service: LocationServiceImpl, points: list[Location]) -> list[int]:
+    """Caminho anterior: distância ponto a ponto, filtro e ordenação em Python."""
+    within = [
+        (CENTER.distance_to(p), i)
+        for i, p in enumerate(points)
+        if service.is_within_radius(p, CENTER, RADIUS_KM)
+    ]
+    within.sort()
+    return [i for _, i in within]
+
+
+def run(sizes: list[int]) -> None:
+    service = LocationServiceImpl(MagicMock())
+    rows = []
+
+    for size in sizes:
+        points = random_points(size)
+        repeat = 5 if size >= 100_000 else 20
+
+        scalar_dist = measure_sync(lambda: [CENTER.distance_to(p) for p in points], repeat)
+        vector_dist = measure_sync(lambda: CENTER.distances_to_many(points), repeat)
+        scalar = measure_sync(lambda: scalar_filter(service, points), repeat)
+        vector = measure_sync(
+            lambda: service.filter_within_radius(points, CENTER, RADIUS_KM), repeat
+        )
+
+        rows.append([size, "distance_to (loop)", scalar_dist["p50"], scalar_dist["p95"], 1.0])
+        rows.append([
+            size, "distances_to_many", vector_dist["p50"], vector_dist["p95"],
+            scalar_dist["p50"] / vector_dist["p50"],
+        ])
+        rows.append([size, "is_within_radius (loop)", scalar["p50"], scalar["p95"], 1.0])
+        rows.append([
+            size, "filter_within_radius", vector["p50"], vector["p95"],
+            scalar["p50"] / vector["p50"],
+        ])
+
+    print_table(["pontos", "modo", "p50 ms", "p95 ms", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    run([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
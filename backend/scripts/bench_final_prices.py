@@ -0,0 +1,68 @@
+"""
+Benchmark: preços finais calculados x gravados
+
+Mede a montagem dos candidatos da busca (TileCandidate.from_profile) para uma
+página de perfis: calculando os cinco preços finais a cada leitura (antes) e
+lendo os preços gravados no perfil (depois, PricingService.final_prices).
+
+Não requer banco de dados nem rede.
+
+Uso (a partir de backend/):
+    python -m scripts.bench_final_prices
+    python -m scripts.bench_final_prices 200
+"""
+
+import random
+import sys
+from decimal import Decimal
+from uuid import uuid4
+
+from scripts.bench_common import measure_sync, print_table
+from src.application.services.instructor_tile_cache import TileCandidate
+from src.domain.entities.instructor_profile import InstructorProfile
+from src.infrastructure.services.pricing_service import PricingService
+
+
+def synthetic_profiles(count: int) -> list[InstructorProfile]:
+    rng = random.Random(7)
+
+    def price() -> Decimal | None:
+        return Decimal(rng.randrange(6000, 15000)) / 100 if rng.random() < 0.7 else None
+
+    return [
+        InstructorProfile(
+            user_id=uuid4(),
+            hourly_rate=Decimal(rng.randrange(6000, 15000)) / 100,
+            price_cat_a_instructor_vehicle=price(),
+            price_cat_a_student_vehicle=price(),
+            price_cat_b_instructor_vehicle=price(),
+            price_cat_b_student_vehicle=price(),
+        )
+        for _ in range(count)
+    ]
+
+
+def run(count: int) -> None:
+    computed = synthetic_profiles(count)
+    stored = synthetic_profiles(count)
+    for profile in stored:
+        PricingService.apply_final_prices(profile)
+
+    def page(profiles: list[InstructorProfile]) -> None:
+        for profile in profiles:
+            TileCandidate.from_profile(profile)
+
+    computed_stats = measure_sync(lambda: page(computed), repeat=50, warmup=5)
+    stored_stats = measure_sync(lambda: page(stored), repeat=50, warmup=5)
+
+    print_table(
+        ["preços", "perfis", "p50 ms", "p95 ms"],
+        [
+            ["calculados", count, computed_stats["p50"], computed_stats["p95"]],
+            ["gravados", count, stored_stats["p50"], stored_stats["p95"]],
+        ],
+    )
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 100)
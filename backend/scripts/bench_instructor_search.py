@@ -0,0 +1,198 @@
+"""
+Benchmark: busca de instrutores por proximidade
+
+Compara o caminho anterior (ST_Transform(..., 3857) na coluna indexada) com o
+caminho atual de InstructorRepositoryImpl.search_by_location (geography +
+KNN + ramo separado para instrutores sem localização) e com a projeção de
+busca (instructor_search_index, tabela única), com 10k/100k/1M perfis.
+
+Para cada tamanho, mostra as varreduras do plano (uso de índice) e a latência.
+Os dados sintéticos são inseridos dentro de uma transação e descartados
+(ROLLBACK) ao final.
+
+Uso (a partir de backend/, com migrations aplicadas):
+    DATABASE_URL=postgresql+asyncpg://... python -m scripts.bench_instructor_search
+    python -m scripts.bench_instructor_search 10000 100000
+"""
+
+import asyncio
+import sys
+
+from sqlalchemy import func, or_, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from scripts.bench_common import explain, make_engine, measure, print_table, scan_summary
+from src.domain.entities.location import Location
+from src.infrastructure.db.models.instructor_profile_model import InstructorProfileModel
+from src.infrastructure.repositories.instructor_repository_impl import (
+    InstructorRepositoryImpl,
+)
+from src.infrastructure.repositories.instructor_search_index_repository_impl import (
+    InstructorSearchIndexRepositoryImpl,
+)
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+
+# Centro da busca: São Paulo (região de maior densidade no seed)
+CENTER = Location(latitude=-23.5505, longitude=-46.6333)
+RADIUS_KM = 10.0
+LIMIT = 50
+
+SEED_USERS_SQL = """
+INSERT INTO users (id, email, hashed_password, full_name, user_type,
+                   is_active, is_verified, biological_sex)
+SELECT gen_random_uuid(),
+       'bench-' || g || '@bench.local',
+       'x',
+       'Instrutor Bench ' || g,
+       'instructor',
+       true,
+       true,
+       CASE WHEN g % 2 = 0 THEN 'male' ELSE 'female' END
+FROM generate_series(:start, :stop) AS g
+"""
+
+# Instrutores espalhados ao redor de capitais (±0,3°), 5% sem localização
+SEED_PROFILES_SQL = """
+INSERT INTO instructor_profiles (id, user_id, bio, vehicle_type, license_category,
+                                 hourly_rate, rating, total_reviews, is_available,
+                                 location, city)
+SELECT gen_random_uuid(),
+       u.id,
+       '',
+       'Hatch',
+       CASE WHEN random() < 0.5 THEN 'B' ELSE 'AB' END,
+       80,
+       round((random() * 5)::numeric, 2),
+       0,
+       random() < 0.9,
+       CASE WHEN random() < 0.05 THEN NULL
+            ELSE ST_SetSRID(ST_MakePoint(
+                c.lon + (random() - 0.5) * 0.6,
+                c.lat + (random() - 0.5) * 0.6), 4326)
+       END,
+       c.name
+FROM users u
+CROSS JOIN LATERAL (
+    SELECT (ARRAY[-46.63, -43.17, -47.88, -49.27, -38.52])[k] AS lon,
+           (ARRAY[-23.55, -22.91, -15.79, -25.43, -12.97])[k] AS lat,
+           (ARRAY['São Paulo', 'Rio de Janeiro', 'Brasília', 'Curitiba', 'Salvador'])[k] AS name
+    FROM (SELECT 1 + abs(hashtext(u.email)) % 5 AS k) AS pick
+) AS c
+WHERE u.email LIKE 'bench-%@bench.local'
+  AND NOT EXISTS (SELECT 1 FROM instructor_profiles p WHERE p.user_id = u.id)
+"""
+
+
+def legacy_search_stmt():
+    """Reproduz a query anterior (ST_Transform na coluna indexada)."""
+    center_point = func.ST_SetSRID(
+        func.ST_MakePoint(CENTER.longitude, CENTER.latitude), 4326
+    )
+    return (
+        select(
+            InstructorProfileModel.id,
+            func.ST_Distance(
+                func.ST_Transform(InstructorProfileModel.location, 3857),
+                func.ST_Transform(center_point, 3857),
+            ).label("distance"),
+        )
+        .join(InstructorProfileModel.user)
+        .where(
+            or_(
+                func.ST_DWithin(
+                    func.ST_Transform(InstructorProfileModel.location, 3857),
+                    func.ST_Transform(center_point, 3857),
+                    RADIUS_KM * 1000,
+                ),
+                InstructorProfileModel.location.is_(None),
+            ),
+            InstructorProfileModel.is_available.is_(True),
+        )
+        .order_by(
+            InstructorProfileModel.location.is_(None).asc(),
+            text("distance"),
+            InstructorProfileModel.rating.desc(),
+        )
+        .limit(LIMIT)
+    )
+
+
+async def seed(session: AsyncSession, current: int, target: int) -> None:
+    """Insere perfis sintéticos até atingir `target` instrutores."""
+    if target <= current:
+        return
+    await session.execute(text(SEED_USERS_SQL), {"start": current + 1, "stop": target})
+    await session.execute(text(SEED_PROFILES_SQL))
+    await session.execute(text("ANALYZE users"))
+    await session.execute(text("ANALYZE instructor_profiles"))
+
+
+async def run(sizes: list[int]) -> None:
+    engine = make_engine()
+    repo_kwargs = {"center": CENTER, "radius_km": RADIUS_KM, "limit": LIMIT}
+    rows = []
+
+    async with AsyncSession(engine) as session:
+        await session.begin()
+        repo = InstructorRepositoryImpl(session)
+        projection = InstructorSearchIndexRepositoryImpl(session)
+        seeded = 0
+
+        try:
+            for size in sorted(sizes):
+                await seed(session, seeded, size)
+                seeded = size
+                await repo.recompute_final_prices(batch_size=5000)
+                await projection.rebuild(batch_size=5000)
+                await session.execute(text("ANALYZE instructor_search_index"))
+
+                legacy_plan = await explain(session, legacy_search_stmt())
+                located_plan = await explain(
+                    session,
+                    repo._located_search_stmt(
+                        biological_sex=None,
+                        license_category=None,
+                        search_query=None,
+                        only_available=True,
+                        **repo_kwargs,
+                    ),
+                )
+
+                projection_plan = await explain(
+                    session,
+                    projection._located_stmt(
+                        biological_sex=None,
+                        license_category=None,
+                        search_query=None,
+                        only_available=True,
+                        **repo_kwargs,
+                    ),
+                )
+
+                legacy = await measure(lambda: session.execute(legacy_search_stmt()))
+                current = await measure(lambda: repo.search_by_location(**repo_kwargs))
+                projected = await measure(lambda: projection.search(**repo_kwargs))
+
+                rows.append([
+                    size, "anterior", legacy["p50"], legacy["p95"],
+                    ", ".join(sorted(set(scan_summary(legacy_plan)))),
+                ])
+                rows.append([
+                    size, "geography+KNN", current["p50"], current["p95"],
+                    ", ".join(sorted(set(scan_summary(located_plan)))),
+                ])
+                rows.append([
+                    size, "projeção", projected["p50"], projected["p95"],
+                    ", ".join(sorted(set(scan_summary(projection_plan)))),
+                ])
+        finally:
+            await session.rollback()
+
+    await engine.dispose()
+    print_table(["perfis", "modo", "p50 ms", "p95 ms", "varreduras"], rows)
+
+
+if __name__ == "__main__":
+    requested = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    asyncio.run(run(requested))
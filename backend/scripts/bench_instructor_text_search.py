@@ -0,0 +1,147 @@
+"""
+Benchmark: busca textual de instrutores (nome/cidade)
+
+Compara o predicado anterior (unaccent(col) ILIKE unaccent('%termo%'), sem
+índice utilizável) com o predicado atual de InstructorRepositoryImpl
+(f_unaccent(col) ILIKE ..., servido pelos índices GIN trigram) e com a busca
+completa do repositório (que também ordena por similaridade).
+
+Os dados sintéticos (nomes brasileiros com acentos) são inseridos dentro de
+uma transação e descartados (ROLLBACK) ao final.
+
+Uso (a partir de backend/, com migrations aplicadas):
+    DATABASE_URL=postgresql+asyncpg://... python -m scripts.bench_instructor_text_search
+    python -m scripts.bench_instructor_text_search 100000 1000000
+"""
+
+import asyncio
+import sys
+
+from sqlalchemy import func, or_, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from scripts.bench_common import explain, make_engine, measure, print_table, scan_summary
+from scripts.bench_instructor_search import CENTER, SEED_PROFILES_SQL
+from src.infrastructure.db.models.instructor_profile_model import InstructorProfileModel
+from src.infrastructure.db.models.user_model import UserModel
+from src.infrastructure.repositories.instructor_repository_impl import (
+    InstructorRepositoryImpl,
+)
+
+DEFAULT_SIZES = [100_000, 1_000_000]
+
+QUERIES = ["joao", "Conceição", "ferreira", "curitiba", "zyx"]
+
+LIMIT = 50
+
+SEED_USERS_SQL = """
+INSERT INTO users (id, email, hashed_password, full_name, user_type,
+                   is_active, is_verified, biological_sex)
+SELECT gen_random_uuid(),
+       'bench-' || g || '@bench.local',
+       'x',
+       (ARRAY['João', 'José', 'Antônio', 'Márcia', 'Luíza', 'Conceição',
+              'André', 'Fábio', 'Vitória', 'Sérgio'])[1 + g % 10]
+       || ' ' ||
+       (ARRAY['Silva', 'Conceição', 'Araújo', 'Gonçalves', 'Ferreira',
+              'Simões', 'Magalhães', 'Lima', 'Brandão', 'Assunção'])[1 + (g / 10) % 10]
+       || ' ' || g,
+       'instructor',
+       true,
+       true,
+       CASE WHEN g % 2 = 0 THEN 'male' ELSE 'female' END
+FROM generate_series(:start, :stop) AS g
+"""
+
+
+def legacy_text_stmt(query: str):
+    """Reproduz o filtro anterior (unaccent STABLE, sem índice)."""
+    pattern = func.unaccent(f"%{query}%")
+    return (
+        select(InstructorProfileModel.id)
+        .join(InstructorProfileModel.user)
+        .where(
+            or_(
+                func.unaccent(UserModel.full_name).ilike(pattern),
+                func.unaccent(InstructorProfileModel.city).ilike(pattern),
+            ),
+            InstructorProfileModel.is_available.is_(True),
+        )
+        .order_by(InstructorProfileModel.rating.desc())
+        .limit(LIMIT)
+    )
+
+
+def trigram_text_stmt(repo: InstructorRepositoryImpl, query: str):
+    """Mesmo formato, com o predicado indexado atual do repositório."""
+    stmt = (
+        select(InstructorProfileModel.id)
+        .join(InstructorProfileModel.user)
+        .order_by(InstructorProfileModel.rating.desc())
+        .limit(LIMIT)
+    )
+    return repo._apply_search_filters(stmt, None, None, query, True)
+
+
+async def seed(session: AsyncSession, current: int, target: int) -> None:
+    """Insere perfis sintéticos até atingir `target` instrutores."""
+    if target <= current:
+        return
+    await session.execute(text(SEED_USERS_SQL), {"start": current + 1, "stop": target})
+    await session.execute(text(SEED_PROFILES_SQL))
+    await session.execute(text("ANALYZE users"))
+    await session.execute(text("ANALYZE instructor_profiles"))
+
+
+async def run(sizes: list[int]) -> None:
+    engine = make_engine()
+    rows = []
+
+    async with AsyncSession(engine) as session:
+        await session.begin()
+        repo = InstructorRepositoryImpl(session)
+        seeded = 0
+
+        try:
+            for size in sorted(sizes):
+                await seed(session, seeded, size)
+                seeded = size
+
+                for query in QUERIES:
+                    legacy_plan = await explain(session, legacy_text_stmt(query))
+                    trigram_plan = await explain(session, trigram_text_stmt(repo, query))
+
+                    legacy = await measure(
+                        lambda q=query: session.execute(legacy_text_stmt(q)), repeat=10
+                    )
+                    trigram = await measure(
+                        lambda q=query: session.execute(trigram_text_stmt(repo, q)), repeat=10
+                    )
+                    ranked = await measure(
+                        lambda q=query: repo.search_by_location(
+                            center=CENTER, radius_km=50.0, search_query=q, limit=LIMIT
+                        ),
+                        repeat=10,
+                    )
+
+                    rows.append([
+                        size, query, "unaccent ILIKE", legacy["p50"], legacy["p95"],
+                        ", ".join(sorted(set(scan_summary(legacy_plan)))),
+                    ])
+                    rows.append([
+                        size, query, "f_unaccent trgm", trigram["p50"], trigram["p95"],
+                        ", ".join(sorted(set(scan_summary(trigram_plan)))),
+                    ])
+                    rows.append([
+                        size, query, "repo (ranqueada)", ranked["p50"], ranked["p95"], "",
+                    ])
+        finally:
+            await session.rollback()
+
+    await engine.dispose()
+    print_table(["perfis", "termo", "modo", "p50 ms", "p95 ms", "varreduras"], rows)
+
+
+if __name__ == "__main__":
+    requested = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    asyncio.run(run(requested))
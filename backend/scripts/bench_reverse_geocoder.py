@@ -0,0 +1,91 @@
+"""
+Benchmark: geocodificação reversa offline
+
+Mede OfflineReverseGeocoder.city_at sobre uma malha sintética com o mesmo
+número de polígonos dos municípios brasileiros (células de Voronoi dentro da
+caixa envolvente do Brasil): consultas sem cache (R-tree + ponto-em-polígono)
+e com o cache LRU aquecido. Para comparação, a chamada ao Nominatim levava de
+centenas de ms até o timeout de 10 s.
+
+Não requer banco de dados nem rede.
+
+Uso (a partir de backend/):
+    python -m scripts.bench_reverse_geocoder
+    python -m scripts.bench_reverse_geocoder 5570 20000
+"""
+
+import random
+import sys
+import time
+
+import numpy as np
+import shapely
+
+from scripts.bench_common import measure_sync, print_table
+from src.domain.entities.location import Location
+from src.infrastructure.services.reverse_geocoder import OfflineReverseGeocoder
+
+# Caixa envolvente aproximada do Brasil (lon/lat)
+BBOX = (-73.99, -33.75, -34.79, 5.27)
+
+
+def synthetic_municipalities(count: int) -> tuple[list, list[str]]:
+    """Células de Voronoi de `count` sementes aleatórias dentro da caixa."""
+    rng = np.random.default_rng(42)
+    seeds = shapely.points(
+        rng.uniform(BBOX[0], BBOX[2], count),
+        rng.uniform(BBOX[1], BBOX[3], count),
+    )
+    extent = shapely.box(*BBOX)
+    cells = shapely.get_parts(shapely.voronoi_polygons(shapely.multipoints(seeds), extend_to=extent))
+    cells = shapely.intersection(cells, extent)
+    return list(cells), [f"Município {i}" for i in range(len(cells))]
+
+
+def random_locations(count: int) -> list[Location]:
+    rng = random.Random(7)
+    return [
+        Location(
+            latitude=rng.uniform(BBOX[1], BBOX[3]),
+            longitude=rng.uniform(BBOX[0], BBOX[2]),
+        )
+        for _ in range(count)
+    ]
+
+
+def run(municipalities: int, lookups: int) -> None:
+    geometries, names = synthetic_municipalities(municipalities)
+    locations = random_locations(lookups)
+
+    started = time.perf_counter()
+    geocoder = OfflineReverseGeocoder(cache_size=lookups)
+    geocoder.load(geometries, names)
+    load_ms = (time.perf_counter() - started) * 1000
+
+    def cold() -> None:
+        geocoder._cache.clear()
+        for location in locations:
+            geocoder.city_at(location)
+
+    def warm() -> None:
+        for location in locations:
+            geocoder.city_at(location)
+
+    cold_stats = measure_sync(cold, repeat=5, warmup=1)
+    warm()
+    warm_stats = measure_sync(warm, repeat=5, warmup=1)
+
+    per_lookup = lambda stats: stats["p50"] * 1000 / lookups  # noqa: E731
+    print(f"{len(names)} polígonos carregados em {load_ms:.1f} ms\n")
+    print_table(
+        ["modo", "consultas", "p50 lote ms", "µs/consulta"],
+        [
+            ["sem cache", lookups, cold_stats["p50"], per_lookup(cold_stats)],
+            ["cache LRU", lookups, warm_stats["p50"], per_lookup(warm_stats)],
+        ],
+    )
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    run(args[0] if args else 5570, args[1] if len(args) > 1 else 10_000)
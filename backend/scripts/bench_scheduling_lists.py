@@ -0,0 +1,106 @@
+"""
+Benchmark: listagens de agendamentos (ORM com joinedload x projeção)
+
+Compara, para o instrutor e o aluno com mais agendamentos do banco local, a
+listagem anterior (SchedulingModel com joinedload de pagamento, aluno,
+instrutor, perfil completo do instrutor e review, unique() e to_entity())
+com a projeção atual (scheduling_list_stmt + scheduling_from_list_row):
+latência da consulta com a montagem das entidades e largura das linhas
+estimada pelo planejador.
+
+Requer banco de dados com agendamentos (ex: scripts/seed_test_data.py).
+
+Uso (a partir de backend/):
+    DATABASE_URL=postgresql+asyncpg://... python -m scripts.bench_scheduling_lists
+    DATABASE_URL=postgresql+asyncpg://... python -m scripts.bench_scheduling_lists 50
+"""
+
+import asyncio
+import sys
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, load_only
+
+from scripts.bench_common import explain, make_engine, measure, print_table
+from src.infrastructure.db.models.scheduling_model import SchedulingModel
+from src.infrastructure.db.models.user_model import UserModel
+from src.infrastructure.repositories.scheduling_repository_impl import (
+    scheduling_from_list_row,
+    scheduling_list_stmt,
+)
+
+
+def orm_stmt(column, user_id, limit: int):
+    """Listagem anterior: entidades completas com joinedload."""
+    return (
+        select(SchedulingModel)
+        .where(column == user_id)
+        .order_by(SchedulingModel.scheduled_datetime.desc())
+        .limit(limit)
+        .options(
+            joinedload(SchedulingModel.payment),
+            joinedload(SchedulingModel.student).load_only(UserModel.id, UserModel.full_name),
+            joinedload(SchedulingModel.instructor).options(
+                load_only(UserModel.id, UserModel.full_name),
+                joinedload(UserModel.instructor_profile),
+            ),
+            joinedload(SchedulingModel.review),
+        )
+    )
+
+
+def projection_stmt(column, user_id, limit: int):
+    return (
+        scheduling_list_stmt()
+        .where(column == user_id)
+        .order_by(SchedulingModel.scheduled_datetime.desc())
+        .limit(limit)
+    )
+
+
+async def busiest(session: AsyncSession, column):
+    result = await session.execute(
+        select(column).group_by(column).order_by(func.count().desc()).limit(1)
+    )
+    return result.scalar_one_or_none()
+
+
+async def run(limit: int) -> None:
+    engine = make_engine()
+    rows = []
+    async with AsyncSession(engine) as session:
+        for label, column in (
+            ("instrutor", SchedulingModel.instructor_id),
+            ("aluno", SchedulingModel.student_id),
+        ):
+            user_id = await busiest(session, column)
+            if user_id is None:
+                print("Nenhum agendamento no banco.")
+                return
+
+            async def orm_list():
+                result = await session.execute(orm_stmt(column, user_id, limit))
+                entities = [m.to_entity() for m in result.unique().scalars().all()]
+                session.expunge_all()
+                return entities
+
+            async def projection_list():
+                result = await session.execute(projection_stmt(column, user_id, limit))
+                return [scheduling_from_list_row(row) for row in result.all()]
+
+            for name, fn, stmt in (
+                ("joinedload", orm_list, orm_stmt(column, user_id, limit)),
+                ("projeção", projection_list, projection_stmt(column, user_id, limit)),
+            ):
+                count = len(await fn())
+                stats = await measure(fn, repeat=30, warmup=3)
+                plan = await explain(session, stmt, analyze=False)
+                rows.append([label, name, count, plan.get("Plan Width"), stats["p50"], stats["p95"]])
+
+    await engine.dispose()
+    print_table(["lista", "consulta", "linhas", "largura (B)", "p50 ms", "p95 ms"], rows)
+
+
+if __name__ == "__main__":
+    asyncio.run(run(int(sys.argv[1]) if len(sys.argv) > 1 else 20))
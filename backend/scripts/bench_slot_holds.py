@@ -0,0 +1,100 @@
+"""
+Benchmark: disputa por horários no carrinho (reservas no Redis)
+
+Dispara centenas de reservas concorrentes (RedisSlotHoldService.hold) de
+alunos diferentes para poucos horários de um mesmo instrutor, incluindo
+horários sobrepostos, e verifica que cada intervalo fica com um único dono.
+Mede a latência de cada reserva sob disputa.
+
+Requer um Redis acessível (REDIS_URL ou settings.redis_url). Usa um
+instrutor aleatório e remove as chaves criadas ao final.
+
+Uso (a partir de backend/):
+    REDIS_URL=redis://localhost:6379/0 python -m scripts.bench_slot_holds
+    python -m scripts.bench_slot_holds 500   # reservas concorrentes
+"""
+
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+from scripts.bench_common import print_table, summarize
+from src.domain.entities.slot_hold import SlotHold
+from src.infrastructure.external.redis_slot_holds import (
+    RedisSlotHoldService,
+    instructor_key,
+    student_key,
+)
+
+# Horários disputados: de 30 em 30 min com aulas de 50 min, então horários
+# vizinhos se sobrepõem e só metade deles pode ser segurada.
+SLOTS = 8
+STEP = timedelta(minutes=30)
+DURATION = 50
+
+
+async def run(attempts: int) -> None:
+    service = RedisSlotHoldService(os.getenv("REDIS_URL"))
+    await service.connect()
+
+    instructor_id = uuid4()
+    base = (datetime.now(timezone.utc) + timedelta(days=7)).replace(minute=0, second=0, microsecond=0)
+    expires_at = datetime.now(timezone.utc) + timedelta(minutes=5)
+    holds = [
+        SlotHold(
+            instructor_id=instructor_id,
+            student_id=uuid4(),
+            scheduled_datetime=base + STEP * (i % SLOTS),
+            duration_minutes=DURATION,
+            lesson_category="B",
+            vehicle_ownership="instructor",
+            price=Decimal("100.00"),
+            expires_at=expires_at,
+        )
+        for i in range(attempts)
+    ]
+
+    async def attempt(hold: SlotHold) -> tuple[SlotHold, bool, float]:
+        started = time.perf_counter()
+        held = await service.hold(hold)
+        return hold, held, (time.perf_counter() - started) * 1000
+
+    try:
+        started = time.perf_counter()
+        results = await asyncio.gather(*(attempt(h) for h in holds))
+        wall_ms = (time.perf_counter() - started) * 1000
+
+        winners = sorted((h for h, held, _ in results if held), key=lambda h: h.scheduled_datetime)
+        for previous, current in zip(winners, winners[1:]):
+            assert previous.end_datetime <= current.scheduled_datetime, "reservas sobrepostas!"
+        for hold in winners:
+            assert not await service.is_held_by_other(
+                instructor_id, hold.student_id, hold.scheduled_datetime, hold.end_datetime
+            )
+
+        latency = summarize([ms for _, _, ms in results])
+        print(f"{attempts} reservas concorrentes para {SLOTS} horários sobrepostos\n")
+        print_table(
+            ["aceitas", "recusadas", "total (ms)", "p50 (ms)", "p95 (ms)", "média (ms)"],
+            [[
+                len(winners),
+                attempts - len(winners),
+                wall_ms,
+                latency["p50"],
+                latency["p95"],
+                latency["mean"],
+            ]],
+        )
+        print("\nSem sobreposição entre as reservas aceitas.")
+    finally:
+        client = service._client
+        await client.delete(instructor_key(instructor_id), *(student_key(h.student_id) for h in holds))
+        await service.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(run(int(sys.argv[1]) if len(sys.argv) > 1 else 300))
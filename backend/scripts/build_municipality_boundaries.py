@@ -0,0 +1,71 @@
+"""
+Gera o conjunto de dados de limites municipais do geocodificador offline
+
+Combina a malha municipal do IBGE (GeoJSON, propriedade "codarea") com a
+lista de municípios (id -> nome) e grava um FeatureCollection compacto com
+properties {"name", "code"} e geometrias simplificadas, no formato lido por
+OfflineReverseGeocoder.load_geojson.
+
+Arquivos de entrada (API de dados do IBGE):
+    malha:      https://servicodados.ibge.gov.br/api/v3/malhas/paises/BR
+                ?intrarregiao=municipio&formato=application/vnd.geo+json
+    municípios: https://servicodados.ibge.gov.br/api/v1/localidades/municipios
+
+Uso (a partir de backend/):
+    python -m scripts.build_municipality_boundaries malha.json municipios.json
+    python -m scripts.build_municipality_boundaries malha.json municipios.json \\
+        --out data/municipalities.geojson --tolerance 0.0005
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+import shapely
+
+from src.infrastructure.services.reverse_geocoder import DEFAULT_BOUNDARIES_PATH
+
+
+def build(boundaries_path: Path, names_path: Path, tolerance: float) -> dict:
+    """Monta o FeatureCollection de saída."""
+    with open(names_path, encoding="utf-8") as file:
+        names = {str(item["id"]): item["nome"] for item in json.load(file)}
+    with open(boundaries_path, encoding="utf-8") as file:
+        collection = json.load(file)
+
+    features = []
+    for feature in collection["features"]:
+        code = str(feature["properties"]["codarea"])
+        if code not in names:
+            continue
+        geometry = shapely.from_geojson(json.dumps(feature["geometry"]))
+        if tolerance > 0:
+            # Simplificação preservando topologia: arquivo menor e testes de
+            # inclusão mais rápidos, com erro de ~tolerance graus nas divisas
+            geometry = shapely.simplify(geometry, tolerance, preserve_topology=True)
+        features.append({
+            "type": "Feature",
+            "properties": {"name": names[code], "code": code},
+            "geometry": json.loads(shapely.to_geojson(geometry, indent=None)),
+        })
+
+    return {"type": "FeatureCollection", "features": features}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("boundaries", type=Path, help="GeoJSON da malha municipal do IBGE")
+    parser.add_argument("names", type=Path, help="JSON da lista de municípios do IBGE")
+    parser.add_argument("--out", type=Path, default=DEFAULT_BOUNDARIES_PATH)
+    parser.add_argument("--tolerance", type=float, default=0.0005)
+    args = parser.parse_args()
+
+    output = build(args.boundaries, args.names, args.tolerance)
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.out, "w", encoding="utf-8") as file:
+        json.dump(output, file, ensure_ascii=False, separators=(",", ":"))
+    print(f"{len(output['features'])} municípios gravados em {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+"""
+Verificação de planos: consultas dos repositórios sem Seq Scan em tabelas grandes
+
+Insere um volume sintético de alunos, instrutores, agendamentos e pagamentos
+(dentro de uma transação descartada com ROLLBACK ao final), executa as
+consultas quentes de SchedulingRepositoryImpl e PaymentRepositoryImpl
+capturando os statements emitidos e roda EXPLAIN em cada um.
+
+Falha (código de saída 1) quando algum plano faz Seq Scan em uma tabela com
+mais linhas que o limite — ex: um predicado que deixou de casar com o índice
+parcial correspondente (ix_schedulings_*_active_date,
+ix_schedulings_cart_created, ix_schedulings_confirmed_end).
+
+Uso (a partir de backend/, com migrations aplicadas):
+    DATABASE_URL=postgresql+asyncpg://... python -m scripts.check_query_plans
+    python -m scripts.check_query_plans 500000 --max-seq-rows 20000
+"""
+
+import argparse
+import asyncio
+import sys
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from scripts.bench_common import explain, iter_plan_nodes, make_engine, print_table, scan_summary
+from src.domain.entities.scheduling_status import SchedulingStatus
+from src.infrastructure.repositories.payment_repository_impl import PaymentRepositoryImpl
+from src.infrastructure.repositories.scheduling_repository_impl import SchedulingRepositoryImpl
+
+DEFAULT_SCHEDULINGS = 200_000
+DEFAULT_MAX_SEQ_ROWS = 10_000
+INSTRUCTORS = 500
+STUDENTS = 5_000
+
+SEED_USERS_SQL = """
+INSERT INTO users (id, email, hashed_password, full_name, user_type, is_active, is_verified)
+SELECT gen_random_uuid(),
+       'plan-' || :role || '-' || g || '@plan.local',
+       'x',
+       'Plano ' || :role || ' ' || g,
+       :role,
+       true,
+       true
+FROM generate_series(1, :count) AS g
+"""
+
+# Aulas de 50 min a cada 3 h por instrutor (sem sobreposição), metade no
+# passado e metade no futuro. Passado: concluídas, canceladas e algumas
+# confirmadas vencidas; futuro: confirmadas, carrinho (pending) e canceladas.
+SEED_SCHEDULINGS_SQL = """
+WITH instructors AS (
+    SELECT id, row_number() OVER (ORDER BY id) - 1 AS n
+    FROM users WHERE email LIKE 'plan-instructor-%@plan.local'
+), students AS (
+    SELECT id, row_number() OVER (ORDER BY id) - 1 AS n
+    FROM users WHERE email LIKE 'plan-student-%@plan.local'
+), lessons AS (
+    SELECT g,
+           now() - make_interval(hours => 3 * (:total / :instructors) / 2)
+                 + make_interval(hours => 3 * (g / :instructors)) AS starts_at,
+           random() AS roll
+    FROM generate_series(0, :total - 1) AS g
+)
+INSERT INTO schedulings (id, student_id, instructor_id, scheduled_datetime,
+                         duration_minutes, end_datetime, price, status, created_at)
+SELECT gen_random_uuid(),
+       s.id,
+       i.id,
+       l.starts_at,
+       50,
+       l.starts_at + interval '50 minutes',
+       120,
+       (CASE
+            WHEN l.starts_at < now() AND l.roll < 0.80 THEN 'completed'
+            WHEN l.starts_at < now() AND l.roll < 0.95 THEN 'cancelled'
+            WHEN l.starts_at < now() THEN 'confirmed'
+            WHEN l.roll < 0.50 THEN 'confirmed'
+            WHEN l.roll < 0.80 THEN 'pending'
+            ELSE 'cancelled'
+        END)::scheduling_status_enum,
+       CASE WHEN l.starts_at >= now() AND l.roll >= 0.50 AND l.roll < 0.80
+            THEN now() - random() * interval '20 minutes'
+            ELSE l.starts_at - interval '7 days'
+       END
+FROM lessons l
+JOIN instructors i ON i.n = l.g % :instructors
+JOIN students s ON s.n = (l.g::bigint * 7919) % :students
+"""
+
+SEED_PAYMENTS_SQL = """
+INSERT INTO payments (id, scheduling_id, student_id, instructor_id, amount,
+                      platform_fee_percentage, platform_fee_amount,
+                      instructor_amount, status, gateway_provider, created_at)
+SELECT gen_random_uuid(),
+       s.id,
+       s.student_id,
+       s.instructor_id,
+       s.price,
+       10,
+       s.price * 0.10,
+       s.price * 0.90,
+       (CASE WHEN s.status = 'pending' THEN 'pending' ELSE 'completed' END)::paymentstatus,
+       'mercadopago',
+       s.created_at
+FROM schedulings s
+JOIN users u ON u.id = s.student_id
+WHERE u.email LIKE 'plan-student-%@plan.local'
+  AND (s.status IN ('completed', 'confirmed') OR (s.status = 'pending' AND random() < 0.5))
+"""
+
+TABLE_SIZES_SQL = """
+SELECT relname, reltuples::bigint
+FROM pg_class
+WHERE relkind = 'r' AND relnamespace = 'public'::regnamespace
+"""
+
+
+async def seed(session: AsyncSession, total: int) -> None:
+    """Insere usuários, agendamentos e pagamentos sintéticos e atualiza as estatísticas."""
+    await session.execute(text(SEED_USERS_SQL), {"role": "instructor", "count": INSTRUCTORS})
+    await session.execute(text(SEED_USERS_SQL), {"role": "student", "count": STUDENTS})
+    await session.execute(
+        text(SEED_SCHEDULINGS_SQL),
+        {"total": total, "instructors": INSTRUCTORS, "students": STUDENTS},
+    )
+    await session.execute(text(SEED_PAYMENTS_SQL))
+    for table in ("users", "schedulings", "payments"):
+        await session.execute(text(f"ANALYZE {table}"))
+
+
+async def sample_user(session: AsyncSession, role: str):
+    result = await session.execute(
+        text("SELECT id FROM users WHERE email = :email"),
+        {"email": f"plan-{role}-1@plan.local"},
+    )
+    return result.scalar_one()
+
+
+@contextmanager
+def recorded_statements(session: AsyncSession) -> Iterator[list[Any]]:
+    """
+    Registra os statements executados pela sessão dentro do bloco.
+
+    Só entram statements com os valores embutidos (select/update do ORM);
+    execuções com parâmetros à parte (ex: executemany do resumo mensal)
+    ficam de fora, pois não há um único conjunto de valores para o EXPLAIN.
+    """
+    captured: list[Any] = []
+
+    def _record(state) -> None:
+        if not state.parameters:
+            captured.append(state.statement)
+
+    event.listen(session.sync_session, "do_orm_execute", _record)
+    try:
+        yield captured
+    finally:
+        event.remove(session.sync_session, "do_orm_execute", _record)
+
+
+def seq_scan_violations(plan: dict, table_sizes: dict[str, int], max_rows: int) -> list[str]:
+    """Tabelas varridas sequencialmente com mais de max_rows linhas."""
+    violations = []
+    for node in iter_plan_nodes(plan):
+        if node.get("Node Type") != "Seq Scan":
+            continue
+        relation = node.get("Relation Name", "")
+        rows = table_sizes.get(relation, 0)
+        if rows > max_rows:
+            violations.append(f"{relation} ({rows} linhas)")
+    return violations
+
+
+def hot_queries(session: AsyncSession, student_id, instructor_id) -> list[tuple[str, Callable[[], Awaitable[Any]]]]:
+    """Consultas quentes dos repositórios; as que alteram dados ficam por último."""
+    schedulings = SchedulingRepositoryImpl(session)
+    payments = PaymentRepositoryImpl(session)
+    now = datetime.now(timezone.utc)
+    return [
+        ("próxima aula do instrutor", lambda: schedulings.get_next_instructor_scheduling(instructor_id)),
+        ("próxima aula do aluno", lambda: schedulings.get_next_student_scheduling(student_id)),
+        ("aulas do aluno", lambda: schedulings.page_by_student(student_id)),
+        ("carrinho do aluno", lambda: schedulings.page_by_student(student_id, payment_status_filter="pending")),
+        (
+            "histórico do aluno",
+            lambda: schedulings.page_by_student(student_id, status=[SchedulingStatus.COMPLETED]),
+        ),
+        ("agenda do instrutor", lambda: schedulings.page_by_instructor(instructor_id)),
+        ("contagem do instrutor", lambda: schedulings.count_by_instructor(instructor_id)),
+        (
+            "calendário do mês",
+            lambda: schedulings.get_scheduling_dates_for_month(instructor_id, now.year, now.month),
+        ),
+        ("conflito de horário", lambda: schedulings.check_conflict(instructor_id, now, 50)),
+        (
+            "horários ocupados",
+            lambda: schedulings.list_busy_intervals(instructor_id, now, now + timedelta(days=7)),
+        ),
+        ("admin: todos", lambda: schedulings.page_all()),
+        ("admin: pendentes", lambda: schedulings.page_all(status=SchedulingStatus.PENDING)),
+        ("pagamentos do aluno", lambda: payments.list_by_student(student_id)),
+        ("pagamentos do instrutor", lambda: payments.list_by_instructor(instructor_id)),
+        ("confirmadas vencidas", lambda: schedulings.get_overdue_confirmed()),
+        ("carrinhos expirados", lambda: schedulings.get_expired_cart_items()),
+        ("concluir vencidas", lambda: schedulings.complete_overdue_confirmed()),
+        ("cancelar carrinhos", lambda: schedulings.cancel_expired_cart_items("Carrinho expirado")),
+    ]
+
+
+async def run(total: int, max_seq_rows: int) -> int:
+    engine = make_engine()
+    rows = []
+    failures = 0
+
+    async with AsyncSession(engine) as session:
+        await session.begin()
+        try:
+            await seed(session, total)
+            table_sizes = dict((await session.execute(text(TABLE_SIZES_SQL))).all())
+            student_id = await sample_user(session, "student")
+            instructor_id = await sample_user(session, "instructor")
+
+            for name, query in hot_queries(session, student_id, instructor_id):
+                with recorded_statements(session) as captured:
+                    await query()
+                for stmt in captured:
+                    plan = await explain(session, stmt, analyze=False)
+                    violations = seq_scan_violations(plan, table_sizes, max_seq_rows)
+                    failures += bool(violations)
+                    rows.append([
+                        name,
+                        ", ".join(scan_summary(plan)),
+                        "FALHA: Seq Scan em " + ", ".join(violations) if violations else "ok",
+                    ])
+        finally:
+            await session.rollback()
+
+    await engine.dispose()
+    print_table(["consulta", "varreduras", "resultado"], rows)
+    print(f"\n{failures} plano(s) com Seq Scan acima de {max_seq_rows} linhas")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("schedulings", nargs="?", type=int, default=DEFAULT_SCHEDULINGS)
+    parser.add_argument("--max-seq-rows", type=int, default=DEFAULT_MAX_SEQ_ROWS)
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(args.schedulings, args.max_seq_rows)))
@@ -0,0 +1,62 @@
+"""
+Preenche (ou ressincroniza) a projeção de busca de instrutores
+
+Recalcula os preços finais dos perfis ainda sem preço com as taxas vigentes
+e regrava todas as linhas de instructor_search_index a partir de
+instructor_profiles e users, em lotes, numa única transação.
+
+Ordem de implantação da projeção:
+    1. INSTRUCTOR_SEARCH_PROJECTION_SYNC_ENABLED=true (as escritas passam a
+       ser replicadas)
+    2. este script (linhas anteriores à replicação)
+    3. INSTRUCTOR_SEARCH_PROJECTION_ENABLED=true (a busca passa a ler a
+       projeção)
+
+Também deve ser executado depois de qualquer período com a replicação
+desabilitada.
+
+Uso (a partir de backend/, com migrations aplicadas):
+    python -m scripts.rebuild_instructor_search_index
+    python -m scripts.rebuild_instructor_search_index --batch-size 2000
+"""
+
+import argparse
+import asyncio
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.infrastructure.config import settings
+from src.infrastructure.repositories.instructor_repository_impl import (
+    InstructorRepositoryImpl,
+)
+from src.infrastructure.repositories.instructor_search_index_repository_impl import (
+    InstructorSearchIndexRepositoryImpl,
+)
+
+
+async def run(batch_size: int) -> tuple[int, int]:
+    """Retorna (perfis com preços recalculados, linhas regravadas)."""
+    engine = create_async_engine(settings.database_url, echo=False)
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+    try:
+        async with session_factory() as session, session.begin():
+            # A projeção copia os preços finais gravados nos perfis
+            recomputed = await InstructorRepositoryImpl(session).recompute_final_prices(batch_size)
+            rebuilt = await InstructorSearchIndexRepositoryImpl(session).rebuild(batch_size)
+            return recomputed, rebuilt
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    recomputed, rebuilt = asyncio.run(run(args.batch_size))
+    print(f"Preços finais recalculados: {recomputed}")
+    print(f"Linhas da projeção regravadas: {rebuilt}")
+
+
+if __name__ == "__main__":
+    main()
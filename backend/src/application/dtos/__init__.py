@@ -40,6 +40,7 @@ from .profile_dtos import (
 from .scheduling_dtos import (
     AvailabilityListResponseDTO,
     AvailabilityResponseDTO,
+    BookLessonPackageDTO,
     CancellationResultDTO,
     CancelSchedulingDTO,
     CompleteSchedulingDTO,
@@ -47,10 +48,15 @@ from .scheduling_dtos import (
     CreateAvailabilityDTO,
     CreateSchedulingDTO,
     DeleteAvailabilityDTO,
+    LessonPackageResultDTO,
     ListSchedulingsDTO,
+    PackageLessonDTO,
+    PackageLessonFailureDTO,
+    ReplaceWeeklyAvailabilityDTO,
     SchedulingListResponseDTO,
     SchedulingResponseDTO,
     UpdateAvailabilityDTO,
+    WeeklySlotDTO,
 )
 
 __all__ = [
@@ -69,6 +75,8 @@ __all__ = [
     "InstructorSearchResultDTO",
     # Scheduling DTOs
     "CreateSchedulingDTO",
+    "PackageLessonDTO",
+    "BookLessonPackageDTO",
     "CancelSchedulingDTO",
     "ConfirmSchedulingDTO",
     "CompleteSchedulingDTO",
@@ -76,8 +84,12 @@ __all__ = [
     "CreateAvailabilityDTO",
     "UpdateAvailabilityDTO",
     "DeleteAvailabilityDTO",
+    "WeeklySlotDTO",
+    "ReplaceWeeklyAvailabilityDTO",
     "SchedulingResponseDTO",
     "CancellationResultDTO",
+    "PackageLessonFailureDTO",
+    "LessonPackageResultDTO",
     "SchedulingListResponseDTO",
     "AvailabilityResponseDTO",
     "AvailabilityListResponseDTO",
@@ -25,6 +25,7 @@ class ListAllSchedulingsDTO:
     date_to: datetime | None = None
     limit: int = 50
     offset: int = 0
+    cursor: str | None = None  # next_cursor da página anterior (substitui offset)
 
 
 @dataclass(frozen=True)
@@ -76,3 +77,4 @@ class SchedulingListResponseDTO:
     limit: int
     offset: int
     has_more: bool
+    next_cursor: str | None = None
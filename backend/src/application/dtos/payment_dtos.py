@@ -39,6 +39,7 @@ class GetPaymentHistoryDTO:
     user_id: UUID
     limit: int = 50
     offset: int = 0
+    cursor: str | None = None  # next_cursor da página anterior (substitui offset)
 
 
 @dataclass(frozen=True)
@@ -158,6 +159,7 @@ class PaymentHistoryResponseDTO:
     limit: int
     offset: int
     has_more: bool
+    next_cursor: str | None = None
 
 
 @dataclass
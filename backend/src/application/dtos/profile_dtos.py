@@ -5,7 +5,7 @@ Data Transfer Objects para operações com perfis de usuários.
 """
 
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, datetime
 from decimal import Decimal
 from uuid import UUID
 
@@ -64,6 +64,23 @@ class InstructorSearchDTO:
     search_query: str | None = None
     only_available: bool = True
     limit: int = 50
+    # Só instrutores livres em [free_from, free_from + free_minutes)
+    free_from: datetime | None = None
+    free_minutes: int = 50
+
+
+@dataclass(frozen=True)
+class InstructorFeedDTO:
+    """DTO para uma página do feed de descoberta de instrutores (por cursor)."""
+
+    latitude: float
+    longitude: float
+    radius_km: float = 10.0
+    biological_sex: str | None = None
+    license_category: str | None = None
+    search_query: str | None = None
+    limit: int = 20
+    cursor: str | None = None
 
 
 @dataclass(frozen=True)
@@ -141,3 +158,14 @@ class InstructorSearchResultDTO:
     radius_km: float
     center_latitude: float
     center_longitude: float
+
+
+@dataclass
+class InstructorFeedResultDTO:
+    """DTO de resposta para uma página do feed de instrutores."""
+
+    instructors: list[InstructorProfileResponseDTO]
+    next_cursor: str | None
+    radius_km: float
+    center_latitude: float
+    center_longitude: float
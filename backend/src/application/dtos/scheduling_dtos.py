@@ -27,6 +27,25 @@ class CreateSchedulingDTO:
     duration_minutes: int = 50
 
 
+@dataclass(frozen=True)
+class PackageLessonDTO:
+    """DTO de uma aula do pacote."""
+
+    scheduled_datetime: datetime
+    duration_minutes: int = 50
+
+
+@dataclass(frozen=True)
+class BookLessonPackageDTO:
+    """DTO para agendamento de um pacote de aulas com o mesmo instrutor."""
+
+    student_id: UUID
+    instructor_id: UUID
+    lesson_category: str  # "A", "B" ou "AB"
+    vehicle_ownership: str  # "instructor" ou "student"
+    lessons: list[PackageLessonDTO]
+
+
 @dataclass(frozen=True)
 class CancelSchedulingDTO:
     """DTO para cancelamento de agendamento."""
@@ -92,6 +111,24 @@ class DeleteAvailabilityDTO:
     instructor_id: UUID
 
 
+@dataclass(frozen=True)
+class WeeklySlotDTO:
+    """DTO de um slot da semana desejada."""
+
+    day_of_week: int
+    start_time: time
+    end_time: time
+    is_active: bool = True
+
+
+@dataclass(frozen=True)
+class ReplaceWeeklyAvailabilityDTO:
+    """DTO para substituir toda a disponibilidade semanal do instrutor."""
+
+    instructor_id: UUID
+    slots: list[WeeklySlotDTO]
+
+
 @dataclass(frozen=True)
 class StartSchedulingDTO:
     """DTO para iniciar um agendamento."""
@@ -153,6 +190,24 @@ class SchedulingResponseDTO:
     applied_final_price: Decimal | None = None
 
 
+@dataclass
+class PackageLessonFailureDTO:
+    """DTO de uma aula do pacote que não pôde ser agendada."""
+
+    scheduled_datetime: datetime
+    duration_minutes: int
+    reason: str  # "unavailable_slot", "scheduling_conflict" ou "slot_held"
+    message: str
+
+
+@dataclass
+class LessonPackageResultDTO:
+    """DTO de resultado do agendamento de um pacote de aulas."""
+
+    created: list[SchedulingResponseDTO]
+    failed: list[PackageLessonFailureDTO]
+
+
 @dataclass
 class CancellationResultDTO:
     """DTO de resultado de cancelamento com informações de reembolso."""
@@ -164,6 +219,20 @@ class CancellationResultDTO:
     cancelled_at: datetime
 
 
+@dataclass
+class SlotHoldResponseDTO:
+    """DTO de resposta para horário reservado no carrinho."""
+
+    hold_id: str
+    instructor_id: UUID
+    scheduled_datetime: datetime
+    duration_minutes: int
+    lesson_category: str
+    vehicle_ownership: str
+    price: Decimal
+    expires_at: datetime
+
+
 @dataclass
 class SchedulingListResponseDTO:
     """DTO de resposta para lista paginada de agendamentos."""
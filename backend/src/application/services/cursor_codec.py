@@ -0,0 +1,119 @@
+"""
+Cursor Codec
+
+Codificação de cursores opacos para paginação keyset.
+
+O cursor é o JSON compacto da posição (chaves de ordenação da última linha
+da página) em base64 url-safe. Não é assinado: adulterá-lo só altera o ponto
+de partida da própria busca do cliente.
+"""
+
+import base64
+import binascii
+import hashlib
+import json
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from src.domain.entities.search_position import ListPosition
+from src.domain.exceptions import InvalidCursorException
+
+
+def encode_cursor(payload: dict[str, Any]) -> str:
+    """
+    Codifica a posição de paginação em um cursor opaco.
+
+    Args:
+        payload: Dicionário JSON-serializável com a posição.
+
+    Returns:
+        Cursor em base64 url-safe (sem padding).
+    """
+    raw = json.dumps(payload, separators=(",", ":"), default=str).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> dict[str, Any]:
+    """
+    Decodifica um cursor opaco.
+
+    Args:
+        cursor: Cursor recebido do cliente.
+
+    Returns:
+        Dicionário com a posição.
+
+    Raises:
+        InvalidCursorException: Se o cursor estiver malformado.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidCursorException("formato inválido") from e
+
+    if not isinstance(payload, dict):
+        raise InvalidCursorException("formato inválido")
+    return payload
+
+
+def cursor_scope(*params: Any) -> str:
+    """
+    Identifica uma listagem (dono e filtros) para rejeitar cursores de outra.
+
+    Args:
+        params: Valores que definem a listagem.
+
+    Returns:
+        Hash curto dos parâmetros.
+    """
+    return hashlib.sha256(json.dumps(params, default=str).encode()).hexdigest()[:16]
+
+
+def encode_list_position(position: ListPosition, scope: str) -> str:
+    """
+    Codifica a posição da última linha de uma listagem por data.
+
+    Args:
+        position: Posição (instante, id) da última linha da página.
+        scope: Resultado de cursor_scope() para a listagem.
+
+    Returns:
+        Cursor opaco.
+    """
+    return encode_cursor({
+        "k": scope,
+        "at": position.at.isoformat(),
+        "id": str(position.id),
+        "n": position.ordinal,
+    })
+
+
+def decode_list_position(cursor: str, scope: str) -> ListPosition:
+    """
+    Restaura a posição de uma listagem por data a partir do cursor.
+
+    Args:
+        cursor: Cursor recebido do cliente.
+        scope: Resultado de cursor_scope() para a listagem atual.
+
+    Returns:
+        ListPosition: Posição a partir da qual a página começa.
+
+    Raises:
+        InvalidCursorException: Se o cursor estiver malformado ou pertencer
+            a outra listagem.
+    """
+    payload = decode_cursor(cursor)
+    if payload.get("k") != scope:
+        raise InvalidCursorException("cursor pertence a outra listagem")
+
+    try:
+        return ListPosition(
+            at=datetime.fromisoformat(payload["at"]),
+            id=UUID(payload["id"]),
+            ordinal=int(payload["n"]) if payload.get("n") is not None else None,
+        )
+    except (KeyError, TypeError, ValueError) as e:
+        raise InvalidCursorException("posição inválida") from e
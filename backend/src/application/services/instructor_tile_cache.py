@@ -0,0 +1,444 @@
+"""
+Instructor Tile Cache
+
+Cache de candidatos da busca de instrutores por tile geográfico.
+
+Em vez de guardar o resultado final de cada busca (chave com lat/lon exatos,
+que quase nunca se repete), guarda o conjunto de instrutores candidatos de um
+tile do grid para um "balde" de raio. Distâncias exatas, filtros e ordenação
+são aplicados em memória no momento da requisição, de modo que todos os alunos
+dentro do mesmo tile compartilham a mesma entrada.
+"""
+
+import json
+import math
+from dataclasses import asdict, dataclass
+from decimal import Decimal
+from typing import Protocol
+from uuid import UUID
+
+import numpy as np
+import structlog
+
+from src.application.dtos.profile_dtos import InstructorProfileResponseDTO, LocationResponseDTO
+from src.domain.entities.instructor_profile import InstructorProfile
+from src.domain.entities.instructor_search_entry import InstructorSearchEntry
+from src.domain.entities.location import EARTH_RADIUS_KM, Location, haversine_km
+from src.domain.interfaces.instructor_repository import IInstructorRepository
+from src.domain.interfaces.instructor_search_index_repository import (
+    IInstructorSearchIndexRepository,
+)
+from src.infrastructure.repositories.search_filters import normalize_gender
+from src.infrastructure.services.pricing_service import PricingService
+
+logger = structlog.get_logger()
+
+# Baldes de raio (km). Buscas com raio maior que o último não usam o cache.
+RADIUS_BUCKETS_KM = (5.0, 10.0, 25.0, 50.0)
+
+# km por grau de latitude (mesmo raio terrestre de Location.distance_to)
+KM_PER_DEGREE = EARTH_RADIUS_KM * math.pi / 180
+
+# Folga entre a distância geodésica do PostGIS e a de Haversine
+DISTANCE_MARGIN = 1.01
+
+TILE_KEY_PREFIX = "instructors:tile"
+
+
+class ICacheService(Protocol):
+    """Interface para serviço de cache."""
+
+    async def get(self, key: str) -> str | None:
+        """Obtém valor do cache."""
+        ...
+
+    async def set(self, key: str, value: str, ttl_seconds: int = 60) -> None:
+        """Define valor no cache."""
+        ...
+
+    async def delete(self, key: str) -> None:
+        """Remove valor do cache."""
+        ...
+
+    async def delete_many(self, keys: list[str]) -> int:
+        """Remove várias chaves do cache em uma única operação."""
+        ...
+
+    async def delete_pattern(self, pattern: str) -> int:
+        """Remove todas as chaves que correspondem ao padrão."""
+        ...
+
+
+def radius_bucket(radius_km: float) -> float | None:
+    """Retorna o menor balde que cobre o raio, ou None se exceder o maior."""
+    for bucket in RADIUS_BUCKETS_KM:
+        if radius_km <= bucket:
+            return bucket
+    return None
+
+
+def tile_size_deg(bucket_km: float) -> float:
+    """Lado do tile em graus: metade do raio do balde."""
+    return (bucket_km / 2) / KM_PER_DEGREE
+
+
+def tile_half_diagonal_km(bucket_km: float) -> float:
+    """Distância máxima entre qualquer ponto do tile e o seu centro."""
+    return math.sqrt(2) * (bucket_km / 2) / 2
+
+
+def tile_reach_km(bucket_km: float) -> float:
+    """Raio usado para buscar os candidatos de um tile a partir do seu centro."""
+    return (bucket_km + tile_half_diagonal_km(bucket_km)) * DISTANCE_MARGIN
+
+
+def tile_index(location: Location, bucket_km: float) -> tuple[int, int]:
+    """Índice (linha, coluna) do tile que contém a localização."""
+    size = tile_size_deg(bucket_km)
+    return math.floor(location.latitude / size), math.floor(location.longitude / size)
+
+
+def tile_center(index: tuple[int, int], bucket_km: float) -> Location:
+    """Centro geográfico de um tile."""
+    size = tile_size_deg(bucket_km)
+    return Location(
+        latitude=max(-90.0, min(90.0, (index[0] + 0.5) * size)),
+        longitude=max(-180.0, min(180.0, (index[1] + 0.5) * size)),
+    )
+
+
+def tile_key(index: tuple[int, int], bucket_km: float) -> str:
+    """Chave de cache de um tile para um balde de raio."""
+    return f"{TILE_KEY_PREFIX}:{bucket_km:g}:{index[0]}:{index[1]}"
+
+
+def tiles_reaching(location: Location, bucket_km: float) -> list[tuple[int, int]]:
+    """
+    Tiles cujo conjunto de candidatos pode conter um instrutor na localização.
+
+    Um tile busca candidatos até tile_reach_km a partir do seu centro, então
+    qualquer tile com centro dentro desse alcance precisa ser invalidado.
+    """
+    size = tile_size_deg(bucket_km)
+    reach_km = tile_reach_km(bucket_km)
+    lat_delta = reach_km / KM_PER_DEGREE
+    cos_lat = max(math.cos(math.radians(location.latitude)), 0.01)
+    lon_delta = reach_km / (KM_PER_DEGREE * cos_lat)
+
+    return [
+        (row, col)
+        for row in range(
+            math.floor((location.latitude - lat_delta) / size),
+            math.floor((location.latitude + lat_delta) / size) + 1,
+        )
+        for col in range(
+            math.floor((location.longitude - lon_delta) / size),
+            math.floor((location.longitude + lon_delta) / size) + 1,
+        )
+    ]
+
+
+def _format_name(full_name: str | None) -> str:
+    """Exibe apenas primeiro e último nome do instrutor."""
+    if not full_name:
+        return "Instrutor"
+    parts = full_name.split()
+    if len(parts) >= 2:
+        return f"{parts[0]} {parts[-1]}"
+    return full_name
+
+
+def _decimal_or_none(value: str | None) -> Decimal | None:
+    return Decimal(value) if value else None
+
+
+@dataclass
+class TileCandidate:
+    """Instrutor candidato armazenado em um tile (preços já finais para o aluno)."""
+
+    id: str
+    user_id: str
+    city: str | None
+    vehicle_type: str
+    license_category: str
+    hourly_rate: str
+    rating: float
+    total_reviews: int
+    is_available: bool
+    full_name: str | None
+    biological_sex: str | None
+    latitude: float | None
+    longitude: float | None
+    has_mp_account: bool = False
+    price_cat_a_instructor_vehicle: str | None = None
+    price_cat_a_student_vehicle: str | None = None
+    price_cat_b_instructor_vehicle: str | None = None
+    price_cat_b_student_vehicle: str | None = None
+
+    @classmethod
+    def from_profile(cls, profile: InstructorProfile) -> "TileCandidate":
+        """Cria candidato a partir do perfil retornado pelo repositório."""
+        final_prices = PricingService.final_prices(profile)
+
+        def final_price(field: str) -> str | None:
+            return str(final_prices[field]) if getattr(profile, field) else None
+
+        return cls(
+            id=str(profile.id),
+            user_id=str(profile.user_id),
+            city=profile.city,
+            vehicle_type=profile.vehicle_type,
+            license_category=profile.license_category,
+            hourly_rate=str(final_prices["hourly_rate"]),
+            rating=profile.rating,
+            total_reviews=profile.total_reviews,
+            is_available=profile.is_available,
+            full_name=profile.full_name,
+            biological_sex=profile.biological_sex,
+            latitude=profile.location.latitude if profile.location else None,
+            longitude=profile.location.longitude if profile.location else None,
+            has_mp_account=profile.has_mp_account,
+            price_cat_a_instructor_vehicle=final_price("price_cat_a_instructor_vehicle"),
+            price_cat_a_student_vehicle=final_price("price_cat_a_student_vehicle"),
+            price_cat_b_instructor_vehicle=final_price("price_cat_b_instructor_vehicle"),
+            price_cat_b_student_vehicle=final_price("price_cat_b_student_vehicle"),
+        )
+
+    @classmethod
+    def from_search_entry(cls, entry: InstructorSearchEntry) -> "TileCandidate":
+        """Cria candidato a partir da projeção de busca (preços já finais)."""
+
+        def price(value: Decimal | None) -> str | None:
+            return str(value) if value else None
+
+        return cls(
+            id=str(entry.profile_id),
+            user_id=str(entry.user_id),
+            city=entry.city,
+            vehicle_type=entry.vehicle_type,
+            license_category=entry.license_category,
+            hourly_rate=str(entry.hourly_rate),
+            rating=entry.rating,
+            total_reviews=entry.total_reviews,
+            is_available=entry.is_available,
+            full_name=entry.display_name,
+            biological_sex=entry.biological_sex,
+            latitude=entry.location.latitude if entry.location else None,
+            longitude=entry.location.longitude if entry.location else None,
+            has_mp_account=entry.has_mp_account,
+            price_cat_a_instructor_vehicle=price(entry.price_cat_a_instructor_vehicle),
+            price_cat_a_student_vehicle=price(entry.price_cat_a_student_vehicle),
+            price_cat_b_instructor_vehicle=price(entry.price_cat_b_instructor_vehicle),
+            price_cat_b_student_vehicle=price(entry.price_cat_b_student_vehicle),
+        )
+
+    def to_response(self, distance: float | None) -> InstructorProfileResponseDTO:
+        """Monta o DTO de resposta da busca (preços já finais para o aluno)."""
+        location_dto = None
+        if self.latitude is not None and self.longitude is not None:
+            location_dto = LocationResponseDTO(
+                latitude=self.latitude,
+                longitude=self.longitude,
+            )
+
+        return InstructorProfileResponseDTO(
+            id=UUID(self.id),
+            user_id=UUID(self.user_id),
+            bio="",
+            city=self.city,
+            vehicle_type=self.vehicle_type,
+            license_category=self.license_category,
+            hourly_rate=Decimal(self.hourly_rate),
+            rating=self.rating,
+            total_reviews=self.total_reviews,
+            is_available=self.is_available,
+            full_name=_format_name(self.full_name),
+            location=location_dto,
+            distance_km=round(distance, 2) if distance is not None else None,
+            has_mp_account=self.has_mp_account,
+            price_cat_a_instructor_vehicle=_decimal_or_none(self.price_cat_a_instructor_vehicle),
+            price_cat_a_student_vehicle=_decimal_or_none(self.price_cat_a_student_vehicle),
+            price_cat_b_instructor_vehicle=_decimal_or_none(self.price_cat_b_instructor_vehicle),
+            price_cat_b_student_vehicle=_decimal_or_none(self.price_cat_b_student_vehicle),
+        )
+
+
+def select_candidates(
+    candidates: list[TileCandidate],
+    center: Location,
+    radius_km: float,
+    biological_sex: str | None = None,
+    license_category: str | None = None,
+    limit: int = 50,
+) -> list[tuple[TileCandidate, float | None]]:
+    """
+    Aplica em memória os filtros e a ordenação de search_by_location (sem
+    busca textual, que é sempre feita no banco).
+
+    Returns:
+        Pares (candidato, distância em km) — localizados por distância e,
+        em seguida, os sem localização por rating.
+    """
+    normalized_sex = normalize_gender(biological_sex) if biological_sex else None
+
+    located: list[TileCandidate] = []
+    unlocated: list[TileCandidate] = []
+
+    for candidate in candidates:
+        if normalized_sex and candidate.biological_sex != normalized_sex:
+            continue
+        if license_category and candidate.license_category != license_category:
+            continue
+
+        if candidate.latitude is None or candidate.longitude is None:
+            unlocated.append(candidate)
+        else:
+            located.append(candidate)
+
+    # Distâncias de todos os localizados em uma única passada
+    distances = haversine_km(
+        center.latitude,
+        center.longitude,
+        np.fromiter((c.latitude for c in located), dtype=float, count=len(located)),
+        np.fromiter((c.longitude for c in located), dtype=float, count=len(located)),
+    )
+    within = np.flatnonzero(distances <= radius_km)
+    order = within[np.argsort(distances[within], kind="stable")][:limit]
+
+    unlocated.sort(key=lambda c: c.rating, reverse=True)
+
+    selected: list[tuple[TileCandidate, float | None]] = [
+        (located[i], float(distances[i])) for i in order
+    ]
+    selected.extend((c, None) for c in unlocated[: limit - len(selected)])
+    return selected
+
+
+@dataclass
+class InstructorTileCache:
+    """
+    Cache de candidatos por tile + balde de raio.
+
+    Cada entrada contém todos os instrutores disponíveis a até tile_reach_km
+    do centro do tile, mais os instrutores sem localização. Isso é um superconjunto do resultado de qualquer busca com
+    centro dentro do tile e raio <= balde. Entradas que atingem max_candidates
+    são consideradas truncadas e não são usadas (a busca vai direto ao banco).
+
+    Com search_index_repository, os tiles são preenchidos a partir da
+    projeção de busca em vez das tabelas de perfil e usuário.
+    """
+
+    cache_service: ICacheService
+    instructor_repository: IInstructorRepository | None = None
+    search_index_repository: IInstructorSearchIndexRepository | None = None
+    ttl_seconds: int = 120
+    max_candidates: int = 500
+
+    async def get_candidates(
+        self, center: Location, radius_km: float
+    ) -> list[TileCandidate] | None:
+        """
+        Obtém os candidatos do tile que contém o centro (read-through).
+
+        Returns:
+            Lista de candidatos, ou None se a busca não puder ser servida pelo
+            cache (raio acima do maior balde ou tile denso demais).
+        """
+        bucket = radius_bucket(radius_km)
+        if bucket is None:
+            return None
+
+        index = tile_index(center, bucket)
+        key = tile_key(index, bucket)
+
+        cached = await self.cache_service.get(key)
+        if cached is not None:
+            payload = json.loads(cached)
+            if not payload["complete"]:
+                return None
+            return [TileCandidate(**item) for item in payload["candidates"]]
+
+        search_kwargs = {
+            "center": tile_center(index, bucket),
+            "radius_km": tile_reach_km(bucket),
+            "only_available": True,
+            "limit": self.max_candidates,
+        }
+        if self.search_index_repository is not None:
+            entries = await self.search_index_repository.search(**search_kwargs)
+            found = [TileCandidate.from_search_entry(e) for e in entries]
+        elif self.instructor_repository is not None:
+            profiles = await self.instructor_repository.search_by_location(**search_kwargs)
+            found = [TileCandidate.from_profile(p) for p in profiles]
+        else:
+            return None
+
+        # Se o limite foi atingido, pode haver candidatos de fora do conjunto
+        complete = len(found) < self.max_candidates
+        candidates = found if complete else []
+
+        await self.cache_service.set(
+            key,
+            json.dumps({
+                "complete": complete,
+                "candidates": [asdict(c) for c in candidates],
+            }),
+            ttl_seconds=self.ttl_seconds,
+        )
+        logger.debug("instructor_tile_filled", key=key, candidates=len(found))
+        return candidates if complete else None
+
+    async def invalidate_instructor(
+        self,
+        user_id: UUID,
+        location: Location | None,
+        previous_location: Location | None = None,
+    ) -> None:
+        """
+        Invalida os tiles afetados por uma mudança em um instrutor.
+
+        Invalida os tiles ao redor da posição atual e da anterior, lida pela
+        própria escrita (perfis novos informam a posição atual). Instrutores
+        sem localização aparecem em todos os tiles, então, se uma das duas
+        posições é nula, o cache inteiro é invalidado.
+        """
+        if location is None or previous_location is None:
+            await self.invalidate_all()
+            logger.debug("instructor_tiles_invalidated", user_id=str(user_id), tiles="all")
+            return
+
+        keys: set[str] = set()
+        for point in (location, previous_location):
+            for bucket in RADIUS_BUCKETS_KM:
+                keys.update(tile_key(i, bucket) for i in tiles_reaching(point, bucket))
+        await self.cache_service.delete_many(sorted(keys))
+        logger.debug("instructor_tiles_invalidated", user_id=str(user_id), tiles=len(keys))
+
+    async def invalidate_all(self) -> None:
+        """Remove todas as entradas de tiles."""
+        await self.cache_service.delete_pattern(f"{TILE_KEY_PREFIX}:*")
+
+
+@dataclass(frozen=True)
+class TileInvalidation:
+    """
+    Tiles afetados por uma alteração de instrutor, a invalidar após o commit.
+
+    Os casos de uso devolvem a invalidação em vez de aplicá-la: se os tiles
+    fossem limpos antes do commit, uma busca nesse intervalo os preencheria
+    de novo com os dados antigos até o fim do TTL.
+    """
+
+    user_id: UUID
+    location: Location | None
+    previous_location: Location | None = None
+
+    async def apply(self, cache_service: ICacheService | None) -> None:
+        """Invalida os tiles (chamar depois do commit da alteração)."""
+        if cache_service is None:
+            return
+        await InstructorTileCache(cache_service).invalidate_instructor(
+            user_id=self.user_id,
+            location=self.location,
+            previous_location=self.previous_location,
+        )
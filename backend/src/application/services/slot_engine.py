@@ -0,0 +1,233 @@
+"""
+Slot Engine
+
+Gera os horários de aula de um dia (ou de um calendário de vários dias) a
+partir da disponibilidade semanal do instrutor e marca os ocupados em memória.
+
+Os agendamentos do período são carregados com uma única consulta
+(ISchedulingRepository.list_busy_intervals) e cruzados com todos os horários
+por varredura de intervalos: O((n + m) log m) em vez de uma consulta de
+conflito por horário.
+"""
+
+import heapq
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from src.core.helpers.timezone_utils import DEFAULT_TIMEZONE
+from src.domain.entities.availability import Availability
+
+# Intervalo entre o início de horários consecutivos
+SLOT_STEP = timedelta(hours=1)
+
+
+@dataclass(frozen=True)
+class TimeSlot:
+    """Horário de aula gerado (início e fim no timezone local)."""
+
+    start: datetime
+    end: datetime
+    is_available: bool
+
+
+@dataclass(frozen=True)
+class CalendarDay:
+    """
+    Horários de um dia do calendário.
+
+    O bit i de `available_mask` indica se o horário que começa em
+    `start_times[i]` (hora local) está livre.
+    """
+
+    day: date
+    start_times: tuple[time, ...]
+    available_mask: int
+
+
+def local_datetime(day: date, at: time, tz: ZoneInfo = DEFAULT_TIMEZONE) -> datetime:
+    """
+    Data/hora local aware, normalizada para um instante existente.
+
+    Um horário que não existe no dia da mudança para o horário de verão
+    (ex: 00:30 quando o relógio pula de 00:00 para 01:00) é levado para o
+    instante equivalente após o salto.
+    """
+    return datetime.combine(day, at, tzinfo=tz).astimezone(timezone.utc).astimezone(tz)
+
+
+def _utc(value: datetime) -> datetime:
+    return value.astimezone(timezone.utc)
+
+
+def day_bounds(day: date, tz: ZoneInfo = DEFAULT_TIMEZONE) -> tuple[datetime, datetime]:
+    """Início do dia e início do dia seguinte no timezone local (fim exclusivo)."""
+    return local_datetime(day, time.min, tz), local_datetime(day + timedelta(days=1), time.min, tz)
+
+
+def range_bounds(
+    first_day: date,
+    days: int,
+    tz: ZoneInfo = DEFAULT_TIMEZONE,
+) -> tuple[datetime, datetime]:
+    """Início do primeiro dia e fim exclusivo do último dia de um período."""
+    return day_bounds(first_day, tz)[0], day_bounds(first_day + timedelta(days=days - 1), tz)[1]
+
+
+def mark_busy(
+    slots: Sequence[tuple[datetime, datetime]],
+    busy: Sequence[tuple[datetime, datetime]],
+) -> list[bool]:
+    """
+    Indica, para cada horário, se ele se sobrepõe a algum intervalo ocupado.
+
+    Varredura única: os horários são percorridos por início e os intervalos
+    ocupados entram em um heap de términos quando começam antes do fim do
+    horário e saem quando terminam até o início dele. Requer que o fim dos
+    horários cresça com o início (horários de mesma duração).
+
+    Args:
+        slots: Pares (início, fim) dos horários.
+        busy: Pares (início, fim) dos intervalos ocupados.
+
+    Returns:
+        Lista na ordem de `slots`: True se o horário está ocupado.
+    """
+    # Comparações em UTC: datetimes com o mesmo tzinfo são comparados pelo
+    # horário de parede, o que erra na hora repetida do fim do horário de verão
+    pending = sorted((_utc(start), _utc(end)) for start, end in busy)
+    utc_slots = [(_utc(start), _utc(end)) for start, end in slots]
+    active_ends: list[datetime] = []
+    next_busy = 0
+    result = [False] * len(slots)
+
+    for index in sorted(range(len(utc_slots)), key=lambda i: utc_slots[i][0]):
+        slot_start, slot_end = utc_slots[index]
+        while next_busy < len(pending) and pending[next_busy][0] < slot_end:
+            heapq.heappush(active_ends, pending[next_busy][1])
+            next_busy += 1
+        while active_ends and active_ends[0] <= slot_start:
+            heapq.heappop(active_ends)
+        result[index] = bool(active_ends)
+
+    return result
+
+
+def slot_bounds(
+    day: date,
+    availabilities: Sequence[Availability],
+    duration_minutes: int,
+    tz: ZoneInfo = DEFAULT_TIMEZONE,
+) -> list[tuple[datetime, datetime]]:
+    """
+    Gera os pares (início, fim) dos horários de um dia.
+
+    Para cada período de disponibilidade, gera horários de hora em hora a
+    partir do início enquanto a aula couber até o fim do período.
+    """
+    duration = timedelta(minutes=duration_minutes)
+    bounds: list[tuple[datetime, datetime]] = []
+
+    for availability in availabilities:
+        period_end = local_datetime(day, availability.end_time, tz)
+        wall_start = datetime.combine(day, availability.start_time)
+        while True:
+            start = local_datetime(wall_start.date(), wall_start.time(), tz)
+            # Duração absoluta (em UTC): correta também na troca de horário
+            end = (start.astimezone(timezone.utc) + duration).astimezone(tz)
+            if wall_start.date() != day or end > period_end:
+                break
+            bounds.append((start, end))
+            wall_start += SLOT_STEP
+
+    return bounds
+
+
+def build_day_slots(
+    day: date,
+    availabilities: Sequence[Availability],
+    duration_minutes: int,
+    busy: Sequence[tuple[datetime, datetime]],
+    now: datetime,
+    tz: ZoneInfo = DEFAULT_TIMEZONE,
+) -> list[TimeSlot]:
+    """
+    Gera os horários do dia e marca os livres.
+
+    Um horário está livre se não começou até `now` e não se sobrepõe a
+    nenhum intervalo ocupado.
+
+    Args:
+        day: Data consultada.
+        availabilities: Períodos de disponibilidade do dia da semana.
+        duration_minutes: Duração da aula.
+        busy: Intervalos ocupados (início, fim) que podem tocar o dia.
+        now: Instante atual (aware).
+        tz: Timezone local dos horários.
+
+    Returns:
+        Horários na ordem dos períodos de disponibilidade.
+    """
+    now = _utc(now)
+    bounds = slot_bounds(day, availabilities, duration_minutes, tz)
+    occupied = mark_busy(bounds, busy)
+    return [
+        TimeSlot(start=start, end=end, is_available=_utc(start) > now and not taken)
+        for (start, end), taken in zip(bounds, occupied, strict=True)
+    ]
+
+
+def build_calendar(
+    first_day: date,
+    days: int,
+    availabilities: Sequence[Availability],
+    duration_minutes: int,
+    busy: Sequence[tuple[datetime, datetime]],
+    now: datetime,
+    tz: ZoneInfo = DEFAULT_TIMEZONE,
+) -> list[CalendarDay]:
+    """
+    Gera o calendário de horários de vários dias.
+
+    Os horários de todos os dias são cruzados com os intervalos ocupados em
+    uma única varredura.
+
+    Args:
+        first_day: Primeiro dia do calendário.
+        days: Quantidade de dias.
+        availabilities: Disponibilidade semanal (todos os dias da semana).
+        duration_minutes: Duração da aula.
+        busy: Intervalos ocupados (início, fim) que podem tocar o período.
+        now: Instante atual (aware).
+        tz: Timezone local dos horários.
+
+    Returns:
+        Um CalendarDay por dia, em ordem.
+    """
+    now = _utc(now)
+    by_weekday: dict[int, list[Availability]] = {}
+    for availability in sorted(availabilities, key=lambda a: a.start_time):
+        by_weekday.setdefault(availability.day_of_week, []).append(availability)
+
+    calendar_days = [first_day + timedelta(days=offset) for offset in range(days)]
+    per_day = [
+        slot_bounds(day, by_weekday.get(day.weekday(), []), duration_minutes, tz)
+        for day in calendar_days
+    ]
+    occupied = iter(mark_busy([bounds for slots in per_day for bounds in slots], busy))
+
+    result: list[CalendarDay] = []
+    for day, bounds in zip(calendar_days, per_day, strict=True):
+        mask = 0
+        for index, (start, _) in enumerate(bounds):
+            if not next(occupied) and _utc(start) > now:
+                mask |= 1 << index
+        result.append(
+            CalendarDay(
+                day=day,
+                start_times=tuple(start.time() for start, _ in bounds),
+                available_mask=mask,
+            )
+        )
+    return result
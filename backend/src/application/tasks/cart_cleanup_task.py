@@ -39,49 +39,28 @@ async def cleanup_expired_cart_items(session_factory: async_sessionmaker) -> int
     async with session_factory() as session:
         try:
             repo = SchedulingRepositoryImpl(session)
-            expired_items = await repo.get_expired_cart_items(
-                timeout_minutes=CART_TIMEOUT_MINUTES
-            )
-
-            if not expired_items:
-                return 0
-
-            logger.info(
-                "cart_cleanup_found_expired",
-                count=len(expired_items),
+            # Um único UPDATE ... RETURNING com as regras de expiração no WHERE
+            cancelled = await repo.cancel_expired_cart_items(
+                reason=f"Carrinho expirado (timeout de {CART_TIMEOUT_MINUTES} minutos)",
                 timeout_minutes=CART_TIMEOUT_MINUTES,
             )
-
-            for scheduling in expired_items:
-                try:
-                    # Usar student_id como cancelled_by para respeitar FK em users.id
-                    scheduling.cancel(
-                        cancelled_by=scheduling.student_id,
-                        reason=f"Carrinho expirado (timeout de {CART_TIMEOUT_MINUTES} minutos)",
-                    )
-                    await repo.update(scheduling)
-                    cancelled_count += 1
-
-                    logger.info(
-                        "cart_item_expired_cancelled",
-                        scheduling_id=str(scheduling.id),
-                        student_id=str(scheduling.student_id),
-                        instructor_id=str(scheduling.instructor_id),
-                        created_at=str(scheduling.created_at),
-                    )
-                except Exception as e:
-                    logger.error(
-                        "cart_cleanup_item_error",
-                        scheduling_id=str(scheduling.id),
-                        error=str(e),
-                    )
-
             await session.commit()
-
-            logger.info(
-                "cart_cleanup_completed",
-                cancelled_count=cancelled_count,
-            )
+            cancelled_count = len(cancelled)
+
+            for scheduling in cancelled:
+                logger.info(
+                    "cart_item_expired_cancelled",
+                    scheduling_id=str(scheduling.id),
+                    student_id=str(scheduling.student_id),
+                    instructor_id=str(scheduling.instructor_id),
+                )
+
+            if cancelled_count:
+                logger.info(
+                    "cart_cleanup_completed",
+                    cancelled_count=cancelled_count,
+                    timeout_minutes=CART_TIMEOUT_MINUTES,
+                )
         except Exception as e:
             await session.rollback()
             logger.error("cart_cleanup_error", error=str(e))
@@ -9,6 +9,12 @@ from src.application.dtos.admin_scheduling_dtos import (
     SchedulingAdminResponseDTO,
     SchedulingListResponseDTO,
 )
+from src.application.services.cursor_codec import (
+    cursor_scope,
+    decode_list_position,
+    encode_list_position,
+)
+from src.domain.entities.search_position import ListPosition
 from src.domain.interfaces.scheduling_repository import ISchedulingRepository
 
 
@@ -19,24 +25,35 @@ class ListAllSchedulingsUseCase:
         self._scheduling_repo = scheduling_repository
 
     async def execute(self, dto: ListAllSchedulingsDTO) -> SchedulingListResponseDTO:
-        """Executa a listagem de agendamentos."""
-        schedulings = await self._scheduling_repo.list_all(
-            status=dto.status,
-            student_id=dto.student_id,
-            instructor_id=dto.instructor_id,
-            date_from=dto.date_from,
-            date_to=dto.date_to,
-            limit=dto.limit,
-            offset=dto.offset,
+        """
+        Executa a listagem de agendamentos.
+
+        Com dto.cursor a página continua do último agendamento da anterior
+        (keyset) e dto.offset é ignorado.
+
+        Raises:
+            InvalidCursorException: Se o cursor for inválido ou de outros filtros.
+        """
+        scope = cursor_scope(
+            "admin_schedulings", dto.status, dto.student_id, dto.instructor_id, dto.date_from, dto.date_to
         )
+        after = decode_list_position(dto.cursor, scope) if dto.cursor else None
+        offset = (after.ordinal or 0) if after else dto.offset
 
-        total_count = await self._scheduling_repo.count_all(
+        # Um item extra indica se existe próxima página; o total vem na mesma
+        # consulta (estimado quando não há filtros)
+        schedulings, total_count = await self._scheduling_repo.page_all(
             status=dto.status,
             student_id=dto.student_id,
             instructor_id=dto.instructor_id,
             date_from=dto.date_from,
             date_to=dto.date_to,
+            limit=dto.limit + 1,
+            offset=0 if after else offset,
+            after=after,
         )
+        has_more = len(schedulings) > dto.limit
+        schedulings = schedulings[: dto.limit]
 
         scheduling_dtos = [
             SchedulingAdminResponseDTO(
@@ -66,10 +83,18 @@ class ListAllSchedulingsUseCase:
             for s in schedulings
         ]
 
+        next_cursor = None
+        if has_more:
+            last = schedulings[-1]
+            next_cursor = encode_list_position(
+                ListPosition(last.scheduled_datetime, last.id, ordinal=offset + dto.limit), scope
+            )
+
         return SchedulingListResponseDTO(
             schedulings=scheduling_dtos,
             total_count=total_count,
             limit=dto.limit,
-            offset=dto.offset,
-            has_more=(dto.offset + dto.limit) < total_count,
+            offset=offset,
+            has_more=has_more,
+            next_cursor=next_cursor,
         )
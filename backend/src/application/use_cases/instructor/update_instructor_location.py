@@ -7,12 +7,15 @@ Caso de uso otimizado para atualização frequente de localização.
 from dataclasses import dataclass
 
 from src.application.dtos.profile_dtos import UpdateLocationDTO
+from src.application.services.instructor_tile_cache import TileInvalidation
 from src.domain.entities.location import Location
 from src.domain.exceptions import (
     InstructorNotFoundException,
     InvalidLocationException,
 )
 from src.domain.interfaces.instructor_repository import IInstructorRepository
+from src.domain.interfaces.location_service import ILocationService
+from src.domain.interfaces.location_write_buffer import ILocationWriteBuffer
 
 
 @dataclass
@@ -25,13 +28,18 @@ class UpdateInstructorLocationUseCase:
 
     Fluxo:
         1. Validar coordenadas
-        2. Atualizar localização diretamente no banco
-        3. Invalidar cache se necessário
+        2. Resolver a cidade (geocodificação reversa offline)
+        3. Acumular no buffer de escrita, se habilitado; senão (ou se o buffer
+           recusar) atualizar localização diretamente no banco
+        4. Devolver os tiles da busca a invalidar após o commit (no modo
+           buffer, o flusher invalida após gravar o lote)
     """
 
     instructor_repository: IInstructorRepository
+    location_service: ILocationService | None = None
+    location_buffer: ILocationWriteBuffer | None = None
 
-    async def execute(self, dto: UpdateLocationDTO) -> bool:
+    async def execute(self, dto: UpdateLocationDTO) -> TileInvalidation | None:
         """
         Atualiza a localização do instrutor.
 
@@ -39,7 +47,9 @@ class UpdateInstructorLocationUseCase:
             dto: Dados da nova localização.
 
         Returns:
-            True se atualizado com sucesso.
+            Tiles a invalidar após o commit, se gravado diretamente no banco;
+            None se a posição foi aceita pelo buffer e será gravada no
+            próximo flush.
 
         Raises:
             InvalidLocationException: Se coordenadas forem inválidas.
@@ -51,13 +61,32 @@ class UpdateInstructorLocationUseCase:
         except ValueError as e:
             raise InvalidLocationException(str(e)) from e
 
+        # Cidade da nova posição (mantida se não puder ser resolvida)
+        city = None
+        if self.location_service:
+            city = await self.location_service.get_city_name(location)
+
+        # Modo buffer: a posição mais recente é gravada em lote pelo flusher.
+        # Perfis inexistentes são ignorados no flush.
+        if self.location_buffer and await self.location_buffer.enqueue(
+            user_id=dto.user_id,
+            location=location,
+            city=city,
+        ):
+            return None
+
         # Atualizar localização (operação otimizada)
-        updated = await self.instructor_repository.update_location(
+        updated, previous_location = await self.instructor_repository.update_location(
             user_id=dto.user_id,
             location=location,
+            city=city,
         )
 
         if not updated:
             raise InstructorNotFoundException(str(dto.user_id))
 
-        return True
+        return TileInvalidation(
+            user_id=dto.user_id,
+            location=location,
+            previous_location=previous_location,
+        )
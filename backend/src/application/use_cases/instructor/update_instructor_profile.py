@@ -12,6 +12,7 @@ from src.application.dtos.profile_dtos import (
     LocationResponseDTO,
     UpdateInstructorProfileDTO,
 )
+from src.application.services.instructor_tile_cache import TileInvalidation
 from src.domain.entities.instructor_profile import InstructorProfile
 from src.domain.entities.location import Location
 from src.domain.entities.user_type import UserType
@@ -30,13 +31,16 @@ class UpdateInstructorProfileUseCase:
         2. Buscar perfil existente ou criar novo
         3. Atualizar campos fornecidos
         4. Persistir alterações
-        5. Retornar perfil atualizado
+        5. Retornar perfil atualizado e os tiles da busca a invalidar após
+           o commit (preços, disponibilidade, nome e posição alimentam a busca)
     """
 
     user_repository: IUserRepository
     instructor_repository: IInstructorRepository
 
-    async def execute(self, dto: UpdateInstructorProfileDTO) -> InstructorProfileResponseDTO:
+    async def execute(
+        self, dto: UpdateInstructorProfileDTO
+    ) -> tuple[InstructorProfileResponseDTO, TileInvalidation]:
         """
         Executa a criação ou atualização do perfil.
 
@@ -44,7 +48,7 @@ class UpdateInstructorProfileUseCase:
             dto: Dados do perfil a atualizar.
 
         Returns:
-            InstructorProfileResponseDTO: Perfil atualizado.
+            Perfil atualizado e os tiles a invalidar após o commit.
 
         Raises:
             UserNotFoundException: Se usuário não existir.
@@ -64,9 +68,11 @@ class UpdateInstructorProfileUseCase:
         # Buscar perfil existente ou criar novo
         profile = await self.instructor_repository.get_by_user_id(dto.user_id)
 
-        if profile is None:
+        is_new = profile is None
+        if is_new:
             # Criar novo perfil
             profile = InstructorProfile(user_id=dto.user_id)
+        previous_location = profile.location
 
         # Atualizar campos fornecidos
         if dto.bio is not None or dto.vehicle_type is not None or \
@@ -135,7 +141,7 @@ class UpdateInstructorProfileUseCase:
                 longitude=saved_profile.location.longitude,
             )
 
-        return InstructorProfileResponseDTO(
+        response = InstructorProfileResponseDTO(
             id=saved_profile.id,
             user_id=saved_profile.user_id,
             bio=saved_profile.bio,
@@ -158,3 +164,11 @@ class UpdateInstructorProfileUseCase:
             price_cat_b_instructor_vehicle=saved_profile.price_cat_b_instructor_vehicle,
             price_cat_b_student_vehicle=saved_profile.price_cat_b_student_vehicle,
         )
+
+        # Perfil novo ainda não aparecia em nenhum tile: só os da posição atual
+        invalidation = TileInvalidation(
+            user_id=dto.user_id,
+            location=profile.location,
+            previous_location=profile.location if is_new else previous_location,
+        )
+        return response, invalidation
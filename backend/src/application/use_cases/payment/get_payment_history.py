@@ -11,6 +11,12 @@ from src.application.dtos.payment_dtos import (
     PaymentHistoryResponseDTO,
     PaymentResponseDTO,
 )
+from src.application.services.cursor_codec import (
+    cursor_scope,
+    decode_list_position,
+    encode_list_position,
+)
+from src.domain.entities.search_position import ListPosition
 from src.domain.entities.user_type import UserType
 from src.domain.exceptions import UserNotFoundException
 from src.domain.interfaces.payment_repository import IPaymentRepository
@@ -46,27 +52,38 @@ class GetPaymentHistoryUseCase:
 
         Raises:
             UserNotFoundException: Se usuário não existir.
+            InvalidCursorException: Se o cursor for inválido ou de outro usuário.
         """
         # 1. Buscar usuário e determinar tipo
         user = await self.user_repository.get_by_id(dto.user_id)
         if user is None:
             raise UserNotFoundException(str(dto.user_id))
 
-        # 2. Buscar pagamentos baseado no tipo de usuário
+        # 2. Buscar pagamentos baseado no tipo de usuário (com cursor, a
+        # página continua do último pagamento da anterior e offset é ignorado)
+        scope = cursor_scope("payment_history", dto.user_id)
+        after = decode_list_position(dto.cursor, scope) if dto.cursor else None
+        offset = 0 if after else dto.offset
+
+        # Um item extra indica se existe próxima página
         if user.user_type == UserType.STUDENT:
             payments = await self.payment_repository.list_by_student(
                 student_id=dto.user_id,
-                limit=dto.limit,
-                offset=dto.offset,
+                limit=dto.limit + 1,
+                offset=offset,
+                after=after,
             )
             total_count = await self.payment_repository.count_by_student(dto.user_id)
         else:
             payments = await self.payment_repository.list_by_instructor(
                 instructor_id=dto.user_id,
-                limit=dto.limit,
-                offset=dto.offset,
+                limit=dto.limit + 1,
+                offset=offset,
+                after=after,
             )
             total_count = await self.payment_repository.count_by_instructor(dto.user_id)
+        has_more = len(payments) > dto.limit
+        payments = payments[: dto.limit]
 
         # 3. Converter para DTOs e enriquecer
         payment_dtos: list[PaymentResponseDTO] = []
@@ -88,7 +105,7 @@ class GetPaymentHistoryUseCase:
                     platform_fee_amount=payment.platform_fee_amount,
                     instructor_amount=payment.instructor_amount,
                     status=payment.status.value,
-                    stripe_payment_intent_id=payment.stripe_payment_intent_id,
+                    gateway_payment_id=payment.gateway_payment_id,
                     refund_amount=payment.refund_amount,
                     refunded_at=payment.refunded_at,
                     created_at=payment.created_at,
@@ -97,10 +114,16 @@ class GetPaymentHistoryUseCase:
             )
 
         # 4. Retornar resultado paginado
+        next_cursor = None
+        if has_more:
+            last = payments[-1]
+            next_cursor = encode_list_position(ListPosition(last.created_at, last.id), scope)
+
         return PaymentHistoryResponseDTO(
             payments=payment_dtos,
             total_count=total_count,
             limit=dto.limit,
-            offset=dto.offset,
-            has_more=(dto.offset + len(payments)) < total_count,
+            offset=offset,
+            has_more=has_more,
+            next_cursor=next_cursor,
         )
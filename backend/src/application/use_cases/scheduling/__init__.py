@@ -4,11 +4,14 @@ Scheduling Use Cases
 Casos de uso relacionados a agendamentos de aulas.
 """
 
+from .book_lesson_package import BookLessonPackageUseCase
 from .cancel_scheduling import CancelSchedulingUseCase
+from .checkout_slot_holds import CheckoutSlotHoldsUseCase
 from .clear_student_cart import ClearStudentCartUseCase
 from .complete_scheduling import CompleteSchedulingUseCase
 from .confirm_scheduling import ConfirmSchedulingUseCase
 from .create_scheduling import CreateSchedulingUseCase
+from .hold_slot import HoldSlotUseCase
 from .list_user_schedulings import ListUserSchedulingsUseCase
 from .manage_availability import ManageAvailabilityUseCase
 from .open_dispute import OpenDisputeUseCase
@@ -21,8 +24,11 @@ from .get_next_student_scheduling_use_case import GetNextStudentSchedulingUseCas
 
 __all__ = [
     "CreateSchedulingUseCase",
+    "BookLessonPackageUseCase",
     "CancelSchedulingUseCase",
     "ClearStudentCartUseCase",
+    "HoldSlotUseCase",
+    "CheckoutSlotHoldsUseCase",
     "ConfirmSchedulingUseCase",
     "CompleteSchedulingUseCase",
     "ListUserSchedulingsUseCase",
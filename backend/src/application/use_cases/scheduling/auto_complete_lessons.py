@@ -24,10 +24,10 @@ class AutoCompleteLessonsUseCase:
         Aulas com status DISPUTED são ignoradas.
 
     Fluxo:
-        1. Buscar agendamentos CONFIRMED cuja aula terminou há > 24h
-        2. Para cada um: auto_complete() (não exige started_at/student_confirmed_at)
-        3. Persistir alterações
-        4. Retornar contagem de aulas auto-completadas
+        1. Concluir, em uma única instrução, os agendamentos CONFIRMED cuja
+           aula terminou há > 24h (a regra de auto_complete() vai no WHERE)
+        2. Registrar as aulas concluídas
+        3. Retornar contagem de aulas auto-completadas
     """
 
     scheduling_repository: ISchedulingRepository
@@ -42,34 +42,19 @@ class AutoCompleteLessonsUseCase:
         Returns:
             Número de aulas auto-completadas.
         """
-        overdue_schedulings = await self.scheduling_repository.get_overdue_confirmed(
+        completed = await self.scheduling_repository.complete_overdue_confirmed(
             hours_threshold=hours_threshold
         )
 
-        if not overdue_schedulings:
+        if not completed:
             logger.info("auto_complete_no_overdue_found")
             return 0
 
-        completed_count = 0
-        for scheduling in overdue_schedulings:
-            try:
-                scheduling.auto_complete()
-                await self.scheduling_repository.update(scheduling)
-                completed_count += 1
-                logger.info(
-                    "auto_complete_lesson_success",
-                    scheduling_id=str(scheduling.id),
-                )
-            except Exception as e:
-                logger.error(
-                    "auto_complete_lesson_error",
-                    scheduling_id=str(scheduling.id),
-                    error=str(e),
-                )
+        for scheduling in completed:
+            logger.info(
+                "auto_complete_lesson_success",
+                scheduling_id=str(scheduling.id),
+            )
 
-        logger.info(
-            "auto_complete_finished",
-            completed=completed_count,
-            total=len(overdue_schedulings),
-        )
-        return completed_count
+        logger.info("auto_complete_finished", completed=len(completed))
+        return len(completed)
@@ -0,0 +1,154 @@
+"""
+Book Lesson Package Use Case
+
+Caso de uso para agendar um pacote de aulas com o mesmo instrutor.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from src.application.dtos.scheduling_dtos import (
+    BookLessonPackageDTO,
+    LessonPackageResultDTO,
+    PackageLessonDTO,
+    PackageLessonFailureDTO,
+)
+from src.application.use_cases.scheduling.create_scheduling import CreateSchedulingUseCase
+from src.domain.entities.scheduling import Scheduling
+from src.infrastructure.services.weekly_availability_cache import WeeklyAvailability
+
+CONFLICT_MESSAGE = "O instrutor já possui um agendamento neste horário"
+
+
+@dataclass
+class BookLessonPackageUseCase:
+    """
+    Caso de uso para agendar várias aulas de uma vez.
+
+    Aluno, carrinho, instrutor, perfil e preço são validados uma vez para o
+    pacote (as mesmas regras de CreateSchedulingUseCase). Os horários são
+    conferidos em memória contra a semana de disponibilidade e os intervalos
+    ocupados do instrutor, lidos em uma consulta cada, e as aulas aceitas são
+    gravadas em um único INSERT. Aulas recusadas são devolvidas em `failed`
+    com o motivo, sem impedir as demais; isso inclui as que um agendamento
+    concorrente ocupou entre a verificação e o INSERT.
+    """
+
+    create_scheduling: CreateSchedulingUseCase
+
+    async def execute(self, dto: BookLessonPackageDTO) -> LessonPackageResultDTO:
+        """
+        Executa o agendamento do pacote.
+
+        Args:
+            dto: Dados do pacote.
+
+        Returns:
+            LessonPackageResultDTO: Aulas criadas e aulas recusadas.
+
+        Raises:
+            As exceções de CreateSchedulingUseCase.load_parties() e
+            resolve_price(), que valem para o pacote inteiro.
+        """
+        booking = self.create_scheduling
+        student, instructor, profile = await booking.load_parties(dto.student_id, dto.instructor_id)
+        category, vehicle, base_price, final_price = booking.resolve_price(
+            profile, dto.lesson_category, dto.vehicle_ownership
+        )
+        if not dto.lessons:
+            return LessonPackageResultDTO(created=[], failed=[])
+
+        lessons = sorted(dto.lessons, key=lambda lesson: self._start(lesson))
+        week = WeeklyAvailability.from_availabilities(
+            dto.instructor_id,
+            0,
+            await booking.availability_repository.list_by_instructor(dto.instructor_id),
+        )
+        busy = await booking.scheduling_repository.list_busy_intervals(
+            dto.instructor_id,
+            self._start(lessons[0]),
+            max(self._end(lesson) for lesson in lessons),
+        )
+
+        accepted: list[tuple[datetime, datetime]] = []
+        schedulings: list[Scheduling] = []
+        failed: list[PackageLessonFailureDTO] = []
+        for lesson in lessons:
+            start, end = self._start(lesson), self._end(lesson)
+            rejection = await self._rejection(dto, lesson, week, busy + accepted)
+            if rejection is not None:
+                reason, message = rejection
+                failed.append(
+                    PackageLessonFailureDTO(
+                        scheduled_datetime=lesson.scheduled_datetime,
+                        duration_minutes=lesson.duration_minutes,
+                        reason=reason,
+                        message=message,
+                    )
+                )
+                continue
+
+            accepted.append((start, end))
+            schedulings.append(
+                Scheduling(
+                    student_id=dto.student_id,
+                    instructor_id=dto.instructor_id,
+                    scheduled_datetime=lesson.scheduled_datetime,
+                    duration_minutes=lesson.duration_minutes,
+                    price=final_price,
+                    lesson_category=category,
+                    vehicle_ownership=vehicle,
+                    applied_base_price=base_price,
+                    applied_final_price=final_price,
+                )
+            )
+
+        created, conflicting = await booking.scheduling_repository.create_many(schedulings)
+        # Horários ocupados por outro agendamento entre a leitura e o INSERT
+        failed.extend(
+            PackageLessonFailureDTO(
+                scheduled_datetime=s.scheduled_datetime,
+                duration_minutes=s.duration_minutes,
+                reason="scheduling_conflict",
+                message=CONFLICT_MESSAGE,
+            )
+            for s in conflicting
+        )
+        return LessonPackageResultDTO(
+            created=[booking.to_response(s, student, instructor) for s in created],
+            failed=failed,
+        )
+
+    async def _rejection(
+        self,
+        dto: BookLessonPackageDTO,
+        lesson: PackageLessonDTO,
+        week: WeeklyAvailability,
+        busy: list[tuple[datetime, datetime]],
+    ) -> tuple[str, str] | None:
+        """Motivo e mensagem da recusa de uma aula, ou None se ela pode ser criada."""
+        start, end = self._start(lesson), self._end(lesson)
+        if not week.covers(start, lesson.duration_minutes):
+            return "unavailable_slot", "O instrutor não tem disponibilidade configurada para este horário"
+        if any(busy_start < end and start < busy_end for busy_start, busy_end in busy):
+            return "scheduling_conflict", CONFLICT_MESSAGE
+        slot_holds = self.create_scheduling.slot_hold_service
+        if slot_holds and await slot_holds.is_held_by_other(
+            instructor_id=dto.instructor_id,
+            student_id=dto.student_id,
+            start=start,
+            end=end,
+        ):
+            return "slot_held", "O horário está reservado no carrinho de outro aluno"
+        return None
+
+    @staticmethod
+    def _start(lesson: PackageLessonDTO) -> datetime:
+        # Datetime naive é tratado como UTC (mesma regra do check_conflict)
+        if lesson.scheduled_datetime.tzinfo is None:
+            return lesson.scheduled_datetime.replace(tzinfo=timezone.utc)
+        return lesson.scheduled_datetime
+
+    @classmethod
+    def _end(cls, lesson: PackageLessonDTO) -> datetime:
+        return cls._start(lesson) + timedelta(minutes=lesson.duration_minutes)
@@ -0,0 +1,76 @@
+"""
+Checkout Slot Holds Use Case
+
+Caso de uso para transformar as reservas do carrinho em agendamentos.
+"""
+
+from dataclasses import dataclass
+from uuid import UUID
+
+import structlog
+
+from src.application.dtos.scheduling_dtos import CreateSchedulingDTO, SchedulingResponseDTO
+from src.application.use_cases.scheduling.create_scheduling import CreateSchedulingUseCase
+from src.domain.entities.slot_hold import SlotHold
+from src.domain.exceptions import SchedulingNotFoundException
+from src.domain.interfaces.slot_hold_service import ISlotHoldService
+
+logger = structlog.get_logger()
+
+
+@dataclass
+class CheckoutSlotHoldsUseCase:
+    """
+    Caso de uso para materializar as reservas do carrinho no checkout.
+
+    Cria um agendamento por reserva válida do aluno, revalidando horário e
+    preço (CreateSchedulingUseCase). As reservas não são liberadas aqui: o
+    chamador chama release() depois do commit, para que o horário nunca fique
+    sem reserva e sem agendamento ao mesmo tempo.
+    """
+
+    create_scheduling: CreateSchedulingUseCase
+    slot_hold_service: ISlotHoldService
+
+    async def execute(self, student_id: UUID) -> tuple[list[SchedulingResponseDTO], list[SlotHold]]:
+        """
+        Cria os agendamentos das reservas do aluno.
+
+        Args:
+            student_id: ID do aluno.
+
+        Returns:
+            Agendamentos criados e reservas materializadas.
+
+        Raises:
+            SchedulingNotFoundException: Se o carrinho não tem reservas válidas.
+            As exceções de CreateSchedulingUseCase (ex: conflito de horário).
+        """
+        holds = await self.slot_hold_service.list_for_student(student_id)
+        if not holds:
+            raise SchedulingNotFoundException("Nenhum horário reservado no carrinho")
+
+        created = []
+        for hold in holds:
+            created.append(
+                await self.create_scheduling.execute(
+                    CreateSchedulingDTO(
+                        student_id=student_id,
+                        instructor_id=hold.instructor_id,
+                        scheduled_datetime=hold.scheduled_datetime,
+                        lesson_category=hold.lesson_category,
+                        vehicle_ownership=hold.vehicle_ownership,
+                        duration_minutes=hold.duration_minutes,
+                    )
+                )
+            )
+        return created, holds
+
+    async def release(self, student_id: UUID, holds: list[SlotHold]) -> None:
+        """Libera as reservas já materializadas (após o commit)."""
+        for hold in holds:
+            try:
+                await self.slot_hold_service.release(student_id, hold.hold_id)
+            except Exception as e:
+                # A reserva expira sozinha; o agendamento já ocupa o horário
+                logger.warning("slot_hold_release_error", hold_id=hold.hold_id, error=str(e))
@@ -5,11 +5,15 @@ Caso de uso para criar um novo agendamento de aula.
 """
 
 from dataclasses import dataclass
+from datetime import timedelta
 from decimal import Decimal
+from uuid import UUID
 
 from src.application.dtos.scheduling_dtos import CreateSchedulingDTO, SchedulingResponseDTO
+from src.domain.entities.instructor_profile import InstructorProfile
 from src.domain.entities.lesson_category import LessonCategory
 from src.domain.entities.scheduling import Scheduling
+from src.domain.entities.user import User
 from src.domain.entities.user_type import UserType
 from src.domain.entities.vehicle_ownership import VehicleOwnership
 from src.domain.exceptions import (
@@ -24,6 +28,7 @@ from src.domain.exceptions import (
 from src.domain.interfaces.availability_repository import IAvailabilityRepository
 from src.domain.interfaces.instructor_repository import IInstructorRepository
 from src.domain.interfaces.scheduling_repository import ISchedulingRepository
+from src.domain.interfaces.slot_hold_service import ISlotHoldService
 from src.domain.interfaces.user_repository import IUserRepository
 from src.infrastructure.services.pricing_service import PricingService
 
@@ -41,12 +46,16 @@ class CreateSchedulingUseCase:
         5. Calcular preço (hourly_rate * duração)
         6. Criar agendamento com status PENDING
         7. Retornar SchedulingResponseDTO
+
+    Com `slot_hold_service`, horários reservados no carrinho de outro aluno
+    também são recusados (passo 4).
     """
 
     user_repository: IUserRepository
     instructor_repository: IInstructorRepository
     scheduling_repository: ISchedulingRepository
     availability_repository: IAvailabilityRepository
+    slot_hold_service: ISlotHoldService | None = None
 
     async def execute(self, dto: CreateSchedulingDTO) -> SchedulingResponseDTO:
         """
@@ -64,53 +73,29 @@ class CreateSchedulingUseCase:
             UnavailableSlotException: Se o horário não estiver na disponibilidade.
             SchedulingConflictException: Se houver conflito de horário.
         """
-        # 1. Validar aluno
-        student = await self.user_repository.get_by_id(dto.student_id)
-        if student is None:
-            raise StudentNotFoundException(str(dto.student_id))
-        if student.user_type != UserType.STUDENT:
-            raise StudentNotFoundException(f"Usuário {dto.student_id} não é um aluno")
-        if not student.is_active:
-            raise StudentNotFoundException("Aluno está inativo")
+        scheduling, student, instructor = await self.prepare(dto)
 
-        # 1.1 Validar se já existe itens no carrinho de outro instrutor
-        # Buscamos itens no carrinho (payment_status_filter="pending")
-        cart_items = await self.scheduling_repository.list_by_student(
-            student_id=dto.student_id,
-            payment_status_filter="pending",
-            limit=1
-        )
-        
-        if cart_items:
-            # Pega o primeiro item (se houver) e verifica o instrutor
-            current_cart_instructor_id = cart_items[0].instructor_id
-            if current_cart_instructor_id != dto.instructor_id:
-                raise MixedInstructorsException(
-                    "Você só pode agendar aulas com um instrutor por vez no carrinho. "
-                    "Esvazie o carrinho ou conclua a compra atual para agendar com outro instrutor."
-                )
+        saved_scheduling = await self.scheduling_repository.create(scheduling)
 
-        # 2. Validar instrutor
-        instructor = await self.user_repository.get_by_id(dto.instructor_id)
-        if instructor is None:
-            raise InstructorNotFoundException(str(dto.instructor_id))
-        if instructor.user_type != UserType.INSTRUCTOR:
-            raise InstructorNotFoundException(
-                f"Usuário {dto.instructor_id} não é um instrutor"
-            )
-        if not instructor.is_active:
-            raise InstructorNotFoundException("Instrutor está inativo")
+        # 7. Retornar resposta
+        return self.to_response(saved_scheduling, student, instructor)
 
-        # Buscar perfil do instrutor para obter hourly_rate
-        instructor_profile = await self.instructor_repository.get_by_user_id(
-            dto.instructor_id
+    async def prepare(self, dto: CreateSchedulingDTO) -> tuple[Scheduling, User, User]:
+        """
+        Valida o pedido e monta o agendamento sem gravá-lo (passos 1 a 5).
+
+        Args:
+            dto: Dados do agendamento.
+
+        Returns:
+            Agendamento não persistido, aluno e instrutor.
+
+        Raises:
+            As mesmas exceções de execute().
+        """
+        student, instructor, instructor_profile = await self.load_parties(
+            dto.student_id, dto.instructor_id
         )
-        if instructor_profile is None:
-            raise InstructorNotFoundException(
-                f"Perfil do instrutor {dto.instructor_id} não encontrado"
-            )
-        if not instructor_profile.is_available:
-            raise UnavailableSlotException("Instrutor não está aceitando novos alunos")
 
         # 3. Verificar disponibilidade configurada
         is_available = await self.availability_repository.is_time_available(
@@ -133,12 +118,20 @@ class CreateSchedulingUseCase:
             raise SchedulingConflictException(
                 "O instrutor já possui um agendamento neste horário"
             )
+        if self.slot_hold_service and await self.slot_hold_service.is_held_by_other(
+            instructor_id=dto.instructor_id,
+            student_id=dto.student_id,
+            start=dto.scheduled_datetime,
+            end=dto.scheduled_datetime + timedelta(minutes=dto.duration_minutes),
+        ):
+            raise SchedulingConflictException(
+                "O horário está reservado no carrinho de outro aluno"
+            )
 
         # 5. Calcular preço com lookup dinâmico
-        category = LessonCategory(dto.lesson_category)
-        vehicle = VehicleOwnership(dto.vehicle_ownership)
-        base_price = self._resolve_base_price(instructor_profile, category, vehicle)
-        final_price = PricingService.calculate_final_price(base_price)
+        category, vehicle, base_price, final_price = self.resolve_price(
+            instructor_profile, dto.lesson_category, dto.vehicle_ownership
+        )
 
         # 6. Criar agendamento com snapshots de preço
         scheduling = Scheduling(
@@ -153,34 +146,128 @@ class CreateSchedulingUseCase:
             applied_final_price=final_price,
         )
 
-        saved_scheduling = await self.scheduling_repository.create(scheduling)
+        return scheduling, student, instructor
 
-        # 7. Retornar resposta
+    async def load_parties(
+        self, student_id: UUID, instructor_id: UUID
+    ) -> tuple[User, User, InstructorProfile]:
+        """
+        Valida aluno, carrinho e instrutor (passos 1 e 2).
+
+        Args:
+            student_id: ID do aluno.
+            instructor_id: ID do instrutor.
+
+        Returns:
+            Aluno, instrutor e perfil do instrutor.
+
+        Raises:
+            StudentNotFoundException: Se aluno não existir ou não for aluno.
+            MixedInstructorsException: Se o carrinho tem aulas de outro instrutor.
+            InstructorNotFoundException: Se instrutor não existir ou não for instrutor.
+            UnavailableSlotException: Se o instrutor não aceita novos alunos.
+        """
+        # 1. Validar aluno
+        student = await self.user_repository.get_by_id(student_id)
+        if student is None:
+            raise StudentNotFoundException(str(student_id))
+        if student.user_type != UserType.STUDENT:
+            raise StudentNotFoundException(f"Usuário {student_id} não é um aluno")
+        if not student.is_active:
+            raise StudentNotFoundException("Aluno está inativo")
+
+        # 1.1 Validar se já existe itens no carrinho de outro instrutor
+        # Buscamos itens no carrinho (payment_status_filter="pending")
+        cart_items = await self.scheduling_repository.list_by_student(
+            student_id=student_id,
+            payment_status_filter="pending",
+            limit=1
+        )
+        
+        if cart_items:
+            # Pega o primeiro item (se houver) e verifica o instrutor
+            current_cart_instructor_id = cart_items[0].instructor_id
+            if current_cart_instructor_id != instructor_id:
+                raise MixedInstructorsException(
+                    "Você só pode agendar aulas com um instrutor por vez no carrinho. "
+                    "Esvazie o carrinho ou conclua a compra atual para agendar com outro instrutor."
+                )
+
+        # 2. Validar instrutor
+        instructor = await self.user_repository.get_by_id(instructor_id)
+        if instructor is None:
+            raise InstructorNotFoundException(str(instructor_id))
+        if instructor.user_type != UserType.INSTRUCTOR:
+            raise InstructorNotFoundException(
+                f"Usuário {instructor_id} não é um instrutor"
+            )
+        if not instructor.is_active:
+            raise InstructorNotFoundException("Instrutor está inativo")
+
+        # Buscar perfil do instrutor para obter hourly_rate
+        instructor_profile = await self.instructor_repository.get_by_user_id(
+            instructor_id
+        )
+        if instructor_profile is None:
+            raise InstructorNotFoundException(
+                f"Perfil do instrutor {instructor_id} não encontrado"
+            )
+        if not instructor_profile.is_available:
+            raise UnavailableSlotException("Instrutor não está aceitando novos alunos")
+
+        return student, instructor, instructor_profile
+
+    @classmethod
+    def resolve_price(
+        cls,
+        profile: InstructorProfile,
+        lesson_category: str,
+        vehicle_ownership: str,
+    ) -> tuple[LessonCategory, VehicleOwnership, Decimal, Decimal]:
+        """
+        Calcula o preço da aula (passo 5).
+
+        Returns:
+            Categoria, veículo, preço base e preço final.
+
+        Raises:
+            PriceCombinationNotAvailableException: Se a combinação não está configurada.
+        """
+        category = LessonCategory(lesson_category)
+        vehicle = VehicleOwnership(vehicle_ownership)
+        price_field = cls._resolve_price_field(profile, category, vehicle)
+        base_price = getattr(profile, price_field)
+        final_price = PricingService.final_price(profile, price_field)
+        return category, vehicle, base_price, final_price
+
+    @staticmethod
+    def to_response(scheduling: Scheduling, student: User, instructor: User) -> SchedulingResponseDTO:
+        """Monta a resposta de um agendamento recém-criado."""
         return SchedulingResponseDTO(
-            id=saved_scheduling.id,
-            student_id=saved_scheduling.student_id,
-            instructor_id=saved_scheduling.instructor_id,
-            scheduled_datetime=saved_scheduling.scheduled_datetime,
-            duration_minutes=saved_scheduling.duration_minutes,
-            price=saved_scheduling.price,
-            status=saved_scheduling.status.value,
-            created_at=saved_scheduling.created_at,
+            id=scheduling.id,
+            student_id=scheduling.student_id,
+            instructor_id=scheduling.instructor_id,
+            scheduled_datetime=scheduling.scheduled_datetime,
+            duration_minutes=scheduling.duration_minutes,
+            price=scheduling.price,
+            status=scheduling.status.value,
+            created_at=scheduling.created_at,
             student_name=student.full_name,
             instructor_name=instructor.full_name,
-            lesson_category=saved_scheduling.lesson_category.value if saved_scheduling.lesson_category else None,
-            vehicle_ownership=saved_scheduling.vehicle_ownership.value if saved_scheduling.vehicle_ownership else None,
-            applied_base_price=saved_scheduling.applied_base_price,
-            applied_final_price=saved_scheduling.applied_final_price,
+            lesson_category=scheduling.lesson_category.value if scheduling.lesson_category else None,
+            vehicle_ownership=scheduling.vehicle_ownership.value if scheduling.vehicle_ownership else None,
+            applied_base_price=scheduling.applied_base_price,
+            applied_final_price=scheduling.applied_final_price,
         )
 
     @staticmethod
-    def _resolve_base_price(
-        profile: "InstructorProfile",
+    def _resolve_price_field(
+        profile: InstructorProfile,
         category: LessonCategory,
         vehicle: VehicleOwnership,
-    ) -> Decimal:
+    ) -> str:
         """
-        Faz lookup do preço base no perfil do instrutor pela combinação categoria/veículo.
+        Faz lookup do campo de preço do perfil do instrutor pela combinação categoria/veículo.
 
         Args:
             profile: Perfil do instrutor com os 4 campos de preço.
@@ -188,33 +275,30 @@ class CreateSchedulingUseCase:
             vehicle: Propriedade do veículo (instrutor ou aluno).
 
         Returns:
-            Preço base (Decimal).
+            Nome do campo de preço base configurado para a combinação.
 
         Raises:
             PriceCombinationNotAvailableException: Se a combinação não está configurada.
         """
         # Mapa de combinações -> campo do perfil
-        price_map = {
-            (LessonCategory.A, VehicleOwnership.INSTRUCTOR): profile.price_cat_a_instructor_vehicle,
-            (LessonCategory.A, VehicleOwnership.STUDENT): profile.price_cat_a_student_vehicle,
-            (LessonCategory.B, VehicleOwnership.INSTRUCTOR): profile.price_cat_b_instructor_vehicle,
-            (LessonCategory.B, VehicleOwnership.STUDENT): profile.price_cat_b_student_vehicle,
+        field_map = {
+            (LessonCategory.A, VehicleOwnership.INSTRUCTOR): "price_cat_a_instructor_vehicle",
+            (LessonCategory.A, VehicleOwnership.STUDENT): "price_cat_a_student_vehicle",
+            (LessonCategory.B, VehicleOwnership.INSTRUCTOR): "price_cat_b_instructor_vehicle",
+            (LessonCategory.B, VehicleOwnership.STUDENT): "price_cat_b_student_vehicle",
         }
 
         # Para categoria AB, aceitar qualquer veículo na categoria B como fallback
         if category == LessonCategory.AB:
             # Categoria AB: tentar cat B primeiro (carro é o padrão mais comum)
-            price = price_map.get((LessonCategory.B, vehicle))
-            if price is not None:
-                return price
-            # Fallback para cat A
-            price = price_map.get((LessonCategory.A, vehicle))
-            if price is not None:
-                return price
+            for fallback_category in (LessonCategory.B, LessonCategory.A):
+                field_name = field_map[(fallback_category, vehicle)]
+                if getattr(profile, field_name) is not None:
+                    return field_name
             raise PriceCombinationNotAvailableException(category.value, vehicle.value)
 
-        price = price_map.get((category, vehicle))
-        if price is None:
+        field_name = field_map.get((category, vehicle))
+        if field_name is None or getattr(profile, field_name) is None:
             raise PriceCombinationNotAvailableException(category.value, vehicle.value)
-        return price
+        return field_name
 
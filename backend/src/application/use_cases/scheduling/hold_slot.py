@@ -0,0 +1,87 @@
+"""
+Hold Slot Use Case
+
+Caso de uso para adicionar um horário ao carrinho como reserva temporária.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from src.application.dtos.scheduling_dtos import CreateSchedulingDTO, SlotHoldResponseDTO
+from src.application.tasks.cart_cleanup_task import CART_TIMEOUT_MINUTES
+from src.application.use_cases.scheduling.create_scheduling import CreateSchedulingUseCase
+from src.domain.entities.slot_hold import SlotHold
+from src.domain.exceptions import MixedInstructorsException, SchedulingConflictException
+from src.domain.interfaces.slot_hold_service import ISlotHoldService
+
+
+@dataclass
+class HoldSlotUseCase:
+    """
+    Caso de uso para segurar um horário no carrinho do aluno.
+
+    Aplica as mesmas validações da criação de agendamento, mas em vez de
+    gravar um agendamento PENDING grava apenas uma reserva com expiração no
+    Redis; o agendamento é criado no checkout (CheckoutSlotHoldsUseCase).
+    Reservas vencidas somem sozinhas, sem cancelamento no banco.
+
+    Fluxo:
+        1. Validar pedido e calcular preço (CreateSchedulingUseCase.prepare)
+        2. Verificar que o carrinho tem apenas um instrutor
+        3. Segurar o horário atomicamente (recusa reserva sobreposta)
+    """
+
+    create_scheduling: CreateSchedulingUseCase
+    slot_hold_service: ISlotHoldService
+    ttl_minutes: int = CART_TIMEOUT_MINUTES
+
+    async def execute(self, dto: CreateSchedulingDTO) -> SlotHoldResponseDTO:
+        """
+        Executa a reserva do horário.
+
+        Args:
+            dto: Dados do horário a reservar.
+
+        Returns:
+            SlotHoldResponseDTO: Reserva gravada com preço e expiração.
+
+        Raises:
+            MixedInstructorsException: Se o carrinho tem reservas de outro instrutor.
+            SchedulingConflictException: Se o horário já está agendado ou reservado.
+            As demais exceções de CreateSchedulingUseCase.
+        """
+        # 1. Validações e preço
+        scheduling, _, _ = await self.create_scheduling.prepare(dto)
+
+        # 2. Um instrutor por carrinho
+        current_holds = await self.slot_hold_service.list_for_student(dto.student_id)
+        if any(h.instructor_id != dto.instructor_id for h in current_holds):
+            raise MixedInstructorsException(
+                "Você só pode agendar aulas com um instrutor por vez no carrinho. "
+                "Esvazie o carrinho ou conclua a compra atual para agendar com outro instrutor."
+            )
+
+        # 3. Reserva atômica
+        hold = SlotHold(
+            instructor_id=scheduling.instructor_id,
+            student_id=scheduling.student_id,
+            scheduled_datetime=scheduling.scheduled_datetime,
+            duration_minutes=scheduling.duration_minutes,
+            lesson_category=dto.lesson_category,
+            vehicle_ownership=dto.vehicle_ownership,
+            price=scheduling.price,
+            expires_at=datetime.now(timezone.utc) + timedelta(minutes=self.ttl_minutes),
+        )
+        if not await self.slot_hold_service.hold(hold):
+            raise SchedulingConflictException("O horário está reservado no carrinho de outro aluno")
+
+        return SlotHoldResponseDTO(
+            hold_id=hold.hold_id,
+            instructor_id=hold.instructor_id,
+            scheduled_datetime=hold.scheduled_datetime,
+            duration_minutes=hold.duration_minutes,
+            lesson_category=hold.lesson_category,
+            vehicle_ownership=hold.vehicle_ownership,
+            price=hold.price,
+            expires_at=hold.expires_at,
+        )
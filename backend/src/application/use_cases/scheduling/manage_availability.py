@@ -5,13 +5,16 @@ Caso de uso para gerenciar slots de disponibilidade do instrutor.
 """
 
 from dataclasses import dataclass
+from datetime import datetime, timezone
 
 from src.application.dtos.scheduling_dtos import (
     AvailabilityListResponseDTO,
     AvailabilityResponseDTO,
     CreateAvailabilityDTO,
     DeleteAvailabilityDTO,
+    ReplaceWeeklyAvailabilityDTO,
     UpdateAvailabilityDTO,
+    WeeklySlotDTO,
 )
 from src.domain.entities.availability import Availability
 from src.domain.entities.user_type import UserType
@@ -35,6 +38,7 @@ class ManageAvailabilityUseCase:
         - create: Criar novo slot
         - update: Atualizar slot existente
         - delete: Remover slot
+        - replace_week: Substituir a semana inteira em lote
         - list: Listar todos os slots do instrutor
     """
 
@@ -176,6 +180,109 @@ class ManageAvailabilityUseCase:
 
         return await self.availability_repository.delete(dto.availability_id)
 
+    async def replace_week(
+        self, dto: ReplaceWeeklyAvailabilityDTO
+    ) -> AvailabilityListResponseDTO:
+        """
+        Substitui toda a disponibilidade semanal do instrutor.
+
+        Os slots são identificados por (dia, hora de início): slots existentes
+        com a mesma chave são atualizados, os ausentes da semana desejada são
+        removidos e os demais são criados. As sobreposições são validadas em
+        memória e as mudanças são gravadas em lote, na mesma transação.
+
+        Args:
+            dto: Semana desejada (lista completa de slots).
+
+        Returns:
+            AvailabilityListResponseDTO: Slots após a substituição.
+
+        Raises:
+            InstructorNotFoundException: Se instrutor não existir.
+            InvalidAvailabilityTimeException: Se algum intervalo for inválido.
+            AvailabilityOverlapException: Se dois slots se sobrepuserem.
+        """
+        # Validar instrutor
+        user = await self.user_repository.get_by_id(dto.instructor_id)
+        if user is None:
+            raise UserNotFoundException(str(dto.instructor_id))
+        if user.user_type != UserType.INSTRUCTOR:
+            raise InstructorNotFoundException(
+                f"Usuário {dto.instructor_id} não é um instrutor"
+            )
+
+        # Validar intervalos e sobreposições (ordenação + varredura)
+        desired = self._validate_week(dto.slots)
+
+        # Calcular o diff contra os slots atuais
+        current = await self.availability_repository.list_by_instructor(
+            instructor_id=dto.instructor_id,
+            only_active=False,
+        )
+        current_by_key = {(a.day_of_week, a.start_time): a for a in current}
+        now = datetime.now(timezone.utc)
+
+        created: list[Availability] = []
+        updated: list[Availability] = []
+        for slot in desired:
+            existing = current_by_key.pop((slot.day_of_week, slot.start_time), None)
+            if existing is None:
+                created.append(
+                    Availability(
+                        instructor_id=dto.instructor_id,
+                        day_of_week=slot.day_of_week,
+                        start_time=slot.start_time,
+                        end_time=slot.end_time,
+                        is_active=slot.is_active,
+                    )
+                )
+            elif (existing.end_time, existing.is_active) != (slot.end_time, slot.is_active):
+                existing.end_time = slot.end_time
+                existing.is_active = slot.is_active
+                existing.updated_at = now
+                updated.append(existing)
+        removed = {a.id for a in current_by_key.values()}
+
+        await self.availability_repository.apply_week_changes(
+            instructor_id=dto.instructor_id,
+            created=created,
+            updated=updated,
+            deleted_ids=list(removed),
+        )
+
+        kept = [a for a in current if a.id not in removed]
+        week = sorted(kept + created, key=lambda a: (a.day_of_week, a.start_time))
+        return AvailabilityListResponseDTO(
+            availabilities=[self._to_response_dto(a) for a in week],
+            instructor_id=dto.instructor_id,
+            total_count=len(week),
+        )
+
+    @staticmethod
+    def _validate_week(slots: list[WeeklySlotDTO]) -> list[WeeklySlotDTO]:
+        """
+        Valida a semana desejada e a retorna ordenada por dia e início.
+
+        Ordenados os slots, basta comparar cada um com o anterior do mesmo
+        dia: há sobreposição se ele começa antes do término do anterior
+        (mesma regra de check_overlap, inclusive para slots inativos).
+        """
+        for slot in slots:
+            if not 0 <= slot.day_of_week <= 6:
+                raise InvalidAvailabilityTimeException(
+                    "Dia da semana deve estar entre 0 (Segunda) e 6 (Domingo)"
+                )
+            if slot.start_time >= slot.end_time:
+                raise InvalidAvailabilityTimeException(
+                    "Hora de início deve ser anterior à hora de término"
+                )
+
+        ordered = sorted(slots, key=lambda s: (s.day_of_week, s.start_time))
+        for previous, slot in zip(ordered, ordered[1:]):
+            if slot.day_of_week == previous.day_of_week and slot.start_time < previous.end_time:
+                raise AvailabilityOverlapException()
+        return ordered
+
     async def list(self, instructor_id: str) -> AvailabilityListResponseDTO:
         """
         Lista todos os slots de disponibilidade de um instrutor.
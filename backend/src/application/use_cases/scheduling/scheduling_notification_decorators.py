@@ -16,15 +16,18 @@ from dataclasses import dataclass
 from uuid import UUID
 
 from src.application.dtos.scheduling_dtos import (
+    BookLessonPackageDTO,
     CancelSchedulingDTO,
     CancellationResultDTO,
     ConfirmSchedulingDTO,
     CreateSchedulingDTO,
+    LessonPackageResultDTO,
     RequestRescheduleDTO,
     RespondRescheduleDTO,
     SchedulingResponseDTO,
 )
 from src.application.services.notification_service import NotificationService
+from src.application.use_cases.scheduling.book_lesson_package import BookLessonPackageUseCase
 from src.application.use_cases.scheduling.cancel_scheduling import CancelSchedulingUseCase
 from src.application.use_cases.scheduling.confirm_scheduling import ConfirmSchedulingUseCase
 from src.application.use_cases.scheduling.create_scheduling import CreateSchedulingUseCase
@@ -70,6 +73,45 @@ class NotifyOnCreateScheduling:
         return result
 
 
+@dataclass
+class NotifyOnBookLessonPackage:
+    """
+    Decorator de BookLessonPackageUseCase.
+
+    Notifica o instrutor uma vez por pacote com NEW_SCHEDULING.
+    """
+
+    _wrapped: BookLessonPackageUseCase
+    _notification_service: NotificationService
+
+    async def execute(self, dto: BookLessonPackageDTO) -> LessonPackageResultDTO:
+        result = await self._wrapped.execute(dto)
+        if not result.created:
+            return result
+
+        first = result.created[0]
+        try:
+            scheduled_at = first.scheduled_datetime.astimezone(DEFAULT_TIMEZONE).strftime("%d/%m às %H:%Mh")
+            await self._notification_service.notify(
+                user_id=first.instructor_id,
+                notification_type=NotificationType.NEW_SCHEDULING,
+                title="Novo pacote de aulas! 🎉",
+                body=(
+                    f"{first.student_name} agendou {len(result.created)} aulas, "
+                    f"a partir de {scheduled_at}."
+                ),
+                action_type=NotificationActionType.SCHEDULING,
+                action_id=first.id,
+            )
+        except Exception:
+            logger.exception(
+                "notify_on_book_lesson_package_failed",
+                scheduling_id=str(first.id),
+            )
+
+        return result
+
+
 @dataclass
 class NotifyOnConfirmScheduling:
     """
@@ -0,0 +1,132 @@
+"""
+Get Instructor Feed Use Case
+
+Caso de uso para o feed de descoberta de instrutores com paginação por cursor.
+"""
+
+import hashlib
+import json
+import math
+from dataclasses import dataclass
+from decimal import Decimal, InvalidOperation
+from uuid import UUID
+
+from src.application.dtos.profile_dtos import InstructorFeedDTO, InstructorFeedResultDTO
+from src.application.services.cursor_codec import decode_cursor, encode_cursor
+from src.application.services.instructor_tile_cache import TileCandidate
+from src.domain.entities.location import Location
+from src.domain.entities.search_position import InstructorSearchPosition
+from src.domain.exceptions import InvalidCursorException, InvalidLocationException
+from src.domain.interfaces.instructor_repository import IInstructorRepository
+
+
+@dataclass
+class GetInstructorFeedUseCase:
+    """
+    Caso de uso para o feed de descoberta de instrutores disponíveis.
+
+    Cada página parte da posição do último instrutor da página anterior
+    (cursor opaco), então a página N+1 é buscada por seek nos índices em vez
+    de recalcular e descartar as páginas anteriores (OFFSET).
+
+    Fluxo:
+        1. Validar coordenadas e decodificar o cursor (se houver)
+        2. Buscar limit + 1 instrutores após a posição do cursor
+        3. Montar o próximo cursor se houver mais resultados
+    """
+
+    instructor_repository: IInstructorRepository
+
+    async def execute(self, dto: InstructorFeedDTO) -> InstructorFeedResultDTO:
+        """
+        Busca uma página do feed de instrutores.
+
+        Args:
+            dto: Parâmetros da busca e cursor da página.
+
+        Returns:
+            InstructorFeedResultDTO: Instrutores da página e próximo cursor.
+
+        Raises:
+            InvalidLocationException: Se coordenadas forem inválidas.
+            InvalidCursorException: Se o cursor for inválido ou de outra busca.
+        """
+        try:
+            center = Location(latitude=dto.latitude, longitude=dto.longitude)
+        except ValueError as e:
+            raise InvalidLocationException(str(e)) from e
+
+        search_key = self._search_key(dto)
+        after = self._decode_position(dto.cursor, search_key) if dto.cursor else None
+
+        # Um item extra indica se existe próxima página
+        rows = await self.instructor_repository.search_page_by_location(
+            center=center,
+            radius_km=dto.radius_km,
+            biological_sex=dto.biological_sex,
+            license_category=dto.license_category,
+            search_query=dto.search_query,
+            limit=dto.limit + 1,
+            after=after,
+        )
+        has_more = len(rows) > dto.limit
+        rows = rows[: dto.limit]
+
+        profiles = [profile for profile, _ in rows]
+        distances = center.distances_to_many([p.location for p in profiles])
+        instructors = [
+            TileCandidate.from_profile(profile).to_response(
+                None if math.isnan(distance) else float(distance)
+            )
+            for profile, distance in zip(profiles, distances)
+        ]
+
+        next_cursor = None
+        if has_more:
+            next_cursor = self._encode_position(rows[-1][1], search_key)
+
+        return InstructorFeedResultDTO(
+            instructors=instructors,
+            next_cursor=next_cursor,
+            radius_km=dto.radius_km,
+            center_latitude=dto.latitude,
+            center_longitude=dto.longitude,
+        )
+
+    def _search_key(self, dto: InstructorFeedDTO) -> str:
+        """Identifica a busca para rejeitar cursores gerados por outra."""
+        params = [
+            dto.latitude,
+            dto.longitude,
+            dto.radius_km,
+            dto.biological_sex,
+            dto.license_category,
+            dto.search_query,
+        ]
+        return hashlib.sha256(json.dumps(params).encode()).hexdigest()[:16]
+
+    def _encode_position(self, position: InstructorSearchPosition, search_key: str) -> str:
+        """Serializa a posição do último instrutor da página."""
+        return encode_cursor({
+            "k": search_key,
+            "id": str(position.profile_id),
+            "r": str(position.rating),
+            "d": position.distance,
+            "s": position.rank,
+        })
+
+    def _decode_position(self, cursor: str, search_key: str) -> InstructorSearchPosition:
+        """Restaura a posição a partir do cursor recebido."""
+        payload = decode_cursor(cursor)
+        if payload.get("k") != search_key:
+            raise InvalidCursorException("cursor pertence a outra busca")
+
+        try:
+            return InstructorSearchPosition(
+                profile_id=UUID(payload["id"]),
+                rating=Decimal(payload["r"]),
+                distance=float(payload["d"]) if payload.get("d") is not None else None,
+                rank=float(payload["s"]) if payload.get("s") is not None else None,
+            )
+        except (KeyError, TypeError, ValueError, InvalidOperation) as e:
+            raise InvalidCursorException("posição inválida") from e
@@ -4,37 +4,33 @@ Get Nearby Instructors Use Case
 Caso de uso otimizado para busca de instrutores próximos com cache.
 """
 
+import math
 from dataclasses import dataclass
-from decimal import Decimal
-from typing import Protocol
-import json
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
 
 from src.application.dtos.profile_dtos import (
-    InstructorProfileResponseDTO,
     InstructorSearchDTO,
     InstructorSearchResultDTO,
-    LocationResponseDTO,
 )
+from src.application.services.instructor_tile_cache import (
+    ICacheService,
+    InstructorTileCache,
+    TileCandidate,
+    select_candidates,
+)
+from src.domain.entities.instructor_profile import InstructorProfile
 from src.domain.entities.location import Location
 from src.domain.exceptions import InvalidLocationException
 from src.domain.interfaces.instructor_repository import IInstructorRepository
-from src.infrastructure.services.pricing_service import PricingService
-
-
-class ICacheService(Protocol):
-    """Interface para serviço de cache."""
-
-    async def get(self, key: str) -> str | None:
-        """Obtém valor do cache."""
-        ...
-
-    async def set(self, key: str, value: str, ttl_seconds: int = 60) -> None:
-        """Define valor no cache."""
-        ...
+from src.domain.interfaces.instructor_search_index_repository import (
+    IInstructorSearchIndexRepository,
+)
+from src.domain.interfaces.slot_hold_service import ISlotHoldService
 
-    async def delete(self, key: str) -> None:
-        """Remove valor do cache."""
-        ...
+# Buscas "livre no horário" refeitas excluindo instrutores com o horário
+# segurado em carrinhos; depois disso, os segurados só são filtrados
+HOLD_EXCLUSION_PASSES = 3
 
 
 @dataclass
@@ -42,29 +38,31 @@ class GetNearbyInstructorsUseCase:
     """
     Caso de uso para busca otimizada de instrutores próximos.
 
-    Utiliza cache Redis para melhorar performance em buscas frequentes.
-    O cache é baseado em grid (arredondamento de coordenadas).
+    Utiliza o cache de tiles (InstructorTileCache): o conjunto de candidatos é
+    compartilhado por todas as buscas com centro no mesmo tile do grid e raio
+    no mesmo balde; filtros, distâncias e ordenação são aplicados em memória.
+
+    Com search_index_repository, as buscas no banco (preenchimento de tiles
+    e busca direta) leem apenas a projeção de busca, com preços já finais.
+
+    Com free_from, a busca vira "livre perto de mim no horário": uma única
+    consulta no banco combina o filtro espacial com a cobertura da
+    disponibilidade e a ausência de agendamentos no período (sem cache de
+    tiles, que não conhece a agenda). Com slot_hold_service, instrutores com
+    o horário segurado no carrinho de um aluno também ficam de fora.
 
     Fluxo:
-        1. Verificar cache para a região
-        2. Se cache miss, executar busca no banco
-        3. Armazenar resultado em cache (TTL 60s)
+        1. Obter candidatos do tile (cache ou banco, read-through)
+        2. Filtrar/ordenar em memória
+        3. Se o tile não puder ser usado (ou houver busca textual), executar
+           a busca direta no banco
         4. Retornar resultados
     """
 
     instructor_repository: IInstructorRepository
     cache_service: ICacheService | None = None
-
-    def _get_cache_key(self, lat: float, lon: float, radius: float) -> str:
-        """
-        Gera chave de cache baseada em grid.
-
-        Arredonda coordenadas para precisão de ~1km para agrupar buscas.
-        """
-        # Arredonda para 2 casas decimais (~1km de precisão)
-        grid_lat = round(lat, 2)
-        grid_lon = round(lon, 2)
-        return f"instructors:nearby:{grid_lat}:{grid_lon}:{radius}"
+    search_index_repository: IInstructorSearchIndexRepository | None = None
+    slot_hold_service: ISlotHoldService | None = None
 
     async def execute(self, dto: InstructorSearchDTO) -> InstructorSearchResultDTO:
         """
@@ -85,90 +83,81 @@ class GetNearbyInstructorsUseCase:
         except ValueError as e:
             raise InvalidLocationException(str(e)) from e
 
-        # Tentar buscar do cache
-        if self.cache_service:
-            cache_key = (
-                f"nearby:{dto.latitude}:{dto.longitude}:{dto.radius_km}:"
-                f"{dto.biological_sex}:{dto.license_category}:{dto.search_query}"
+        selected: list[tuple[TileCandidate, float | None]] | None = None
+
+        if dto.free_from is not None:
+            start = dto.free_from
+            if start.tzinfo is None:
+                start = start.replace(tzinfo=timezone.utc)
+            end = start + timedelta(minutes=dto.free_minutes)
+            profiles = await self._search_free(dto, center, start, end)
+            distances = center.distances_to_many([p.location for p in profiles])
+            selected = [
+                (TileCandidate.from_profile(profile), float(distance))
+                for profile, distance in zip(profiles, distances, strict=True)
+            ]
+
+        # Tiles guardam apenas instrutores disponíveis; busca textual é
+        # ranqueada por similaridade no banco (índices trigram)
+        if selected is None and self.cache_service and dto.only_available and not dto.search_query:
+            tile_cache = InstructorTileCache(
+                cache_service=self.cache_service,
+                instructor_repository=self.instructor_repository,
+                search_index_repository=self.search_index_repository,
             )
-            cached = await self.cache_service.get(cache_key)
-
-            if cached:
-                data = json.loads(cached)
-                return InstructorSearchResultDTO(
-                    instructors=[
-                        InstructorProfileResponseDTO(
-                        **{k: v for k, v in inst.items() if k not in ["hourly_rate", "price_cat_a_instructor_vehicle", "price_cat_a_student_vehicle", "price_cat_b_instructor_vehicle", "price_cat_b_student_vehicle"]},
-                            hourly_rate=Decimal(inst["hourly_rate"]),
-                            price_cat_a_instructor_vehicle=Decimal(inst["price_cat_a_instructor_vehicle"]) if inst.get("price_cat_a_instructor_vehicle") else None,
-                            price_cat_a_student_vehicle=Decimal(inst["price_cat_a_student_vehicle"]) if inst.get("price_cat_a_student_vehicle") else None,
-                            price_cat_b_instructor_vehicle=Decimal(inst["price_cat_b_instructor_vehicle"]) if inst.get("price_cat_b_instructor_vehicle") else None,
-                            price_cat_b_student_vehicle=Decimal(inst["price_cat_b_student_vehicle"]) if inst.get("price_cat_b_student_vehicle") else None,
-                        )
-                        for inst in data["instructors"]
-                    ],
-                    total_count=data["total_count"],
-                    radius_km=data["radius_km"],
-                    center_latitude=data["center_latitude"],
-                    center_longitude=data["center_longitude"],
+            candidates = await tile_cache.get_candidates(center, dto.radius_km)
+            if candidates is not None:
+                selected = select_candidates(
+                    candidates,
+                    center=center,
+                    radius_km=dto.radius_km,
+                    biological_sex=dto.biological_sex,
+                    license_category=dto.license_category,
+                    limit=dto.limit,
                 )
 
-        # Cache miss - buscar no banco
-        profiles = await self.instructor_repository.search_by_location(
-            center=center,
-            radius_km=dto.radius_km,
-            biological_sex=dto.biological_sex,
-            license_category=dto.license_category,
-            search_query=dto.search_query,
-            only_available=dto.only_available,
-            limit=dto.limit,
-        )
-
-        def format_name(full_name: str | None) -> str:
-            if not full_name:
-                return "Instrutor"
-            parts = full_name.split()
-            if len(parts) >= 2:
-                return f"{parts[0]} {parts[-1]}"
-            return full_name
-
-        # Montar resposta
-        instructors = []
-        for profile in profiles:
-            location_dto = None
-            distance = None
-
-            if profile.location:
-                location_dto = LocationResponseDTO(
-                    latitude=profile.location.latitude,
-                    longitude=profile.location.longitude,
-                )
-                distance = center.distance_to(profile.location)
-
-            instructors.append(
-                InstructorProfileResponseDTO(
-                    id=profile.id,
-                    user_id=profile.user_id,
-                    bio=profile.bio,
-                    city=profile.city,
-                    vehicle_type=profile.vehicle_type,
-                    license_category=profile.license_category,
-                    hourly_rate=PricingService.calculate_final_price(profile.hourly_rate),
-                    rating=profile.rating,
-                    total_reviews=profile.total_reviews,
-                    is_available=profile.is_available,
-                    full_name=format_name(profile.full_name),
-                    location=location_dto,
-                    distance_km=round(distance, 2) if distance is not None else None,
-                    has_mp_account=profile.has_mp_account,
-                    price_cat_a_instructor_vehicle=PricingService.calculate_final_price(profile.price_cat_a_instructor_vehicle) if profile.price_cat_a_instructor_vehicle else None,
-                    price_cat_a_student_vehicle=PricingService.calculate_final_price(profile.price_cat_a_student_vehicle) if profile.price_cat_a_student_vehicle else None,
-                    price_cat_b_instructor_vehicle=PricingService.calculate_final_price(profile.price_cat_b_instructor_vehicle) if profile.price_cat_b_instructor_vehicle else None,
-                    price_cat_b_student_vehicle=PricingService.calculate_final_price(profile.price_cat_b_student_vehicle) if profile.price_cat_b_student_vehicle else None,
+        # Sem cache utilizável - buscar direto no banco
+        if selected is None and self.search_index_repository is not None:
+            entries = await self.search_index_repository.search(
+                center=center,
+                radius_km=dto.radius_km,
+                biological_sex=dto.biological_sex,
+                license_category=dto.license_category,
+                search_query=dto.search_query,
+                only_available=dto.only_available,
+                limit=dto.limit,
+            )
+            distances = center.distances_to_many([e.location for e in entries])
+            selected = [
+                (
+                    TileCandidate.from_search_entry(entry),
+                    None if math.isnan(distance) else float(distance),
                 )
+                for entry, distance in zip(entries, distances, strict=True)
+            ]
+
+        if selected is None:
+            profiles = await self.instructor_repository.search_by_location(
+                center=center,
+                radius_km=dto.radius_km,
+                biological_sex=dto.biological_sex,
+                license_category=dto.license_category,
+                search_query=dto.search_query,
+                only_available=dto.only_available,
+                limit=dto.limit,
             )
+            distances = center.distances_to_many([p.location for p in profiles])
+            selected = [
+                (
+                    TileCandidate.from_profile(profile),
+                    None if math.isnan(distance) else float(distance),
+                )
+                for profile, distance in zip(profiles, distances, strict=True)
+            ]
 
-        result = InstructorSearchResultDTO(
+        instructors = [candidate.to_response(distance) for candidate, distance in selected]
+
+        return InstructorSearchResultDTO(
             instructors=instructors,
             total_count=len(instructors),
             radius_km=dto.radius_km,
@@ -176,48 +165,38 @@ class GetNearbyInstructorsUseCase:
             center_longitude=dto.longitude,
         )
 
-        # Armazenar em cache (TTL 60s)
-        if self.cache_service:
-            cache_data = {
-                "instructors": [
-                    {
-                        "id": str(inst.id),
-                        "user_id": str(inst.user_id),
-                        "bio": inst.bio,
-                        "city": inst.city,
-                        "vehicle_type": inst.vehicle_type,
-                        "license_category": inst.license_category,
-                        "hourly_rate": str(inst.hourly_rate),
-                        "rating": inst.rating,
-                        "total_reviews": inst.total_reviews,
-                        "is_available": inst.is_available,
-                        "full_name": inst.full_name,
-                        "location": {
-                            "latitude": inst.location.latitude,
-                            "longitude": inst.location.longitude,
-                        } if inst.location else None,
-                        "distance_km": inst.distance_km,
-                        "has_mp_account": inst.has_mp_account,
-                        "price_cat_a_instructor_vehicle": str(inst.price_cat_a_instructor_vehicle) if inst.price_cat_a_instructor_vehicle else None,
-                        "price_cat_a_student_vehicle": str(inst.price_cat_a_student_vehicle) if inst.price_cat_a_student_vehicle else None,
-                        "price_cat_b_instructor_vehicle": str(inst.price_cat_b_instructor_vehicle) if inst.price_cat_b_instructor_vehicle else None,
-                        "price_cat_b_student_vehicle": str(inst.price_cat_b_student_vehicle) if inst.price_cat_b_student_vehicle else None,
-                    }
-                    for inst in instructors
-                ],
-                "total_count": result.total_count,
-                "radius_km": result.radius_km,
-                "center_latitude": result.center_latitude,
-                "center_longitude": result.center_longitude,
-            }
-            cache_key = (
-                f"nearby:{dto.latitude}:{dto.longitude}:{dto.radius_km}:"
-                f"{dto.biological_sex}:{dto.license_category}:{dto.search_query}"
+    async def _search_free(
+        self,
+        dto: InstructorSearchDTO,
+        center: Location,
+        start: datetime,
+        end: datetime,
+    ) -> list[InstructorProfile]:
+        """
+        Instrutores livres no período, sem os que têm o horário segurado.
+
+        Os segurados encontrados em uma página são excluídos na consulta
+        seguinte, para completar o limite com outros instrutores.
+        """
+        held: set[UUID] = set()
+        for _ in range(HOLD_EXCLUSION_PASSES):
+            profiles = await self.instructor_repository.search_free_by_location(
+                center=center,
+                start=start,
+                end=end,
+                radius_km=dto.radius_km,
+                biological_sex=dto.biological_sex,
+                license_category=dto.license_category,
+                search_query=dto.search_query,
+                limit=dto.limit,
+                exclude_instructor_ids=held,
             )
-            await self.cache_service.set(
-                cache_key,
-                json.dumps(cache_data),
-                ttl_seconds=60,
+            if self.slot_hold_service is None:
+                return profiles
+            newly_held = await self.slot_hold_service.held_instructors(
+                [p.user_id for p in profiles], start, end
             )
-
-        return result
+            if not newly_held:
+                return profiles
+            held |= newly_held
+        return [p for p in profiles if p.user_id not in held]
@@ -66,9 +66,12 @@ class SearchInstructorsByLocationUseCase:
             limit=dto.limit,
         )
 
+        # Distâncias aproximadas de todos os resultados em uma única passada
+        distances = center.distances_to_many([p.location for p in profiles])
+
         # Montar resposta com distâncias
         instructors = []
-        for profile in profiles:
+        for profile, raw_distance in zip(profiles, distances):
             location_dto = None
             distance = None
 
@@ -77,8 +80,7 @@ class SearchInstructorsByLocationUseCase:
                     latitude=profile.location.latitude,
                     longitude=profile.location.longitude,
                 )
-                # Calcular distância aproximada
-                distance = center.distance_to(profile.location)
+                distance = float(raw_distance)
 
             instructors.append(
                 InstructorProfileResponseDTO(
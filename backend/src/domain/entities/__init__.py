@@ -11,11 +11,15 @@ from .notification import Notification, NotificationActionType, NotificationType
 from .push_token import PushToken
 from .review import Review
 from .instructor_profile import InstructorProfile
+from .instructor_search_entry import InstructorSearchEntry
 from .location import Location
 from .payment import Payment
 from .payment_status import PaymentStatus
 from .refresh_token import RefreshToken
 from .scheduling import Scheduling
+from .scheduling_transition import SchedulingTransition
+from .search_position import InstructorSearchPosition, ListPosition
+from .slot_hold import SlotHold
 from .scheduling_status import SchedulingStatus
 from .student_profile import LearningStage, StudentProfile
 from .transaction import Transaction
@@ -29,10 +33,15 @@ __all__ = [
     "RefreshToken",
     "Location",
     "InstructorProfile",
+    "InstructorSearchEntry",
+    "InstructorSearchPosition",
+    "ListPosition",
     "StudentProfile",
     "LearningStage",
     "Scheduling",
     "SchedulingStatus",
+    "SchedulingTransition",
+    "SlotHold",
     "Availability",
     "Dispute",
     "DisputeReason",
@@ -50,7 +50,16 @@ class InstructorProfile:
     price_cat_a_student_vehicle: Decimal | None = None
     price_cat_b_instructor_vehicle: Decimal | None = None
     price_cat_b_student_vehicle: Decimal | None = None
-    
+
+    # Preços finais para o aluno gravados junto aos preços base e assinatura
+    # das taxas com que foram calculados (ver PricingService.final_prices)
+    final_hourly_rate: Decimal | None = None
+    final_price_cat_a_instructor_vehicle: Decimal | None = None
+    final_price_cat_a_student_vehicle: Decimal | None = None
+    final_price_cat_b_instructor_vehicle: Decimal | None = None
+    final_price_cat_b_student_vehicle: Decimal | None = None
+    final_prices_signature: str | None = None
+
     # Mercado Pago OAuth
     mp_access_token: str | None = None
     mp_refresh_token: str | None = None
@@ -0,0 +1,57 @@
+"""
+InstructorSearchEntry Entity
+
+Linha da projeção de busca de instrutores (somente leitura).
+"""
+
+from dataclasses import dataclass
+from decimal import Decimal
+from uuid import UUID
+
+from .location import Location
+
+
+@dataclass(frozen=True)
+class InstructorSearchEntry:
+    """
+    Instrutor como aparece na busca, já no formato exibido ao aluno.
+
+    Mantida pelos caminhos de escrita de perfil e usuário; os preços já são
+    os finais para o aluno (com taxas), calculados na escrita.
+
+    Attributes:
+        profile_id: ID do perfil do instrutor.
+        user_id: ID do usuário instrutor.
+        first_name: Primeiro nome.
+        last_name: Último nome (None se o nome tiver uma única parte).
+        hourly_rate: Preço final por hora para o aluno.
+        price_cat_*: Preços finais por categoria e veículo.
+    """
+
+    profile_id: UUID
+    user_id: UUID
+    first_name: str | None
+    last_name: str | None
+    biological_sex: str | None
+    city: str | None
+    vehicle_type: str
+    license_category: str
+    location: Location | None
+    is_available: bool
+    has_mp_account: bool
+    rating: float
+    total_reviews: int
+    hourly_rate: Decimal
+    price_cat_a_instructor_vehicle: Decimal | None = None
+    price_cat_a_student_vehicle: Decimal | None = None
+    price_cat_b_instructor_vehicle: Decimal | None = None
+    price_cat_b_student_vehicle: Decimal | None = None
+
+    @property
+    def display_name(self) -> str:
+        """Nome exibido na busca: primeiro e último nome."""
+        if not self.first_name:
+            return "Instrutor"
+        if self.last_name:
+            return f"{self.first_name} {self.last_name}"
+        return self.first_name
@@ -4,8 +4,40 @@ Location Value Object
 Value Object representando uma localização geográfica.
 """
 
+import math
+from collections.abc import Sequence
 from dataclasses import dataclass
 
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0
+
+
+def haversine_km(
+    lat: float,
+    lon: float,
+    lats: np.ndarray,
+    lons: np.ndarray,
+) -> np.ndarray:
+    """
+    Calcula distâncias Haversine de um ponto para vários em uma única passada.
+
+    Args:
+        lat: Latitude do ponto de origem (graus).
+        lon: Longitude do ponto de origem (graus).
+        lats: Latitudes dos destinos (graus).
+        lons: Longitudes dos destinos (graus).
+
+    Returns:
+        Array de distâncias em quilômetros (NaN onde a coordenada é NaN).
+    """
+    lat1 = math.radians(lat)
+    lat2 = np.radians(lats)
+    delta_lat = lat2 - lat1
+    delta_lon = np.radians(lons) - math.radians(lon)
+    a = np.sin(delta_lat / 2) ** 2 + math.cos(lat1) * np.cos(lat2) * np.sin(delta_lon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
 
 @dataclass(frozen=True)
 class Location:
@@ -74,9 +106,7 @@ class Location:
         Returns:
             Distância em quilômetros.
         """
-        import math
-
-        R = 6371  # Raio da Terra em km
+        R = EARTH_RADIUS_KM
 
         lat1_rad = math.radians(self.latitude)
         lat2_rad = math.radians(other.latitude)
@@ -90,3 +120,29 @@ class Location:
         c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
 
         return R * c
+
+    def distances_to_many(self, others: Sequence["Location | None"]) -> np.ndarray:
+        """
+        Calcula distâncias Haversine para várias localizações de uma vez.
+
+        Equivalente a chamar distance_to para cada item, mas vetorizado.
+
+        Args:
+            others: Localizações de destino (None para itens sem localização).
+
+        Returns:
+            Array de distâncias em quilômetros, na mesma ordem de `others`,
+            com NaN para itens None (NaN nunca passa em comparações <= raio e
+            fica por último em np.argsort).
+        """
+        lats = np.fromiter(
+            (o.latitude if o is not None else np.nan for o in others),
+            dtype=float,
+            count=len(others),
+        )
+        lons = np.fromiter(
+            (o.longitude if o is not None else np.nan for o in others),
+            dtype=float,
+            count=len(others),
+        )
+        return haversine_km(self.latitude, self.longitude, lats, lons)
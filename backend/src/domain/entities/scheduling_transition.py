@@ -0,0 +1,30 @@
+"""
+Scheduling Transition Value Object
+
+Agendamento afetado por uma mudança de status em lote.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class SchedulingTransition:
+    """
+    Identificação de um agendamento que mudou de status em lote.
+
+    Devolvido pelas transições em lote do repositório para que o chamador
+    registre logs e emita eventos sem recarregar os agendamentos.
+
+    Attributes:
+        id: ID do agendamento.
+        student_id: ID do aluno.
+        instructor_id: ID do instrutor.
+        scheduled_datetime: Data/hora da aula.
+    """
+
+    id: UUID
+    student_id: UUID
+    instructor_id: UUID
+    scheduled_datetime: datetime
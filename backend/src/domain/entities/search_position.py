@@ -0,0 +1,59 @@
+"""
+Search Position Value Object
+
+Posições na ordenação de listagens paginadas por cursor (keyset).
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class InstructorSearchPosition:
+    """
+    Chave de ordenação de um instrutor no feed de descoberta.
+
+    A ordem total do feed é: instrutores localizados por (distância ASC,
+    rating DESC, id ASC) e, depois, os sem localização por (rating DESC,
+    id ASC). Com busca textual, a similaridade (DESC) vem antes de tudo
+    dentro de cada ramo.
+
+    Attributes:
+        profile_id: ID do perfil do instrutor (desempate final).
+        rating: Avaliação média (valor exato da coluna).
+        distance: Distância até o centro da busca (unidade do banco), ou
+            None para instrutores sem localização.
+        rank: Similaridade textual com o termo buscado, se houver busca.
+    """
+
+    profile_id: UUID
+    rating: Decimal
+    distance: float | None = None
+    rank: float | None = None
+
+    @property
+    def is_located(self) -> bool:
+        """Indica se a posição pertence ao ramo de instrutores localizados."""
+        return self.distance is not None
+
+
+@dataclass(frozen=True)
+class ListPosition:
+    """
+    Chave de ordenação de uma linha em listagens por data (agendamentos e
+    pagamentos).
+
+    A ordem total é (instante, id), na mesma direção para as duas chaves.
+
+    Attributes:
+        at: Instante da linha (scheduled_datetime ou created_at).
+        id: ID da linha (desempate).
+        ordinal: Quantas linhas da listagem vêm até esta, inclusive (para
+            o total das páginas seguintes), se conhecido.
+    """
+
+    at: datetime
+    id: UUID
+    ordinal: int | None = None
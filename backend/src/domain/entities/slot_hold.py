@@ -0,0 +1,50 @@
+"""
+Slot Hold Value Object
+
+Reserva temporária de um horário de instrutor no carrinho do aluno.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from decimal import Decimal
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class SlotHold:
+    """
+    Horário segurado por um aluno até o checkout ou a expiração.
+
+    Enquanto a reserva vale, nenhum outro aluno consegue segurar ou agendar
+    um horário sobreposto do mesmo instrutor. O agendamento só é gravado no
+    banco no checkout.
+
+    Attributes:
+        instructor_id: ID do instrutor.
+        student_id: ID do aluno que segura o horário.
+        scheduled_datetime: Início da aula (aware).
+        duration_minutes: Duração da aula.
+        lesson_category: Categoria da CNH ("A", "B" ou "AB").
+        vehicle_ownership: Propriedade do veículo ("instructor" ou "student").
+        price: Preço cotado ao segurar (o checkout recalcula).
+        expires_at: Expiração da reserva (aware).
+    """
+
+    instructor_id: UUID
+    student_id: UUID
+    scheduled_datetime: datetime
+    duration_minutes: int
+    lesson_category: str
+    vehicle_ownership: str
+    price: Decimal
+    expires_at: datetime
+
+    @property
+    def end_datetime(self) -> datetime:
+        """Término da aula."""
+        return self.scheduled_datetime + timedelta(minutes=self.duration_minutes)
+
+    @property
+    def hold_id(self) -> str:
+        """Identificador da reserva: instrutor e início da aula (epoch)."""
+        return f"{self.instructor_id}:{int(self.scheduled_datetime.timestamp())}"
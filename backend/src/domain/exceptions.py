@@ -424,3 +424,14 @@ class ActiveSchedulingRequiredException(DomainException):
             "Você só pode enviar mensagens para usuários com quem possui agendamentos ativos.",
             "ACTIVE_SCHEDULING_REQUIRED",
         )
+
+
+# === Pagination Exceptions ===
+
+
+class InvalidCursorException(DomainException):
+    """Exceção lançada quando o cursor de paginação é inválido ou de outra busca."""
+
+    def __init__(self, reason: str | None = None) -> None:
+        message = f"Cursor inválido: {reason}" if reason else "Cursor inválido"
+        super().__init__(message, "INVALID_CURSOR")
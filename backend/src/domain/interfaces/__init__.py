@@ -11,10 +11,13 @@ from .notification_repository import INotificationRepository
 from .push_notification_service import IPushNotificationService
 from .availability_repository import IAvailabilityRepository
 from .instructor_repository import IInstructorRepository
+from .instructor_search_index_repository import IInstructorSearchIndexRepository
 from .location_service import ILocationService
+from .location_write_buffer import ILocationWriteBuffer
 from .payment_gateway import IPaymentGateway
 from .payment_repository import IPaymentRepository
 from .scheduling_repository import ISchedulingRepository
+from .slot_hold_service import ISlotHoldService
 from .student_repository import IStudentRepository
 from .token_repository import ITokenRepository
 from .transaction_repository import ITransactionRepository
@@ -26,9 +29,12 @@ __all__ = [
     "IAuthService",
     "IDisputeRepository",
     "IInstructorRepository",
+    "IInstructorSearchIndexRepository",
     "IStudentRepository",
     "ILocationService",
+    "ILocationWriteBuffer",
     "ISchedulingRepository",
+    "ISlotHoldService",
     "IAvailabilityRepository",
     "IPaymentRepository",
     "ITransactionRepository",
@@ -153,3 +153,26 @@ class IAvailabilityRepository(ABC):
             True se há sobreposição.
         """
         ...
+
+    @abstractmethod
+    async def apply_week_changes(
+        self,
+        instructor_id: UUID,
+        created: list[Availability],
+        updated: list[Availability],
+        deleted_ids: list[UUID],
+    ) -> None:
+        """
+        Aplica em lote as mudanças da semana de um instrutor.
+
+        Executa um DELETE, um UPDATE e um INSERT em lote (os vazios são
+        omitidos) na transação atual e incrementa a versão da disponibilidade
+        uma única vez.
+
+        Args:
+            instructor_id: ID do instrutor dono dos slots.
+            created: Slots novos.
+            updated: Slots existentes com horário de término/estado novos.
+            deleted_ids: IDs dos slots a remover.
+        """
+        ...
@@ -5,10 +5,13 @@ Interface para repositório de perfis de instrutores.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Collection, Sequence
+from datetime import datetime
 from uuid import UUID
 
 from src.domain.entities.instructor_profile import InstructorProfile
 from src.domain.entities.location import Location
+from src.domain.entities.search_position import InstructorSearchPosition
 
 
 class IInstructorRepository(ABC):
@@ -135,7 +138,71 @@ class IInstructorRepository(ABC):
         ...
 
     @abstractmethod
-    async def update_location(self, user_id: UUID, location: Location, city: str | None = None) -> bool:
+    async def search_free_by_location(
+        self,
+        center: Location,
+        start: datetime,
+        end: datetime,
+        radius_km: float = 10.0,
+        biological_sex: str | None = None,
+        license_category: str | None = None,
+        search_query: str | None = None,
+        limit: int = 50,
+        exclude_instructor_ids: Collection[UUID] = (),
+    ) -> list[InstructorProfile]:
+        """
+        Busca instrutores próximos e livres em um período.
+
+        Livre significa: um slot de disponibilidade ativo cobre o período
+        inteiro (horário de Brasília) e nenhum agendamento não cancelado se
+        sobrepõe a ele. Reservas de carrinho ficam fora do banco; quem as
+        conhece informa os instrutores a excluir.
+
+        Args:
+            center: Localização central da busca.
+            start: Início do período (aware).
+            end: Fim do período (aware, exclusivo).
+            radius_km: Raio de busca em quilômetros.
+            limit: Número máximo de resultados.
+            exclude_instructor_ids: Instrutores (user_id) a desconsiderar.
+
+        Returns:
+            Perfis de instrutores disponíveis e com localização, ordenados por
+            distância (vazio se o período cruza a meia-noite).
+        """
+        ...
+
+    @abstractmethod
+    async def search_page_by_location(
+        self,
+        center: Location,
+        radius_km: float = 10.0,
+        biological_sex: str | None = None,
+        license_category: str | None = None,
+        search_query: str | None = None,
+        limit: int = 20,
+        after: InstructorSearchPosition | None = None,
+    ) -> list[tuple[InstructorProfile, InstructorSearchPosition]]:
+        """
+        Busca uma página do feed de instrutores disponíveis (paginação keyset).
+
+        Args:
+            center: Localização central da busca.
+            radius_km: Raio de busca em quilômetros.
+            limit: Número máximo de resultados da página.
+            after: Posição do último instrutor da página anterior (None para
+                a primeira página).
+
+        Returns:
+            Pares (perfil, posição) na ordem total do feed, a partir do
+            primeiro instrutor após `after`.
+        """
+        ...
+
+    @abstractmethod
+    async def update_location(
+        self, user_id: UUID, location: Location, city: str | None = None
+    ) -> tuple[bool, Location | None]:
         """
         Atualiza apenas a localização (e opcionalmente a cidade) do instrutor.
 
@@ -147,7 +214,45 @@ class IInstructorRepository(ABC):
             city: Nova cidade (opcional).
 
         Returns:
-            True se atualizado, False se perfil não encontrado.
+            Tupla (atualizado, posição anterior): atualizado é False se o
+            perfil não foi encontrado; a posição anterior é None se o
+            instrutor não tinha localização.
+        """
+        ...
+
+    @abstractmethod
+    async def bulk_update_locations(
+        self, updates: Sequence[tuple[UUID, Location, str | None]]
+    ) -> dict[UUID, Location | None]:
+        """
+        Atualiza a localização de vários instrutores em um único UPDATE.
+
+        Usado pelo buffer de escrita de localização para aplicar um lote de
+        posições acumuladas.
+
+        Args:
+            updates: Tuplas (user_id, localização, cidade ou None para manter),
+                no máximo uma por instrutor.
+
+        Returns:
+            Posição anterior (None se não havia) de cada usuário cujo perfil
+            foi atualizado.
+        """
+        ...
+
+    @abstractmethod
+    async def recompute_final_prices(self, batch_size: int = 500) -> int:
+        """
+        Recalcula os preços finais dos perfis gravados com outras taxas.
+
+        Executado quando PLATFORM_FEE_PERCENTAGE ou MERCADOPAGO_FEE_PERCENTAGE
+        mudam (a assinatura das taxas gravada no perfil difere da vigente).
+
+        Args:
+            batch_size: Perfis por UPDATE.
+
+        Returns:
+            Número de perfis recalculados.
         """
         ...
 
@@ -156,13 +261,13 @@ class IInstructorRepository(ABC):
         self,
         biological_sex: str | None = None,
         license_category: str | None = None,
-        limit: int = 100,
+        limit: int | None = 100,
     ) -> list[InstructorProfile]:
         """
         Lista instrutores disponíveis.
 
         Args:
-            limit: Número máximo de resultados.
+            limit: Número máximo de resultados (None para todos).
 
         Returns:
             Lista de perfis de instrutores disponíveis.
@@ -0,0 +1,133 @@
+"""
+IInstructorSearchIndexRepository Interface
+
+Interface para a projeção desnormalizada usada na busca de instrutores.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Collection, Sequence
+from uuid import UUID
+
+from src.domain.entities.instructor_search_entry import InstructorSearchEntry
+from src.domain.entities.location import Location
+
+
+class IInstructorSearchIndexRepository(ABC):
+    """
+    Interface abstrata para a projeção de busca de instrutores.
+
+    A projeção guarda, em uma única tabela, tudo o que a busca precisa
+    (nome, sexo, cidade, localização, disponibilidade, rating e preços finais
+    para o aluno). Quando a replicação está habilitada, é mantida pelos
+    repositórios de instrutores e usuários a cada escrita, inclusive no
+    recálculo em lote dos preços finais quando as taxas mudam.
+    """
+
+    @abstractmethod
+    async def search(
+        self,
+        center: Location,
+        radius_km: float = 10.0,
+        biological_sex: str | None = None,
+        license_category: str | None = None,
+        search_query: str | None = None,
+        only_available: bool = True,
+        limit: int = 50,
+    ) -> list[InstructorSearchEntry]:
+        """
+        Busca instrutores por proximidade na projeção.
+
+        Mesma semântica de IInstructorRepository.search_by_location.
+
+        Args:
+            center: Localização central da busca.
+            radius_km: Raio de busca em quilômetros.
+            biological_sex: Filtro por sexo.
+            license_category: Filtro por categoria de CNH.
+            search_query: Termo buscado no nome ou na cidade.
+            only_available: Se True, retorna apenas instrutores disponíveis.
+            limit: Número máximo de resultados.
+
+        Returns:
+            Instrutores localizados por distância e, em seguida, os sem
+            localização por rating.
+        """
+        ...
+
+    @abstractmethod
+    async def sync_instructor(self, user_id: UUID) -> None:
+        """
+        Regrava a linha do instrutor a partir das tabelas de origem.
+
+        Args:
+            user_id: ID do usuário instrutor.
+        """
+        ...
+
+    @abstractmethod
+    async def sync_location(
+        self, user_id: UUID, location: Location, city: str | None = None
+    ) -> None:
+        """
+        Atualiza apenas a localização (e a cidade, se informada) do instrutor.
+
+        Args:
+            user_id: ID do usuário instrutor.
+            location: Nova localização.
+            city: Nova cidade (opcional).
+        """
+        ...
+
+    @abstractmethod
+    async def sync_locations(
+        self, updates: Sequence[tuple[UUID, Location, str | None]]
+    ) -> None:
+        """
+        Atualiza, em um único comando, a localização de vários instrutores.
+
+        Args:
+            updates: Tuplas (user_id, localização, cidade ou None para manter).
+        """
+        ...
+
+    @abstractmethod
+    async def sync_user(
+        self, user_id: UUID, full_name: str, biological_sex: str | None
+    ) -> None:
+        """
+        Atualiza os dados do usuário replicados na projeção.
+
+        Não faz nada se o usuário não for instrutor.
+
+        Args:
+            user_id: ID do usuário.
+            full_name: Nome completo.
+            biological_sex: Sexo biológico.
+        """
+        ...
+
+    @abstractmethod
+    async def sync_prices(self, profile_ids: Collection[UUID]) -> None:
+        """
+        Copia para a projeção os preços finais gravados nos perfis.
+
+        Args:
+            profile_ids: IDs dos perfis com preços finais recalculados.
+        """
+        ...
+
+    @abstractmethod
+    async def rebuild(self, batch_size: int = 500) -> int:
+        """
+        Regrava todas as linhas a partir das tabelas de origem.
+
+        Usado no preenchimento inicial e para ressincronizar a projeção
+        depois de um período com a replicação desabilitada.
+
+        Args:
+            batch_size: Instrutores processados por lote.
+
+        Returns:
+            Número de instrutores regravados.
+        """
+        ...
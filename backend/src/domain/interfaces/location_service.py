@@ -5,6 +5,9 @@ Interface para serviço de geolocalização.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+import numpy as np
 
 from src.domain.entities.instructor_profile import InstructorProfile
 from src.domain.entities.location import Location
@@ -71,6 +74,28 @@ class ILocationService(ABC):
         """
         ...
 
+    @abstractmethod
+    def filter_within_radius(
+        self,
+        points: Sequence[Location | None],
+        center: Location,
+        radius_km: float,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Filtra, em lote, os pontos que estão dentro de um raio.
+
+        Args:
+            points: Pontos a verificar (None para itens sem localização).
+            center: Centro do raio.
+            radius_km: Raio em quilômetros.
+
+        Returns:
+            Tupla (índices, distâncias): posições em `points` dentro do raio,
+            ordenadas da mais próxima para a mais distante, e as respectivas
+            distâncias em quilômetros.
+        """
+        ...
+
     @abstractmethod
     async def get_city_name(self, location: Location) -> str | None:
         """
@@ -0,0 +1,36 @@
+"""
+ILocationWriteBuffer Interface
+
+Interface para o buffer de escrita de localização de instrutores.
+"""
+
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from src.domain.entities.location import Location
+
+
+class ILocationWriteBuffer(ABC):
+    """
+    Interface abstrata para o buffer de escrita de localização.
+
+    Acumula as posições recebidas (a mais recente de cada instrutor vence)
+    para que sejam gravadas no banco em lote, periodicamente.
+    """
+
+    @abstractmethod
+    async def enqueue(self, user_id: UUID, location: Location, city: str | None = None) -> bool:
+        """
+        Acumula a posição de um instrutor para a próxima gravação em lote.
+
+        Args:
+            user_id: ID do usuário instrutor.
+            location: Nova localização.
+            city: Nova cidade (opcional).
+
+        Returns:
+            True se a posição foi aceita; False se o buffer não garante a
+            gravação dentro do atraso máximo (ex: nenhum flusher ativo) e a
+            posição deve ser gravada diretamente.
+        """
+        ...
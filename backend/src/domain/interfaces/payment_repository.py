@@ -10,6 +10,7 @@ from uuid import UUID
 from src.domain.entities.payment import Payment
 from src.domain.entities.payment_status import PaymentStatus
 from src.domain.entities.scheduling_status import SchedulingStatus
+from src.domain.entities.search_position import ListPosition
 
 
 class IPaymentRepository(ABC):
@@ -105,6 +106,7 @@ class IPaymentRepository(ABC):
         scheduling_status: SchedulingStatus | None = None,
         limit: int = 50,
         offset: int = 0,
+        after: ListPosition | None = None,
     ) -> list[Payment]:
         """
         Lista pagamentos de um aluno.
@@ -115,9 +117,12 @@ class IPaymentRepository(ABC):
             scheduling_status: Filtro pelo status do agendamento vinculado (opcional).
             limit: Número máximo de resultados.
             offset: Deslocamento para paginação.
+            after: Posição (created_at, id) do último pagamento da página
+                anterior; quando informada, a página começa logo depois dele
+                e offset é ignorado.
 
         Returns:
-            Lista de pagamentos ordenados por data (mais recentes primeiro).
+            Lista de pagamentos ordenados por (data, id), mais recentes primeiro.
         """
         ...
 
@@ -129,6 +134,7 @@ class IPaymentRepository(ABC):
         scheduling_status: SchedulingStatus | None = None,
         limit: int = 50,
         offset: int = 0,
+        after: ListPosition | None = None,
     ) -> list[Payment]:
         """
         Lista pagamentos de um instrutor.
@@ -139,9 +145,12 @@ class IPaymentRepository(ABC):
             scheduling_status: Filtro pelo status do agendamento vinculado (opcional).
             limit: Número máximo de resultados.
             offset: Deslocamento para paginação.
+            after: Posição (created_at, id) do último pagamento da página
+                anterior; quando informada, a página começa logo depois dele
+                e offset é ignorado.
 
         Returns:
-            Lista de pagamentos ordenados por data (mais recentes primeiro).
+            Lista de pagamentos ordenados por (data, id), mais recentes primeiro.
         """
         ...
 
@@ -11,6 +11,8 @@ from uuid import UUID
 
 from src.domain.entities.scheduling import Scheduling
 from src.domain.entities.scheduling_status import SchedulingStatus
+from src.domain.entities.scheduling_transition import SchedulingTransition
+from src.domain.entities.search_position import ListPosition
 
 
 class ISchedulingRepository(ABC):
@@ -37,6 +39,7 @@ class ISchedulingRepository(ABC):
         date_to: datetime | None = None,
         limit: int = 50,
         offset: int = 0,
+        after: ListPosition | None = None,
     ) -> list[Scheduling]:
         """
         Lista todos os agendamentos do sistema com filtros abrangentes.
@@ -49,6 +52,9 @@ class ISchedulingRepository(ABC):
             date_to: Data final (scheduled_datetime).
             limit: Limite de resultados.
             offset: Deslocamento para paginação.
+            after: Posição (scheduled_datetime, id) da última linha da página
+                anterior; quando informada, a página começa logo depois dela
+                e offset é ignorado.
         """
         ...
 
@@ -66,6 +72,32 @@ class ISchedulingRepository(ABC):
         """
         ...
 
+    @abstractmethod
+    async def page_all(
+        self,
+        status: SchedulingStatus | None = None,
+        student_id: UUID | None = None,
+        instructor_id: UUID | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        limit: int = 50,
+        offset: int = 0,
+        after: ListPosition | None = None,
+    ) -> tuple[list[Scheduling], int]:
+        """
+        Página de list_all() com o total de agendamentos que atendem aos
+        filtros, calculado na mesma consulta (substitui count_all()).
+
+        Sem nenhum filtro o total é a estimativa do planejador para a tabela.
+
+        Args:
+            Os mesmos de list_all().
+
+        Returns:
+            Tupla (agendamentos da página, total da listagem).
+        """
+        ...
+
     @abstractmethod
     async def create(self, scheduling: Scheduling) -> Scheduling:
         """
@@ -76,6 +108,30 @@ class ISchedulingRepository(ABC):
 
         Returns:
             Agendamento criado com ID persistido.
+
+        Raises:
+            SchedulingConflictException: Se o horário se sobrepõe a outro
+                agendamento não cancelado do instrutor.
+        """
+        ...
+
+    @abstractmethod
+    async def create_many(
+        self, schedulings: list[Scheduling]
+    ) -> tuple[list[Scheduling], list[Scheduling]]:
+        """
+        Cria vários agendamentos em um único INSERT.
+
+        Se um agendamento concorrente ocupou algum dos horários, cada um é
+        gravado separadamente e só os sobrepostos ficam de fora; a transação
+        da requisição continua utilizável.
+
+        Args:
+            schedulings: Agendamentos a criar (já validados).
+
+        Returns:
+            Tupla (criados, recusados por sobreposição a outro agendamento
+            não cancelado do instrutor).
         """
         ...
 
@@ -102,6 +158,10 @@ class ISchedulingRepository(ABC):
 
         Returns:
             Agendamento atualizado.
+
+        Raises:
+            SchedulingConflictException: Se o novo horário se sobrepõe a outro
+                agendamento não cancelado do instrutor.
         """
         ...
 
@@ -126,6 +186,7 @@ class ISchedulingRepository(ABC):
         limit: int = 50,
         offset: int = 0,
         payment_status_filter: str | None = None,
+        after: ListPosition | None = None,
     ) -> list[Scheduling]:
         """
         Lista agendamentos de um aluno.
@@ -136,9 +197,37 @@ class ISchedulingRepository(ABC):
             limit: Número máximo de resultados.
             offset: Deslocamento para paginação.
             payment_status_filter: Filtro por status de pagamento (pending, completed, none).
+            after: Posição (scheduled_datetime, id) da última linha da página
+                anterior; quando informada, a página começa logo depois dela
+                e offset é ignorado.
 
         Returns:
-            Lista de agendamentos ordenados por data.
+            Lista de agendamentos ordenados por (data, id): ascendente sem
+            filtro de status, descendente com filtro.
+        """
+        ...
+
+    @abstractmethod
+    async def page_by_student(
+        self,
+        student_id: UUID,
+        status: SchedulingStatus | Sequence[SchedulingStatus] | None = None,
+        limit: int = 50,
+        offset: int = 0,
+        payment_status_filter: str | None = None,
+        after: ListPosition | None = None,
+    ) -> tuple[list[Scheduling], int]:
+        """
+        Página de list_by_student() com o total da listagem calculado na
+        mesma consulta (substitui count_by_student()).
+
+        Com posição, o total é o ordinal dela mais as linhas seguintes.
+
+        Args:
+            Os mesmos de list_by_student().
+
+        Returns:
+            Tupla (agendamentos da página, total da listagem).
         """
         ...
 
@@ -149,6 +238,7 @@ class ISchedulingRepository(ABC):
         status: SchedulingStatus | Sequence[SchedulingStatus] | None = None,
         limit: int = 50,
         offset: int = 0,
+        after: ListPosition | None = None,
     ) -> list[Scheduling]:
         """
         Lista agendamentos de um instrutor.
@@ -158,12 +248,38 @@ class ISchedulingRepository(ABC):
             status: Filtro por status (opcional).
             limit: Número máximo de resultados.
             offset: Deslocamento para paginação.
+            after: Posição (scheduled_datetime, id) da última linha da página
+                anterior; quando informada, a página começa logo depois dela
+                e offset é ignorado.
 
         Returns:
             Lista de agendamentos ordenados por data (mais recentes primeiro).
         """
         ...
 
+    @abstractmethod
+    async def page_by_instructor(
+        self,
+        instructor_id: UUID,
+        status: SchedulingStatus | Sequence[SchedulingStatus] | None = None,
+        limit: int = 50,
+        offset: int = 0,
+        after: ListPosition | None = None,
+    ) -> tuple[list[Scheduling], int]:
+        """
+        Página de list_by_instructor() com o total da listagem calculado na
+        mesma consulta (substitui count_by_instructor()).
+
+        Com posição, o total é o ordinal dela mais as linhas seguintes.
+
+        Args:
+            Os mesmos de list_by_instructor().
+
+        Returns:
+            Tupla (agendamentos da página, total da listagem).
+        """
+        ...
+
     @abstractmethod
     async def get_next_instructor_scheduling(
         self,
@@ -220,6 +336,30 @@ class ISchedulingRepository(ABC):
         """
         ...
 
+    @abstractmethod
+    async def list_busy_intervals(
+        self,
+        instructor_id: UUID,
+        start: datetime,
+        end: datetime,
+    ) -> list[tuple[datetime, datetime]]:
+        """
+        Lista os intervalos ocupados do instrutor que se sobrepõem a um período.
+
+        Usado para calcular a disponibilidade de vários horários com uma
+        única consulta, em vez de um check_conflict por horário.
+
+        Args:
+            instructor_id: ID do instrutor.
+            start: Início do período (aware).
+            end: Fim do período (aware, exclusivo).
+
+        Returns:
+            Pares (início, fim) dos agendamentos não cancelados, ordenados
+            pelo início.
+        """
+        ...
+
     @abstractmethod
     async def count_by_student(
         self,
@@ -314,7 +454,9 @@ class ISchedulingRepository(ABC):
             month: Mês (1-12).
 
         Returns:
-            Lista de datas que possuem agendamentos (não cancelados).
+            Dicionário com dates (datas ISO com aulas não canceladas e não
+            concluídas, no horário de Brasília), year, month, has_prev e
+            has_next (se há aulas em meses anteriores/posteriores).
         """
         ...
 
@@ -360,4 +502,49 @@ class ISchedulingRepository(ABC):
         """
         ...
 
+    @abstractmethod
+    async def cancel_expired_cart_items(
+        self,
+        reason: str,
+        student_id: UUID | None = None,
+        timeout_minutes: int = 12,
+        processing_timeout_minutes: int = 30,
+    ) -> list[SchedulingTransition]:
+        """
+        Cancela em lote os agendamentos expirados no carrinho.
+
+        Usa o mesmo critério de get_expired_cart_items() e as regras de
+        Scheduling.cancel() (só status canceláveis), com o próprio aluno
+        como autor do cancelamento, em uma única instrução.
+
+        Args:
+            reason: Motivo gravado em cancellation_reason.
+            student_id: ID do aluno para filtrar (opcional).
+            timeout_minutes: Tempo máximo no carrinho (PENDING) em minutos.
+            processing_timeout_minutes: Tempo máximo em checkout (PROCESSING) em minutos.
+
+        Returns:
+            Agendamentos cancelados.
+        """
+        ...
+
+    @abstractmethod
+    async def complete_overdue_confirmed(
+        self, hours_threshold: int = 24
+    ) -> list[SchedulingTransition]:
+        """
+        Conclui em lote as aulas confirmadas cujo término excedeu o threshold.
+
+        Usa o mesmo critério de get_overdue_confirmed() e as regras de
+        Scheduling.auto_complete() (só aulas CONFIRMED; disputas ficam de
+        fora), em uma única instrução.
+
+        Args:
+            hours_threshold: Horas após o término da aula.
+
+        Returns:
+            Agendamentos concluídos.
+        """
+        ...
+
 
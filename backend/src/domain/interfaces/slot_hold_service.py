@@ -0,0 +1,123 @@
+"""
+ISlotHoldService Interface
+
+Interface para as reservas temporárias de horários do carrinho.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from datetime import datetime
+from uuid import UUID
+
+from src.domain.entities.slot_hold import SlotHold
+
+
+class ISlotHoldService(ABC):
+    """
+    Interface abstrata para reservas temporárias de horários.
+
+    Uma reserva impede, até expirar, que outro aluno segure um horário
+    sobreposto do mesmo instrutor. A verificação e a gravação são atômicas.
+    """
+
+    @abstractmethod
+    async def hold(self, hold: SlotHold) -> bool:
+        """
+        Segura um horário para o aluno (ou renova a reserva dele).
+
+        Args:
+            hold: Reserva a gravar, válida até hold.expires_at.
+
+        Returns:
+            True se a reserva foi gravada; False se outra reserva válida
+            sobrepõe o horário.
+        """
+        ...
+
+    @abstractmethod
+    async def release(self, student_id: UUID, hold_id: str) -> bool:
+        """
+        Libera uma reserva do aluno.
+
+        Args:
+            student_id: ID do aluno dono da reserva.
+            hold_id: Identificador da reserva (SlotHold.hold_id).
+
+        Returns:
+            True se a reserva existia e foi liberada.
+        """
+        ...
+
+    @abstractmethod
+    async def list_for_student(self, student_id: UUID) -> list[SlotHold]:
+        """
+        Lista as reservas válidas do aluno, ordenadas pelo horário.
+
+        Args:
+            student_id: ID do aluno.
+        """
+        ...
+
+    @abstractmethod
+    async def is_held_by_other(
+        self,
+        instructor_id: UUID,
+        student_id: UUID,
+        start: datetime,
+        end: datetime,
+    ) -> bool:
+        """
+        Verifica se outro aluno segura um horário sobreposto ao período.
+
+        Args:
+            instructor_id: ID do instrutor.
+            student_id: ID do aluno que consulta (reservas dele são ignoradas).
+            start: Início do período (aware).
+            end: Fim do período (aware, exclusivo).
+        """
+        ...
+
+    @abstractmethod
+    async def list_for_instructor(
+        self,
+        instructor_id: UUID,
+        start: datetime,
+        end: datetime,
+        exclude_student_id: UUID | None = None,
+    ) -> list[tuple[datetime, datetime]]:
+        """
+        Lista os horários do instrutor segurados que se sobrepõem ao período.
+
+        Complementa ISchedulingRepository.list_busy_intervals: os horários em
+        carrinhos ainda não são agendamentos, mas não podem ser oferecidos.
+
+        Args:
+            instructor_id: ID do instrutor.
+            start: Início do período (aware).
+            end: Fim do período (aware, exclusivo).
+            exclude_student_id: Aluno cujas reservas são ignoradas (opcional).
+
+        Returns:
+            Pares (início, fim) das reservas válidas, ordenados pelo início.
+        """
+        ...
+
+    @abstractmethod
+    async def held_instructors(
+        self,
+        instructor_ids: Sequence[UUID],
+        start: datetime,
+        end: datetime,
+        exclude_student_id: UUID | None = None,
+    ) -> set[UUID]:
+        """
+        Dentre os instrutores informados, os que têm horário segurado
+        sobreposto ao período (uma ida ao Redis para todos).
+
+        Args:
+            instructor_ids: IDs dos instrutores a verificar.
+            start: Início do período (aware).
+            end: Fim do período (aware, exclusivo).
+            exclude_student_id: Aluno cujas reservas são ignoradas (opcional).
+        """
+        ...
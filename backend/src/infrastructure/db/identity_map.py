@@ -0,0 +1,47 @@
+"""
+Identity Map
+
+Entidades de domínio já carregadas na requisição, indexadas por (tipo, id).
+
+Os repositórios que recebem o mesmo mapa (um por requisição, junto da
+sessão) servem da memória as buscas repetidas pelo mesmo id, sem nova ida ao
+banco; as escritas do repositório atualizam ou descartam a entrada.
+
+Entradas e leituras são cópias rasas: um caso de uso que altera a entidade
+lida não muda o que outras leituras recebem até o repositório gravá-la.
+"""
+
+import copy
+from collections.abc import Callable
+from typing import Any, TypeVar
+from uuid import UUID
+
+T = TypeVar("T")
+
+
+class IdentityMap:
+    """Entidades carregadas na requisição, por (tipo, id)."""
+
+    def __init__(self) -> None:
+        self._entities: dict[tuple[type, UUID], Any] = {}
+
+    def get(self, entity_type: type[T], entity_id: UUID) -> T | None:
+        """Retorna uma cópia da entidade em memória, se já carregada."""
+        entity = self._entities.get((entity_type, entity_id))
+        return copy.copy(entity) if entity is not None else None
+
+    def find(self, entity_type: type[T], predicate: Callable[[T], bool]) -> T | None:
+        """Busca por outro atributo (ex: pagamento de um agendamento) entre as carregadas."""
+        for (cached_type, _), entity in self._entities.items():
+            if cached_type is entity_type and predicate(entity):
+                return copy.copy(entity)
+        return None
+
+    def put(self, entity: T) -> T:
+        """Registra (ou substitui) a entidade pelo seu id e a devolve."""
+        self._entities[(type(entity), entity.id)] = copy.copy(entity)
+        return entity
+
+    def discard(self, entity_type: type, entity_id: UUID) -> None:
+        """Remove a entidade; a próxima leitura volta ao banco."""
+        self._entities.pop((entity_type, entity_id), None)
@@ -8,7 +8,9 @@ from .availability_model import AvailabilityModel
 from .dispute_model import DisputeModel
 from .notification_model import NotificationModel
 from .push_token_model import PushTokenModel
+from .instructor_month_summary_model import InstructorMonthSummaryModel
 from .instructor_profile_model import InstructorProfileModel
+from .instructor_search_index_model import InstructorSearchIndexModel
 from .message_model import MessageModel
 from .payment_model import PaymentModel
 from .refresh_token_model import RefreshTokenModel
@@ -22,6 +24,8 @@ __all__ = [
     "UserModel",
     "RefreshTokenModel",
     "InstructorProfileModel",
+    "InstructorSearchIndexModel",
+    "InstructorMonthSummaryModel",
     "StudentProfileModel",
     "SchedulingModel",
     "AvailabilityModel",
@@ -0,0 +1,57 @@
+"""
+InstructorMonthSummary SQLAlchemy Model
+
+Resumo mensal de aulas por dia de cada instrutor (calendário da agenda).
+"""
+
+import uuid
+from datetime import date, datetime
+
+from sqlalchemy import Date, DateTime, ForeignKey, Integer, func
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infrastructure.db.database import Base
+
+# Posições de day_counts (dias 1 a 31)
+MONTH_DAYS = 31
+
+
+class InstructorMonthSummaryModel(Base):
+    """
+    Modelo SQLAlchemy para a tabela instructor_month_summaries.
+
+    Uma linha por instrutor e mês (horário de Brasília) com a quantidade de
+    aulas não canceladas e não concluídas de cada dia: day_counts[d] é o dia
+    d do mês. Mantida por SchedulingRepositoryImpl na mesma transação das
+    escritas de agendamento; o calendário da agenda lê uma linha em vez de
+    agregar os agendamentos do mês.
+    """
+
+    __tablename__ = "instructor_month_summaries"
+
+    instructor_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    # Primeiro dia do mês
+    month: Mapped[date] = mapped_column(Date, primary_key=True)
+
+    day_counts: Mapped[list[int]] = mapped_column(ARRAY(Integer), nullable=False)
+    lesson_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    @property
+    def days_mask(self) -> int:
+        """Bitmap dos dias com aulas (bit d-1 = dia d)."""
+        return sum(1 << i for i, count in enumerate(self.day_counts) if count > 0)
+
+    def __repr__(self) -> str:
+        return f"<InstructorMonthSummaryModel(instructor_id={self.instructor_id}, month={self.month})>"
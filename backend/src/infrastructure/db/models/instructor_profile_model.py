@@ -9,7 +9,7 @@ from datetime import datetime
 from decimal import Decimal
 
 from geoalchemy2 import Geometry
-from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Numeric, String, Text, func
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, Numeric, String, Text, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -86,6 +86,26 @@ class InstructorProfileModel(Base):
         Numeric(10, 2), nullable=True,
     )
 
+    # Preços finais para o aluno (PricingService.calculate_final_price),
+    # gravados na escrita dos preços base e recalculados em lote quando as
+    # taxas mudam (assinatura das taxas usadas em final_prices_signature)
+    final_hourly_rate: Mapped[Decimal | None] = mapped_column(
+        Numeric(10, 2), nullable=True,
+    )
+    final_price_cat_a_instructor_vehicle: Mapped[Decimal | None] = mapped_column(
+        Numeric(10, 2), nullable=True,
+    )
+    final_price_cat_a_student_vehicle: Mapped[Decimal | None] = mapped_column(
+        Numeric(10, 2), nullable=True,
+    )
+    final_price_cat_b_instructor_vehicle: Mapped[Decimal | None] = mapped_column(
+        Numeric(10, 2), nullable=True,
+    )
+    final_price_cat_b_student_vehicle: Mapped[Decimal | None] = mapped_column(
+        Numeric(10, 2), nullable=True,
+    )
+    final_prices_signature: Mapped[str | None] = mapped_column(String(50), nullable=True)
+
     # Avaliações
     rating: Mapped[float] = mapped_column(
         Numeric(3, 2),
@@ -104,6 +124,14 @@ class InstructorProfileModel(Base):
         nullable=False,
         index=True,
     )
+    # Versão da disponibilidade semanal: incrementada pelo repositório de
+    # disponibilidade a cada escrita; chave do cache da semana
+    availability_version: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default=text("0"),
+        nullable=False,
+    )
 
     # Localização (PostGIS Point, SRID 4326 = WGS84)
     location: Mapped[str | None] = mapped_column(
@@ -137,8 +165,24 @@ class InstructorProfileModel(Base):
     __table_args__ = (
         # Índice GIST para busca espacial
         Index("ix_instructor_profiles_location", "location", postgresql_using="gist"),
+        # Índice GIST de expressão geography: usado por ST_DWithin e KNN (<->)
+        # em metros reais sem reprojetar a coluna indexada
+        Index(
+            "ix_instructor_profiles_location_geog",
+            text("geography(location)"),
+            postgresql_using="gist",
+        ),
+        # Índice parcial para o ramo "sem localização" da busca
+        Index(
+            "ix_instructor_profiles_no_location_rating",
+            "rating",
+            postgresql_where=text("location IS NULL AND is_available"),
+        ),
         # Índice composto para filtrar por disponibilidade
         Index("ix_instructor_profiles_available_rating", "is_available", "rating"),
+        # ix_instructor_profiles_city_unaccent_trgm (GIN trigram sobre
+        # f_unaccent(city)) é criado apenas via migration, pois depende da
+        # função f_unaccent e da extensão pg_trgm
     )
 
     def to_entity(self) -> InstructorProfile:
@@ -172,6 +216,12 @@ class InstructorProfileModel(Base):
             price_cat_a_student_vehicle=self.price_cat_a_student_vehicle,
             price_cat_b_instructor_vehicle=self.price_cat_b_instructor_vehicle,
             price_cat_b_student_vehicle=self.price_cat_b_student_vehicle,
+            final_hourly_rate=self.final_hourly_rate,
+            final_price_cat_a_instructor_vehicle=self.final_price_cat_a_instructor_vehicle,
+            final_price_cat_a_student_vehicle=self.final_price_cat_a_student_vehicle,
+            final_price_cat_b_instructor_vehicle=self.final_price_cat_b_instructor_vehicle,
+            final_price_cat_b_student_vehicle=self.final_price_cat_b_student_vehicle,
+            final_prices_signature=self.final_prices_signature,
             created_at=self.created_at,
             updated_at=self.updated_at,
         )
@@ -204,6 +254,12 @@ class InstructorProfileModel(Base):
             price_cat_a_student_vehicle=profile.price_cat_a_student_vehicle,
             price_cat_b_instructor_vehicle=profile.price_cat_b_instructor_vehicle,
             price_cat_b_student_vehicle=profile.price_cat_b_student_vehicle,
+            final_hourly_rate=profile.final_hourly_rate,
+            final_price_cat_a_instructor_vehicle=profile.final_price_cat_a_instructor_vehicle,
+            final_price_cat_a_student_vehicle=profile.final_price_cat_a_student_vehicle,
+            final_price_cat_b_instructor_vehicle=profile.final_price_cat_b_instructor_vehicle,
+            final_price_cat_b_student_vehicle=profile.final_price_cat_b_student_vehicle,
+            final_prices_signature=profile.final_prices_signature,
             created_at=profile.created_at,
             updated_at=profile.updated_at,
         )
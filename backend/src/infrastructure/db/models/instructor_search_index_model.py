@@ -0,0 +1,111 @@
+"""
+InstructorSearchIndex SQLAlchemy Model
+
+Projeção desnormalizada de instrutores usada pela busca.
+"""
+
+import uuid
+from datetime import datetime
+from decimal import Decimal
+
+from geoalchemy2 import Geography
+from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Index, Numeric, String, func, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infrastructure.db.database import Base
+
+
+class InstructorSearchIndexModel(Base):
+    """
+    Modelo SQLAlchemy para a tabela instructor_search_index.
+
+    Uma linha por perfil de instrutor com exatamente o que a busca precisa,
+    para que ela seja uma consulta indexada em uma única tabela (sem JOIN com
+    users nem cálculo de preços por linha). Mantida por
+    InstructorSearchIndexRepositoryImpl a partir das escritas de perfil e
+    usuário (com instructor_search_projection_sync_enabled); os preços são
+    cópias dos preços finais gravados em instructor_profiles.
+    """
+
+    __tablename__ = "instructor_search_index"
+
+    profile_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("instructor_profiles.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        unique=True,
+        nullable=False,
+    )
+
+    # Dados do usuário
+    full_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    first_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    last_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    biological_sex: Mapped[str | None] = mapped_column(String(10), nullable=True)
+
+    # Dados do perfil
+    city: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    vehicle_type: Mapped[str] = mapped_column(String(100), nullable=False)
+    license_category: Mapped[str] = mapped_column(String(10), nullable=False)
+    is_available: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    has_mp_account: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    rating: Mapped[Decimal] = mapped_column(Numeric(3, 2), nullable=False)
+    total_reviews: Mapped[int] = mapped_column(nullable=False)
+
+    # Localização: geography para ST_DWithin/KNN em metros sem conversão;
+    # latitude/longitude evitam ST_X/ST_Y na leitura
+    location: Mapped[str | None] = mapped_column(
+        Geography(geometry_type="POINT", srid=4326, spatial_index=False),
+        nullable=True,
+    )
+    latitude: Mapped[float | None] = mapped_column(Float, nullable=True)
+    longitude: Mapped[float | None] = mapped_column(Float, nullable=True)
+
+    # Preços finais para o aluno (cópia de instructor_profiles.final_*)
+    hourly_rate: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False)
+    price_cat_a_instructor_vehicle: Mapped[Decimal | None] = mapped_column(
+        Numeric(10, 2), nullable=True,
+    )
+    price_cat_a_student_vehicle: Mapped[Decimal | None] = mapped_column(
+        Numeric(10, 2), nullable=True,
+    )
+    price_cat_b_instructor_vehicle: Mapped[Decimal | None] = mapped_column(
+        Numeric(10, 2), nullable=True,
+    )
+    price_cat_b_student_vehicle: Mapped[Decimal | None] = mapped_column(
+        Numeric(10, 2), nullable=True,
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    # Índices
+    __table_args__ = (
+        # KNN/ST_DWithin do ramo localizado
+        Index(
+            "ix_instructor_search_index_location",
+            "location",
+            postgresql_using="gist",
+        ),
+        # Ramo "sem localização" ordenado por rating
+        Index(
+            "ix_instructor_search_index_unlocated_rating",
+            "rating",
+            postgresql_where=text("location IS NULL AND is_available"),
+        ),
+        # ix_instructor_search_index_full_name_trgm e
+        # ix_instructor_search_index_city_trgm (GIN trigram sobre f_unaccent)
+        # são criados apenas via migration, como os de instructor_profiles
+    )
+
+    def __repr__(self) -> str:
+        return f"<InstructorSearchIndexModel(profile_id={self.profile_id}, available={self.is_available})>"
@@ -7,7 +7,7 @@ Modelo SQLAlchemy para a tabela 'payments'.
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import DECIMAL, Enum, ForeignKey
+from sqlalchemy import DECIMAL, Enum, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -80,6 +80,12 @@ class PaymentModel(Base):
         cascade="all, delete-orphan",
     )
 
+    # Índices do histórico paginado por (created_at, id)
+    __table_args__ = (
+        Index("ix_payments_student_created", "student_id", "created_at"),
+        Index("ix_payments_instructor_created", "instructor_id", "created_at"),
+    )
+
     def to_entity(self) -> Payment:
         """Converte model para entidade de domínio."""
         return Payment(
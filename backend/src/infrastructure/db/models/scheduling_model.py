@@ -5,7 +5,7 @@ Modelo de banco de dados para agendamentos.
 """
 
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
 from decimal import Decimal
 
 from sqlalchemy import (
@@ -17,8 +17,9 @@ from sqlalchemy import (
     String,
     Text,
     func,
+    text,
 )
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import UUID, ExcludeConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.domain.entities.lesson_category import LessonCategory
@@ -28,6 +29,15 @@ from src.domain.entities.vehicle_ownership import VehicleOwnership
 from src.infrastructure.db.database import Base
 
 
+LESSON_OVERLAP_CONSTRAINT = "ex_schedulings_instructor_no_overlap"
+
+
+def _default_end_datetime(context) -> datetime:
+    """Término padrão no INSERT, para modelos criados sem end_datetime."""
+    params = context.get_current_parameters()
+    return params["scheduled_datetime"] + timedelta(minutes=params.get("duration_minutes") or 50)
+
+
 class SchedulingModel(Base):
     """
     Modelo SQLAlchemy para tabela de agendamentos.
@@ -63,6 +73,12 @@ class SchedulingModel(Base):
         default=50,
         nullable=False,
     )
+    end_datetime: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=_default_end_datetime,
+        nullable=False,
+        comment="Término da aula (scheduled_datetime + duration_minutes), mantido pelo repositório",
+    )
     price: Mapped[Decimal] = mapped_column(
         Numeric(10, 2),
         nullable=False,
@@ -196,6 +212,44 @@ class SchedulingModel(Base):
         Index("ix_schedulings_student_date", "student_id", "scheduled_datetime"),
         Index("ix_schedulings_instructor_date", "instructor_id", "scheduled_datetime"),
         Index("ix_schedulings_status", "status"),
+        # Listagem do admin sem filtro de usuário, paginada por (data, id)
+        Index("ix_schedulings_date_id", "scheduled_datetime", "id"),
+        # Conflito de horário garantido pelo banco: dois agendamentos não
+        # cancelados do mesmo instrutor não podem se sobrepor. O índice GiST
+        # da constraint (btree_gist para o instructor_id) também atende
+        # check_conflict e list_busy_intervals.
+        ExcludeConstraint(
+            ("instructor_id", "="),
+            (func.tstzrange(scheduled_datetime, end_datetime, "[)"), "&&"),
+            name=LESSON_OVERLAP_CONSTRAINT,
+            using="gist",
+            where=text("status <> 'cancelled'"),
+        ),
+        Index(
+            "ix_schedulings_confirmed_end",
+            "end_datetime",
+            postgresql_where=text("status = 'confirmed'"),
+        ),
+        # Agenda em aberto (próxima aula, calendário do mês, carrinho do
+        # aluno): só agendamentos que não foram cancelados nem concluídos
+        Index(
+            "ix_schedulings_student_active_date",
+            "student_id",
+            "scheduled_datetime",
+            postgresql_where=text("status NOT IN ('cancelled', 'completed')"),
+        ),
+        Index(
+            "ix_schedulings_instructor_active_date",
+            "instructor_id",
+            "scheduled_datetime",
+            postgresql_where=text("status NOT IN ('cancelled', 'completed')"),
+        ),
+        # Limpeza de carrinhos expirados por created_at
+        Index(
+            "ix_schedulings_cart_created",
+            "created_at",
+            postgresql_where=text("status IN ('pending', 'confirmed')"),
+        ),
     )
 
     def to_entity(self) -> Scheduling:
@@ -240,6 +294,7 @@ class SchedulingModel(Base):
             instructor_id=scheduling.instructor_id,
             scheduled_datetime=scheduling.scheduled_datetime,
             duration_minutes=scheduling.duration_minutes,
+            end_datetime=scheduling.lesson_end_datetime,
             price=scheduling.price,
             status=scheduling.status,
             cancellation_reason=scheduling.cancellation_reason,
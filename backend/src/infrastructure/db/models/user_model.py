@@ -202,6 +202,9 @@ class UserModel(Base):
     __table_args__ = (
         Index("ix_users_email_is_active", "email", "is_active"),
         Index("ix_users_user_type_is_active", "user_type", "is_active"),
+        # ix_users_full_name_unaccent_trgm (GIN trigram sobre
+        # f_unaccent(full_name)) é criado apenas via migration, pois depende
+        # da função f_unaccent e da extensão pg_trgm
     )
 
     def to_entity(self) -> User:
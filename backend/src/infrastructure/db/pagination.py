@@ -0,0 +1,88 @@
+"""
+Keyset Pagination Helpers
+
+Predicados de paginação por cursor (keyset/seek) para ordenações com
+múltiplas chaves e direções mistas.
+"""
+
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import Select, and_, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+from src.domain.entities.search_position import ListPosition
+
+# (expressão, valor da última linha da página anterior, ordem descendente?)
+KeysetKey = tuple[ColumnElement[Any], Any, bool]
+
+
+def keyset_after(keys: Sequence[KeysetKey]) -> ColumnElement[bool]:
+    """
+    Monta o predicado "linha vem depois da posição" para uma ordenação.
+
+    Para chaves (a ASC, b DESC, c ASC) e posição (va, vb, vc) gera:
+        a >= va AND (a > va OR (a = va AND b < vb)
+                     OR (a = va AND b = vb AND c > vc))
+
+    O limite na primeira chave (a >= va) é redundante logicamente, mas
+    permite que o planner use um índice sobre ela como condição de busca.
+
+    Args:
+        keys: Chaves na ordem do ORDER BY.
+
+    Returns:
+        Expressão booleana para o WHERE.
+    """
+    alternatives = []
+    for position, (expr, value, descending) in enumerate(keys):
+        equal_prefix = [prev_expr == prev_value for prev_expr, prev_value, _ in keys[:position]]
+        beyond = expr < value if descending else expr > value
+        alternatives.append(and_(*equal_prefix, beyond))
+
+    first_expr, first_value, first_descending = keys[0]
+    bound = first_expr <= first_value if first_descending else first_expr >= first_value
+    return and_(bound, or_(*alternatives))
+
+
+def keyset_order_by(keys: Sequence[KeysetKey]) -> list[ColumnElement[Any]]:
+    """Cláusulas ORDER BY correspondentes às chaves do keyset."""
+    return [expr.desc() if descending else expr.asc() for expr, _, descending in keys]
+
+
+def timeline_page(
+    stmt: Select,
+    at_column: ColumnElement[Any],
+    id_column: ColumnElement[Any],
+    after: ListPosition | None,
+    descending: bool,
+    limit: int,
+    offset: int = 0,
+) -> Select:
+    """
+    Ordena por (instante, id) e pagina a partir da posição ou por OFFSET.
+
+    Com posição, o OFFSET é ignorado: a página começa logo depois da linha
+    do cursor e o custo não cresce com a profundidade. O id como desempate
+    torna a ordem total, então as duas formas percorrem as mesmas linhas.
+
+    Args:
+        stmt: Consulta já filtrada.
+        at_column: Coluna de instante (ex: scheduled_datetime, created_at).
+        id_column: Chave primária da tabela.
+        after: Posição da última linha da página anterior, se houver.
+        descending: Ordem descendente (mais recentes primeiro)?
+        limit: Máximo de linhas.
+        offset: Deslocamento, usado apenas sem posição.
+
+    Returns:
+        Consulta ordenada e paginada.
+    """
+    keys: list[KeysetKey] = [
+        (at_column, after.at if after else None, descending),
+        (id_column, after.id if after else None, descending),
+    ]
+    stmt = stmt.order_by(*keyset_order_by(keys)).limit(limit)
+    if after is not None:
+        return stmt.where(keyset_after(keys))
+    return stmt.offset(offset)
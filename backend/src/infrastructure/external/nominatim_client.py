@@ -0,0 +1,98 @@
+"""
+Nominatim Client
+
+Cliente de geocodificação reversa do Nominatim (OpenStreetMap), usado apenas
+como fallback do geocodificador offline.
+
+Nota: Nominatim requer um User-Agent descritivo e limita o uso a uma
+requisição por segundo. O cliente HTTP é reaproveitado entre chamadas e as
+respostas ficam em cache por coordenada arredondada (~1 km).
+"""
+
+from collections import OrderedDict
+
+import httpx
+import structlog
+
+from src.domain.entities.location import Location
+
+logger = structlog.get_logger()
+
+NOMINATIM_REVERSE_URL = "https://nominatim.openstreetmap.org/reverse"
+
+
+class NominatimClient:
+    """Geocodificação reversa via Nominatim com cliente HTTP compartilhado."""
+
+    def __init__(
+        self,
+        timeout_seconds: float = 3.0,
+        cache_size: int = 1024,
+        precision: int = 2,
+    ) -> None:
+        self._timeout_seconds = timeout_seconds
+        self._cache_size = cache_size
+        self._precision = precision
+        self._cache: OrderedDict[tuple[float, float], str | None] = OrderedDict()
+        self._client: httpx.AsyncClient | None = None
+
+    async def close(self) -> None:
+        """Fecha o cliente HTTP."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def get_city_name(self, location: Location) -> str | None:
+        """
+        Obtém o nome da cidade a partir de coordenadas.
+
+        Args:
+            location: Coordenada consultada.
+
+        Returns:
+            Nome da cidade ou None se não encontrado (ou em caso de erro).
+        """
+        key = (
+            round(location.latitude, self._precision),
+            round(location.longitude, self._precision),
+        )
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self._timeout_seconds,
+                headers={"User-Agent": "GoDrive-App/1.0 (contact@godrive.com)"},
+            )
+
+        params = {
+            "lat": location.latitude,
+            "lon": location.longitude,
+            "format": "json",
+            "addressdetails": 1,
+        }
+        try:
+            response = await self._client.get(NOMINATIM_REVERSE_URL, params=params)
+            response.raise_for_status()
+            address = response.json().get("address", {})
+        except Exception as e:
+            # Erros não entram no cache: a próxima chamada tenta de novo
+            logger.error("geocoding_error", error=str(e), lat=location.latitude, lon=location.longitude)
+            return None
+
+        # Tenta obter cidade, município ou vila
+        city = (
+            address.get("city") or
+            address.get("town") or
+            address.get("village") or
+            address.get("municipality")
+        )
+        self._cache[key] = city
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return city
+
+
+# Instância global (cliente HTTP reaproveitado entre requisições)
+nominatim_client = NominatimClient()
@@ -76,6 +76,22 @@ class RedisCacheService:
             await self.connect()
         await self._client.delete(key)
 
+    async def delete_many(self, keys: list[str]) -> int:
+        """
+        Remove várias chaves em um único comando DEL.
+
+        Args:
+            keys: Lista de chaves a remover.
+
+        Returns:
+            Número de chaves removidas.
+        """
+        if not keys:
+            return 0
+        if self._client is None:
+            await self.connect()
+        return await self._client.delete(*keys)
+
     async def delete_pattern(self, pattern: str) -> int:
         """
         Remove todas as chaves que correspondem ao padrão.
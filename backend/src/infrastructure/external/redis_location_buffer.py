@@ -0,0 +1,256 @@
+"""
+Redis Location Write Buffer
+
+Buffer de escrita de localização de instrutores no Redis.
+
+Cada posição recebida é gravada em um hash (campo = user_id), então pings
+sucessivos do mesmo instrutor se sobrepõem e apenas o mais recente chega ao
+banco. O flusher (LocationBufferFlusher) move periodicamente o hash para um
+hash de trabalho ("flushing"), grava as posições em lote e remove do hash de
+trabalho apenas o que já foi confirmado no banco; um flush interrompido é
+retomado no ciclo seguinte, mesclado com as posições mais novas.
+
+O flusher ativo renova um heartbeat a cada flush bem-sucedido. Se o heartbeat
+estiver mais velho que o atraso máximo configurado (nenhum flusher rodando ou
+banco falhando), enqueue recusa a posição e o chamador grava diretamente.
+
+Contadores de uso ficam em um hash de métricas compartilhado entre as
+instâncias (ver metrics()).
+"""
+
+import json
+import time
+from typing import Any
+from uuid import UUID
+
+import redis.asyncio as redis
+import structlog
+
+from src.domain.entities.location import Location
+from src.domain.interfaces.location_write_buffer import ILocationWriteBuffer
+from src.infrastructure.config import settings
+
+logger = structlog.get_logger()
+
+BUFFER_KEY = "instructors:location-buffer"
+FLUSHING_KEY = f"{BUFFER_KEY}:flushing"
+METRICS_KEY = f"{BUFFER_KEY}:metrics"
+HEARTBEAT_KEY = f"{BUFFER_KEY}:heartbeat"
+LOCK_KEY = f"{BUFFER_KEY}:lock"
+
+# KEYS: buffer, métricas, heartbeat | ARGV: user_id, payload, agora, atraso máximo
+ENQUEUE_SCRIPT = """
+local heartbeat = redis.call('GET', KEYS[3])
+if not heartbeat or tonumber(ARGV[3]) - tonumber(heartbeat) > tonumber(ARGV[4]) then
+    redis.call('HINCRBY', KEYS[2], 'rejected', 1)
+    return 0
+end
+local added = redis.call('HSET', KEYS[1], ARGV[1], ARGV[2])
+redis.call('HINCRBY', KEYS[2], 'accepted', 1)
+if added == 0 then
+    redis.call('HINCRBY', KEYS[2], 'coalesced', 1)
+end
+return 1
+"""
+
+# KEYS: buffer, flushing. Posições novas sobrescrevem as pendentes de um
+# flush anterior que não terminou.
+DRAIN_SCRIPT = """
+local pending = redis.call('HGETALL', KEYS[1])
+for i = 1, #pending, 2 do
+    redis.call('HSET', KEYS[2], pending[i], pending[i + 1])
+end
+redis.call('DEL', KEYS[1])
+return redis.call('HGETALL', KEYS[2])
+"""
+
+# KEYS: lock | ARGV: token. Só libera o lock de quem o adquiriu.
+RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+COUNTER_FIELDS = ("accepted", "coalesced", "rejected", "flushes", "flushed_rows", "flush_errors")
+
+
+class RedisLocationWriteBuffer(ILocationWriteBuffer):
+    """
+    Acumula posições de instrutores no Redis para gravação em lote.
+
+    Posições são aceitas enquanto o heartbeat do flusher tiver no máximo
+    `max_staleness_seconds`; esse é o atraso máximo entre o ping e a
+    gravação no banco em operação normal.
+    """
+
+    def __init__(self, redis_url: str | None = None, max_staleness_seconds: float = 30.0) -> None:
+        self._redis_url = redis_url or settings.redis_url
+        self.max_staleness_seconds = max_staleness_seconds
+        self._client: redis.Redis | None = None
+
+    async def connect(self) -> None:
+        """Estabelece conexão com Redis."""
+        if self._client is None:
+            self._client = redis.from_url(
+                self._redis_url,
+                encoding="utf-8",
+                decode_responses=True,
+            )
+
+    async def disconnect(self) -> None:
+        """Fecha conexão com Redis."""
+        if self._client:
+            await self._client.close()
+            self._client = None
+
+    async def enqueue(self, user_id: UUID, location: Location, city: str | None = None) -> bool:
+        """Acumula a posição (a mais recente de cada instrutor vence)."""
+        if self._client is None:
+            await self.connect()
+
+        now = time.time()
+        payload = json.dumps({
+            "lat": location.latitude,
+            "lon": location.longitude,
+            "city": city,
+            "ts": now,
+        })
+        accepted = await self._client.eval(
+            ENQUEUE_SCRIPT, 3, BUFFER_KEY, METRICS_KEY, HEARTBEAT_KEY,
+            str(user_id), payload, now, self.max_staleness_seconds,
+        )
+        return bool(accepted)
+
+    async def heartbeat(self) -> None:
+        """Registra que há um flusher ativo gravando as posições."""
+        if self._client is None:
+            await self.connect()
+        await self._client.set(HEARTBEAT_KEY, time.time())
+
+    async def acquire_flush_lock(self, token: str, ttl_seconds: float) -> bool:
+        """
+        Adquire o lock de flush (apenas uma instância grava por vez).
+
+        Args:
+            token: Identificador de quem adquire (usado na liberação).
+            ttl_seconds: Expiração do lock, caso o dono pare sem liberá-lo.
+
+        Returns:
+            True se o lock foi adquirido.
+        """
+        if self._client is None:
+            await self.connect()
+        return bool(await self._client.set(LOCK_KEY, token, nx=True, px=int(ttl_seconds * 1000)))
+
+    async def release_flush_lock(self, token: str) -> None:
+        """Libera o lock de flush, se ainda pertencer a `token`."""
+        if self._client is None:
+            await self.connect()
+        await self._client.eval(RELEASE_LOCK_SCRIPT, 1, LOCK_KEY, token)
+
+    async def drain(self) -> dict[UUID, tuple[Location, str | None, float]]:
+        """
+        Move as posições acumuladas para o hash de trabalho e as retorna.
+
+        Deve ser chamado com o lock de flush. Entradas inválidas são
+        descartadas.
+
+        Returns:
+            Mapa user_id -> (localização, cidade, timestamp do ping), incluindo
+            as posições ainda não confirmadas de flushes anteriores.
+        """
+        if self._client is None:
+            await self.connect()
+
+        flat = await self._client.eval(DRAIN_SCRIPT, 2, BUFFER_KEY, FLUSHING_KEY)
+        pending: dict[UUID, tuple[Location, str | None, float]] = {}
+        invalid: list[str] = []
+        for field, raw in zip(flat[::2], flat[1::2]):
+            try:
+                data = json.loads(raw)
+                location = Location(latitude=data["lat"], longitude=data["lon"])
+                pending[UUID(field)] = (location, data.get("city"), float(data["ts"]))
+            except (ValueError, KeyError, TypeError):
+                invalid.append(field)
+
+        if invalid:
+            logger.warning("location_buffer_invalid_entries", count=len(invalid))
+            await self._client.hdel(FLUSHING_KEY, *invalid)
+        return pending
+
+    async def ack(self, user_ids: list[UUID]) -> None:
+        """
+        Remove do hash de trabalho as posições já gravadas no banco.
+
+        Args:
+            user_ids: Instrutores do lote confirmado.
+        """
+        if not user_ids:
+            return
+        if self._client is None:
+            await self.connect()
+        await self._client.hdel(FLUSHING_KEY, *(str(user_id) for user_id in user_ids))
+
+    async def record_flush(self, rows: int, duration_ms: float, max_lag_ms: float) -> None:
+        """
+        Registra um flush concluído.
+
+        Args:
+            rows: Posições gravadas.
+            duration_ms: Duração do flush.
+            max_lag_ms: Maior atraso entre ping e gravação no flush.
+        """
+        if self._client is None:
+            await self.connect()
+        async with self._client.pipeline(transaction=False) as pipe:
+            pipe.hincrby(METRICS_KEY, "flushes", 1)
+            pipe.hincrby(METRICS_KEY, "flushed_rows", rows)
+            pipe.hset(METRICS_KEY, mapping={
+                "last_flush_at": time.time(),
+                "last_flush_ms": round(duration_ms, 3),
+                "last_flush_rows": rows,
+                "last_flush_max_lag_ms": round(max_lag_ms, 3),
+            })
+            await pipe.execute()
+
+    async def record_flush_error(self) -> None:
+        """Registra um flush que falhou."""
+        if self._client is None:
+            await self.connect()
+        await self._client.hincrby(METRICS_KEY, "flush_errors", 1)
+
+    async def metrics(self) -> dict[str, Any]:
+        """
+        Obtém as métricas do buffer (acumuladas entre todas as instâncias).
+
+        Returns:
+            Contadores (accepted, coalesced, rejected, flushes, flushed_rows,
+            flush_errors), posições pendentes, dados do último flush e idade
+            do heartbeat do flusher em segundos (None se nunca houve flush).
+        """
+        if self._client is None:
+            await self.connect()
+        async with self._client.pipeline(transaction=False) as pipe:
+            pipe.hgetall(METRICS_KEY)
+            pipe.hlen(BUFFER_KEY)
+            pipe.hlen(FLUSHING_KEY)
+            pipe.get(HEARTBEAT_KEY)
+            stored, buffered, flushing, heartbeat = await pipe.execute()
+
+        metrics: dict[str, Any] = {field: int(stored.get(field, 0)) for field in COUNTER_FIELDS}
+        metrics["pending"] = buffered + flushing
+        for field in ("last_flush_at", "last_flush_ms", "last_flush_max_lag_ms"):
+            metrics[field] = float(stored[field]) if field in stored else None
+        metrics["last_flush_rows"] = int(stored["last_flush_rows"]) if "last_flush_rows" in stored else None
+        metrics["heartbeat_age_seconds"] = (
+            round(time.time() - float(heartbeat), 3) if heartbeat is not None else None
+        )
+        metrics["max_staleness_seconds"] = self.max_staleness_seconds
+        return metrics
+
+
+# Instância global (singleton)
+location_write_buffer = RedisLocationWriteBuffer(
+    max_staleness_seconds=settings.location_buffer_max_staleness_seconds,
+)
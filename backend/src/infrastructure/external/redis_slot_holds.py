@@ -0,0 +1,265 @@
+"""
+Redis Slot Holds
+
+Reservas temporárias de horários do carrinho no Redis.
+
+Cada instrutor tem um hash com as reservas vigentes (campo = início da aula
+em epoch; valor = aluno, fim da aula e expiração). Segurar um horário é um
+script Lua: remove as reservas expiradas, recusa se outra reserva válida se
+sobrepõe ao período e grava a nova, tudo atomicamente; dois alunos nunca
+seguram horários sobrepostos do mesmo instrutor.
+
+Cada aluno tem um hash com os dados completos das suas reservas (o carrinho),
+usado para listar e, no checkout, materializar os agendamentos. Os dois
+hashes expiram junto com a reserva mais recente; reservas vencidas dentro
+deles são ignoradas na leitura.
+"""
+
+import json
+import time
+from collections.abc import Sequence
+from datetime import datetime, timezone
+from decimal import Decimal
+from uuid import UUID
+
+import redis.asyncio as redis
+import structlog
+
+from src.domain.entities.slot_hold import SlotHold
+from src.domain.interfaces.slot_hold_service import ISlotHoldService
+from src.infrastructure.config import settings
+
+logger = structlog.get_logger()
+
+KEY_PREFIX = "slot-holds"
+
+# KEYS: hash do instrutor, hash do aluno
+# ARGV: aluno, início, fim (epoch s), agora (ms), expiração (ms), hold_id, payload.
+# Os hashes expiram com a reserva que vence por último (o TTL só avança).
+HOLD_SCRIPT = """
+local now = tonumber(ARGV[4])
+local start = tonumber(ARGV[2])
+local finish = tonumber(ARGV[3])
+local holds = redis.call('HGETALL', KEYS[1])
+for i = 1, #holds, 2 do
+    local owner, hold_end, expires = string.match(holds[i + 1], '^([^|]+)|([^|]+)|([^|]+)$')
+    if tonumber(expires) <= now then
+        redis.call('HDEL', KEYS[1], holds[i])
+    elseif tonumber(holds[i]) < finish and tonumber(hold_end) > start
+        and not (owner == ARGV[1] and holds[i] == ARGV[2]) then
+        return 0
+    end
+end
+redis.call('HSET', KEYS[1], ARGV[2], ARGV[1] .. '|' .. ARGV[3] .. '|' .. ARGV[5])
+redis.call('HSET', KEYS[2], ARGV[6], ARGV[7])
+local ttl = tonumber(ARGV[5]) - now
+for _, key in ipairs(KEYS) do
+    if redis.call('PTTL', key) < ttl then
+        redis.call('PEXPIRE', key, ttl)
+    end
+end
+return 1
+"""
+
+# KEYS: hash do instrutor, hash do aluno | ARGV: aluno, início, hold_id.
+# Só remove a reserva do instrutor se ela pertencer ao aluno.
+RELEASE_SCRIPT = """
+local current = redis.call('HGET', KEYS[1], ARGV[2])
+if current and string.sub(current, 1, #ARGV[1] + 1) == ARGV[1] .. '|' then
+    redis.call('HDEL', KEYS[1], ARGV[2])
+end
+return redis.call('HDEL', KEYS[2], ARGV[3])
+"""
+
+
+def instructor_key(instructor_id: UUID) -> str:
+    return f"{KEY_PREFIX}:instructor:{instructor_id}"
+
+
+def student_key(student_id: UUID) -> str:
+    return f"{KEY_PREFIX}:student:{student_id}"
+
+
+class RedisSlotHoldService(ISlotHoldService):
+    """
+    Reservas temporárias de horários com scripts Lua atômicos.
+    """
+
+    def __init__(self, redis_url: str | None = None) -> None:
+        self._redis_url = redis_url or settings.redis_url
+        self._client: redis.Redis | None = None
+
+    async def connect(self) -> None:
+        """Estabelece conexão com Redis."""
+        if self._client is None:
+            self._client = redis.from_url(
+                self._redis_url,
+                encoding="utf-8",
+                decode_responses=True,
+            )
+
+    async def disconnect(self) -> None:
+        """Fecha conexão com Redis."""
+        if self._client:
+            await self._client.close()
+            self._client = None
+
+    async def hold(self, hold: SlotHold) -> bool:
+        """Segura o horário se nenhuma outra reserva válida o sobrepõe."""
+        if self._client is None:
+            await self.connect()
+
+        now_ms = int(time.time() * 1000)
+        expires_ms = int(hold.expires_at.timestamp() * 1000)
+        if expires_ms <= now_ms:
+            return False
+        payload = json.dumps({
+            "instructor_id": str(hold.instructor_id),
+            "start": hold.scheduled_datetime.timestamp(),
+            "duration_minutes": hold.duration_minutes,
+            "lesson_category": hold.lesson_category,
+            "vehicle_ownership": hold.vehicle_ownership,
+            "price": str(hold.price),
+            "expires_ms": expires_ms,
+        })
+        held = await self._client.eval(
+            HOLD_SCRIPT, 2,
+            instructor_key(hold.instructor_id), student_key(hold.student_id),
+            str(hold.student_id),
+            int(hold.scheduled_datetime.timestamp()),
+            int(hold.end_datetime.timestamp()),
+            now_ms, expires_ms, hold.hold_id, payload,
+        )
+        return bool(held)
+
+    async def release(self, student_id: UUID, hold_id: str) -> bool:
+        """Libera a reserva do aluno."""
+        try:
+            instructor_id, start = hold_id.split(":")
+            instructor_id = UUID(instructor_id)
+        except ValueError:
+            return False
+
+        if self._client is None:
+            await self.connect()
+        removed = await self._client.eval(
+            RELEASE_SCRIPT, 2,
+            instructor_key(instructor_id), student_key(student_id),
+            str(student_id), start, hold_id,
+        )
+        return bool(removed)
+
+    async def list_for_student(self, student_id: UUID) -> list[SlotHold]:
+        """Lista as reservas válidas do aluno (as vencidas são descartadas)."""
+        if self._client is None:
+            await self.connect()
+
+        stored = await self._client.hgetall(student_key(student_id))
+        now_ms = time.time() * 1000
+        holds: list[SlotHold] = []
+        stale: list[str] = []
+        for hold_id, raw in stored.items():
+            try:
+                data = json.loads(raw)
+                if data["expires_ms"] <= now_ms:
+                    stale.append(hold_id)
+                    continue
+                holds.append(
+                    SlotHold(
+                        instructor_id=UUID(data["instructor_id"]),
+                        student_id=student_id,
+                        scheduled_datetime=datetime.fromtimestamp(data["start"], tz=timezone.utc),
+                        duration_minutes=int(data["duration_minutes"]),
+                        lesson_category=data["lesson_category"],
+                        vehicle_ownership=data["vehicle_ownership"],
+                        price=Decimal(data["price"]),
+                        expires_at=datetime.fromtimestamp(data["expires_ms"] / 1000, tz=timezone.utc),
+                    )
+                )
+            except (ValueError, KeyError, TypeError, ArithmeticError):
+                logger.warning("slot_hold_invalid_entry", student_id=str(student_id), hold_id=hold_id)
+                stale.append(hold_id)
+
+        if stale:
+            await self._client.hdel(student_key(student_id), *stale)
+        return sorted(holds, key=lambda h: h.scheduled_datetime)
+
+    async def is_held_by_other(
+        self,
+        instructor_id: UUID,
+        student_id: UUID,
+        start: datetime,
+        end: datetime,
+    ) -> bool:
+        """Verifica se outro aluno segura um horário sobreposto ao período."""
+        return bool(await self.list_for_instructor(instructor_id, start, end, student_id))
+
+    async def list_for_instructor(
+        self,
+        instructor_id: UUID,
+        start: datetime,
+        end: datetime,
+        exclude_student_id: UUID | None = None,
+    ) -> list[tuple[datetime, datetime]]:
+        """Lista as reservas válidas do instrutor sobrepostas ao período."""
+        if self._client is None:
+            await self.connect()
+
+        stored = await self._client.hgetall(instructor_key(instructor_id))
+        return held_intervals(stored, start, end, exclude_student_id)
+
+    async def held_instructors(
+        self,
+        instructor_ids: Sequence[UUID],
+        start: datetime,
+        end: datetime,
+        exclude_student_id: UUID | None = None,
+    ) -> set[UUID]:
+        """Instrutores com reserva sobreposta ao período (HGETALL em pipeline)."""
+        if not instructor_ids:
+            return set()
+        if self._client is None:
+            await self.connect()
+
+        async with self._client.pipeline(transaction=False) as pipe:
+            for instructor_id in instructor_ids:
+                pipe.hgetall(instructor_key(instructor_id))
+            stored = await pipe.execute()
+        return {
+            instructor_id
+            for instructor_id, entries in zip(instructor_ids, stored, strict=True)
+            if held_intervals(entries, start, end, exclude_student_id)
+        }
+
+
+def held_intervals(
+    stored: dict[str, str],
+    start: datetime,
+    end: datetime,
+    exclude_student_id: UUID | None = None,
+) -> list[tuple[datetime, datetime]]:
+    """
+    Intervalos (início, fim) das reservas válidas de um hash de instrutor
+    sobrepostas ao período, ordenados pelo início.
+    """
+    now_ms = time.time() * 1000
+    start_ts, end_ts = start.timestamp(), end.timestamp()
+    excluded = str(exclude_student_id) if exclude_student_id is not None else None
+    intervals = []
+    for hold_start, value in stored.items():
+        owner, hold_end, expires = value.split("|")
+        if (
+            owner != excluded
+            and float(expires) > now_ms
+            and float(hold_start) < end_ts
+            and float(hold_end) > start_ts
+        ):
+            intervals.append((
+                datetime.fromtimestamp(float(hold_start), tz=timezone.utc),
+                datetime.fromtimestamp(float(hold_end), tz=timezone.utc),
+            ))
+    return sorted(intervals)
+
+
+# Instância global (singleton)
+slot_hold_service = RedisSlotHoldService()
@@ -2,31 +2,93 @@
 Availability Repository Implementation
 
 Implementação concreta do repositório de disponibilidade.
+
+Toda escrita incrementa instructor_profiles.availability_version na mesma
+transação. Com um WeeklyAvailabilityCache, as leituras de slots ativos
+(list_by_instructor, get_by_instructor_and_day e is_time_available) são
+respondidas pela semana em cache daquela versão, sem ler os slots.
 """
 
 from datetime import datetime
 from typing import Sequence
 from uuid import UUID
 
-from sqlalchemy import and_, or_, select, text
+from sqlalchemy import Boolean, Time, and_, column, delete, insert, or_, select, text, update, values
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.entities.availability import Availability
 from src.domain.interfaces.availability_repository import IAvailabilityRepository
 from src.infrastructure.db.models.availability_model import AvailabilityModel
+from src.infrastructure.db.models.instructor_profile_model import InstructorProfileModel
+from src.infrastructure.services.weekly_availability_cache import (
+    WeeklyAvailability,
+    WeeklyAvailabilityCache,
+)
 
 
 class AvailabilityRepositoryImpl(IAvailabilityRepository):
     """Implementação do repositório de disponibilidade."""
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        week_cache: WeeklyAvailabilityCache | None = None,
+    ) -> None:
         self._session = session
+        self._week_cache = week_cache
+
+    async def _bump_version(self, instructor_id: UUID) -> None:
+        """Incrementa a versão da disponibilidade do instrutor (mesma transação)."""
+        await self._session.execute(
+            update(InstructorProfileModel)
+            .where(InstructorProfileModel.user_id == instructor_id)
+            .values(
+                availability_version=InstructorProfileModel.availability_version + 1,
+                # Editar a disponibilidade não é uma edição do perfil
+                updated_at=InstructorProfileModel.updated_at,
+            )
+        )
+
+    async def _cached_week(self, instructor_id: UUID) -> WeeklyAvailability | None:
+        """
+        Semana de slots ativos da versão atual (cache ou banco).
+
+        Returns:
+            None se não houver cache configurado ou perfil do instrutor.
+        """
+        if self._week_cache is None:
+            return None
+
+        version = (
+            await self._session.execute(
+                select(InstructorProfileModel.availability_version).where(
+                    InstructorProfileModel.user_id == instructor_id
+                )
+            )
+        ).scalar_one_or_none()
+        if version is None:
+            return None
+
+        week = await self._week_cache.get(instructor_id, version)
+        if week is None:
+            stmt = select(AvailabilityModel).where(
+                AvailabilityModel.instructor_id == instructor_id,
+                AvailabilityModel.is_active.is_(True),
+            )
+            result = await self._session.execute(stmt)
+            week = WeeklyAvailability.from_availabilities(
+                instructor_id, version, (row.to_entity() for row in result.scalars().all())
+            )
+            await self._week_cache.put(week)
+        return week
 
     async def create(self, availability: Availability) -> Availability:
         model = AvailabilityModel.from_entity(availability)
         self._session.add(model)
         await self._session.flush()
         await self._session.refresh(model)
+        await self._bump_version(model.instructor_id)
         return model.to_entity()
 
     async def update(self, availability: Availability) -> Availability:
@@ -44,6 +106,7 @@ class AvailabilityRepositoryImpl(IAvailabilityRepository):
 
         await self._session.flush()
         await self._session.refresh(model)
+        await self._bump_version(model.instructor_id)
         return model.to_entity()
 
     async def delete(self, availability_id: UUID) -> bool:
@@ -56,8 +119,59 @@ class AvailabilityRepositoryImpl(IAvailabilityRepository):
 
         await self._session.delete(model)
         await self._session.flush()
+        await self._bump_version(model.instructor_id)
         return True
 
+    async def apply_week_changes(
+        self,
+        instructor_id: UUID,
+        created: list[Availability],
+        updated: list[Availability],
+        deleted_ids: list[UUID],
+    ) -> None:
+        if not (created or updated or deleted_ids):
+            return
+
+        # Um comando por tipo de mudança. Remoções primeiro: um slot novo pode
+        # reutilizar o (dia, início) de um removido (uq_instructor_availability_slot)
+        if deleted_ids:
+            await self._session.execute(
+                delete(AvailabilityModel).where(
+                    AvailabilityModel.instructor_id == instructor_id,
+                    AvailabilityModel.id.in_(deleted_ids),
+                )
+            )
+        if updated:
+            changes = values(
+                column("id", PG_UUID(as_uuid=True)),
+                column("end_time", Time),
+                column("is_active", Boolean),
+                name="changes",
+            ).data([(a.id, a.end_time, a.is_active) for a in updated])
+            await self._session.execute(
+                update(AvailabilityModel)
+                .where(
+                    AvailabilityModel.id == changes.c.id,
+                    AvailabilityModel.instructor_id == instructor_id,
+                )
+                .values(end_time=changes.c.end_time, is_active=changes.c.is_active)
+            )
+        if created:
+            await self._session.execute(
+                insert(AvailabilityModel).values([
+                    {
+                        "id": a.id,
+                        "instructor_id": instructor_id,
+                        "day_of_week": a.day_of_week,
+                        "start_time": a.start_time,
+                        "end_time": a.end_time,
+                        "is_active": a.is_active,
+                    }
+                    for a in created
+                ])
+            )
+        await self._bump_version(instructor_id)
+
     async def get_by_id(self, availability_id: UUID) -> Availability | None:
         stmt = select(AvailabilityModel).where(AvailabilityModel.id == availability_id)
         result = await self._session.execute(stmt)
@@ -67,6 +181,9 @@ class AvailabilityRepositoryImpl(IAvailabilityRepository):
     async def list_by_instructor(
         self, instructor_id: UUID, only_active: bool = True
     ) -> Sequence[Availability]:
+        if only_active and (week := await self._cached_week(instructor_id)) is not None:
+            return week.all()
+
         stmt = (
             select(AvailabilityModel)
             .where(AvailabilityModel.instructor_id == instructor_id)
@@ -86,6 +203,9 @@ class AvailabilityRepositoryImpl(IAvailabilityRepository):
         only_active: bool = True,
     ) -> Sequence[Availability]:
         """Lista slots de um instrutor para um dia específico da semana."""
+        if only_active and (week := await self._cached_week(instructor_id)) is not None:
+            return week.for_day(day_of_week)
+
         stmt = (
             select(AvailabilityModel)
             .where(
@@ -135,6 +255,9 @@ class AvailabilityRepositoryImpl(IAvailabilityRepository):
         """
         Verifica se o horário específico está coberto por algum slot de disponibilidade ativo.
         """
+        if (week := await self._cached_week(instructor_id)) is not None:
+            return week.covers(target_datetime, duration_minutes)
+
         from datetime import timedelta
         from src.core.helpers.timezone_utils import DEFAULT_TIMEZONE
 
@@ -4,49 +4,97 @@ InstructorRepository Implementation
 Implementação concreta do repositório de instrutores com suporte a PostGIS.
 """
 
+from collections.abc import Collection, Sequence
+from datetime import datetime
+from decimal import Decimal
 from uuid import UUID
 
-from sqlalchemy import func as geo_func, select, update, or_
-from sqlalchemy.orm import joinedload, contains_eager, load_only
+from sqlalchemy import Float, Numeric, Select, cast, column, func as geo_func, null, select, union, update, values
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import aliased, joinedload, contains_eager, load_only
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.helpers.timezone_utils import DEFAULT_TIMEZONE
 from src.domain.entities.instructor_profile import InstructorProfile
 from src.domain.entities.location import Location
+from src.domain.entities.search_position import InstructorSearchPosition
 from src.domain.interfaces.instructor_repository import IInstructorRepository
+from src.infrastructure.config import settings
+from src.infrastructure.db.models.availability_model import AvailabilityModel
 from src.infrastructure.db.models.instructor_profile_model import InstructorProfileModel
+from src.infrastructure.db.models.scheduling_model import SchedulingModel
 from src.infrastructure.db.models.user_model import UserModel
-
-
-# Mapeamento de valores de gênero (frontend -> banco)
-GENDER_MAPPING = {
-    'Masculino': 'male',
-    'Feminino': 'female',
-}
-
-
-def _normalize_gender(value: str | None) -> str | None:
-    """Converte valor de gênero do frontend para formato do banco."""
-    if value is None:
+from src.infrastructure.db.pagination import KeysetKey, keyset_after, keyset_order_by
+from src.infrastructure.repositories.instructor_search_index_repository_impl import (
+    InstructorSearchIndexRepositoryImpl,
+    location_updates_values,
+)
+from src.infrastructure.repositories.scheduling_repository_impl import overlaps_active_lessons
+from src.infrastructure.repositories.search_filters import GENDER_MAPPING, normalize_gender
+from src.infrastructure.services.instructor_spatial_index import InstructorSpatialIndex
+from src.infrastructure.services.pricing_service import FINAL_PRICE_FIELDS, PricingService
+
+# Preços finais gravados (e assinatura das taxas), lidos junto aos preços base
+FINAL_PRICE_COLUMNS = (
+    InstructorProfileModel.final_hourly_rate,
+    InstructorProfileModel.final_price_cat_a_instructor_vehicle,
+    InstructorProfileModel.final_price_cat_a_student_vehicle,
+    InstructorProfileModel.final_price_cat_b_instructor_vehicle,
+    InstructorProfileModel.final_price_cat_b_student_vehicle,
+    InstructorProfileModel.final_prices_signature,
+)
+
+
+def previous_position_columns(previous) -> tuple:
+    """Coordenadas da posição antes do UPDATE (alias da própria tabela no FROM)."""
+    return (
+        geo_func.ST_Y(previous.location).label("previous_lat"),
+        geo_func.ST_X(previous.location).label("previous_lon"),
+    )
+
+
+def previous_position(row) -> Location | None:
+    if row.previous_lat is None or row.previous_lon is None:
         return None
-    return GENDER_MAPPING.get(value, value)
+    return Location(latitude=row.previous_lat, longitude=row.previous_lon)
 
 
 class InstructorRepositoryImpl(IInstructorRepository):
     """
     Implementação do repositório de instrutores usando SQLAlchemy e PostGIS.
 
-    Utiliza queries espaciais para busca por proximidade.
+    Utiliza queries espaciais para busca por proximidade. Se um índice
+    espacial em memória carregado for informado, a busca por proximidade de
+    instrutores disponíveis (sem texto) é respondida por ele.
+
+    Com instructor_search_projection_sync_enabled, toda escrita de perfil
+    também atualiza a projeção de busca (instructor_search_index) na mesma
+    transação. A flag é lida aqui, e não por quem instancia o repositório,
+    para que API, tasks e flusher de localização nunca divirjam.
     """
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        spatial_index: InstructorSpatialIndex | None = None,
+    ) -> None:
         self._session = session
+        self._spatial_index = spatial_index
+        self._search_index = (
+            InstructorSearchIndexRepositoryImpl(session)
+            if settings.instructor_search_projection_sync_enabled
+            else None
+        )
 
     async def create(self, profile: InstructorProfile) -> InstructorProfile:
         """Cria um novo perfil de instrutor."""
         model = InstructorProfileModel.from_entity(profile)
+        PricingService.apply_final_prices(model)
         self._session.add(model)
         await self._session.flush()
         await self._session.refresh(model)
+        if self._search_index is not None:
+            await self._search_index.sync_instructor(model.user_id)
         return self._model_to_entity(model)
 
     async def get_by_id(self, profile_id: UUID) -> InstructorProfile | None:
@@ -129,6 +177,7 @@ class InstructorRepositoryImpl(IInstructorRepository):
                     InstructorProfileModel.price_cat_a_student_vehicle,
                     InstructorProfileModel.price_cat_b_instructor_vehicle,
                     InstructorProfileModel.price_cat_b_student_vehicle,
+                    *FINAL_PRICE_COLUMNS,
                     InstructorProfileModel.created_at,
                     InstructorProfileModel.updated_at,
                 ),
@@ -155,6 +204,7 @@ class InstructorRepositoryImpl(IInstructorRepository):
                 price_cat_a_student_vehicle=model.price_cat_a_student_vehicle,
                 price_cat_b_instructor_vehicle=model.price_cat_b_instructor_vehicle,
                 price_cat_b_student_vehicle=model.price_cat_b_student_vehicle,
+                **self._final_price_fields(model),
                 full_name=model.user.full_name if model.user else None,
                 biological_sex=model.user.biological_sex if model.user else None,
                 created_at=model.created_at,
@@ -189,6 +239,7 @@ class InstructorRepositoryImpl(IInstructorRepository):
         model.price_cat_a_student_vehicle = profile.price_cat_a_student_vehicle
         model.price_cat_b_instructor_vehicle = profile.price_cat_b_instructor_vehicle
         model.price_cat_b_student_vehicle = profile.price_cat_b_student_vehicle
+        PricingService.apply_final_prices(model)
 
         # Atualizar campos Mercado Pago OAuth
         model.mp_access_token = profile.mp_access_token
@@ -204,6 +255,8 @@ class InstructorRepositoryImpl(IInstructorRepository):
 
         await self._session.flush()
         await self._session.refresh(model)
+        if self._search_index is not None:
+            await self._search_index.sync_instructor(model.user_id)
         return self._model_to_entity(model)
 
     async def delete(self, profile_id: UUID) -> bool:
@@ -234,26 +287,180 @@ class InstructorRepositoryImpl(IInstructorRepository):
         """
         Busca instrutores por proximidade usando PostGIS e filtros de texto.
 
-        Utiliza ST_DWithin para busca eficiente com índice GIST.
-        Também filtra por nome ou cidade se search_query for fornecido.
+        Executada em dois ramos:
+            1. Instrutores localizados: ST_DWithin + ordenação KNN (<->) sobre
+               geography(location), servidos pelo índice GIST de expressão
+               ix_instructor_profiles_location_geog (sem seq scan/reprojeção).
+            2. Instrutores sem localização: consulta barata ordenada por rating,
+               executada apenas se o primeiro ramo não preencher o limite.
+
+        Se search_query for fornecido, filtra por nome ou cidade (sem acento,
+        via índices trigram) e ordena cada ramo primeiro pela similaridade.
+
+        Com o índice espacial em memória carregado, buscas sem texto de
+        instrutores disponíveis não acessam o banco.
+        """
+        if (
+            self._spatial_index is not None
+            and self._spatial_index.is_ready
+            and only_available
+            and not search_query
+        ):
+            return self._spatial_index.search(
+                center=center,
+                radius_km=radius_km,
+                biological_sex=normalize_gender(biological_sex) if biological_sex else None,
+                license_category=license_category,
+                limit=limit,
+            )
+
+        located_stmt = self._located_search_stmt(
+            center=center,
+            radius_km=radius_km,
+            biological_sex=biological_sex,
+            license_category=license_category,
+            search_query=search_query,
+            only_available=only_available,
+            limit=limit,
+        )
+        result = await self._session.execute(located_stmt)
+        profiles = [self._search_row_to_entity(row) for row in result.all()]
+
+        remaining = limit - len(profiles)
+        if remaining > 0:
+            unlocated_stmt = self._unlocated_search_stmt(
+                biological_sex=biological_sex,
+                license_category=license_category,
+                search_query=search_query,
+                only_available=only_available,
+                limit=remaining,
+            )
+            result = await self._session.execute(unlocated_stmt)
+            profiles.extend(self._search_row_to_entity(row) for row in result.all())
+
+        return profiles
+
+    async def search_free_by_location(
+        self,
+        center: Location,
+        start: datetime,
+        end: datetime,
+        radius_km: float = 10.0,
+        biological_sex: str | None = None,
+        license_category: str | None = None,
+        search_query: str | None = None,
+        limit: int = 50,
+        exclude_instructor_ids: Collection[UUID] = (),
+    ) -> list[InstructorProfile]:
+        """
+        Busca instrutores próximos e livres em um período em uma única query.
+
+        O ramo espacial de search_by_location (ST_DWithin + KNN) recebe dois
+        filtros correlacionados por instrutor: EXISTS de um slot ativo que
+        cobre o período (ix_availability_instructor) e NOT EXISTS de
+        agendamento sobreposto (índice GiST da exclusion constraint).
         """
+        local_start = start.astimezone(DEFAULT_TIMEZONE)
+        local_end = end.astimezone(DEFAULT_TIMEZONE)
+        # Slots não cruzam a meia-noite (mesma regra de is_time_available)
+        if local_end.date() != local_start.date() or end <= start:
+            return []
+
+        covering_slot = select(AvailabilityModel.id).where(
+            AvailabilityModel.instructor_id == InstructorProfileModel.user_id,
+            AvailabilityModel.is_active.is_(True),
+            AvailabilityModel.day_of_week == local_start.weekday(),
+            AvailabilityModel.start_time <= local_start.time(),
+            AvailabilityModel.end_time >= local_end.time(),
+        )
+        booked = select(SchedulingModel.id).where(
+            overlaps_active_lessons(InstructorProfileModel.user_id, start, end)
+        )
+        stmt = self._located_search_stmt(
+            center=center,
+            radius_km=radius_km,
+            biological_sex=biological_sex,
+            license_category=license_category,
+            search_query=search_query,
+            only_available=True,
+            limit=limit,
+        ).where(covering_slot.exists(), ~booked.exists())
+        if exclude_instructor_ids:
+            stmt = stmt.where(InstructorProfileModel.user_id.not_in(exclude_instructor_ids))
+
+        result = await self._session.execute(stmt)
+        return [self._search_row_to_entity(row) for row in result.all()]
+
+    def _located_search_stmt(
+        self,
+        center: Location,
+        radius_km: float,
+        biological_sex: str | None,
+        license_category: str | None,
+        search_query: str | None,
+        only_available: bool,
+        limit: int,
+    ) -> Select:
+        """Monta a query do ramo espacial (instrutores com localização)."""
         # Converter raio de km para metros (PostGIS geography usa metros)
         radius_m = radius_km * 1000
+        location_geog, center_geog = self._geographies(center)
 
-        # Criar ponto de referência
-        center_point = geo_func.ST_SetSRID(
-            geo_func.ST_MakePoint(center.longitude, center.latitude),
-            4326,
+        stmt = (
+            self._search_base_stmt(
+                geo_func.ST_Distance(location_geog, center_geog).label("distance")
+            )
+            .where(geo_func.ST_DWithin(location_geog, center_geog, radius_m))
+            .limit(limit)
+        )
+        if search_query:
+            # Com texto, os mais parecidos primeiro e, em seguida, os mais próximos
+            stmt = stmt.order_by(self._text_rank(search_query).desc())
+        # KNN: ordenação servida diretamente pelo índice GIST
+        stmt = stmt.order_by(location_geog.op("<->")(center_geog))
+        return self._apply_search_filters(
+            stmt, biological_sex, license_category, search_query, only_available
         )
 
-        # Query com busca espacial e suporte a globais (sem localização)
+    def _geographies(self, center: Location):
+        """Expressões geography da coluna (mesma do índice) e do centro."""
+        # Mesma expressão do índice: geography(location) sem typmod
+        location_geog = geo_func.geography(InstructorProfileModel.location)
+        center_geog = geo_func.geography(
+            geo_func.ST_SetSRID(
+                geo_func.ST_MakePoint(center.longitude, center.latitude),
+                4326,
+            )
+        )
+        return location_geog, center_geog
+
+    def _unlocated_search_stmt(
+        self,
+        biological_sex: str | None,
+        license_category: str | None,
+        search_query: str | None,
+        only_available: bool,
+        limit: int,
+    ) -> Select:
+        """Monta a query do ramo de instrutores sem localização (por rating)."""
         stmt = (
+            self._search_base_stmt(null().label("distance"))
+            .where(InstructorProfileModel.location.is_(None))
+            .limit(limit)
+        )
+        if search_query:
+            stmt = stmt.order_by(self._text_rank(search_query).desc())
+        stmt = stmt.order_by(InstructorProfileModel.rating.desc())
+        return self._apply_search_filters(
+            stmt, biological_sex, license_category, search_query, only_available
+        )
+
+    def _search_base_stmt(self, distance_column) -> Select:
+        """Colunas e carregamento compartilhados pelos ramos da busca."""
+        return (
             select(
                 InstructorProfileModel,
-                geo_func.ST_Distance(
-                    geo_func.ST_Transform(InstructorProfileModel.location, 3857),
-                    geo_func.ST_Transform(center_point, 3857),
-                ).label("distance"),
+                distance_column,
                 geo_func.ST_X(InstructorProfileModel.location).label("lon"),
                 geo_func.ST_Y(InstructorProfileModel.location).label("lat"),
             )
@@ -277,116 +484,338 @@ class InstructorRepositoryImpl(IInstructorRepository):
                     InstructorProfileModel.price_cat_a_student_vehicle,
                     InstructorProfileModel.price_cat_b_instructor_vehicle,
                     InstructorProfileModel.price_cat_b_student_vehicle,
+                    *FINAL_PRICE_COLUMNS,
                     InstructorProfileModel.created_at,
                     InstructorProfileModel.updated_at,
                 ),
             )
         )
 
-        # Filtro: (Dentro do raio) OU (Sem localização)
-        spatial_filter = geo_func.ST_DWithin(
-            geo_func.ST_Transform(InstructorProfileModel.location, 3857),
-            geo_func.ST_Transform(center_point, 3857),
-            radius_m,
-        )
-
-        stmt = stmt.where(
-            or_(
-                spatial_filter,
-                InstructorProfileModel.location.is_(None)
-            )
-        )
-
-        # Filtro por texto (Nome ou Cidade)
+    def _apply_search_filters(
+        self,
+        stmt: Select,
+        biological_sex: str | None,
+        license_category: str | None,
+        search_query: str | None,
+        only_available: bool,
+    ) -> Select:
+        """Aplica os filtros não espaciais comuns aos ramos da busca."""
+        # Filtro por texto (Nome ou Cidade). Um OR entre colunas de tabelas
+        # diferentes do JOIN não usa índice; cada lado vira uma subquery
+        # servida pelo seu índice trigram (GIN) e o resultado é unido
         if search_query:
-            stmt = stmt.where(
-                or_(
-                    geo_func.unaccent(UserModel.full_name).ilike(geo_func.unaccent(f"%{search_query}%")),
-                    geo_func.unaccent(InstructorProfileModel.city).ilike(geo_func.unaccent(f"%{search_query}%"))
-                )
+            pattern = geo_func.f_unaccent(f"%{search_query}%")
+            name_user = aliased(UserModel)
+            city_profile = aliased(InstructorProfileModel)
+            matching_user_ids = union(
+                # ix_users_full_name_unaccent_trgm
+                select(name_user.id).where(
+                    geo_func.f_unaccent(name_user.full_name).ilike(pattern)
+                ),
+                # ix_instructor_profiles_city_unaccent_trgm
+                select(city_profile.user_id).where(
+                    geo_func.f_unaccent(city_profile.city).ilike(pattern)
+                ),
             )
-
-        # Ordenação: Localizados primeiro, por distância; depois Sem Localização por rating
-        stmt = stmt.order_by(
-            InstructorProfileModel.location.is_(None).asc(),
-            "distance",
-            InstructorProfileModel.rating.desc()
-        )
-
-        stmt = stmt.limit(limit)
+            stmt = stmt.where(InstructorProfileModel.user_id.in_(matching_user_ids))
 
         if only_available:
             stmt = stmt.where(InstructorProfileModel.is_available.is_(True))
 
         if biological_sex:
             # Normalizar valor de gênero do frontend para formato do banco
-            normalized_sex = _normalize_gender(biological_sex)
+            normalized_sex = normalize_gender(biological_sex)
             stmt = stmt.where(UserModel.biological_sex == normalized_sex)
 
         if license_category:
             stmt = stmt.where(InstructorProfileModel.license_category == license_category)
 
-        result = await self._session.execute(stmt)
-        rows = result.all()
+        return stmt
 
-        # Converter para entidades com localização
-        profiles = []
-        for row in rows:
-            model = row[0]
-            lon = row.lon
-            lat = row.lat
+    def _text_rank(self, search_query: str):
+        """Similaridade trigram (pg_trgm) do termo com o nome ou a cidade."""
+        folded_query = geo_func.f_unaccent(search_query)
+        return geo_func.greatest(
+            geo_func.word_similarity(folded_query, geo_func.f_unaccent(UserModel.full_name)),
+            geo_func.word_similarity(folded_query, geo_func.f_unaccent(InstructorProfileModel.city)),
+        )
 
-            profile = InstructorProfile(
-                id=model.id,
-                user_id=model.user_id,
-                vehicle_type=model.vehicle_type,
-                license_category=model.license_category,
-                hourly_rate=model.hourly_rate,
-                location=Location(latitude=lat, longitude=lon) if lat and lon else None,
-                rating=float(model.rating),
-                total_reviews=model.total_reviews,
-                is_available=model.is_available,
-                price_cat_a_instructor_vehicle=model.price_cat_a_instructor_vehicle,
-                price_cat_a_student_vehicle=model.price_cat_a_student_vehicle,
-                price_cat_b_instructor_vehicle=model.price_cat_b_instructor_vehicle,
-                price_cat_b_student_vehicle=model.price_cat_b_student_vehicle,
-                full_name=model.user.full_name if model.user else None,
-                biological_sex=model.user.biological_sex if model.user else None,
-                bio="",
-                city=model.city,
-                created_at=model.created_at,
-                updated_at=model.updated_at,
-            )
-            profiles.append(profile)
+    def _search_row_to_entity(self, row) -> InstructorProfile:
+        """Converte uma linha da busca (modelo + lon/lat) em entidade."""
+        model = row[0]
+        lon = row.lon
+        lat = row.lat
 
-        return profiles
+        return InstructorProfile(
+            id=model.id,
+            user_id=model.user_id,
+            vehicle_type=model.vehicle_type,
+            license_category=model.license_category,
+            hourly_rate=model.hourly_rate,
+            location=Location(latitude=lat, longitude=lon) if lat and lon else None,
+            rating=float(model.rating),
+            total_reviews=model.total_reviews,
+            is_available=model.is_available,
+            price_cat_a_instructor_vehicle=model.price_cat_a_instructor_vehicle,
+            price_cat_a_student_vehicle=model.price_cat_a_student_vehicle,
+            price_cat_b_instructor_vehicle=model.price_cat_b_instructor_vehicle,
+            price_cat_b_student_vehicle=model.price_cat_b_student_vehicle,
+            **self._final_price_fields(model),
+            full_name=model.user.full_name if model.user else None,
+            biological_sex=model.user.biological_sex if model.user else None,
+            bio="",
+            city=model.city,
+            created_at=model.created_at,
+            updated_at=model.updated_at,
+        )
+
+    async def search_page_by_location(
+        self,
+        center: Location,
+        radius_km: float = 10.0,
+        biological_sex: str | None = None,
+        license_category: str | None = None,
+        search_query: str | None = None,
+        limit: int = 20,
+        after: InstructorSearchPosition | None = None,
+    ) -> list[tuple[InstructorProfile, InstructorSearchPosition]]:
+        """
+        Busca uma página do feed de instrutores disponíveis (paginação keyset).
+
+        A página seguinte parte da posição do último instrutor (`after`) com
+        um predicado de seek sobre as chaves da ordenação, em vez de OFFSET:
+            1. Localizados: (distância <->, rating DESC, id), ordenados pelo
+               índice GIST (KNN) e filtrados a partir da posição.
+            2. Sem localização: (rating DESC, id), busca no índice parcial
+               ix_instructor_profiles_no_location_rating a partir do rating.
+        Com busca textual, a similaridade (DESC) é a primeira chave.
+        """
+        page: list[tuple[InstructorProfile, InstructorSearchPosition]] = []
+        filters = (biological_sex, license_category, search_query)
+
+        if after is None or after.is_located:
+            stmt = self._located_page_stmt(center, radius_km, *filters, limit, after)
+            result = await self._session.execute(stmt)
+            page.extend(self._page_row(row, search_query) for row in result.all())
 
-    async def update_location(self, user_id: UUID, location: Location, city: str | None = None) -> bool:
-        """Atualiza apenas a localização do instrutor (operação otimizada)."""
+        remaining = limit - len(page)
+        if remaining > 0:
+            unlocated_after = after if after is not None and not after.is_located else None
+            stmt = self._unlocated_page_stmt(*filters, remaining, unlocated_after)
+            result = await self._session.execute(stmt)
+            page.extend(self._page_row(row, search_query) for row in result.all())
+
+        return page
+
+    def _located_page_stmt(
+        self,
+        center: Location,
+        radius_km: float,
+        biological_sex: str | None,
+        license_category: str | None,
+        search_query: str | None,
+        limit: int,
+        after: InstructorSearchPosition | None,
+    ) -> Select:
+        """Monta a query de uma página do ramo localizado do feed."""
+        location_geog, center_geog = self._geographies(center)
+        # Distância do operador KNN: mesma expressão na ordenação e no seek
+        distance = location_geog.op("<->", return_type=Float)(center_geog)
+
+        stmt = self._search_base_stmt(distance.label("distance")).where(
+            geo_func.ST_DWithin(location_geog, center_geog, radius_km * 1000)
+        )
+        keys = [
+            (distance, after.distance if after else None, False),
+            (InstructorProfileModel.rating, after.rating if after else None, True),
+            (InstructorProfileModel.id, after.profile_id if after else None, False),
+        ]
+        return self._paginate(stmt, keys, search_query, after, limit, biological_sex, license_category)
+
+    def _unlocated_page_stmt(
+        self,
+        biological_sex: str | None,
+        license_category: str | None,
+        search_query: str | None,
+        limit: int,
+        after: InstructorSearchPosition | None,
+    ) -> Select:
+        """Monta a query de uma página do ramo sem localização do feed."""
+        stmt = self._search_base_stmt(null().label("distance")).where(
+            InstructorProfileModel.location.is_(None)
+        )
+        keys = [
+            (InstructorProfileModel.rating, after.rating if after else None, True),
+            (InstructorProfileModel.id, after.profile_id if after else None, False),
+        ]
+        return self._paginate(stmt, keys, search_query, after, limit, biological_sex, license_category)
+
+    def _paginate(
+        self,
+        stmt: Select,
+        keys: list[KeysetKey],
+        search_query: str | None,
+        after: InstructorSearchPosition | None,
+        limit: int,
+        biological_sex: str | None,
+        license_category: str | None,
+    ) -> Select:
+        """Aplica ranking textual, seek a partir da posição, ordenação e filtros."""
+        if search_query:
+            rank = self._text_rank(search_query)
+            stmt = stmt.add_columns(rank.label("rank"))
+            keys = [(rank, after.rank if after else None, True), *keys]
+
+        if after is not None:
+            stmt = stmt.where(keyset_after(keys))
+
+        stmt = stmt.order_by(*keyset_order_by(keys)).limit(limit)
+        return self._apply_search_filters(
+            stmt, biological_sex, license_category, search_query, only_available=True
+        )
+
+    def _page_row(
+        self, row, search_query: str | None
+    ) -> tuple[InstructorProfile, InstructorSearchPosition]:
+        """Converte uma linha do feed em (entidade, posição na ordenação)."""
+        model = row[0]
+        position = InstructorSearchPosition(
+            profile_id=model.id,
+            rating=Decimal(str(model.rating)),
+            distance=row.distance,
+            rank=row.rank if search_query else None,
+        )
+        return self._search_row_to_entity(row), position
+
+    async def update_location(
+        self, user_id: UUID, location: Location, city: str | None = None
+    ) -> tuple[bool, Location | None]:
+        """
+        Atualiza apenas a localização do instrutor (operação otimizada).
+
+        A posição anterior vem da própria linha antes da alteração (auto-join
+        no FROM), para a invalidação dos tiles da busca.
+        """
         location_wkt = f"SRID=4326;{location.to_wkt()}"
 
         values = {"location": location_wkt}
         if city:
             values["city"] = city
 
+        previous = aliased(InstructorProfileModel, name="previous")
         stmt = (
             update(InstructorProfileModel)
-            .where(InstructorProfileModel.user_id == user_id)
+            .where(
+                InstructorProfileModel.user_id == user_id,
+                InstructorProfileModel.id == previous.id,
+            )
             .values(**values)
+            .returning(*previous_position_columns(previous))
+            .execution_options(synchronize_session=False)
+        )
+
+        result = await self._session.execute(stmt)
+        row = result.first()
+        await self._session.flush()
+
+        if row is None:
+            return False, None
+        if self._search_index is not None:
+            await self._search_index.sync_location(user_id, location, city)
+        return True, previous_position(row)
+
+    async def bulk_update_locations(
+        self, updates: Sequence[tuple[UUID, Location, str | None]]
+    ) -> dict[UUID, Location | None]:
+        """
+        Atualiza a localização de vários instrutores com um único
+        UPDATE ... FROM (VALUES ...) e replica o lote na projeção de busca
+        (se habilitada).
+        """
+        if not updates:
+            return {}
+
+        pings = location_updates_values(updates)
+        previous = aliased(InstructorProfileModel, name="previous")
+        stmt = (
+            update(InstructorProfileModel)
+            .where(
+                InstructorProfileModel.user_id == pings.c.user_id,
+                InstructorProfileModel.id == previous.id,
+            )
+            .values(
+                location=geo_func.ST_SetSRID(geo_func.ST_MakePoint(pings.c.lon, pings.c.lat), 4326),
+                city=geo_func.coalesce(pings.c.city, InstructorProfileModel.city),
+            )
+            .returning(InstructorProfileModel.user_id, *previous_position_columns(previous))
+            .execution_options(synchronize_session=False)
         )
 
         result = await self._session.execute(stmt)
+        updated = {row.user_id: previous_position(row) for row in result.all()}
         await self._session.flush()
 
-        return result.rowcount > 0
+        if updated and self._search_index is not None:
+            await self._search_index.sync_locations(updates)
+        return updated
+
+    async def recompute_final_prices(self, batch_size: int = 500) -> int:
+        """
+        Recalcula os preços finais gravados com taxas diferentes das vigentes.
+
+        Cada lote é gravado com um único UPDATE ... FROM (VALUES ...) e recebe
+        a assinatura atual, então o próximo lote já não o encontra e o laço
+        termina quando não restam perfis desatualizados. Os preços novos são
+        copiados para a projeção de busca no mesmo lote (se habilitada).
+        """
+        signature = PricingService.fee_signature()
+        base_columns = [getattr(InstructorProfileModel, name) for name in FINAL_PRICE_FIELDS]
+        stale_stmt = (
+            select(InstructorProfileModel.id, *base_columns)
+            .where(InstructorProfileModel.final_prices_signature.is_distinct_from(signature))
+            .order_by(InstructorProfileModel.id)
+            .limit(batch_size)
+        )
+
+        recomputed = 0
+        while True:
+            rows = (await self._session.execute(stale_stmt)).all()
+            if not rows:
+                return recomputed
+
+            prices = values(
+                column("id", PG_UUID(as_uuid=True)),
+                *(column(final_field, Numeric(10, 2)) for final_field in FINAL_PRICE_FIELDS.values()),
+                name="prices",
+            ).data([
+                (row.id, *PricingService.calculate_final_prices(row).values())
+                for row in rows
+            ])
+            await self._session.execute(
+                update(InstructorProfileModel)
+                .where(InstructorProfileModel.id == prices.c.id)
+                .values(
+                    # Colunas só com NULL no lote chegam como text
+                    **{
+                        final_field: cast(prices.c[final_field], Numeric(10, 2))
+                        for final_field in FINAL_PRICE_FIELDS.values()
+                    },
+                    final_prices_signature=signature,
+                    # Recálculo de taxas não é uma edição do perfil
+                    updated_at=InstructorProfileModel.updated_at,
+                )
+            )
+            if self._search_index is not None:
+                await self._search_index.sync_prices([row.id for row in rows])
+            recomputed += len(rows)
 
     async def get_available_instructors(
         self,
         biological_sex: str | None = None,
         license_category: str | None = None,
-        limit: int = 100,
+        limit: int | None = 100,
     ) -> list[InstructorProfile]:
-        """Lista instrutores disponíveis com filtros opcionais."""
+        """Lista instrutores disponíveis com filtros opcionais (limit=None: todos)."""
         stmt = (
             select(
                 InstructorProfileModel,
@@ -413,6 +842,7 @@ class InstructorRepositoryImpl(IInstructorRepository):
                     InstructorProfileModel.price_cat_a_student_vehicle,
                     InstructorProfileModel.price_cat_b_instructor_vehicle,
                     InstructorProfileModel.price_cat_b_student_vehicle,
+                    *FINAL_PRICE_COLUMNS,
                     InstructorProfileModel.created_at,
                     InstructorProfileModel.updated_at,
                 ),
@@ -423,45 +853,19 @@ class InstructorRepositoryImpl(IInstructorRepository):
 
         if biological_sex:
             # Normalizar valor de gênero do frontend para formato do banco
-            normalized_sex = _normalize_gender(biological_sex)
+            normalized_sex = normalize_gender(biological_sex)
             stmt = stmt.where(UserModel.biological_sex == normalized_sex)
 
         if license_category:
             stmt = stmt.where(InstructorProfileModel.license_category == license_category)
 
         result = await self._session.execute(stmt)
-        rows = result.all()
-
-        profiles = []
-        for row in rows:
-            model = row[0]
-            lon = row.lon
-            lat = row.lat
-
-            profile = InstructorProfile(
-                id=model.id,
-                user_id=model.user_id,
-                vehicle_type=model.vehicle_type,
-                license_category=model.license_category,
-                hourly_rate=model.hourly_rate,
-                location=Location(latitude=lat, longitude=lon) if lat and lon else None,
-                rating=float(model.rating),
-                total_reviews=model.total_reviews,
-                is_available=model.is_available,
-                price_cat_a_instructor_vehicle=model.price_cat_a_instructor_vehicle,
-                price_cat_a_student_vehicle=model.price_cat_a_student_vehicle,
-                price_cat_b_instructor_vehicle=model.price_cat_b_instructor_vehicle,
-                price_cat_b_student_vehicle=model.price_cat_b_student_vehicle,
-                full_name=model.user.full_name if model.user else None,
-                biological_sex=model.user.biological_sex if model.user else None,
-                bio="",
-                city=model.city,
-                created_at=model.created_at,
-                updated_at=model.updated_at,
-            )
-            profiles.append(profile)
+        return [self._search_row_to_entity(row) for row in result.all()]
 
-        return profiles
+    @staticmethod
+    def _final_price_fields(model: InstructorProfileModel) -> dict:
+        """Preços finais gravados e assinatura das taxas, para a entidade."""
+        return {column.key: getattr(model, column.key) for column in FINAL_PRICE_COLUMNS}
 
     def _model_to_entity(self, model: InstructorProfileModel) -> InstructorProfile:
         """Converte modelo para entidade (sem localização - use queries com ST_X/ST_Y)."""
@@ -485,6 +889,7 @@ class InstructorRepositoryImpl(IInstructorRepository):
             price_cat_a_student_vehicle=model.price_cat_a_student_vehicle,
             price_cat_b_instructor_vehicle=model.price_cat_b_instructor_vehicle,
             price_cat_b_student_vehicle=model.price_cat_b_student_vehicle,
+            **self._final_price_fields(model),
             created_at=model.created_at,
             updated_at=model.updated_at,
         )
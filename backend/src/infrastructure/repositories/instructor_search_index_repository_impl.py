@@ -0,0 +1,400 @@
+"""
+InstructorSearchIndexRepository Implementation
+
+Implementação da projeção de busca de instrutores (instructor_search_index).
+"""
+
+from collections.abc import Collection, Sequence
+from uuid import UUID
+
+from sqlalchemy import Float, Select, String, Values, column, delete, func, or_, select, update, values
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities.instructor_search_entry import InstructorSearchEntry
+from src.domain.entities.location import Location
+from src.domain.interfaces.instructor_search_index_repository import (
+    IInstructorSearchIndexRepository,
+)
+from src.infrastructure.db.models.instructor_profile_model import InstructorProfileModel
+from src.infrastructure.db.models.instructor_search_index_model import (
+    InstructorSearchIndexModel,
+)
+from src.infrastructure.db.models.user_model import UserModel
+from src.infrastructure.repositories.search_filters import normalize_gender
+from src.infrastructure.services.pricing_service import FINAL_PRICE_FIELDS
+
+
+def final_price_columns() -> dict:
+    """
+    Preços finais gravados no perfil, com o nome da coluna na projeção.
+
+    A projeção guarda em hourly_rate/price_* os valores de final_*, já
+    calculados (e recalculados quando as taxas mudam) por PricingService.
+    """
+    return {
+        base_field: getattr(InstructorProfileModel, final_field)
+        for base_field, final_field in FINAL_PRICE_FIELDS.items()
+    }
+
+
+def location_updates_values(updates: Sequence[tuple[UUID, Location, str | None]]) -> Values:
+    """
+    Lista (VALUES) de posições para UPDATE ... FROM em lote.
+
+    Colunas: user_id, lon, lat e city (NULL mantém a cidade atual).
+    """
+    return values(
+        column("user_id", PG_UUID(as_uuid=True)),
+        column("lon", Float),
+        column("lat", Float),
+        column("city", String),
+        name="pings",
+    ).data([
+        (user_id, location.longitude, location.latitude, city)
+        for user_id, location, city in updates
+    ])
+
+
+def split_name(full_name: str | None) -> tuple[str | None, str | None]:
+    """Separa primeiro e último nome (último é None para nome único)."""
+    parts = (full_name or "").split()
+    if not parts:
+        return None, None
+    return parts[0], parts[-1] if len(parts) >= 2 else None
+
+
+class InstructorSearchIndexRepositoryImpl(IInstructorSearchIndexRepository):
+    """
+    Implementação da projeção de busca usando SQLAlchemy e PostGIS.
+
+    A busca lê apenas instructor_search_index: ST_DWithin + KNN (<->) sobre a
+    coluna geography indexada, filtros em colunas da própria tabela e preços
+    finais já gravados. As escritas usam a sessão do chamador, então a
+    projeção é atualizada na mesma transação que as tabelas de origem.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def search(
+        self,
+        center: Location,
+        radius_km: float = 10.0,
+        biological_sex: str | None = None,
+        license_category: str | None = None,
+        search_query: str | None = None,
+        only_available: bool = True,
+        limit: int = 50,
+    ) -> list[InstructorSearchEntry]:
+        """
+        Busca instrutores por proximidade na projeção.
+
+        Mesmos dois ramos de InstructorRepositoryImpl.search_by_location:
+        localizados por distância (KNN) e, se o limite não for preenchido,
+        sem localização por rating. Com busca textual, cada ramo é ordenado
+        primeiro pela similaridade.
+        """
+        filters = (biological_sex, license_category, search_query, only_available)
+
+        result = await self._session.execute(
+            self._located_stmt(center, radius_km, *filters, limit)
+        )
+        entries = [self._model_to_entry(model) for model in result.scalars().all()]
+
+        remaining = limit - len(entries)
+        if remaining > 0:
+            result = await self._session.execute(self._unlocated_stmt(*filters, remaining))
+            entries.extend(self._model_to_entry(model) for model in result.scalars().all())
+
+        return entries
+
+    def _located_stmt(
+        self,
+        center: Location,
+        radius_km: float,
+        biological_sex: str | None,
+        license_category: str | None,
+        search_query: str | None,
+        only_available: bool,
+        limit: int,
+    ) -> Select:
+        """Monta a query do ramo espacial (instrutores com localização)."""
+        center_geog = func.geography(
+            func.ST_SetSRID(func.ST_MakePoint(center.longitude, center.latitude), 4326)
+        )
+        location = InstructorSearchIndexModel.location
+
+        stmt = (
+            select(InstructorSearchIndexModel)
+            .where(func.ST_DWithin(location, center_geog, radius_km * 1000))
+            .limit(limit)
+        )
+        if search_query:
+            stmt = stmt.order_by(self._text_rank(search_query).desc())
+        # KNN: ordenação servida diretamente pelo índice GIST
+        stmt = stmt.order_by(location.op("<->")(center_geog))
+        return self._apply_filters(
+            stmt, biological_sex, license_category, search_query, only_available
+        )
+
+    def _unlocated_stmt(
+        self,
+        biological_sex: str | None,
+        license_category: str | None,
+        search_query: str | None,
+        only_available: bool,
+        limit: int,
+    ) -> Select:
+        """Monta a query do ramo de instrutores sem localização (por rating)."""
+        stmt = (
+            select(InstructorSearchIndexModel)
+            .where(InstructorSearchIndexModel.location.is_(None))
+            .limit(limit)
+        )
+        if search_query:
+            stmt = stmt.order_by(self._text_rank(search_query).desc())
+        stmt = stmt.order_by(InstructorSearchIndexModel.rating.desc())
+        return self._apply_filters(
+            stmt, biological_sex, license_category, search_query, only_available
+        )
+
+    def _apply_filters(
+        self,
+        stmt: Select,
+        biological_sex: str | None,
+        license_category: str | None,
+        search_query: str | None,
+        only_available: bool,
+    ) -> Select:
+        """Aplica os filtros não espaciais comuns aos ramos da busca."""
+        if search_query:
+            # Nome e cidade estão na mesma tabela: o OR vira um BitmapOr dos
+            # dois índices trigram (GIN)
+            pattern = func.f_unaccent(f"%{search_query}%")
+            stmt = stmt.where(
+                or_(
+                    func.f_unaccent(InstructorSearchIndexModel.full_name).ilike(pattern),
+                    func.f_unaccent(InstructorSearchIndexModel.city).ilike(pattern),
+                )
+            )
+
+        if only_available:
+            stmt = stmt.where(InstructorSearchIndexModel.is_available.is_(True))
+
+        if biological_sex:
+            stmt = stmt.where(
+                InstructorSearchIndexModel.biological_sex == normalize_gender(biological_sex)
+            )
+
+        if license_category:
+            stmt = stmt.where(InstructorSearchIndexModel.license_category == license_category)
+
+        return stmt
+
+    def _text_rank(self, search_query: str):
+        """Similaridade trigram (pg_trgm) do termo com o nome ou a cidade."""
+        folded_query = func.f_unaccent(search_query)
+        return func.greatest(
+            func.word_similarity(folded_query, func.f_unaccent(InstructorSearchIndexModel.full_name)),
+            func.word_similarity(folded_query, func.f_unaccent(InstructorSearchIndexModel.city)),
+        )
+
+    def _model_to_entry(self, model: InstructorSearchIndexModel) -> InstructorSearchEntry:
+        """Converte uma linha da projeção em entidade."""
+        location = None
+        if model.latitude is not None and model.longitude is not None:
+            location = Location(latitude=model.latitude, longitude=model.longitude)
+
+        return InstructorSearchEntry(
+            profile_id=model.profile_id,
+            user_id=model.user_id,
+            first_name=model.first_name,
+            last_name=model.last_name,
+            biological_sex=model.biological_sex,
+            city=model.city,
+            vehicle_type=model.vehicle_type,
+            license_category=model.license_category,
+            location=location,
+            is_available=model.is_available,
+            has_mp_account=model.has_mp_account,
+            rating=float(model.rating),
+            total_reviews=model.total_reviews,
+            hourly_rate=model.hourly_rate,
+            price_cat_a_instructor_vehicle=model.price_cat_a_instructor_vehicle,
+            price_cat_a_student_vehicle=model.price_cat_a_student_vehicle,
+            price_cat_b_instructor_vehicle=model.price_cat_b_instructor_vehicle,
+            price_cat_b_student_vehicle=model.price_cat_b_student_vehicle,
+        )
+
+    # =========================================================================
+    # Manutenção da projeção
+    # =========================================================================
+
+    async def sync_instructor(self, user_id: UUID) -> None:
+        """Regrava a linha do instrutor a partir de instructor_profiles e users."""
+        result = await self._session.execute(
+            self._source_stmt().where(InstructorProfileModel.user_id == user_id)
+        )
+        rows = result.all()
+        if not rows:
+            await self._session.execute(
+                delete(InstructorSearchIndexModel).where(
+                    InstructorSearchIndexModel.user_id == user_id
+                )
+            )
+            return
+        await self._upsert(rows)
+
+    async def sync_location(
+        self, user_id: UUID, location: Location, city: str | None = None
+    ) -> None:
+        """Atualiza apenas a localização (e a cidade, se informada) do instrutor."""
+        values = {
+            "location": f"SRID=4326;{location.to_wkt()}",
+            "latitude": location.latitude,
+            "longitude": location.longitude,
+        }
+        if city:
+            values["city"] = city
+
+        await self._session.execute(
+            update(InstructorSearchIndexModel)
+            .where(InstructorSearchIndexModel.user_id == user_id)
+            .values(**values)
+        )
+
+    async def sync_locations(
+        self, updates: Sequence[tuple[UUID, Location, str | None]]
+    ) -> None:
+        """Atualiza a localização de vários instrutores com UPDATE ... FROM (VALUES)."""
+        if not updates:
+            return
+        pings = location_updates_values(updates)
+        point = func.ST_SetSRID(func.ST_MakePoint(pings.c.lon, pings.c.lat), 4326)
+        await self._session.execute(
+            update(InstructorSearchIndexModel)
+            .where(InstructorSearchIndexModel.user_id == pings.c.user_id)
+            .values(
+                location=func.geography(point),
+                latitude=pings.c.lat,
+                longitude=pings.c.lon,
+                city=func.coalesce(pings.c.city, InstructorSearchIndexModel.city),
+            )
+        )
+
+    async def sync_user(
+        self, user_id: UUID, full_name: str, biological_sex: str | None
+    ) -> None:
+        """Atualiza nome e sexo replicados (0 linhas se não for instrutor)."""
+        first_name, last_name = split_name(full_name)
+        await self._session.execute(
+            update(InstructorSearchIndexModel)
+            .where(InstructorSearchIndexModel.user_id == user_id)
+            .values(
+                full_name=full_name,
+                first_name=first_name,
+                last_name=last_name,
+                biological_sex=biological_sex,
+            )
+        )
+
+    async def sync_prices(self, profile_ids: Collection[UUID]) -> None:
+        """Copia os preços finais gravados nos perfis informados (UPDATE ... FROM)."""
+        if not profile_ids:
+            return
+        await self._session.execute(
+            update(InstructorSearchIndexModel)
+            .where(
+                InstructorSearchIndexModel.profile_id == InstructorProfileModel.id,
+                InstructorProfileModel.id.in_(profile_ids),
+            )
+            .values(**final_price_columns())
+        )
+
+    async def rebuild(self, batch_size: int = 500) -> int:
+        """
+        Regrava todas as linhas a partir de instructor_profiles e users.
+
+        Percorre os perfis em lotes por id (keyset), cada lote com um único
+        upsert; linhas ausentes são inseridas e as existentes, substituídas.
+        """
+        rebuilt = 0
+        last_id: UUID | None = None
+
+        while True:
+            stmt = self._source_stmt().order_by(InstructorProfileModel.id).limit(batch_size)
+            if last_id is not None:
+                stmt = stmt.where(InstructorProfileModel.id > last_id)
+            rows = (await self._session.execute(stmt)).all()
+            if not rows:
+                return rebuilt
+
+            await self._upsert(rows)
+            rebuilt += len(rows)
+            last_id = rows[-1].id
+
+    def _source_stmt(self) -> Select:
+        """Colunas de origem da projeção (perfil + usuário)."""
+        return select(
+            InstructorProfileModel.id,
+            InstructorProfileModel.user_id,
+            UserModel.full_name,
+            UserModel.biological_sex,
+            InstructorProfileModel.city,
+            InstructorProfileModel.vehicle_type,
+            InstructorProfileModel.license_category,
+            InstructorProfileModel.is_available,
+            InstructorProfileModel.mp_access_token.is_not(None).label("has_mp_account"),
+            InstructorProfileModel.rating,
+            InstructorProfileModel.total_reviews,
+            func.ST_Y(InstructorProfileModel.location).label("lat"),
+            func.ST_X(InstructorProfileModel.location).label("lon"),
+            *(price.label(name) for name, price in final_price_columns().items()),
+        ).join(UserModel, UserModel.id == InstructorProfileModel.user_id)
+
+    async def _upsert(self, rows) -> None:
+        """Insere ou substitui as linhas da projeção em um único statement."""
+        stmt = insert(InstructorSearchIndexModel).values(
+            [self._row_values(row) for row in rows]
+        )
+        columns = [c.name for c in InstructorSearchIndexModel.__table__.columns]
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[InstructorSearchIndexModel.profile_id],
+            set_={
+                **{
+                    name: stmt.excluded[name]
+                    for name in columns
+                    if name not in ("profile_id", "updated_at")
+                },
+                "updated_at": func.now(),
+            },
+        )
+        await self._session.execute(stmt)
+
+    def _row_values(self, row) -> dict:
+        """Valores da projeção para uma linha de origem (preços já finais)."""
+        first_name, last_name = split_name(row.full_name)
+        has_location = row.lat is not None and row.lon is not None
+
+        values = {
+            "profile_id": row.id,
+            "user_id": row.user_id,
+            "full_name": row.full_name,
+            "first_name": first_name,
+            "last_name": last_name,
+            "biological_sex": row.biological_sex,
+            "city": row.city,
+            "vehicle_type": row.vehicle_type,
+            "license_category": row.license_category,
+            "is_available": row.is_available,
+            "has_mp_account": row.has_mp_account,
+            "rating": row.rating,
+            "total_reviews": row.total_reviews,
+            "location": f"SRID=4326;POINT({row.lon} {row.lat})" if has_location else None,
+            "latitude": row.lat,
+            "longitude": row.lon,
+        }
+        for name in FINAL_PRICE_FIELDS:
+            values[name] = getattr(row, name)
+        return values
@@ -11,23 +11,44 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.entities.payment import Payment
 from src.domain.entities.payment_status import PaymentStatus
+from src.domain.entities.scheduling import Scheduling
 from src.domain.entities.scheduling_status import SchedulingStatus
+from src.domain.entities.search_position import ListPosition
 from src.domain.interfaces.payment_repository import IPaymentRepository
+from src.infrastructure.db.identity_map import IdentityMap
 from src.infrastructure.db.models.payment_model import PaymentModel
 from src.infrastructure.db.models.scheduling_model import SchedulingModel
+from src.infrastructure.db.pagination import timeline_page
 
 
 class PaymentRepositoryImpl(IPaymentRepository):
-    """Implementação do repositório de pagamentos."""
+    """
+    Implementação do repositório de pagamentos.
 
-    def __init__(self, session: AsyncSession):
+    Com identity_map (um por requisição), get_by_id e get_by_scheduling_id
+    repetidos são servidos da memória. As escritas gravam o pagamento no mapa
+    e descartam o agendamento dele, cujo payment_status mudou.
+    """
+
+    def __init__(self, session: AsyncSession, identity_map: IdentityMap | None = None):
         self.session = session
+        self._identity_map = identity_map
+
+    def _remember(self, payment: Payment) -> Payment:
+        if self._identity_map is not None:
+            self._identity_map.put(payment)
+        return payment
+
+    def _written(self, payment: Payment) -> Payment:
+        if self._identity_map is not None:
+            self._identity_map.discard(Scheduling, payment.scheduling_id)
+        return self._remember(payment)
 
     async def create(self, payment: Payment) -> Payment:
         model = PaymentModel.from_entity(payment)
         self.session.add(model)
         await self.session.flush()
-        return model.to_entity()
+        return self._written(model.to_entity())
 
     async def update(self, payment: Payment) -> Payment:
         # Busca o model existente para garantir attach na sessão
@@ -44,18 +65,26 @@ class PaymentRepositoryImpl(IPaymentRepository):
             model.mp_refund_id = payment.mp_refund_id
             model.updated_at = payment.updated_at
             await self.session.flush()
-            return model.to_entity()
+            return self._written(model.to_entity())
         return payment
 
     async def get_by_id(self, payment_id: UUID) -> Payment | None:
+        if self._identity_map is not None:
+            cached = self._identity_map.get(Payment, payment_id)
+            if cached is not None:
+                return cached
         model = await self.session.get(PaymentModel, payment_id)
-        return model.to_entity() if model else None
+        return self._remember(model.to_entity()) if model else None
 
     async def get_by_scheduling_id(self, scheduling_id: UUID) -> Payment | None:
+        if self._identity_map is not None:
+            cached = self._identity_map.find(Payment, lambda p: p.scheduling_id == scheduling_id)
+            if cached is not None:
+                return cached
         query = select(PaymentModel).where(PaymentModel.scheduling_id == scheduling_id)
         result = await self.session.execute(query)
         model = result.scalar_one_or_none()
-        return model.to_entity() if model else None
+        return self._remember(model.to_entity()) if model else None
 
     async def get_by_gateway_payment_id(self, gateway_payment_id: str) -> Payment | None:
         query = select(PaymentModel).where(
@@ -81,6 +110,7 @@ class PaymentRepositoryImpl(IPaymentRepository):
         scheduling_status: SchedulingStatus | None = None,
         limit: int = 50,
         offset: int = 0,
+        after: ListPosition | None = None,
     ) -> list[Payment]:
         query = select(PaymentModel).where(PaymentModel.student_id == student_id)
         
@@ -92,8 +122,16 @@ class PaymentRepositoryImpl(IPaymentRepository):
                 SchedulingModel.status == scheduling_status
             )
             
-        query = query.order_by(PaymentModel.created_at.desc()).limit(limit).offset(offset)
-        
+        query = timeline_page(
+            query,
+            PaymentModel.created_at,
+            PaymentModel.id,
+            after,
+            descending=True,
+            limit=limit,
+            offset=offset,
+        )
+
         result = await self.session.execute(query)
         return [model.to_entity() for model in result.scalars()]
 
@@ -104,6 +142,7 @@ class PaymentRepositoryImpl(IPaymentRepository):
         scheduling_status: SchedulingStatus | None = None,
         limit: int = 50,
         offset: int = 0,
+        after: ListPosition | None = None,
     ) -> list[Payment]:
         query = select(PaymentModel).where(PaymentModel.instructor_id == instructor_id)
         
@@ -115,8 +154,16 @@ class PaymentRepositoryImpl(IPaymentRepository):
                 SchedulingModel.status == scheduling_status
             )
             
-        query = query.order_by(PaymentModel.created_at.desc()).limit(limit).offset(offset)
-        
+        query = timeline_page(
+            query,
+            PaymentModel.created_at,
+            PaymentModel.id,
+            after,
+            descending=True,
+            limit=limit,
+            offset=offset,
+        )
+
         result = await self.session.execute(query)
         return [model.to_entity() for model in result.scalars()]
 
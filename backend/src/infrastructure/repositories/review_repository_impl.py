@@ -11,17 +11,22 @@ from sqlalchemy.orm import joinedload
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.entities.review import Review
+from src.domain.entities.scheduling import Scheduling
 from src.domain.interfaces.review_repository import IReviewRepository
+from src.infrastructure.db.identity_map import IdentityMap
 from src.infrastructure.db.models.review_model import ReviewModel
 
 
 class ReviewRepositoryImpl(IReviewRepository):
     """
     Implementação do repositório de avaliações usando SQLAlchemy.
+
+    Com identity_map, create descarta o agendamento avaliado (has_review).
     """
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(self, session: AsyncSession, identity_map: IdentityMap | None = None) -> None:
         self._session = session
+        self._identity_map = identity_map
 
     async def create(self, review: Review) -> Review:
         """Salva uma nova avaliação."""
@@ -29,6 +34,8 @@ class ReviewRepositoryImpl(IReviewRepository):
         self._session.add(model)
         await self._session.flush()
         await self._session.refresh(model)
+        if self._identity_map is not None:
+            self._identity_map.discard(Scheduling, review.scheduling_id)
         return model.to_entity()
 
     async def get_by_scheduling_id(self, scheduling_id: UUID) -> Review | None:
@@ -4,33 +4,304 @@ Scheduling Repository Implementation
 Implementação concreta do repositório de agendamentos.
 """
 
-from datetime import datetime
-from typing import Sequence
+from calendar import monthrange
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Sequence
 from uuid import UUID
 
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import Select, and_, func, insert, literal_column, or_, select, text, update
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import contains_eager
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload, load_only
+from sqlalchemy.orm import aliased, joinedload, load_only
+from sqlalchemy.sql.elements import ColumnElement
 
 from src.domain.entities.scheduling import Scheduling
 from src.domain.entities.scheduling_status import SchedulingStatus
+from src.domain.entities.scheduling_transition import SchedulingTransition
+from src.domain.entities.search_position import ListPosition
+from src.domain.exceptions import SchedulingConflictException
 from src.domain.interfaces.scheduling_repository import ISchedulingRepository
-from src.infrastructure.db.models.scheduling_model import SchedulingModel
+from src.domain.entities.payment_status import PaymentStatus
+from src.infrastructure.db.identity_map import IdentityMap
+from src.infrastructure.db.models.instructor_month_summary_model import (
+    MONTH_DAYS,
+    InstructorMonthSummaryModel,
+)
+from src.infrastructure.db.models.scheduling_model import (
+    LESSON_OVERLAP_CONSTRAINT,
+    SchedulingModel,
+)
+from src.infrastructure.db.models.instructor_profile_model import InstructorProfileModel
+from src.infrastructure.db.models.payment_model import PaymentModel
+from src.infrastructure.db.models.review_model import ReviewModel
 from src.infrastructure.db.models.user_model import UserModel
+from src.infrastructure.db.pagination import timeline_page
 from src.core.helpers.timezone_utils import DEFAULT_TIMEZONE
 
 
+def lesson_range(start, end):
+    """Intervalo [início, fim) como tstzrange (mesma expressão do índice GiST)."""
+    return func.tstzrange(start, end, literal_column("'[)'"))
+
+
+def overlaps_active_lessons(instructor_id, start: datetime, end: datetime):
+    """
+    Filtro de sobreposição com os agendamentos não cancelados do instrutor.
+
+    instructor_id pode ser um UUID ou uma coluna (subconsulta correlacionada,
+    ex: na busca de instrutores livres).
+
+    O status e os limites do range ficam literais no SQL para que o
+    planejador reconheça o predicado e a expressão da exclusion constraint
+    (ex_schedulings_instructor_no_overlap) e use o índice GiST dela mesmo
+    com planos genéricos de statements preparados.
+    """
+    return and_(
+        SchedulingModel.instructor_id == instructor_id,
+        SchedulingModel.status != literal_column("'cancelled'"),
+        lesson_range(SchedulingModel.scheduled_datetime, SchedulingModel.end_datetime).op("&&")(
+            lesson_range(start, end)
+        ),
+    )
+
+
+def active_lesson_guard() -> ColumnElement[bool]:
+    """
+    Agendamentos que ainda ocupam a agenda (nem cancelados nem concluídos).
+
+    Status literais no SQL, como nos índices parciais
+    ix_schedulings_student_active_date e ix_schedulings_instructor_active_date,
+    para que o planejador prove o predicado também com planos genéricos.
+    """
+    return SchedulingModel.status.notin_(
+        [literal_column("'cancelled'"), literal_column("'completed'")]
+    )
+
+
+def overdue_confirmed_guard(cutoff: datetime) -> ColumnElement[bool]:
+    """Aulas CONFIRMED terminadas até cutoff (regra de Scheduling.auto_complete)."""
+    return and_(
+        # Atendido pelo índice parcial ix_schedulings_confirmed_end
+        SchedulingModel.status == literal_column("'confirmed'"),
+        SchedulingModel.end_datetime <= cutoff,
+    )
+
+
+def expired_cart_guard(cutoff_pending: datetime, cutoff_processing: datetime) -> ColumnElement[bool]:
+    """
+    Itens de carrinho expirados, em status canceláveis do carrinho.
+
+    1. Sem pagamento, ou PENDING/FAILED/REFUNDED: criados até cutoff_pending.
+    2. PROCESSING: criados até cutoff_processing (proteção de checkout).
+
+    O pagamento (1:1 com o agendamento) é consultado por EXISTS em vez de
+    OUTER JOIN para que o mesmo predicado sirva ao SELECT e ao UPDATE.
+    """
+    payment = select(PaymentModel.id).where(PaymentModel.scheduling_id == SchedulingModel.id)
+    return and_(
+        # Atendido pelo índice parcial ix_schedulings_cart_created
+        SchedulingModel.status.in_([literal_column("'pending'"), literal_column("'confirmed'")]),
+        or_(
+            and_(
+                SchedulingModel.created_at <= cutoff_pending,
+                ~payment.where(
+                    PaymentModel.status.notin_(
+                        [PaymentStatus.PENDING, PaymentStatus.FAILED, PaymentStatus.REFUNDED]
+                    )
+                ).exists(),
+            ),
+            and_(
+                SchedulingModel.created_at <= cutoff_processing,
+                payment.where(PaymentModel.status == PaymentStatus.PROCESSING).exists(),
+            ),
+        ),
+    )
+
+
+def _is_overlap_violation(exc: IntegrityError) -> bool:
+    """Indica se a falha veio da exclusion constraint de sobreposição."""
+    return LESSON_OVERLAP_CONSTRAINT in str(exc.orig)
+
+
+def _insert_rows(schedulings: list[Scheduling]) -> list[dict]:
+    """Valores de todas as colunas de cada agendamento, para um INSERT multi-linha."""
+    columns = SchedulingModel.__table__.columns
+    return [
+        {c.key: getattr(model, c.key) for c in columns}
+        for model in map(SchedulingModel.from_entity, schedulings)
+    ]
+
+
+# Status que não aparecem no calendário da agenda
+CALENDAR_EXCLUDED_STATUSES = (SchedulingStatus.CANCELLED, SchedulingStatus.COMPLETED)
+
+# Soma delta à contagem de um dia no resumo mensal (cria a linha se preciso)
+MONTH_SUMMARY_UPSERT_SQL = text(f"""
+INSERT INTO instructor_month_summaries AS s (instructor_id, month, day_counts, lesson_count)
+VALUES (
+    :instructor_id,
+    :month,
+    array_fill(0, ARRAY[:day - 1]) || GREATEST(:delta, 0) || array_fill(0, ARRAY[{MONTH_DAYS} - :day]),
+    GREATEST(:delta, 0)
+)
+ON CONFLICT (instructor_id, month) DO UPDATE
+SET day_counts[:day] = GREATEST(s.day_counts[:day] + :delta, 0),
+    lesson_count = GREATEST(s.lesson_count + :delta, 0),
+    updated_at = now()
+""")
+
+
+def calendar_day(status: SchedulingStatus | str, scheduled_datetime: datetime) -> date | None:
+    """
+    Dia local (Brasília) em que o agendamento aparece no calendário, ou None
+    se o status não aparece nele. Datetime naive é tratado como UTC.
+    """
+    if status in CALENDAR_EXCLUDED_STATUSES:
+        return None
+    if scheduled_datetime.tzinfo is None:
+        scheduled_datetime = scheduled_datetime.replace(tzinfo=timezone.utc)
+    return scheduled_datetime.astimezone(DEFAULT_TIMEZONE).date()
+
+
+def month_bounds(year: int, month: int) -> tuple[datetime, datetime]:
+    """Início do mês e do mês seguinte (Brasília), em UTC: intervalo [início, fim)."""
+    first = datetime(year, month, 1, tzinfo=DEFAULT_TIMEZONE)
+    following = datetime(year + month // 12, month % 12 + 1, 1, tzinfo=DEFAULT_TIMEZONE)
+    return first.astimezone(timezone.utc), following.astimezone(timezone.utc)
+
+
+_list_student = aliased(UserModel, name="list_student")
+_list_instructor = aliased(UserModel, name="list_instructor")
+
+# Colunas do agendamento convertidas para a entidade (end_datetime é derivado)
+_ENTITY_COLUMNS = tuple(c for c in SchedulingModel.__table__.columns if c.key != "end_datetime")
+
+
+def scheduling_list_stmt() -> Select:
+    """
+    SELECT enxuto das listagens de agendamentos.
+
+    Lê as colunas do agendamento e apenas os dados exibidos nas listas (nomes,
+    nota e avaliações do instrutor, se há review e o status do pagamento), sem
+    carregar o perfil completo do instrutor (tokens, geometria), a review e o
+    pagamento como objetos do ORM. Pagamento e review são 1:1 com o
+    agendamento, então os joins não duplicam linhas.
+    """
+    return (
+        select(
+            *_ENTITY_COLUMNS,
+            _list_student.full_name.label("student_name"),
+            _list_instructor.full_name.label("instructor_name"),
+            InstructorProfileModel.rating.label("instructor_rating"),
+            InstructorProfileModel.total_reviews.label("instructor_review_count"),
+            select(ReviewModel.id)
+            .where(ReviewModel.scheduling_id == SchedulingModel.id)
+            .exists()
+            .label("has_review"),
+            PaymentModel.status.label("payment_status"),
+        )
+        .select_from(SchedulingModel)
+        .join(_list_student, _list_student.id == SchedulingModel.student_id)
+        .join(_list_instructor, _list_instructor.id == SchedulingModel.instructor_id)
+        .outerjoin(InstructorProfileModel, InstructorProfileModel.user_id == SchedulingModel.instructor_id)
+        .outerjoin(PaymentModel, PaymentModel.scheduling_id == SchedulingModel.id)
+    )
+
+
+# Total das linhas filtradas, calculado na própria listagem (antes de LIMIT/OFFSET)
+_WINDOW_TOTAL = func.count().over().label("total_count")
+
+# Estimativa do planejador para a tabela inteira (-1 se nunca analisada)
+_ESTIMATED_TOTAL = literal_column(
+    "(SELECT reltuples::bigint FROM pg_class WHERE oid = 'schedulings'::regclass)"
+).label("total_count")
+
+
+def scheduling_detail_options() -> tuple:
+    """Carregamentos do agendamento completo (get_by_id e update): pagamento, nomes, perfil e review."""
+    return (
+        joinedload(SchedulingModel.payment),
+        joinedload(SchedulingModel.student).load_only(UserModel.id, UserModel.full_name),
+        joinedload(SchedulingModel.instructor).options(
+            load_only(UserModel.id, UserModel.full_name),
+            joinedload(UserModel.instructor_profile),
+        ),
+        joinedload(SchedulingModel.review),
+    )
+
+
+def scheduling_from_list_row(row) -> Scheduling:
+    """Converte uma linha de scheduling_list_stmt na entidade (mesmos campos de to_entity)."""
+    mapping = row._mapping
+    return Scheduling(
+        **{c.key: mapping[c] for c in _ENTITY_COLUMNS},
+        student_name=row.student_name,
+        instructor_name=row.instructor_name,
+        instructor_rating=float(row.instructor_rating) if row.instructor_rating is not None else None,
+        instructor_review_count=row.instructor_review_count,
+        has_review=row.has_review,
+        payment_status=row.payment_status.value if row.payment_status else None,
+    )
+
+
 class SchedulingRepositoryImpl(ISchedulingRepository):
-    """Implementação do repositório de agendamentos usando SQLAlchemy."""
+    """
+    Implementação do repositório de agendamentos usando SQLAlchemy.
+
+    As escritas mantêm o resumo mensal do calendário
+    (instructor_month_summaries) na mesma transação; com use_month_summary,
+    get_scheduling_dates_for_month lê o resumo em vez dos agendamentos.
+
+    Com identity_map (um por requisição), get_by_id repetido para o mesmo
+    agendamento é servido da memória; update grava a versão nova no mapa e
+    delete/bulk_transition descartam as entradas afetadas.
+    """
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        use_month_summary: bool = False,
+        identity_map: IdentityMap | None = None,
+    ) -> None:
         self._session = session
+        self._use_month_summary = use_month_summary
+        self._identity_map = identity_map
+
+    async def _move_calendar_day(self, instructor_id: UUID, old: date | None, new: date | None) -> None:
+        """Atualiza o resumo mensal quando o dia de calendário de uma aula muda."""
+        if old == new:
+            return
+        for day, delta in ((old, -1), (new, 1)):
+            if day is not None:
+                await self._session.execute(
+                    MONTH_SUMMARY_UPSERT_SQL,
+                    {
+                        "instructor_id": instructor_id,
+                        "month": day.replace(day=1),
+                        "day": day.day,
+                        "delta": delta,
+                    },
+                )
 
     async def create(self, scheduling: Scheduling) -> Scheduling:
         model = SchedulingModel.from_entity(scheduling)
-        self._session.add(model)
-        await self._session.flush()
+        try:
+            # Savepoint: a violação desfaz só este INSERT, não a transação
+            async with self._session.begin_nested():
+                self._session.add(model)
+                await self._session.flush()
+        except IntegrityError as exc:
+            # Outro agendamento ocupou o horário entre o check_conflict e o INSERT
+            if _is_overlap_violation(exc):
+                raise SchedulingConflictException() from exc
+            raise
+        await self._move_calendar_day(
+            model.instructor_id, None, calendar_day(model.status, model.scheduled_datetime)
+        )
         
         # The model is now in the session, but relationships (student/instructor) 
         # might not be loaded. However, the use cases usually only need the ID 
@@ -44,23 +315,178 @@ class SchedulingRepositoryImpl(ISchedulingRepository):
         created = await self.get_by_id(model.id)
         return created or model.to_entity()
 
+    async def create_many(
+        self, schedulings: list[Scheduling]
+    ) -> tuple[list[Scheduling], list[Scheduling]]:
+        if not schedulings:
+            return [], []
+        try:
+            async with self._session.begin_nested():
+                await self._session.execute(insert(SchedulingModel).values(_insert_rows(schedulings)))
+            created, conflicting = list(schedulings), []
+        except IntegrityError as exc:
+            if not _is_overlap_violation(exc):
+                raise
+            # Um agendamento concorrente ocupou algum horário: cada aula em
+            # seu próprio savepoint, para separar só as que perderam a disputa
+            created, conflicting = [], []
+            for scheduling in schedulings:
+                try:
+                    async with self._session.begin_nested():
+                        await self._session.execute(
+                            insert(SchedulingModel).values(_insert_rows([scheduling]))
+                        )
+                except IntegrityError as row_exc:
+                    if not _is_overlap_violation(row_exc):
+                        raise
+                    conflicting.append(scheduling)
+                else:
+                    created.append(scheduling)
+
+        await self._apply_calendar_deltas(
+            Counter(
+                (s.instructor_id, day)
+                for s in created
+                if (day := calendar_day(s.status, s.scheduled_datetime)) is not None
+            )
+        )
+        return created, conflicting
+
+    async def _apply_calendar_deltas(self, deltas: Counter) -> None:
+        """Soma as variações por (instrutor, dia) ao resumo mensal, uma linha de parâmetros por dia (executemany)."""
+        params = [
+            {
+                "instructor_id": instructor_id,
+                "month": day.replace(day=1),
+                "day": day.day,
+                "delta": delta,
+            }
+            for (instructor_id, day), delta in deltas.items()
+            if delta
+        ]
+        if params:
+            await self._session.execute(MONTH_SUMMARY_UPSERT_SQL, params)
+
+    async def bulk_transition(
+        self,
+        to_status: SchedulingStatus,
+        guard: ColumnElement[bool],
+        **values: Any,
+    ) -> list[SchedulingTransition]:
+        """
+        Muda o status dos agendamentos que atendem a guard em um único UPDATE.
+
+        As regras de domínio da transição (status de origem, prazos) chegam
+        como predicado SQL em guard; values completa os campos da transição
+        (ex: cancelled_at, completed_at). O status anterior vem da própria
+        linha antes da alteração (auto-join no FROM) para ajustar o resumo
+        mensal do calendário.
+
+        Args:
+            to_status: Novo status.
+            guard: Predicado sobre SchedulingModel que seleciona as linhas.
+            values: Demais colunas a atualizar.
+
+        Returns:
+            Agendamentos alterados (RETURNING).
+        """
+        previous = aliased(SchedulingModel, name="previous")
+        stmt = (
+            update(SchedulingModel)
+            .where(SchedulingModel.id == previous.id, guard)
+            .values(status=to_status, updated_at=datetime.now(timezone.utc), **values)
+            .returning(
+                SchedulingModel.id,
+                SchedulingModel.student_id,
+                SchedulingModel.instructor_id,
+                SchedulingModel.scheduled_datetime,
+                previous.status.label("previous_status"),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._session.execute(stmt)
+        rows = result.all()
+        if self._identity_map is not None:
+            for row in rows:
+                self._identity_map.discard(Scheduling, row.id)
+
+        deltas: Counter = Counter()
+        for row in rows:
+            old = calendar_day(row.previous_status, row.scheduled_datetime)
+            new = calendar_day(to_status, row.scheduled_datetime)
+            if old != new:
+                if old is not None:
+                    deltas[(row.instructor_id, old)] -= 1
+                if new is not None:
+                    deltas[(row.instructor_id, new)] += 1
+        await self._apply_calendar_deltas(deltas)
+
+        return [
+            SchedulingTransition(
+                id=row.id,
+                student_id=row.student_id,
+                instructor_id=row.instructor_id,
+                scheduled_datetime=row.scheduled_datetime,
+            )
+            for row in rows
+        ]
+
+    async def cancel_expired_cart_items(
+        self,
+        reason: str,
+        student_id: UUID | None = None,
+        timeout_minutes: int = 12,
+        processing_timeout_minutes: int = 30,
+    ) -> list[SchedulingTransition]:
+        now = datetime.now(timezone.utc)
+        guard = expired_cart_guard(
+            now - timedelta(minutes=timeout_minutes),
+            now - timedelta(minutes=processing_timeout_minutes),
+        )
+        if student_id:
+            guard = and_(guard, SchedulingModel.student_id == student_id)
+
+        # O próprio aluno consta como autor (cancelled_by referencia users.id)
+        return await self.bulk_transition(
+            SchedulingStatus.CANCELLED,
+            guard,
+            cancelled_by=SchedulingModel.student_id,
+            cancellation_reason=reason,
+            cancelled_at=now,
+        )
+
+    async def complete_overdue_confirmed(
+        self, hours_threshold: int = 24
+    ) -> list[SchedulingTransition]:
+        now = datetime.now(timezone.utc)
+        return await self.bulk_transition(
+            SchedulingStatus.COMPLETED,
+            overdue_confirmed_guard(now - timedelta(hours=hours_threshold)),
+            completed_at=now,
+        )
+
     async def get_by_id(self, scheduling_id: UUID) -> Scheduling | None:
+        if self._identity_map is not None:
+            cached = self._identity_map.get(Scheduling, scheduling_id)
+            if cached is not None:
+                return cached
+
         stmt = (
             select(SchedulingModel)
             .where(SchedulingModel.id == scheduling_id)
-            .options(
-                joinedload(SchedulingModel.payment),
-                joinedload(SchedulingModel.student).load_only(UserModel.id, UserModel.full_name),
-                joinedload(SchedulingModel.instructor).options(
-                    load_only(UserModel.id, UserModel.full_name),
-                    joinedload(UserModel.instructor_profile)
-                ),
-                joinedload(SchedulingModel.review)
-            )
+            .options(*scheduling_detail_options())
         )
         result = await self._session.execute(stmt)
         model = result.unique().scalar_one_or_none()
-        return model.to_entity() if model else None
+        if model is None:
+            return None
+        return self._remember(model.to_entity())
+
+    def _remember(self, scheduling: Scheduling) -> Scheduling:
+        """Registra o agendamento completo no identity map da requisição, se houver."""
+        if self._identity_map is not None:
+            self._identity_map.put(scheduling)
+        return scheduling
 
     async def update(self, scheduling: Scheduling) -> Scheduling:
         # Busca o modelo existente para garantir que estamos anexados à sessão
@@ -68,14 +494,7 @@ class SchedulingRepositoryImpl(ISchedulingRepository):
         stmt = (
             select(SchedulingModel)
             .where(SchedulingModel.id == scheduling.id)
-            .options(
-                joinedload(SchedulingModel.student).load_only(UserModel.id, UserModel.full_name),
-                joinedload(SchedulingModel.instructor).options(
-                    load_only(UserModel.id, UserModel.full_name),
-                    joinedload(UserModel.instructor_profile)
-                ),
-                joinedload(SchedulingModel.review)
-            )
+            .options(*scheduling_detail_options())
         )
         result = await self._session.execute(stmt)
         model = result.unique().scalar_one_or_none()
@@ -84,28 +503,39 @@ class SchedulingRepositoryImpl(ISchedulingRepository):
             # Se não encontrado, poderia lançar erro ou tentar criar
             # O comportamento esperado é atualizar um existente
             raise ValueError(f"Agendamento {scheduling.id} não encontrado para atualização")
-
-        # Atualizar campos
-        model.scheduled_datetime = scheduling.scheduled_datetime
-        model.rescheduled_datetime = scheduling.rescheduled_datetime
-        model.duration_minutes = scheduling.duration_minutes
-        model.price = scheduling.price
-        model.status = scheduling.status
-        model.cancellation_reason = scheduling.cancellation_reason
-        model.cancelled_by = scheduling.cancelled_by
-        model.cancelled_at = scheduling.cancelled_at
-        model.completed_at = scheduling.completed_at
-        model.started_at = scheduling.started_at
-        model.student_confirmed_at = scheduling.student_confirmed_at
-        model.rescheduled_by = scheduling.rescheduled_by
-        model.updated_at = scheduling.updated_at
-
-        # Commit da transação
-        await self._session.flush()
+        previous_day = calendar_day(model.status, model.scheduled_datetime)
+
+        try:
+            # Savepoint aberto antes das alterações (begin_nested faz flush do
+            # que está pendente): a violação desfaz só este UPDATE
+            async with self._session.begin_nested():
+                # Atualizar campos
+                model.scheduled_datetime = scheduling.scheduled_datetime
+                model.rescheduled_datetime = scheduling.rescheduled_datetime
+                model.duration_minutes = scheduling.duration_minutes
+                model.end_datetime = scheduling.lesson_end_datetime
+                model.price = scheduling.price
+                model.status = scheduling.status
+                model.cancellation_reason = scheduling.cancellation_reason
+                model.cancelled_by = scheduling.cancelled_by
+                model.cancelled_at = scheduling.cancelled_at
+                model.completed_at = scheduling.completed_at
+                model.started_at = scheduling.started_at
+                model.student_confirmed_at = scheduling.student_confirmed_at
+                model.rescheduled_by = scheduling.rescheduled_by
+                model.updated_at = scheduling.updated_at
+                await self._session.flush()
+        except IntegrityError as exc:
+            if _is_overlap_violation(exc):
+                raise SchedulingConflictException() from exc
+            raise
+        await self._move_calendar_day(
+            model.instructor_id, previous_day, calendar_day(model.status, model.scheduled_datetime)
+        )
         
         # The model was already loaded with joinedload options in the first select.
         # After flush(), we don't need to fetch it again.
-        return model.to_entity()
+        return self._remember(model.to_entity())
 
     async def delete(self, scheduling_id: UUID) -> bool:
         """Remove um agendamento."""
@@ -118,6 +548,11 @@ class SchedulingRepositoryImpl(ISchedulingRepository):
 
         await self._session.delete(model)
         await self._session.flush()
+        if self._identity_map is not None:
+            self._identity_map.discard(Scheduling, scheduling_id)
+        await self._move_calendar_day(
+            model.instructor_id, calendar_day(model.status, model.scheduled_datetime), None
+        )
         return True
 
     async def list_by_student(
@@ -127,38 +562,49 @@ class SchedulingRepositoryImpl(ISchedulingRepository):
         limit: int = 10,
         offset: int = 0,
         payment_status_filter: str | None = None,
+        after: ListPosition | None = None,
     ) -> Sequence[Scheduling]:
-        from src.infrastructure.db.models.payment_model import PaymentModel
-        from src.domain.entities.payment_status import PaymentStatus
-
-        # Para a tela "Minhas Aulas" (sem filtro de status), ordenamos ASC para mostrar as próximas aulas.
-        # Para o "Histórico" (com filtro de status), costuma-se usar DESC para mostrar as mais recentes primeiro.
-        order = SchedulingModel.scheduled_datetime.asc() if status is None else SchedulingModel.scheduled_datetime.desc()
+        stmt = self._student_list_stmt(student_id, status, limit, offset, payment_status_filter, after)
+        result = await self._session.execute(stmt)
+        return [scheduling_from_list_row(row) for row in result.all()]
 
-        stmt = (
-            select(SchedulingModel)
-            .outerjoin(SchedulingModel.payment)
-            .where(SchedulingModel.student_id == student_id)
+    async def page_by_student(
+        self,
+        student_id: UUID,
+        status: SchedulingStatus | Sequence[SchedulingStatus] | None = None,
+        limit: int = 10,
+        offset: int = 0,
+        payment_status_filter: str | None = None,
+        after: ListPosition | None = None,
+    ) -> tuple[list[Scheduling], int]:
+        stmt = self._student_list_stmt(student_id, status, limit, offset, payment_status_filter, after)
+        return await self._page(
+            stmt.add_columns(_WINDOW_TOTAL),
+            after,
+            offset,
+            lambda: self.count_by_student(student_id, status, payment_status_filter),
         )
 
-        # if status is None:
-        #     from datetime import datetime, timezone
-        #     now = datetime.now(timezone.utc)
-        #     stmt = stmt.where(SchedulingModel.scheduled_datetime >= now)
-
-        stmt = (
-            stmt.order_by(order)
-            .limit(limit)
-            .offset(offset)
-            .options(
-                contains_eager(SchedulingModel.payment),
-                joinedload(SchedulingModel.student).load_only(UserModel.id, UserModel.full_name),
-                joinedload(SchedulingModel.instructor).options(
-                    load_only(UserModel.id, UserModel.full_name),
-                    joinedload(UserModel.instructor_profile)
-                ),
-                joinedload(SchedulingModel.review)
-            )
+    @staticmethod
+    def _student_list_stmt(
+        student_id: UUID,
+        status: SchedulingStatus | Sequence[SchedulingStatus] | None,
+        limit: int,
+        offset: int,
+        payment_status_filter: str | None,
+        after: ListPosition | None,
+    ) -> Select:
+        """Listagem do aluno com filtros de status e pagamento, ordenada e paginada."""
+        # Para a tela "Minhas Aulas" (sem filtro de status), ordenamos ASC para mostrar as próximas aulas.
+        # Para o "Histórico" (com filtro de status), costuma-se usar DESC para mostrar as mais recentes primeiro.
+        stmt = timeline_page(
+            scheduling_list_stmt().where(SchedulingModel.student_id == student_id),
+            SchedulingModel.scheduled_datetime,
+            SchedulingModel.id,
+            after,
+            descending=status is not None,
+            limit=limit,
+            offset=offset,
         )
 
         if status:
@@ -175,7 +621,7 @@ class SchedulingRepositoryImpl(ISchedulingRepository):
                     PaymentModel.id.is_(None),
                     PaymentModel.status.in_([PaymentStatus.PENDING, PaymentStatus.PROCESSING]),
                 ),
-                SchedulingModel.status.notin_([SchedulingStatus.CANCELLED, SchedulingStatus.COMPLETED])
+                active_lesson_guard()
             )
         elif payment_status_filter == "completed":
             # Aulas com pagamento confirmado
@@ -184,8 +630,7 @@ class SchedulingRepositoryImpl(ISchedulingRepository):
             # Agendamentos sem nenhum pagamento associado
             stmt = stmt.where(PaymentModel.id.is_(None))
 
-        result = await self._session.execute(stmt)
-        return [row.to_entity() for row in result.unique().scalars().all()]
+        return stmt
 
     async def count_by_student(
         self,
@@ -218,7 +663,7 @@ class SchedulingRepositoryImpl(ISchedulingRepository):
                     PaymentModel.id.is_(None),
                     PaymentModel.status.in_([PaymentStatus.PENDING, PaymentStatus.PROCESSING]),
                 ),
-                SchedulingModel.status.notin_([SchedulingStatus.CANCELLED, SchedulingStatus.COMPLETED])
+                active_lesson_guard()
             )
         elif payment_status_filter == "completed":
             stmt = stmt.where(PaymentModel.status == PaymentStatus.COMPLETED)
@@ -234,22 +679,45 @@ class SchedulingRepositoryImpl(ISchedulingRepository):
         status: SchedulingStatus | Sequence[SchedulingStatus] | None = None,
         limit: int = 10,
         offset: int = 0,
+        after: ListPosition | None = None,
     ) -> Sequence[Scheduling]:
-        stmt = (
-            select(SchedulingModel)
-            .where(SchedulingModel.instructor_id == instructor_id)
-            .order_by(SchedulingModel.scheduled_datetime.desc())
-            .limit(limit)
-            .offset(offset)
-            .options(
-                joinedload(SchedulingModel.payment),
-                joinedload(SchedulingModel.student).load_only(UserModel.id, UserModel.full_name),
-                joinedload(SchedulingModel.instructor).options(
-                    load_only(UserModel.id, UserModel.full_name),
-                    joinedload(UserModel.instructor_profile)
-                ),
-                joinedload(SchedulingModel.review)
-            )
+        stmt = self._instructor_list_stmt(instructor_id, status, limit, offset, after)
+        result = await self._session.execute(stmt)
+        return [scheduling_from_list_row(row) for row in result.all()]
+
+    async def page_by_instructor(
+        self,
+        instructor_id: UUID,
+        status: SchedulingStatus | Sequence[SchedulingStatus] | None = None,
+        limit: int = 10,
+        offset: int = 0,
+        after: ListPosition | None = None,
+    ) -> tuple[list[Scheduling], int]:
+        stmt = self._instructor_list_stmt(instructor_id, status, limit, offset, after)
+        return await self._page(
+            stmt.add_columns(_WINDOW_TOTAL),
+            after,
+            offset,
+            lambda: self.count_by_instructor(instructor_id, status),
+        )
+
+    @staticmethod
+    def _instructor_list_stmt(
+        instructor_id: UUID,
+        status: SchedulingStatus | Sequence[SchedulingStatus] | None,
+        limit: int,
+        offset: int,
+        after: ListPosition | None,
+    ) -> Select:
+        """Listagem do instrutor com filtro de status, ordenada e paginada."""
+        stmt = timeline_page(
+            scheduling_list_stmt().where(SchedulingModel.instructor_id == instructor_id),
+            SchedulingModel.scheduled_datetime,
+            SchedulingModel.id,
+            after,
+            descending=True,
+            limit=limit,
+            offset=offset,
         )
 
         if status:
@@ -258,8 +726,7 @@ class SchedulingRepositoryImpl(ISchedulingRepository):
             else:
                 stmt = stmt.where(SchedulingModel.status == status)
 
-        result = await self._session.execute(stmt)
-        return [row.to_entity() for row in result.unique().scalars().all()]
+        return stmt
 
     async def get_next_instructor_scheduling(
         self,
@@ -273,7 +740,7 @@ class SchedulingRepositoryImpl(ISchedulingRepository):
             .where(
                 SchedulingModel.instructor_id == instructor_id,
                 SchedulingModel.scheduled_datetime >= now,
-                SchedulingModel.status.notin_([SchedulingStatus.CANCELLED, SchedulingStatus.COMPLETED])
+                active_lesson_guard()
             )
             .order_by(SchedulingModel.scheduled_datetime.asc())
             .limit(1)
@@ -308,7 +775,7 @@ class SchedulingRepositoryImpl(ISchedulingRepository):
             .where(
                 SchedulingModel.student_id == student_id,
                 SchedulingModel.scheduled_datetime >= now,
-                SchedulingModel.status.notin_([SchedulingStatus.CANCELLED, SchedulingStatus.COMPLETED])
+                active_lesson_guard()
             )
             .order_by(SchedulingModel.scheduled_datetime.asc())
             .limit(1)
@@ -369,29 +836,35 @@ class SchedulingRepositoryImpl(ISchedulingRepository):
         new_start = scheduled_datetime
         new_end = scheduled_datetime + timedelta(minutes=duration_minutes)
 
-        # Lógica de sobreposição:
-        # (StartA < EndB) and (EndA > StartB)
-        # Onde A é o agendamento existente e B é o novo
-
-        stmt = select(SchedulingModel).where(
-            SchedulingModel.instructor_id == instructor_id,
-            SchedulingModel.status != SchedulingStatus.CANCELLED,
-            SchedulingModel.scheduled_datetime < new_end,
-            (SchedulingModel.scheduled_datetime + func.make_interval(0, 0, 0, 0, 0, SchedulingModel.duration_minutes)) > new_start
+        # Uma sondagem no índice GiST da exclusion constraint
+        stmt = select(SchedulingModel.id).where(
+            overlaps_active_lessons(instructor_id, new_start, new_end)
         )
 
         if exclude_scheduling_id:
             stmt = stmt.where(SchedulingModel.id != exclude_scheduling_id)
-        
-        # Nota: `func.make_interval` é específico do Postgres.
-        # Alternativa portátil seria calcular end_time na aplicação ou persistir end_time no banco.
-        # Como usamos Postgres + PostGIS, make_interval é aceitável.
-        # Mas para garantir robustez, vamos usar datetime puro se possível, mas no 'where' precisamos de expressão SQL.
-        # Outra opção: adicionar coluna `end_datetime` no modelo para facilitar queries, mas vamos usar aritmética de data por enquanto.
+
+        stmt = stmt.limit(1)
 
         result = await self._session.execute(stmt)
         return result.first() is not None
 
+    async def list_busy_intervals(
+        self,
+        instructor_id: UUID,
+        start: datetime,
+        end: datetime,
+    ) -> list[tuple[datetime, datetime]]:
+        """Lista (início, fim) dos agendamentos não cancelados que se sobrepõem ao período."""
+        stmt = (
+            select(SchedulingModel.scheduled_datetime, SchedulingModel.end_datetime)
+            .where(overlaps_active_lessons(instructor_id, start, end))
+            .order_by(SchedulingModel.scheduled_datetime)
+        )
+
+        result = await self._session.execute(stmt)
+        return [(row.scheduled_datetime, row.end_datetime) for row in result.all()]
+
     async def list_by_student_and_instructor(
         self,
         student_id: UUID,
@@ -442,26 +915,17 @@ class SchedulingRepositoryImpl(ISchedulingRepository):
         end_of_day_utc = end_of_day_local.astimezone(timezone.utc)
 
         stmt = (
-            select(SchedulingModel)
+            scheduling_list_stmt()
             .where(
                 SchedulingModel.instructor_id == instructor_id,
                 SchedulingModel.scheduled_datetime >= start_of_day_utc,
                 SchedulingModel.scheduled_datetime <= end_of_day_utc,
             )
             .order_by(SchedulingModel.scheduled_datetime.asc())
-            .options(
-                joinedload(SchedulingModel.payment),
-                joinedload(SchedulingModel.student).load_only(UserModel.id, UserModel.full_name),
-                joinedload(SchedulingModel.instructor).options(
-                    load_only(UserModel.id, UserModel.full_name),
-                    joinedload(UserModel.instructor_profile)
-                ),
-                joinedload(SchedulingModel.review)
-            )
         )
 
         result = await self._session.execute(stmt)
-        return [row.to_entity() for row in result.unique().scalars().all()]
+        return [scheduling_from_list_row(row) for row in result.all()]
 
     async def get_scheduling_dates_for_month(
         self,
@@ -469,61 +933,95 @@ class SchedulingRepositoryImpl(ISchedulingRepository):
         year: int,
         month: int,
     ) -> dict:
-        """Retorna lista de datas únicas com agendamentos no mês e indicadores de meses adjacentes."""
-        from calendar import monthrange
-        from datetime import datetime, timezone
+        """
+        Retorna lista de datas únicas com agendamentos no mês e indicadores de
+        meses adjacentes, em uma única consulta (EXISTS para os indicadores).
+        """
+        if self._use_month_summary:
+            dates, has_prev, has_next = await self._month_from_summary(instructor_id, year, month)
+        else:
+            dates, has_prev, has_next = await self._month_from_schedulings(instructor_id, year, month)
 
-        # Definir limites do mês no timezone local (Brasília)
-        first_day_local = datetime(year, month, 1, 0, 0, 0, tzinfo=DEFAULT_TIMEZONE)
-        last_day_num = monthrange(year, month)[1]
-        last_day_local = datetime(year, month, last_day_num, 23, 59, 59, tzinfo=DEFAULT_TIMEZONE)
+        return {
+            "dates": [d.isoformat() for d in dates],
+            "year": year,
+            "month": month,
+            "has_prev": has_prev,
+            "has_next": has_next,
+        }
 
-        # Converter limites para UTC
-        first_day_utc = first_day_local.astimezone(timezone.utc)
-        last_day_utc = last_day_local.astimezone(timezone.utc)
+    async def _month_from_schedulings(
+        self, instructor_id: UUID, year: int, month: int
+    ) -> tuple[list[date], bool, bool]:
+        """Datas do mês agregadas dos agendamentos (sem o resumo mensal)."""
+        first_utc, following_utc = month_bounds(year, month)
 
-        local_ts = func.timezone(DEFAULT_TIMEZONE.key, SchedulingModel.scheduled_datetime)
-        
-        stmt = (
-            select(func.date(local_ts).label("date"))
-            .where(
+        def calendar_lessons(*criteria):
+            return select(SchedulingModel.id).where(
                 SchedulingModel.instructor_id == instructor_id,
-                SchedulingModel.scheduled_datetime >= first_day_utc,
-                SchedulingModel.scheduled_datetime <= last_day_utc,
-                SchedulingModel.status.notin_([SchedulingStatus.CANCELLED, SchedulingStatus.COMPLETED]),
+                active_lesson_guard(),
+                *criteria,
             )
+
+        local_day = func.date(func.timezone(DEFAULT_TIMEZONE.key, SchedulingModel.scheduled_datetime))
+        days = (
+            calendar_lessons(
+                SchedulingModel.scheduled_datetime >= first_utc,
+                SchedulingModel.scheduled_datetime < following_utc,
+            )
+            .with_only_columns(local_day.label("day"))
             .distinct()
-            .order_by(func.date(local_ts))
+            .subquery()
+        )
+        stmt = select(
+            select(func.array_agg(aggregate_order_by(days.c.day, days.c.day)))
+            .scalar_subquery()
+            .label("dates"),
+            calendar_lessons(SchedulingModel.scheduled_datetime < first_utc)
+            .limit(1)
+            .exists()
+            .label("has_prev"),
+            calendar_lessons(SchedulingModel.scheduled_datetime >= following_utc)
+            .limit(1)
+            .exists()
+            .label("has_next"),
         )
 
-        result = await self._session.execute(stmt)
-        dates = [row[0] for row in result.all()]
+        row = (await self._session.execute(stmt)).one()
+        return list(row.dates or []), row.has_prev, row.has_next
+
+    async def _month_from_summary(
+        self, instructor_id: UUID, year: int, month: int
+    ) -> tuple[list[date], bool, bool]:
+        """Datas do mês lidas do resumo mensal (uma linha por chave primária)."""
+        first = date(year, month, 1)
+        summary = InstructorMonthSummaryModel
+
+        def other_months(*criteria):
+            return (
+                select(summary.month)
+                .where(summary.instructor_id == instructor_id, summary.lesson_count > 0, *criteria)
+                .limit(1)
+                .exists()
+            )
 
-        # Verificar se existem aulas em meses anteriores
-        stmt_prev = select(func.count(SchedulingModel.id)).where(
-            SchedulingModel.instructor_id == instructor_id,
-            SchedulingModel.scheduled_datetime < first_day_utc,
-            SchedulingModel.status.notin_([SchedulingStatus.CANCELLED, SchedulingStatus.COMPLETED]),
-        )
-        result_prev = await self._session.execute(stmt_prev)
-        has_prev = (result_prev.scalar() or 0) > 0
-
-        # Verificar se existem aulas em meses posteriores
-        stmt_next = select(func.count(SchedulingModel.id)).where(
-            SchedulingModel.instructor_id == instructor_id,
-            SchedulingModel.scheduled_datetime > last_day_utc,
-            SchedulingModel.status.notin_([SchedulingStatus.CANCELLED, SchedulingStatus.COMPLETED]),
+        stmt = select(
+            select(summary.day_counts)
+            .where(summary.instructor_id == instructor_id, summary.month == first)
+            .scalar_subquery()
+            .label("day_counts"),
+            other_months(summary.month < first).label("has_prev"),
+            other_months(summary.month > first).label("has_next"),
         )
-        result_next = await self._session.execute(stmt_next)
-        has_next = (result_next.scalar() or 0) > 0
 
-        return {
-            "dates": [d.isoformat() for d in dates],
-            "year": year,
-            "month": month,
-            "has_prev": has_prev,
-            "has_next": has_next,
-        }
+        row = (await self._session.execute(stmt)).one()
+        last_day = monthrange(year, month)[1]
+        dates = [
+            first.replace(day=index + 1)
+            for index, count in enumerate((row.day_counts or [])[:last_day])
+            if count > 0
+        ]
+        return dates, row.has_prev, row.has_next
 
     async def get_overdue_confirmed(
         self, hours_threshold: int = 24
@@ -537,17 +1035,9 @@ class SchedulingRepositoryImpl(ISchedulingRepository):
         now = datetime.now(timezone.utc)
         cutoff = now - timedelta(hours=hours_threshold)
 
-        # end_datetime = scheduled_datetime + duration_minutes
-        end_expr = SchedulingModel.scheduled_datetime + func.make_interval(
-            0, 0, 0, 0, 0, SchedulingModel.duration_minutes
-        )
-
         stmt = (
             select(SchedulingModel)
-            .where(
-                SchedulingModel.status == SchedulingStatus.CONFIRMED,
-                end_expr <= cutoff,
-            )
+            .where(overdue_confirmed_guard(cutoff))
             .options(
                 joinedload(SchedulingModel.payment),
                 joinedload(SchedulingModel.student).load_only(
@@ -576,38 +1066,11 @@ class SchedulingRepositoryImpl(ISchedulingRepository):
         1. PENDING/sem pagamento: expiram em timeout_minutes (12).
         2. PROCESSING: expiram em processing_timeout_minutes (30).
         """
-        from datetime import datetime, timedelta, timezone
-        from src.infrastructure.db.models.payment_model import PaymentModel
-        from src.domain.entities.payment_status import PaymentStatus
-
         now = datetime.now(timezone.utc)
-        cutoff_pending = now - timedelta(minutes=timeout_minutes)
-        cutoff_processing = now - timedelta(minutes=processing_timeout_minutes)
-
-        stmt = (
-            select(SchedulingModel)
-            .outerjoin(PaymentModel, PaymentModel.scheduling_id == SchedulingModel.id)
-            .where(
-                SchedulingModel.status.in_([SchedulingStatus.PENDING, SchedulingStatus.CONFIRMED]),
-                or_(
-                    # Caso 1: Sem pagamento, PENDING, FAILED ou REFUNDED -> expira em 12min
-                    and_(
-                        SchedulingModel.created_at <= cutoff_pending,
-                        or_(
-                            PaymentModel.id.is_(None),
-                            PaymentModel.status.in_([
-                                PaymentStatus.PENDING, 
-                                PaymentStatus.FAILED, 
-                                PaymentStatus.REFUNDED
-                            ]),
-                        ),
-                    ),
-                    # Caso 2: PROCESSING -> expira em 30min (proteção de checkout)
-                    and_(
-                        SchedulingModel.created_at <= cutoff_processing,
-                        PaymentModel.status == PaymentStatus.PROCESSING,
-                    ),
-                ),
+        stmt = select(SchedulingModel).where(
+            expired_cart_guard(
+                now - timedelta(minutes=timeout_minutes),
+                now - timedelta(minutes=processing_timeout_minutes),
             )
         )
 
@@ -638,22 +1101,57 @@ class SchedulingRepositoryImpl(ISchedulingRepository):
         date_to: datetime | None = None,
         limit: int = 50,
         offset: int = 0,
+        after: ListPosition | None = None,
     ) -> list[Scheduling]:
         """
         Lista todos os agendamentos do sistema com filtros abrangentes.
         """
-        stmt = (
-            select(SchedulingModel)
-            .options(
-                joinedload(SchedulingModel.student).load_only(UserModel.id, UserModel.full_name),
-                joinedload(SchedulingModel.instructor).options(
-                    load_only(UserModel.id, UserModel.full_name),
-                    joinedload(UserModel.instructor_profile)
-                ),
-                joinedload(SchedulingModel.payment),
-            )
+        stmt = self._all_list_stmt(status, student_id, instructor_id, date_from, date_to, limit, offset, after)
+        result = await self._session.execute(stmt)
+        return [scheduling_from_list_row(row) for row in result.all()]
+
+    async def page_all(
+        self,
+        status: SchedulingStatus | None = None,
+        student_id: UUID | None = None,
+        instructor_id: UUID | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        limit: int = 50,
+        offset: int = 0,
+        after: ListPosition | None = None,
+    ) -> tuple[list[Scheduling], int]:
+        """
+        Página da listagem do admin com o total na mesma consulta.
+
+        Sem filtros, contar exige percorrer a tabela inteira; o total passa a
+        ser a estimativa do planejador (pg_class.reltuples).
+        """
+        filters = (status, student_id, instructor_id, date_from, date_to)
+        estimated = all(value is None for value in filters)
+        stmt = self._all_list_stmt(*filters, limit, offset, after)
+        return await self._page(
+            stmt.add_columns(_ESTIMATED_TOTAL if estimated else _WINDOW_TOTAL),
+            after,
+            offset,
+            lambda: self.count_all(*filters),
+            estimated=estimated,
         )
 
+    @staticmethod
+    def _all_list_stmt(
+        status: SchedulingStatus | None,
+        student_id: UUID | None,
+        instructor_id: UUID | None,
+        date_from: datetime | None,
+        date_to: datetime | None,
+        limit: int,
+        offset: int,
+        after: ListPosition | None,
+    ) -> Select:
+        """Listagem do admin com filtros, ordenada e paginada."""
+        stmt = scheduling_list_stmt()
+
         if status is not None:
             stmt = stmt.where(SchedulingModel.status == status.value)
         if student_id is not None:
@@ -665,11 +1163,44 @@ class SchedulingRepositoryImpl(ISchedulingRepository):
         if date_to is not None:
             stmt = stmt.where(SchedulingModel.scheduled_datetime <= date_to)
 
-        stmt = stmt.order_by(SchedulingModel.scheduled_datetime.desc())
-        stmt = stmt.limit(limit).offset(offset)
+        return timeline_page(
+            stmt,
+            SchedulingModel.scheduled_datetime,
+            SchedulingModel.id,
+            after,
+            descending=True,
+            limit=limit,
+            offset=offset,
+        )
+
+    async def _page(
+        self,
+        stmt: Select,
+        after: ListPosition | None,
+        offset: int,
+        count: Callable[[], Awaitable[int]],
+        estimated: bool = False,
+    ) -> tuple[list[Scheduling], int]:
+        """
+        Executa uma listagem com a coluna total_count e devolve (itens, total).
 
+        A contagem em janela é feita antes de LIMIT/OFFSET, mas depois do
+        seek: com posição, ela cobre só as linhas seguintes e o ordinal da
+        posição completa o total. Página vazia não traz a coluna; o total
+        só é contado à parte quando o offset passou do fim da listagem (ou
+        quando a estimativa não existe, em tabela nunca analisada).
+        """
         result = await self._session.execute(stmt)
-        return [row.to_entity() for row in result.unique().scalars().all()]
+        rows = result.all()
+        schedulings = [scheduling_from_list_row(row) for row in rows]
+        seen = (after.ordinal or 0) if after else 0
+
+        if rows and rows[0].total_count >= 0:
+            total = rows[0].total_count
+            return schedulings, total if estimated else seen + total
+        if not rows and (after is not None or offset == 0):
+            return schedulings, seen
+        return schedulings, await count()
 
     async def count_all(
         self,
@@ -0,0 +1,19 @@
+"""
+Search Filters
+
+Normalização dos filtros recebidos do frontend, compartilhada pelas buscas
+de instrutores (tabelas de origem e projeção de busca).
+"""
+
+# Mapeamento de valores de gênero (frontend -> banco)
+GENDER_MAPPING = {
+    'Masculino': 'male',
+    'Feminino': 'female',
+}
+
+
+def normalize_gender(value: str | None) -> str | None:
+    """Converte valor de gênero do frontend para formato do banco."""
+    if value is None:
+        return None
+    return GENDER_MAPPING.get(value, value)
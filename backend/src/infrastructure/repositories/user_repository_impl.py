@@ -11,7 +11,11 @@ from sqlalchemy.orm import load_only
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.entities.user import User
+from src.infrastructure.config import settings
 from src.infrastructure.db.models.user_model import UserModel
+from src.infrastructure.repositories.instructor_search_index_repository_impl import (
+    InstructorSearchIndexRepositoryImpl,
+)
 
 
 class UserRepositoryImpl:
@@ -29,6 +33,11 @@ class UserRepositoryImpl:
             session: Sessão assíncrona do SQLAlchemy.
         """
         self._session = session
+        self._search_index = (
+            InstructorSearchIndexRepositoryImpl(session)
+            if settings.instructor_search_projection_sync_enabled
+            else None
+        )
 
     async def create(self, user: User) -> User:
         """
@@ -135,7 +144,13 @@ class UserRepositoryImpl:
 
         await self._session.flush()
         await self._session.refresh(model)
-        return model.to_entity()
+        updated = model.to_entity()
+        if updated.is_instructor and self._search_index is not None:
+            # Nome e sexo são replicados na projeção de busca de instrutores
+            await self._search_index.sync_user(
+                updated.id, updated.full_name, updated.biological_sex
+            )
+        return updated
 
     async def delete(self, user_id: UUID) -> bool:
         """
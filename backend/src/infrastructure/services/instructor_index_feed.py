@@ -0,0 +1,115 @@
+"""
+Instructor Index Feed
+
+Mantém o índice espacial em memória sincronizado com o banco.
+
+Cada instância do backend carrega o índice no startup e escuta o canal
+Redis PubSub de alterações de instrutores. Quando um perfil ou localização
+muda (após o commit), o router publica o ID do instrutor e cada instância
+recarrega apenas aquele perfil. Um recarregamento completo periódico cobre
+alterações que não passam pelos endpoints de perfil (ex: avaliações).
+"""
+
+import asyncio
+from uuid import UUID
+
+import structlog
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.infrastructure.external.redis_pubsub import RedisPubSubService
+from src.infrastructure.repositories.instructor_repository_impl import (
+    InstructorRepositoryImpl,
+)
+from src.infrastructure.services.instructor_spatial_index import InstructorSpatialIndex
+
+logger = structlog.get_logger()
+
+# Canal de alterações de perfil/localização de instrutores
+INSTRUCTOR_CHANGES_CHANNEL = "instructors:changes"
+
+
+async def publish_instructor_changed(pubsub: RedisPubSubService, user_id: UUID) -> None:
+    """
+    Publica a alteração de um instrutor para todas as instâncias.
+
+    Deve ser chamado após o commit da transação que alterou o perfil.
+
+    Args:
+        pubsub: Serviço de PubSub.
+        user_id: ID do usuário instrutor.
+    """
+    await pubsub.publish(INSTRUCTOR_CHANGES_CHANNEL, {"user_id": str(user_id)})
+
+
+class InstructorIndexFeed:
+    """
+    Carrega o índice espacial e aplica as alterações publicadas no canal.
+    """
+
+    def __init__(
+        self,
+        index: InstructorSpatialIndex,
+        pubsub: RedisPubSubService,
+        session_factory: async_sessionmaker[AsyncSession],
+        full_reload_seconds: int = 600,
+    ) -> None:
+        self._index = index
+        self._pubsub = pubsub
+        self._session_factory = session_factory
+        self._full_reload_seconds = full_reload_seconds
+        self._reload_task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        """Carrega o índice, escuta alterações e agenda o recarregamento periódico."""
+        # Subscreve antes da carga para não perder alterações feitas durante ela
+        await self._pubsub.subscribe(INSTRUCTOR_CHANGES_CHANNEL, self.handle_change)
+        try:
+            await self.reload()
+        except Exception as e:
+            # Sem carga inicial o repositório segue usando SQL até o próximo ciclo
+            logger.error("instructor_spatial_index_load_error", error=str(e))
+        self._reload_task = asyncio.create_task(self._periodic_reload())
+
+    async def stop(self) -> None:
+        """Para o recarregamento periódico e a escuta do canal."""
+        if self._reload_task and not self._reload_task.done():
+            self._reload_task.cancel()
+            try:
+                await self._reload_task
+            except asyncio.CancelledError:
+                pass
+        await self._pubsub.unsubscribe(INSTRUCTOR_CHANGES_CHANNEL, self.handle_change)
+
+    async def reload(self) -> None:
+        """Recarrega todos os instrutores disponíveis do banco."""
+        async with self._session_factory() as session:
+            repo = InstructorRepositoryImpl(session)
+            profiles = await repo.get_available_instructors(limit=None)
+        self._index.load(profiles)
+
+    async def handle_change(self, message: dict) -> None:
+        """
+        Aplica a alteração de um instrutor publicada no canal.
+
+        Args:
+            message: Mensagem com "user_id" do instrutor alterado.
+        """
+        user_id = UUID(message["user_id"])
+        async with self._session_factory() as session:
+            repo = InstructorRepositoryImpl(session)
+            profile = await repo.get_public_profile_by_user_id(user_id)
+
+        if profile is None:
+            self._index.remove(user_id)
+        else:
+            self._index.upsert(profile)
+        logger.debug("instructor_spatial_index_updated", user_id=str(user_id))
+
+    async def _periodic_reload(self) -> None:
+        """Loop de recarregamento completo (rede de segurança)."""
+        while True:
+            await asyncio.sleep(self._full_reload_seconds)
+            try:
+                await self.reload()
+            except Exception as e:
+                logger.error("instructor_spatial_index_reload_error", error=str(e))
@@ -0,0 +1,245 @@
+"""
+Instructor Spatial Index
+
+Índice espacial em memória dos instrutores disponíveis.
+
+Mantém as coordenadas e os campos filtráveis em arrays NumPy (colunas) e uma
+R-tree (shapely STRtree) sobre os pontos. A busca por proximidade consulta a
+R-tree com a caixa envolvente do raio e calcula as distâncias exatas
+(Haversine) de todos os candidatos de uma só vez.
+
+A STRtree é imutável: alterações após a construção ficam em um conjunto de
+posições pendentes, avaliadas por força bruta junto com os candidatos da
+árvore, até que a árvore seja reconstruída.
+"""
+
+import copy
+import math
+from uuid import UUID
+
+import numpy as np
+import shapely
+import structlog
+
+from src.domain.entities.instructor_profile import InstructorProfile
+from src.domain.entities.location import EARTH_RADIUS_KM, Location, haversine_km
+
+logger = structlog.get_logger()
+
+# km por grau de latitude (mesmo raio terrestre de Location.distance_to)
+KM_PER_DEGREE = EARTH_RADIUS_KM * math.pi / 180
+
+
+class InstructorSpatialIndex:
+    """
+    Índice em memória para a busca de instrutores disponíveis por proximidade.
+
+    Reproduz a semântica de InstructorRepositoryImpl.search_by_location com
+    only_available=True: instrutores localizados dentro do raio ordenados por
+    distância, seguidos dos sem localização ordenados por rating. Busca
+    textual não é suportada (o repositório usa SQL nesse caso).
+
+    Distâncias são calculadas por Haversine (esfera), então instrutores a
+    poucos metros da borda do raio podem divergir do resultado do PostGIS.
+    """
+
+    def __init__(self, rebuild_threshold: int = 256) -> None:
+        self._rebuild_threshold = rebuild_threshold
+        self._ready = False
+        self._reset(0)
+
+    @property
+    def is_ready(self) -> bool:
+        """Indica se o índice já foi carregado e pode responder buscas."""
+        return self._ready
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def load(self, profiles: list[InstructorProfile]) -> None:
+        """
+        Substitui todo o conteúdo do índice e reconstrói a R-tree.
+
+        Args:
+            profiles: Perfis de instrutores disponíveis.
+        """
+        available = [p for p in profiles if p.is_available]
+        self._reset(len(available))
+        for profile in available:
+            self._write(self._allocate(profile.user_id), profile)
+        self._build_tree()
+        self._ready = True
+        logger.info("instructor_spatial_index_loaded", instructors=len(available))
+
+    def upsert(self, profile: InstructorProfile) -> None:
+        """
+        Insere ou atualiza um instrutor (remove se ficou indisponível).
+
+        Args:
+            profile: Perfil atualizado do instrutor.
+        """
+        if not profile.is_available:
+            self.remove(profile.user_id)
+            return
+
+        slot = self._slots.get(profile.user_id)
+        if slot is None:
+            slot = self._allocate(profile.user_id)
+        self._write(slot, profile)
+        # A posição na árvore pode estar desatualizada (ou não existir)
+        self._pending.add(slot)
+        self._maybe_rebuild()
+
+    def remove(self, user_id: UUID) -> None:
+        """
+        Remove um instrutor do índice.
+
+        Args:
+            user_id: ID do usuário instrutor.
+        """
+        slot = self._slots.pop(user_id, None)
+        if slot is None:
+            return
+        self._active[slot] = False
+        self._profiles[slot] = None
+        self._pending.discard(slot)
+        self._removed += 1
+        self._maybe_rebuild()
+
+    def search(
+        self,
+        center: Location,
+        radius_km: float = 10.0,
+        biological_sex: str | None = None,
+        license_category: str | None = None,
+        limit: int = 50,
+    ) -> list[InstructorProfile]:
+        """
+        Busca instrutores disponíveis por proximidade.
+
+        Args:
+            center: Ponto central da busca.
+            radius_km: Raio de busca em km.
+            biological_sex: Filtro por sexo, já no formato do banco.
+            license_category: Filtro por categoria de CNH.
+            limit: Número máximo de resultados.
+
+        Returns:
+            Perfis localizados por distância e, em seguida, os sem
+            localização por rating.
+        """
+        size = self._size
+        base_mask = self._active[:size].copy()
+        if biological_sex:
+            base_mask &= self._sex[:size] == biological_sex
+        if license_category:
+            base_mask &= self._license[:size] == license_category
+
+        # Ramo localizado: candidatos da R-tree + posições pendentes
+        candidates = self._query_box(center, radius_km)
+        if self._pending:
+            candidates = np.union1d(candidates, np.fromiter(self._pending, dtype=np.intp))
+        candidates = candidates[base_mask[candidates] & self._has_location[candidates]]
+
+        distances = haversine_km(
+            center.latitude,
+            center.longitude,
+            self._lat[candidates],
+            self._lon[candidates],
+        )
+        within = distances <= radius_km
+        candidates, distances = candidates[within], distances[within]
+        order = np.argsort(distances, kind="stable")[:limit]
+        slots = candidates[order].tolist()
+
+        # Ramo sem localização, por rating
+        remaining = limit - len(slots)
+        if remaining > 0:
+            unlocated = np.flatnonzero(base_mask & ~self._has_location[:size])
+            order = np.argsort(-self._rating[unlocated], kind="stable")[:remaining]
+            slots.extend(unlocated[order].tolist())
+
+        return [copy.copy(self._profiles[slot]) for slot in slots]
+
+    def _query_box(self, center: Location, radius_km: float) -> np.ndarray:
+        """Posições cujos pontos na R-tree estão na caixa envolvente do raio."""
+        if self._tree is None:
+            return np.empty(0, dtype=np.intp)
+
+        lat_delta = radius_km / KM_PER_DEGREE
+        cos_lat = max(math.cos(math.radians(center.latitude)), 0.01)
+        lon_delta = min(radius_km / (KM_PER_DEGREE * cos_lat), 180.0)
+        box = shapely.box(
+            center.longitude - lon_delta,
+            center.latitude - lat_delta,
+            center.longitude + lon_delta,
+            center.latitude + lat_delta,
+        )
+        return self._tree.query(box).astype(np.intp)
+
+    def _reset(self, capacity: int) -> None:
+        """Zera as colunas com a capacidade informada."""
+        capacity = max(capacity, 16)
+        self._size = 0
+        self._slots: dict[UUID, int] = {}
+        self._profiles: list[InstructorProfile | None] = []
+        self._lat = np.zeros(capacity)
+        self._lon = np.zeros(capacity)
+        self._has_location = np.zeros(capacity, dtype=bool)
+        self._active = np.zeros(capacity, dtype=bool)
+        self._rating = np.zeros(capacity)
+        self._sex = np.empty(capacity, dtype=object)
+        self._license = np.empty(capacity, dtype=object)
+        self._tree: shapely.STRtree | None = None
+        self._pending: set[int] = set()
+        self._removed = 0
+
+    def _allocate(self, user_id: UUID) -> int:
+        """Reserva uma nova posição nas colunas (dobrando a capacidade se preciso)."""
+        if self._size == len(self._lat):
+            capacity = len(self._lat) * 2
+            for name in ("_lat", "_lon", "_has_location", "_active", "_rating", "_sex", "_license"):
+                column = getattr(self, name)
+                grown = np.zeros(capacity, dtype=column.dtype)
+                if column.dtype == object:
+                    grown[:] = None
+                grown[: self._size] = column[: self._size]
+                setattr(self, name, grown)
+
+        slot = self._size
+        self._size += 1
+        self._slots[user_id] = slot
+        self._profiles.append(None)
+        return slot
+
+    def _write(self, slot: int, profile: InstructorProfile) -> None:
+        """Grava os campos do perfil nas colunas."""
+        location = profile.location
+        self._has_location[slot] = location is not None
+        self._lat[slot] = location.latitude if location else 0.0
+        self._lon[slot] = location.longitude if location else 0.0
+        self._active[slot] = True
+        self._rating[slot] = float(profile.rating)
+        self._sex[slot] = profile.biological_sex
+        self._license[slot] = profile.license_category
+        self._profiles[slot] = profile
+
+    def _build_tree(self) -> None:
+        """Constrói a R-tree sobre as posições atuais (índice = posição)."""
+        size = self._size
+        points = shapely.points(self._lon[:size], self._lat[:size])
+        # Geometrias None são ignoradas pela STRtree
+        points[~(self._has_location[:size] & self._active[:size])] = None
+        self._tree = shapely.STRtree(points)
+        self._pending.clear()
+
+    def _maybe_rebuild(self) -> None:
+        """Compacta e reconstrói o índice quando há alterações demais pendentes."""
+        if len(self._pending) + self._removed <= self._rebuild_threshold:
+            return
+        profiles = [p for p in self._profiles if p is not None]
+        self.load(profiles)
+
+
+# Instância global (carregada no startup quando habilitada)
+instructor_spatial_index = InstructorSpatialIndex()
@@ -0,0 +1,142 @@
+"""
+Location Buffer Flusher
+
+Grava periodicamente no banco as posições acumuladas no buffer de escrita de
+localização (RedisLocationWriteBuffer).
+
+A cada intervalo, a instância que obtiver o lock de flush drena o buffer e
+aplica as posições em lotes, um UPDATE ... FROM (VALUES ...) por lote. Cada
+lote é confirmado no buffer após o commit; só então os tiles da busca são
+invalidados e a alteração é publicada para os índices espaciais em memória.
+"""
+
+import asyncio
+import contextlib
+import time
+from uuid import UUID, uuid4
+
+import structlog
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.application.services.instructor_tile_cache import InstructorTileCache
+from src.domain.entities.location import Location
+from src.infrastructure.external.redis_cache import RedisCacheService
+from src.infrastructure.external.redis_location_buffer import RedisLocationWriteBuffer
+from src.infrastructure.external.redis_pubsub import RedisPubSubService
+from src.infrastructure.repositories.instructor_repository_impl import (
+    InstructorRepositoryImpl,
+)
+from src.infrastructure.services.instructor_index_feed import publish_instructor_changed
+
+logger = structlog.get_logger()
+
+
+class LocationBufferFlusher:
+    """
+    Loop de gravação em lote das posições acumuladas no buffer.
+    """
+
+    def __init__(
+        self,
+        buffer: RedisLocationWriteBuffer,
+        session_factory: async_sessionmaker[AsyncSession],
+        cache_service: RedisCacheService | None = None,
+        pubsub: RedisPubSubService | None = None,
+        flush_interval_seconds: float = 5.0,
+        batch_size: int = 500,
+    ) -> None:
+        if flush_interval_seconds >= buffer.max_staleness_seconds:
+            raise ValueError("flush_interval_seconds deve ser menor que o atraso máximo do buffer")
+        self._buffer = buffer
+        self._session_factory = session_factory
+        self._cache_service = cache_service
+        self._pubsub = pubsub
+        self._flush_interval_seconds = flush_interval_seconds
+        self._batch_size = batch_size
+        self._flush_task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        """Marca o flusher como ativo e agenda o flush periódico."""
+        await self._buffer.heartbeat()
+        self._flush_task = asyncio.create_task(self._periodic_flush())
+
+    async def stop(self) -> None:
+        """Para o flush periódico e grava o que estiver pendente."""
+        if self._flush_task and not self._flush_task.done():
+            self._flush_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flush_task
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error("location_buffer_final_flush_error", error=str(e))
+
+    async def flush(self) -> int:
+        """
+        Grava as posições acumuladas, se obtiver o lock de flush.
+
+        Returns:
+            Número de perfis atualizados (0 se outra instância está gravando).
+        """
+        token = uuid4().hex
+        if not await self._buffer.acquire_flush_lock(token, self._buffer.max_staleness_seconds):
+            return 0
+
+        started = time.perf_counter()
+        try:
+            pending = await self._buffer.drain()
+            now = time.time()
+            max_lag_ms = max(((now - ts) * 1000 for _, _, ts in pending.values()), default=0.0)
+
+            updates = [(user_id, location, city) for user_id, (location, city, _) in pending.items()]
+            written = 0
+            for start in range(0, len(updates), self._batch_size):
+                written += await self._flush_batch(updates[start:start + self._batch_size])
+
+            await self._buffer.heartbeat()
+            await self._buffer.record_flush(
+                rows=written,
+                duration_ms=(time.perf_counter() - started) * 1000,
+                max_lag_ms=max_lag_ms,
+            )
+            return written
+        except Exception:
+            await self._buffer.record_flush_error()
+            raise
+        finally:
+            await self._buffer.release_flush_lock(token)
+
+    async def _flush_batch(self, batch: list[tuple[UUID, Location, str | None]]) -> int:
+        """Grava um lote em uma transação e propaga as alterações confirmadas."""
+        async with self._session_factory() as session, session.begin():
+            updated = await InstructorRepositoryImpl(session).bulk_update_locations(batch)
+
+        # Perfis inexistentes também saem do buffer: não há o que gravar
+        await self._buffer.ack([user_id for user_id, _, _ in batch])
+
+        locations = {user_id: location for user_id, location, _ in batch}
+        for user_id, previous_location in updated.items():
+            await self._propagate(user_id, locations[user_id], previous_location)
+        return len(updated)
+
+    async def _propagate(
+        self, user_id: UUID, location: Location, previous_location: Location | None
+    ) -> None:
+        """Invalida os tiles afetados e notifica as demais instâncias."""
+        if self._cache_service:
+            await InstructorTileCache(self._cache_service).invalidate_instructor(
+                user_id=user_id,
+                location=location,
+                previous_location=previous_location,
+            )
+        if self._pubsub:
+            await publish_instructor_changed(self._pubsub, user_id)
+
+    async def _periodic_flush(self) -> None:
+        """Loop de flush periódico."""
+        while True:
+            await asyncio.sleep(self._flush_interval_seconds)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error("location_buffer_flush_error", error=str(e))
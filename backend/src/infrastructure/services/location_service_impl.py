@@ -4,21 +4,36 @@ LocationService Implementation
 Implementação concreta do serviço de geolocalização.
 """
 
+from collections.abc import Sequence
+
+import numpy as np
+
 from src.domain.entities.instructor_profile import InstructorProfile
 from src.domain.entities.location import Location
 from src.domain.interfaces.instructor_repository import IInstructorRepository
 from src.domain.interfaces.location_service import ILocationService
+from src.infrastructure.external.nominatim_client import NominatimClient
+from src.infrastructure.services.reverse_geocoder import OfflineReverseGeocoder
 
 
 class LocationServiceImpl(ILocationService):
     """
     Implementação do serviço de geolocalização.
 
-    Utiliza o repositório de instrutores para queries espaciais.
+    Utiliza o repositório de instrutores para queries espaciais e o
+    geocodificador offline (com Nominatim opcional como fallback) para a
+    geocodificação reversa.
     """
 
-    def __init__(self, instructor_repository: IInstructorRepository) -> None:
+    def __init__(
+        self,
+        instructor_repository: IInstructorRepository,
+        reverse_geocoder: OfflineReverseGeocoder | None = None,
+        nominatim: NominatimClient | None = None,
+    ) -> None:
         self._instructor_repo = instructor_repository
+        self._reverse_geocoder = reverse_geocoder
+        self._nominatim = nominatim
 
     def calculate_distance(self, point_a: Location, point_b: Location) -> float:
         """Calcula distância entre dois pontos usando Haversine."""
@@ -47,43 +62,32 @@ class LocationServiceImpl(ILocationService):
         distance = self.calculate_distance(point, center)
         return distance <= radius_km
 
+    def filter_within_radius(
+        self,
+        points: Sequence[Location | None],
+        center: Location,
+        radius_km: float,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Filtra pontos dentro de um raio com uma única passada vetorizada."""
+        distances = center.distances_to_many(points)
+        # NaN (sem localização) nunca satisfaz a comparação
+        within = np.flatnonzero(distances <= radius_km)
+        order = within[np.argsort(distances[within], kind="stable")]
+        return order, distances[order]
+
     async def get_city_name(self, location: Location) -> str | None:
         """
-        Obtém o nome da cidade a partir de coordenadas (Nominatim OSM).
-        
-        Nota: Nominatim requer um User-Agent descritivo e tem limites de uso.
-        Para produção, considere Google Maps ou Mapbox.
-        """
-        import httpx
-        import structlog
-
-        logger = structlog.get_logger()
-        url = "https://nominatim.openstreetmap.org/reverse"
-        params = {
-            "lat": location.latitude,
-            "lon": location.longitude,
-            "format": "json",
-            "addressdetails": 1,
-        }
-        headers = {
-            "User-Agent": "GoDrive-App/1.0 (contact@godrive.com)"
-        }
+        Obtém o nome da cidade a partir de coordenadas.
 
-        try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(url, params=params, headers=headers)
-                response.raise_for_status()
-                data = response.json()
-                
-                address = data.get("address", {})
-                # Tenta obter cidade, município ou vila
-                city = (
-                    address.get("city") or 
-                    address.get("town") or 
-                    address.get("village") or 
-                    address.get("municipality")
-                )
+        Consulta primeiro os limites municipais em memória (sem rede); o
+        Nominatim só é chamado se configurado e o ponto não for resolvido
+        localmente (conjunto de dados ausente ou ponto fora dos polígonos).
+        """
+        if self._reverse_geocoder is not None:
+            city = self._reverse_geocoder.city_at(location)
+            if city is not None:
                 return city
-        except Exception as e:
-            logger.error("geocoding_error", error=str(e), lat=location.latitude, lon=location.longitude)
-            return None
+
+        if self._nominatim is not None:
+            return await self._nominatim.get_city_name(location)
+        return None
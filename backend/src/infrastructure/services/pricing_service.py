@@ -10,8 +10,19 @@ Implementa a lógica de precificação fee-on-top para o GoDrive.
 
 from decimal import Decimal, ROUND_CEILING
 import math
+from typing import Any
+
 from src.infrastructure.config import settings
 
+# Campo de preço base do perfil -> campo com o preço final gravado
+FINAL_PRICE_FIELDS = {
+    "hourly_rate": "final_hourly_rate",
+    "price_cat_a_instructor_vehicle": "final_price_cat_a_instructor_vehicle",
+    "price_cat_a_student_vehicle": "final_price_cat_a_student_vehicle",
+    "price_cat_b_instructor_vehicle": "final_price_cat_b_instructor_vehicle",
+    "price_cat_b_student_vehicle": "final_price_cat_b_student_vehicle",
+}
+
 class PricingService:
     @staticmethod
     def calculate_final_price(base_price: Decimal) -> Decimal:
@@ -58,6 +69,83 @@ class PricingService:
             
         return final_price.quantize(Decimal("0.01"))
 
+    @staticmethod
+    def fee_signature() -> str:
+        """
+        Identifica as taxas vigentes usadas em calculate_final_price.
+
+        Preços finais gravados com outra assinatura foram calculados com
+        taxas antigas e precisam ser recalculados.
+        """
+        platform_fee = Decimal(str(settings.platform_fee_percentage)).normalize()
+        mp_fee = Decimal(str(settings.mercadopago_fee_percentage)).normalize()
+        # Notação fixa: normalize() de 20 é 2E+1
+        return f"{platform_fee:f}:{mp_fee:f}"
+
+    @staticmethod
+    def calculate_final_prices(profile: Any) -> dict[str, Decimal | None]:
+        """
+        Calcula o preço final de cada campo de preço base do perfil.
+
+        Args:
+            profile: Perfil (entidade ou modelo) com os campos de preço base.
+
+        Returns:
+            Mapa campo de preço base -> preço final (None se o preço base não
+            estiver configurado).
+        """
+        prices = {}
+        for base_field in FINAL_PRICE_FIELDS:
+            base_price = getattr(profile, base_field)
+            prices[base_field] = (
+                PricingService.calculate_final_price(base_price) if base_price is not None else None
+            )
+        return prices
+
+    @staticmethod
+    def apply_final_prices(profile: Any) -> None:
+        """
+        Grava no perfil (entidade ou modelo) os preços finais calculados com
+        as taxas vigentes e a assinatura dessas taxas.
+        """
+        for base_field, final_price in PricingService.calculate_final_prices(profile).items():
+            setattr(profile, FINAL_PRICE_FIELDS[base_field], final_price)
+        profile.final_prices_signature = PricingService.fee_signature()
+
+    @staticmethod
+    def final_prices(profile: Any) -> dict[str, Decimal | None]:
+        """
+        Preços finais do perfil para exibição e cobrança.
+
+        Usa os valores gravados no perfil quando calculados com as taxas
+        vigentes; um perfil ainda não recalculado após mudança de taxas tem
+        os preços calculados na hora.
+
+        Returns:
+            Mapa campo de preço base -> preço final (None se não configurado).
+        """
+        if profile.final_prices_signature == PricingService.fee_signature():
+            return {
+                base_field: getattr(profile, final_field)
+                for base_field, final_field in FINAL_PRICE_FIELDS.items()
+            }
+        return PricingService.calculate_final_prices(profile)
+
+    @staticmethod
+    def final_price(profile: Any, base_field: str) -> Decimal | None:
+        """
+        Preço final de um único campo de preço base do perfil (mesma regra de
+        final_prices).
+
+        Args:
+            profile: Perfil do instrutor.
+            base_field: Campo de preço base (ex: "price_cat_b_student_vehicle").
+        """
+        if profile.final_prices_signature == PricingService.fee_signature():
+            return getattr(profile, FINAL_PRICE_FIELDS[base_field])
+        base_price = getattr(profile, base_field)
+        return PricingService.calculate_final_price(base_price) if base_price is not None else None
+
     @staticmethod
     def calculate_marketplace_fee(final_price: Decimal, instructor_base_price: Decimal) -> Decimal:
         """
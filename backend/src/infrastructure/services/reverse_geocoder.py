@@ -0,0 +1,137 @@
+"""
+Offline Reverse Geocoder
+
+Geocodificação reversa local: resolve o município de uma coordenada por
+ponto-em-polígono sobre os limites municipais carregados em memória.
+
+Os polígonos ficam em uma R-tree (shapely STRtree); uma consulta percorre
+apenas os poucos municípios cuja caixa envolvente contém o ponto e testa a
+inclusão nos polígonos preparados. Resultados são guardados em um cache LRU
+com chave nas coordenadas arredondadas, já que atualizações de localização
+de um mesmo instrutor tendem a se repetir no mesmo lugar.
+
+O conjunto de dados é um GeoJSON (FeatureCollection) com um Polygon ou
+MultiPolygon por município e o nome em properties.name, gerado por
+scripts/build_municipality_boundaries.py.
+"""
+
+import json
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+import shapely
+import structlog
+
+from src.domain.entities.location import Location
+
+logger = structlog.get_logger()
+
+# Caminho padrão do conjunto de dados (relativo a backend/)
+DEFAULT_BOUNDARIES_PATH = Path(__file__).resolve().parents[3] / "data" / "municipalities.geojson"
+
+
+class OfflineReverseGeocoder:
+    """
+    Resolve o nome do município de uma coordenada sem acessar a rede.
+
+    Coordenadas são arredondadas para `precision` casas decimais (4 casas ≈
+    11 m) antes da consulta, então pontos a poucos metros de uma divisa podem
+    ser atribuídos ao município vizinho.
+    """
+
+    def __init__(self, cache_size: int = 8192, precision: int = 4) -> None:
+        self._cache_size = cache_size
+        self._precision = precision
+        self._cache: OrderedDict[tuple[float, float], str | None] = OrderedDict()
+        self._names: list[str] = []
+        self._geometries = np.empty(0, dtype=object)
+        self._tree: shapely.STRtree | None = None
+
+    @property
+    def is_ready(self) -> bool:
+        """Indica se os limites municipais já foram carregados."""
+        return self._tree is not None
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def load(self, geometries: list, names: list[str]) -> None:
+        """
+        Substitui os municípios carregados e reconstrói a R-tree.
+
+        Args:
+            geometries: Polígonos (shapely) dos municípios.
+            names: Nome de cada município, na mesma ordem.
+        """
+        if len(geometries) != len(names):
+            raise ValueError("geometries e names devem ter o mesmo tamanho")
+
+        self._geometries = np.asarray(geometries, dtype=object)
+        # Polígonos preparados: testes de inclusão sem reprocessar as arestas
+        shapely.prepare(self._geometries)
+        self._names = list(names)
+        self._tree = shapely.STRtree(self._geometries)
+        self._cache.clear()
+        logger.info("reverse_geocoder_loaded", municipalities=len(self._names))
+
+    def load_geojson(self, path: str | Path, name_property: str = "name") -> None:
+        """
+        Carrega os limites municipais de um arquivo GeoJSON.
+
+        Args:
+            path: Caminho do FeatureCollection.
+            name_property: Propriedade com o nome do município.
+        """
+        with open(path, encoding="utf-8") as file:
+            collection = json.load(file)
+
+        geometries, names = [], []
+        for feature in collection["features"]:
+            name = (feature.get("properties") or {}).get(name_property)
+            if not name or not feature.get("geometry"):
+                continue
+            geometries.append(shapely.from_geojson(json.dumps(feature["geometry"])))
+            names.append(name)
+
+        self.load(geometries, names)
+
+    def city_at(self, location: Location) -> str | None:
+        """
+        Obtém o município que contém a coordenada.
+
+        Args:
+            location: Coordenada consultada.
+
+        Returns:
+            Nome do município, ou None se o índice não estiver carregado ou o
+            ponto estiver fora de todos os polígonos.
+        """
+        if self._tree is None:
+            return None
+
+        key = (
+            round(location.latitude, self._precision),
+            round(location.longitude, self._precision),
+        )
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        city = self._resolve(key[0], key[1])
+        self._cache[key] = city
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return city
+
+    def _resolve(self, latitude: float, longitude: float) -> str | None:
+        """Ponto-em-polígono via R-tree (caixa envolvente + teste exato)."""
+        matches = self._tree.query(shapely.Point(longitude, latitude), predicate="intersects")
+        if len(matches) == 0:
+            return None
+        # Ponto exatamente sobre uma divisa: escolha determinística
+        return self._names[int(matches.min())]
+
+
+# Instância global (carregada no startup; a API não inicia sem o conjunto de dados)
+reverse_geocoder = OfflineReverseGeocoder()
@@ -0,0 +1,204 @@
+"""
+Weekly Availability Cache
+
+Cache da disponibilidade semanal (slots ativos) de cada instrutor.
+
+A semana inteira é guardada como uma estrutura compacta (dia, início e fim em
+microssegundos do dia) indexada pela versão da disponibilidade do instrutor
+(instructor_profiles.availability_version), incrementada na mesma transação de
+cada escrita de slot. Como a versão muda a cada edição, nenhuma entrada
+precisa ser invalidada: versões antigas deixam de ser lidas e expiram.
+
+Duas camadas: um LRU local por processo (acerto sem ida ao Redis) e o Redis,
+compartilhado entre processos. Falhas do Redis apenas desviam a leitura para
+o banco.
+"""
+
+import json
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, time, timedelta, timezone
+from typing import Protocol
+from uuid import UUID
+
+import structlog
+
+from src.core.helpers.timezone_utils import DEFAULT_TIMEZONE
+from src.domain.entities.availability import Availability
+
+logger = structlog.get_logger()
+
+WEEK_KEY_PREFIX = "availability:week"
+
+
+class ICacheService(Protocol):
+    """Interface para serviço de cache."""
+
+    async def get(self, key: str) -> str | None:
+        """Obtém valor do cache."""
+        ...
+
+    async def set(self, key: str, value: str, ttl_seconds: int = 60) -> None:
+        """Define valor no cache."""
+        ...
+
+
+def week_key(instructor_id: UUID, version: int) -> str:
+    """Chave de cache da semana de um instrutor em uma versão."""
+    return f"{WEEK_KEY_PREFIX}:{instructor_id}:{version}"
+
+
+def _micros(value: time) -> int:
+    """Microssegundos desde a meia-noite."""
+    return ((value.hour * 60 + value.minute) * 60 + value.second) * 1_000_000 + value.microsecond
+
+
+def _time(micros: int) -> time:
+    seconds, microsecond = divmod(micros, 1_000_000)
+    minutes, second = divmod(seconds, 60)
+    hour, minute = divmod(minutes, 60)
+    return time(hour, minute, second, microsecond)
+
+
+@dataclass(frozen=True)
+class WeeklyAvailability:
+    """
+    Slots ativos da semana de um instrutor em uma versão.
+
+    Attributes:
+        instructor_id: ID do instrutor.
+        version: Versão da disponibilidade que originou a entrada.
+        slots: Tuplas (id, dia da semana, início, fim), com início e fim em
+            microssegundos do dia, ordenadas por dia e início.
+    """
+
+    instructor_id: UUID
+    version: int
+    slots: tuple[tuple[UUID, int, int, int], ...]
+
+    @classmethod
+    def from_availabilities(
+        cls,
+        instructor_id: UUID,
+        version: int,
+        availabilities: Iterable[Availability],
+    ) -> "WeeklyAvailability":
+        """Monta a semana a partir dos slots (inativos são ignorados)."""
+        slots = sorted(
+            (
+                (a.id, a.day_of_week, _micros(a.start_time), _micros(a.end_time))
+                for a in availabilities
+                if a.is_active
+            ),
+            key=lambda slot: (slot[1], slot[2]),
+        )
+        return cls(instructor_id, version, tuple(slots))
+
+    @classmethod
+    def from_json(cls, instructor_id: UUID, version: int, raw: str) -> "WeeklyAvailability":
+        return cls(
+            instructor_id,
+            version,
+            tuple((UUID(slot_id), day, start, end) for slot_id, day, start, end in json.loads(raw)),
+        )
+
+    def to_json(self) -> str:
+        return json.dumps([[str(slot_id), day, start, end] for slot_id, day, start, end in self.slots])
+
+    def for_day(self, day_of_week: int) -> list[Availability]:
+        """Slots de um dia da semana, ordenados pelo início."""
+        return [self._entity(slot) for slot in self.slots if slot[1] == day_of_week]
+
+    def all(self) -> list[Availability]:
+        """Todos os slots, ordenados por dia e início."""
+        return [self._entity(slot) for slot in self.slots]
+
+    def covers(self, target_datetime: datetime, duration_minutes: int) -> bool:
+        """
+        Verifica se a aula cabe inteira em um slot (mesma regra de
+        IAvailabilityRepository.is_time_available: horário local de Brasília,
+        datetime naive tratado como UTC e aulas que cruzam a meia-noite recusadas).
+        """
+        if target_datetime.tzinfo is None:
+            target_datetime = target_datetime.replace(tzinfo=timezone.utc)
+        local_dt = target_datetime.astimezone(DEFAULT_TIMEZONE)
+        end_dt = local_dt + timedelta(minutes=duration_minutes)
+        if end_dt.date() != local_dt.date():
+            return False
+
+        day = local_dt.weekday()
+        start, end = _micros(local_dt.time()), _micros(end_dt.time())
+        return any(
+            slot_day == day and slot_start <= start and slot_end >= end
+            for _, slot_day, slot_start, slot_end in self.slots
+        )
+
+    def _entity(self, slot: tuple[UUID, int, int, int]) -> Availability:
+        # Entradas do cache não carregam created_at/updated_at
+        slot_id, day, start, end = slot
+        return Availability(
+            id=slot_id,
+            instructor_id=self.instructor_id,
+            day_of_week=day,
+            start_time=_time(start),
+            end_time=_time(end),
+            is_active=True,
+        )
+
+
+@dataclass
+class WeeklyAvailabilityCache:
+    """
+    Cache de duas camadas da semana de disponibilidade, por versão.
+
+    O LRU local guarda a última versão vista de cada instrutor; uma versão
+    nova substitui a anterior.
+    """
+
+    cache_service: ICacheService
+    ttl_seconds: int = 86400
+    local_size: int = 2048
+    _local: "OrderedDict[UUID, WeeklyAvailability]" = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+
+    async def get(self, instructor_id: UUID, version: int) -> WeeklyAvailability | None:
+        """Obtém a semana na versão informada (LRU local, depois Redis)."""
+        local = self._local.get(instructor_id)
+        if local is not None and local.version == version:
+            self._local.move_to_end(instructor_id)
+            return local
+
+        try:
+            cached = await self.cache_service.get(week_key(instructor_id, version))
+        except Exception as e:
+            logger.warning("availability_cache_read_error", instructor_id=str(instructor_id), error=str(e))
+            return None
+        if cached is None:
+            return None
+
+        week = WeeklyAvailability.from_json(instructor_id, version, cached)
+        self._remember(week)
+        return week
+
+    async def put(self, week: WeeklyAvailability) -> None:
+        """Grava a semana nas duas camadas."""
+        self._remember(week)
+        try:
+            await self.cache_service.set(
+                week_key(week.instructor_id, week.version),
+                week.to_json(),
+                ttl_seconds=self.ttl_seconds,
+            )
+        except Exception as e:
+            logger.warning("availability_cache_write_error", instructor_id=str(week.instructor_id), error=str(e))
+
+    def _remember(self, week: WeeklyAvailability) -> None:
+        current = self._local.get(week.instructor_id)
+        if current is not None and current.version > week.version:
+            return
+        self._local[week.instructor_id] = week
+        self._local.move_to_end(week.instructor_id)
+        while len(self._local) > self.local_size:
+            self._local.popitem(last=False)
@@ -44,6 +44,7 @@ celery_app.conf.include = [
     "src.infrastructure.tasks.webhook_tasks",
     "src.infrastructure.tasks.lesson_tasks",
     "src.infrastructure.tasks.refund_tasks",
+    "src.infrastructure.tasks.pricing_tasks",
 ]
 
 # Configurar o Celery Beat para rodar as tarefas periodicamente
@@ -56,4 +57,8 @@ celery_app.conf.beat_schedule = {
         "task": "lessons.auto_complete_overdue",
         "schedule": 1800.0,  # A cada 30 minutos
     },
+    "recompute-final-prices-every-5-minutes": {
+        "task": "pricing.recompute_final_prices",
+        "schedule": 300.0,  # A cada 5 minutos
+    },
 }
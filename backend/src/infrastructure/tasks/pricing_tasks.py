@@ -0,0 +1,73 @@
+"""
+Pricing Tasks
+
+Celery tasks de manutenção dos preços finais gravados nos perfis de
+instrutores.
+"""
+
+import asyncio
+
+import structlog
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.infrastructure.config import settings
+from src.infrastructure.repositories.instructor_repository_impl import (
+    InstructorRepositoryImpl,
+)
+from src.infrastructure.tasks.celery_app import celery_app
+
+logger = structlog.get_logger(__name__)
+
+
+async def _run_recompute_final_prices() -> int:
+    """
+    Wrapper assíncrono para o recálculo dos preços finais.
+    Cria um engine específico para o loop de eventos atual.
+    """
+    engine = create_async_engine(
+        settings.database_url,
+        echo=False,
+        pool_size=5,
+        max_overflow=5,
+    )
+    session_factory = async_sessionmaker(
+        bind=engine,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    )
+    try:
+        async with session_factory() as session, session.begin():
+            repo = InstructorRepositoryImpl(session)
+            return await repo.recompute_final_prices()
+    finally:
+        await engine.dispose()
+
+
+@celery_app.task(
+    name="pricing.recompute_final_prices",
+    bind=True,
+    max_retries=3,
+    default_retry_delay=60,
+)
+def recompute_final_prices(self):
+    """
+    Task Celery que recalcula os preços finais gravados nos perfis quando
+    PLATFORM_FEE_PERCENTAGE ou MERCADOPAGO_FEE_PERCENTAGE mudam (assinatura
+    de taxas diferente da vigente) e os copia para a projeção de busca, se
+    a replicação estiver habilitada.
+
+    Sem alterações, é uma única consulta que não retorna linhas.
+    """
+    try:
+        recomputed = asyncio.run(_run_recompute_final_prices())
+
+        if recomputed > 0:
+            logger.info("celery_final_prices_recomputed", recomputed=recomputed)
+            return f"Recomputed final prices of {recomputed} instructors"
+
+        return "Final prices up to date"
+
+    except Exception as exc:
+        logger.error("celery_final_prices_recompute_failed", error=str(exc))
+        raise self.retry(exc=exc) from exc
@@ -21,7 +21,12 @@ from src.domain.exceptions import (
 )
 from src.domain.interfaces.auth_service import IAuthService
 from src.domain.interfaces.instructor_repository import IInstructorRepository
+from src.domain.interfaces.instructor_search_index_repository import (
+    IInstructorSearchIndexRepository,
+)
 from src.domain.interfaces.location_service import ILocationService
+from src.domain.interfaces.location_write_buffer import ILocationWriteBuffer
+from src.domain.interfaces.slot_hold_service import ISlotHoldService
 from src.domain.interfaces.message_repository import IMessageRepository
 from src.domain.interfaces.scheduling_repository import ISchedulingRepository
 from src.domain.interfaces.review_repository import IReviewRepository
@@ -31,10 +36,15 @@ from src.domain.interfaces.token_repository import ITokenRepository
 from src.domain.interfaces.user_repository import IUserRepository
 from src.domain.interfaces.payment_repository import IPaymentRepository
 from src.domain.interfaces.dispute_repository import IDisputeRepository
+from src.infrastructure.config import settings
 from src.infrastructure.db.database import get_db
+from src.infrastructure.db.identity_map import IdentityMap
 from src.infrastructure.repositories.instructor_repository_impl import (
     InstructorRepositoryImpl,
 )
+from src.infrastructure.repositories.instructor_search_index_repository_impl import (
+    InstructorSearchIndexRepositoryImpl,
+)
 from src.infrastructure.repositories.review_repository_impl import (
     ReviewRepositoryImpl,
 )
@@ -57,8 +67,14 @@ from src.infrastructure.repositories.dispute_repository_impl import (
     DisputeRepositoryImpl,
 )
 from src.infrastructure.services.auth_service_impl import AuthServiceImpl
+from src.infrastructure.services.instructor_spatial_index import instructor_spatial_index
 from src.infrastructure.services.location_service_impl import LocationServiceImpl
+from src.infrastructure.services.reverse_geocoder import reverse_geocoder
+from src.infrastructure.services.weekly_availability_cache import WeeklyAvailabilityCache
+from src.infrastructure.external.nominatim_client import nominatim_client
 from src.infrastructure.external.redis_cache import RedisCacheService, cache_service
+from src.infrastructure.external.redis_location_buffer import location_write_buffer
+from src.infrastructure.external.redis_slot_holds import slot_hold_service
 
 
 # =============================================================================
@@ -68,6 +84,22 @@ from src.infrastructure.external.redis_cache import RedisCacheService, cache_ser
 DBSession = Annotated[AsyncSession, Depends(get_db)]
 
 
+def get_identity_map() -> IdentityMap:
+    """
+    Fornece o identity map da requisição.
+
+    O FastAPI resolve a dependência uma vez por requisição, então todos os
+    repositórios da mesma sessão compartilham o mesmo mapa.
+    """
+    return IdentityMap()
+
+
+RequestIdentityMap = Annotated[IdentityMap, Depends(get_identity_map)]
+
+# Cache da semana de disponibilidade: o LRU local precisa viver entre requisições
+weekly_availability_cache = WeeklyAvailabilityCache(cache_service)
+
+
 # =============================================================================
 # Repository Dependencies
 # =============================================================================
@@ -85,7 +117,21 @@ def get_token_repository(session: DBSession) -> ITokenRepository:
 
 def get_instructor_repository(session: DBSession) -> IInstructorRepository:
     """Fornece uma instância do repositório de instrutores."""
-    return InstructorRepositoryImpl(session)
+    return InstructorRepositoryImpl(session, spatial_index=instructor_spatial_index)
+
+
+def get_instructor_search_index_repository(
+    session: DBSession,
+) -> IInstructorSearchIndexRepository | None:
+    """
+    Fornece o repositório da projeção de busca, se a leitura estiver habilitada.
+
+    A leitura (instructor_search_projection_enabled) só é ligada com a
+    replicação das escritas habilitada e após o preenchimento inicial.
+    """
+    if not settings.instructor_search_projection_enabled:
+        return None
+    return InstructorSearchIndexRepositoryImpl(session)
 
 
 def get_student_repository(session: DBSession) -> IStudentRepository:
@@ -93,24 +139,41 @@ def get_student_repository(session: DBSession) -> IStudentRepository:
     return StudentRepositoryImpl(session)
 
 
-def get_scheduling_repository(session: DBSession) -> ISchedulingRepository:
+def get_scheduling_repository(
+    session: DBSession, identity_map: RequestIdentityMap
+) -> ISchedulingRepository:
     """Fornece uma instância do repositório de agendamentos."""
-    return SchedulingRepositoryImpl(session)
+    return SchedulingRepositoryImpl(
+        session,
+        use_month_summary=settings.scheduling_month_summary_enabled,
+        identity_map=identity_map,
+    )
 
 
-def get_payment_repository(session: DBSession) -> IPaymentRepository:
+def get_payment_repository(
+    session: DBSession, identity_map: RequestIdentityMap
+) -> IPaymentRepository:
     """Fornece uma instância do repositório de pagamentos."""
-    return PaymentRepositoryImpl(session)
+    return PaymentRepositoryImpl(session, identity_map=identity_map)
 
 
 def get_availability_repository(session: DBSession) -> IAvailabilityRepository:
-    """Fornece uma instância do repositório de disponibilidade."""
-    return AvailabilityRepositoryImpl(session)
+    """
+    Fornece uma instância do repositório de disponibilidade.
+
+    As leituras de slots ativos usam o cache da semana por versão, exceto se
+    desligado (availability_cache_enabled).
+    """
+    if not settings.availability_cache_enabled:
+        return AvailabilityRepositoryImpl(session)
+    return AvailabilityRepositoryImpl(session, week_cache=weekly_availability_cache)
 
 
-def get_review_repository(session: DBSession) -> IReviewRepository:
+def get_review_repository(
+    session: DBSession, identity_map: RequestIdentityMap
+) -> IReviewRepository:
     """Fornece uma instância do repositório de avaliações."""
-    return ReviewRepositoryImpl(session)
+    return ReviewRepositoryImpl(session, identity_map=identity_map)
 
 
 def get_message_repository(session: DBSession) -> IMessageRepository:
@@ -136,8 +199,19 @@ def get_auth_service() -> IAuthService:
 def get_location_service(
     instructor_repo: Annotated[IInstructorRepository, Depends(get_instructor_repository)],
 ) -> ILocationService:
-    """Fornece uma instância do serviço de geolocalização."""
-    return LocationServiceImpl(instructor_repo)
+    """
+    Fornece uma instância do serviço de geolocalização.
+
+    A geocodificação reversa é offline; o Nominatim só é usado como fallback
+    se habilitado (nominatim_fallback_enabled), pois a atualização de
+    localização passa a resolver a cidade a cada chamada.
+    """
+    nominatim_enabled = settings.nominatim_fallback_enabled
+    return LocationServiceImpl(
+        instructor_repo,
+        reverse_geocoder=reverse_geocoder,
+        nominatim=nominatim_client if nominatim_enabled else None,
+    )
 
 
 def get_cache_service() -> RedisCacheService:
@@ -145,6 +219,21 @@ def get_cache_service() -> RedisCacheService:
     return cache_service
 
 
+def get_location_write_buffer() -> ILocationWriteBuffer | None:
+    """
+    Fornece o buffer de escrita de localização, se habilitado
+    (location_buffer_enabled); sem ele a localização é gravada a cada ping.
+    """
+    if not settings.location_buffer_enabled:
+        return None
+    return location_write_buffer
+
+
+def get_slot_hold_service() -> ISlotHoldService:
+    """Fornece o serviço de reservas temporárias de horários do carrinho."""
+    return slot_hold_service
+
+
 # =============================================================================
 # Authentication Dependencies
 # =============================================================================
@@ -267,6 +356,9 @@ def require_admin(
 UserRepo = Annotated[IUserRepository, Depends(get_user_repository)]
 TokenRepo = Annotated[ITokenRepository, Depends(get_token_repository)]
 InstructorRepo = Annotated[IInstructorRepository, Depends(get_instructor_repository)]
+InstructorSearchIndexRepo = Annotated[
+    IInstructorSearchIndexRepository | None, Depends(get_instructor_search_index_repository)
+]
 StudentRepo = Annotated[IStudentRepository, Depends(get_student_repository)]
 SchedulingRepo = Annotated[ISchedulingRepository, Depends(get_scheduling_repository)]
 PaymentRepo = Annotated[IPaymentRepository, Depends(get_payment_repository)]
@@ -275,6 +367,8 @@ ReviewRepo = Annotated[IReviewRepository, Depends(get_review_repository)]
 AuthService = Annotated[IAuthService, Depends(get_auth_service)]
 LocationService = Annotated[ILocationService, Depends(get_location_service)]
 CacheService = Annotated[RedisCacheService, Depends(get_cache_service)]
+LocationWriteBuffer = Annotated[ILocationWriteBuffer | None, Depends(get_location_write_buffer)]
+SlotHolds = Annotated[ISlotHoldService, Depends(get_slot_hold_service)]
 MessageRepo = Annotated[IMessageRepository, Depends(get_message_repository)]
 DisputeRepo = Annotated[IDisputeRepository, Depends(get_dispute_repository)]
 
@@ -23,6 +23,17 @@ from src.interface.websockets.chat_handler import ws_router, set_pubsub_service
 from src.interface.websockets.event_dispatcher import init_event_dispatcher
 from src.interface.websockets.event_dispatcher import init_event_dispatcher
 from src.infrastructure.external.redis_pubsub import pubsub_service
+from src.infrastructure.services.instructor_index_feed import InstructorIndexFeed
+from src.infrastructure.services.instructor_spatial_index import instructor_spatial_index
+from src.infrastructure.external.nominatim_client import nominatim_client
+from src.infrastructure.external.redis_cache import cache_service
+from src.infrastructure.external.redis_location_buffer import location_write_buffer
+from src.infrastructure.external.redis_slot_holds import slot_hold_service
+from src.infrastructure.services.location_buffer_flusher import LocationBufferFlusher
+from src.infrastructure.services.reverse_geocoder import (
+    DEFAULT_BOUNDARIES_PATH,
+    reverse_geocoder,
+)
 import logging
 import sys
 
@@ -56,6 +67,28 @@ structlog.configure(
 
 logger = structlog.get_logger()
 
+# Índice espacial em memória da busca de instrutores (opcional)
+instructor_index_feed = InstructorIndexFeed(
+    index=instructor_spatial_index,
+    pubsub=pubsub_service,
+    session_factory=AsyncSessionLocal,
+)
+spatial_index_enabled = settings.instructor_spatial_index_enabled
+
+# Buffer de escrita de localização (opcional): gravação em lote periódica
+location_buffer_enabled = settings.location_buffer_enabled
+location_buffer_flusher = LocationBufferFlusher(
+    buffer=location_write_buffer,
+    session_factory=AsyncSessionLocal,
+    cache_service=cache_service,
+    pubsub=pubsub_service,
+    flush_interval_seconds=settings.location_buffer_flush_interval_seconds,
+    batch_size=settings.location_buffer_batch_size,
+)
+
+# Limites municipais da geocodificação reversa offline
+municipality_boundaries_path = settings.municipality_boundaries_path or DEFAULT_BOUNDARIES_PATH
+
 # Criar aplicação FastAPI
 app = FastAPI(
     title=settings.api_title,
@@ -137,6 +170,27 @@ async def startup_event() -> None:
     # Inicializar Event Dispatcher para eventos de agendamento em tempo real
     init_event_dispatcher(pubsub_service)
 
+    # Carregar índice espacial de instrutores e escutar alterações
+    if spatial_index_enabled:
+        await instructor_index_feed.start()
+
+    # Gravar em lote as posições acumuladas no buffer de localização
+    if location_buffer_enabled:
+        await location_buffer_flusher.start()
+
+    # Carregar limites municipais (fora do event loop: parse de GeoJSON).
+    # Obrigatórios: sem eles cada atualização de localização cairia no
+    # fallback de rede (Nominatim) ou ficaria sem cidade
+    try:
+        await asyncio.to_thread(reverse_geocoder.load_geojson, municipality_boundaries_path)
+    except FileNotFoundError as e:
+        logger.error("reverse_geocoder_dataset_missing", path=str(municipality_boundaries_path))
+        raise RuntimeError(
+            f"Limites municipais não encontrados em {municipality_boundaries_path}: gere o "
+            "arquivo com scripts/build_municipality_boundaries.py (ver README) ou "
+            "informe MUNICIPALITY_BOUNDARIES_PATH"
+        ) from e
+
     logger.info(
         "application_startup",
         environment=settings.environment,
@@ -145,12 +199,29 @@ async def startup_event() -> None:
         security_headers="enabled",
         websockets="enabled",
         cart_cleanup="enabled",
+        instructor_spatial_index="enabled" if spatial_index_enabled else "disabled",
+        municipalities=len(reverse_geocoder),
+        location_buffer="enabled" if location_buffer_enabled else "disabled",
     )
 
 
 @app.on_event("shutdown")
 async def shutdown_event() -> None:
     """Evento executado ao encerrar a aplicação."""
+    if spatial_index_enabled:
+        await instructor_index_feed.stop()
+
+    # Gravar posições pendentes antes de encerrar
+    if location_buffer_enabled:
+        await location_buffer_flusher.stop()
+        await location_write_buffer.disconnect()
+
+    # Encerrar cliente HTTP do Nominatim (se usado)
+    await nominatim_client.close()
+
+    # Encerrar cliente Redis das reservas do carrinho
+    await slot_hold_service.disconnect()
+
     # Encerrar Redis PubSub
     await pubsub_service.disconnect()
 
@@ -6,7 +6,7 @@ Routers exclusivos para administradores.
 
 from fastapi import APIRouter
 
-from src.interface.api.routers.admin import disputes, users, schedulings
+from src.interface.api.routers.admin import disputes, location_buffer, users, schedulings
 
 router = APIRouter()
 
@@ -14,5 +14,6 @@ router = APIRouter()
 router.include_router(disputes.router)
 router.include_router(users.router)
 router.include_router(schedulings.router)
+router.include_router(location_buffer.router)
 
 __all__ = ["router"]
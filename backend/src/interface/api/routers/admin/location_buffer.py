@@ -0,0 +1,36 @@
+"""
+Admin Location Buffer Router
+
+Métricas do buffer de escrita de localização de instrutores.
+"""
+
+from fastapi import APIRouter
+
+from src.infrastructure.config import settings
+from src.infrastructure.external.redis_location_buffer import location_write_buffer
+from src.interface.api.dependencies import CurrentAdmin
+from src.interface.api.schemas.admin_location_buffer_schemas import (
+    LocationBufferMetricsResponse,
+)
+
+router = APIRouter(prefix="/location-buffer", tags=["Admin - Location Buffer"])
+
+
+@router.get(
+    "/metrics",
+    response_model=LocationBufferMetricsResponse,
+    summary="Métricas do buffer de localização",
+    description=(
+        "Pings aceitos, coalescidos e recusados, posições pendentes e dados "
+        "do último flush em lote."
+    ),
+)
+async def get_location_buffer_metrics(
+    _: CurrentAdmin,
+) -> LocationBufferMetricsResponse:
+    """Retorna as métricas do buffer de escrita de localização."""
+    metrics = await location_write_buffer.metrics()
+    return LocationBufferMetricsResponse(
+        enabled=settings.location_buffer_enabled,
+        **metrics,
+    )
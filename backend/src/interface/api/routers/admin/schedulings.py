@@ -53,6 +53,7 @@ async def list_all_schedulings(
     date_to: datetime | None = None,
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None, description="next_cursor da página anterior (substitui page)"),
 ) -> SchedulingListResponse:
     """Lista agendamentos para o painel administrativo."""
     use_case = ListAllSchedulingsUseCase(scheduling_repository=scheduling_repo)
@@ -66,6 +67,7 @@ async def list_all_schedulings(
         date_to=date_to,
         limit=limit,
         offset=offset,
+        cursor=cursor,
     )
 
     result = await use_case.execute(dto)
@@ -79,6 +81,7 @@ async def list_all_schedulings(
         limit=result.limit,
         offset=result.offset,
         has_more=result.has_more,
+        next_cursor=result.next_cursor,
     )
 
 
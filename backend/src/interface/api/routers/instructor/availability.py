@@ -9,13 +9,18 @@ from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, status
 
-from src.application.dtos.scheduling_dtos import CreateAvailabilityDTO
+from src.application.dtos.scheduling_dtos import (
+    CreateAvailabilityDTO,
+    ReplaceWeeklyAvailabilityDTO,
+    WeeklySlotDTO,
+)
 from src.application.use_cases.scheduling import ManageAvailabilityUseCase
 from src.interface.api.dependencies import AvailabilityRepo, CurrentInstructor, UserRepo
 from src.interface.api.schemas.scheduling_schemas import (
     AvailabilityListResponse,
     AvailabilityResponse,
     CreateAvailabilityRequest,
+    ReplaceWeeklyAvailabilityRequest,
 )
 
 router = APIRouter(prefix="/availability", tags=["Instructor - Availability"])
@@ -114,6 +119,54 @@ async def create_availability(
     return _availability_to_response(result)
 
 
+@router.put(
+    "/week",
+    response_model=AvailabilityListResponse,
+    summary="Substituir disponibilidade semanal",
+    description=(
+        "Recebe a semana completa do instrutor e aplica as diferenças em lote: "
+        "slots com o mesmo dia e início são atualizados, os ausentes são removidos "
+        "e os novos são criados."
+    ),
+)
+async def replace_weekly_availability(
+    request: ReplaceWeeklyAvailabilityRequest,
+    current_user: CurrentInstructor,
+    availability_repo: AvailabilityRepo,
+    user_repo: UserRepo,
+) -> AvailabilityListResponse:
+    """Substitui toda a disponibilidade semanal do instrutor."""
+    use_case = ManageAvailabilityUseCase(
+        availability_repository=availability_repo,
+        user_repository=user_repo,
+    )
+
+    try:
+        slots = [
+            WeeklySlotDTO(
+                day_of_week=slot.day_of_week,
+                start_time=datetime.strptime(slot.start_time, "%H:%M").time(),
+                end_time=datetime.strptime(slot.end_time, "%H:%M").time(),
+                is_active=slot.is_active,
+            )
+            for slot in request.slots
+        ]
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Formato de hora inválido. Use HH:MM",
+        )
+
+    result = await use_case.replace_week(
+        ReplaceWeeklyAvailabilityDTO(instructor_id=current_user.id, slots=slots)
+    )
+    return AvailabilityListResponse(
+        availabilities=[_availability_to_response(a) for a in result.availabilities],
+        instructor_id=result.instructor_id,
+        total_count=result.total_count,
+    )
+
+
 @router.delete(
     "/{availability_id}",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -23,9 +23,15 @@ from src.interface.api.schemas.profiles import (
     UpdateInstructorProfileRequest,
     UpdateLocationRequest,
 )
+from src.infrastructure.external.redis_pubsub import pubsub_service
+from src.infrastructure.services.instructor_index_feed import publish_instructor_changed
 from src.interface.api.dependencies import (
+    CacheService,
     CurrentInstructor,
+    DBSession,
     InstructorRepo,
+    LocationService,
+    LocationWriteBuffer,
     ReviewRepo,
     UserRepo,
 )
@@ -88,6 +94,8 @@ async def update_instructor_profile(
     current_user: CurrentInstructor,
     user_repo: UserRepo,
     instructor_repo: InstructorRepo,
+    cache_service: CacheService,
+    db_session: DBSession,
 ) -> InstructorProfileResponse:
     """Atualiza perfil do instrutor."""
     use_case = UpdateInstructorProfileUseCase(
@@ -117,7 +125,12 @@ async def update_instructor_profile(
     )
 
     try:
-        result = await use_case.execute(dto)
+        result, invalidation = await use_case.execute(dto)
+        # Commit antes de limpar os tiles da busca e notificar as instâncias
+        # que recarregam o perfil
+        await db_session.commit()
+        await invalidation.apply(cache_service)
+        await publish_instructor_changed(pubsub_service, current_user.id)
         return InstructorProfileResponse.model_validate(result)
     except InstructorNotFoundException as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
@@ -138,10 +151,16 @@ async def update_location(
     request: UpdateLocationRequest,
     current_user: CurrentInstructor,
     instructor_repo: InstructorRepo,
+    cache_service: CacheService,
+    location_service: LocationService,
+    location_buffer: LocationWriteBuffer,
+    db_session: DBSession,
 ) -> None:
     """Atualiza localização do instrutor."""
     use_case = UpdateInstructorLocationUseCase(
         instructor_repository=instructor_repo,
+        location_service=location_service,
+        location_buffer=location_buffer,
     )
 
     dto = UpdateLocationDTO(
@@ -151,7 +170,14 @@ async def update_location(
     )
 
     try:
-        await use_case.execute(dto)
+        invalidation = await use_case.execute(dto)
+        # Posição no buffer: o flusher grava, limpa os tiles e notifica
+        if invalidation is not None:
+            # Commit antes de limpar os tiles da busca e notificar as
+            # instâncias que recarregam o perfil
+            await db_session.commit()
+            await invalidation.apply(cache_service)
+            await publish_instructor_changed(pubsub_service, current_user.id)
     except InvalidLocationException as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -18,6 +18,11 @@ from src.application.dtos.scheduling_dtos import (
     RespondRescheduleDTO,
     StartSchedulingDTO,
 )
+from src.application.services.cursor_codec import (
+    cursor_scope,
+    decode_list_position,
+    encode_list_position,
+)
 from src.application.use_cases.scheduling import (
     CancelSchedulingUseCase,
     CompleteSchedulingUseCase,
@@ -34,6 +39,7 @@ from src.application.use_cases.scheduling.scheduling_notification_decorators imp
 )
 from src.domain.exceptions import DomainException
 from src.domain.entities.scheduling_status import SchedulingStatus
+from src.domain.entities.search_position import ListPosition
 from src.interface.api.dependencies import (
     AvailabilityRepo,
     CurrentInstructor,
@@ -68,26 +74,39 @@ async def list_instructor_schedule(
     status_filter: SchedulingStatus | None = None,
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=50),
+    cursor: str | None = Query(None, description="next_cursor da página anterior (substitui page)"),
 ) -> SchedulingListResponse:
     """Lista agendamentos do instrutor."""
-    offset = (page - 1) * limit
-    schedulings = await scheduling_repo.list_by_instructor(
-        instructor_id=current_user.id,
-        status=status_filter,
-        limit=limit,
-        offset=offset,
-    )
-    total = await scheduling_repo.count_by_instructor(
+    # Com cursor a página continua do último agendamento da anterior (keyset)
+    scope = cursor_scope("instructor_schedule", current_user.id, status_filter)
+    after = decode_list_position(cursor, scope) if cursor else None
+    offset = (after.ordinal or 0) if after else (page - 1) * limit
+
+    # Um item extra indica se existe próxima página; o total vem na mesma consulta
+    schedulings, total = await scheduling_repo.page_by_instructor(
         instructor_id=current_user.id,
         status=status_filter,
+        limit=limit + 1,
+        offset=0 if after else offset,
+        after=after,
     )
+    has_more = len(schedulings) > limit
+    schedulings = schedulings[:limit]
+
+    next_cursor = None
+    if has_more:
+        last = schedulings[-1]
+        next_cursor = encode_list_position(
+            ListPosition(last.scheduled_datetime, last.id, ordinal=offset + limit), scope
+        )
 
     return SchedulingListResponse(
         schedulings=[SchedulingResponse.model_validate(s) for s in schedulings],
         total_count=total,
         limit=limit,
         offset=offset,
-        has_more=(offset + limit) < total,
+        has_more=has_more,
+        next_cursor=next_cursor,
     )
 
 
@@ -170,6 +170,8 @@ async def get_instructor_by_id(
         for r in best_reviews.values()
     ]
 
+    final_prices = PricingService.final_prices(instructor)
+
     return InstructorDetailResponse(
         id=str(instructor.id),
         user_id=str(instructor.user_id),
@@ -177,14 +179,14 @@ async def get_instructor_by_id(
         bio=instructor.bio or "",
         vehicle_type=instructor.vehicle_type or "",
         license_category=instructor.license_category or "",
-        hourly_rate=float(PricingService.calculate_final_price(instructor.hourly_rate)),
+        hourly_rate=float(final_prices["hourly_rate"]),
         rating=float(instructor.rating),
         total_reviews=instructor.total_reviews,
         is_available=instructor.is_available,
         location=location,
         reviews=filtered_reviews,
-        price_cat_a_instructor_vehicle=float(PricingService.calculate_final_price(instructor.price_cat_a_instructor_vehicle)) if instructor.price_cat_a_instructor_vehicle else None,
-        price_cat_a_student_vehicle=float(PricingService.calculate_final_price(instructor.price_cat_a_student_vehicle)) if instructor.price_cat_a_student_vehicle else None,
-        price_cat_b_instructor_vehicle=float(PricingService.calculate_final_price(instructor.price_cat_b_instructor_vehicle)) if instructor.price_cat_b_instructor_vehicle else None,
-        price_cat_b_student_vehicle=float(PricingService.calculate_final_price(instructor.price_cat_b_student_vehicle)) if instructor.price_cat_b_student_vehicle else None,
+        price_cat_a_instructor_vehicle=float(final_prices["price_cat_a_instructor_vehicle"]) if instructor.price_cat_a_instructor_vehicle else None,
+        price_cat_a_student_vehicle=float(final_prices["price_cat_a_student_vehicle"]) if instructor.price_cat_a_student_vehicle else None,
+        price_cat_b_instructor_vehicle=float(final_prices["price_cat_b_instructor_vehicle"]) if instructor.price_cat_b_instructor_vehicle else None,
+        price_cat_b_student_vehicle=float(final_prices["price_cat_b_student_vehicle"]) if instructor.price_cat_b_student_vehicle else None,
     )
@@ -7,7 +7,7 @@ Endpoints de pagamento compartilhados entre alunos e instrutores.
 import logging
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -71,6 +71,7 @@ async def get_payment_history(
     current_user: CurrentUser,
     limit: int = 50,
     offset: int = 0,
+    cursor: str | None = Query(None, description="next_cursor da página anterior (substitui offset)"),
     db: AsyncSession = Depends(get_db),
 ) -> PaymentHistoryResponseDTO:
     """Histórico financeiro."""
@@ -88,6 +89,7 @@ async def get_payment_history(
         user_id=current_user.id,
         limit=limit,
         offset=offset,
+        cursor=cursor,
     )
 
     try:
@@ -6,7 +6,14 @@ Routers exclusivos para alunos.
 
 from fastapi import APIRouter
 
-from src.interface.api.routers.student import availability, instructors, lessons, payments, profile
+from src.interface.api.routers.student import (
+    availability,
+    cart,
+    instructors,
+    lessons,
+    payments,
+    profile,
+)
 
 router = APIRouter()
 
@@ -16,6 +23,7 @@ router.include_router(instructors.router)
 router.include_router(lessons.router)
 router.include_router(payments.router)
 router.include_router(availability.router)
+router.include_router(cart.router)
 
 __all__ = ["router"]
 
@@ -9,15 +9,25 @@ from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Query, status
 
+from src.application.services.slot_engine import (
+    build_calendar,
+    build_day_slots,
+    day_bounds,
+    range_bounds,
+)
+from src.core.helpers.timezone_utils import DEFAULT_TIMEZONE
 from src.domain.exceptions import InstructorNotFoundException, UserNotFoundException
 from src.interface.api.dependencies import (
     AvailabilityRepo,
     CurrentUser,
     InstructorRepo,
     SchedulingRepo,
+    SlotHolds,
     UserRepo,
 )
 from src.interface.api.schemas.scheduling_schemas import (
+    AvailabilityCalendarDayResponse,
+    AvailabilityCalendarResponse,
     AvailabilityListResponse,
     AvailabilityResponse,
     AvailableTimeSlotsResponse,
@@ -88,6 +98,7 @@ async def get_available_time_slots(
     current_user: CurrentUser,
     availability_repo: AvailabilityRepo,
     scheduling_repo: SchedulingRepo,
+    slot_holds: SlotHolds,
     user_repo: UserRepo,
     instructor_repo: InstructorRepo,
     target_date: date = Query(..., description="Data para consulta (YYYY-MM-DD)"),
@@ -97,8 +108,12 @@ async def get_available_time_slots(
     Busca horários livres para agendamento.
     
     1. Verifica disponibilidade configurada para o dia da semana
-    2. Exclui horários que já possuem agendamentos
+    2. Exclui horários que já possuem agendamentos ou estão segurados no
+       carrinho de um aluno
     3. Exclui horários no passado (se for hoje)
+
+    Custo constante em consultas: usuário, perfil, disponibilidade,
+    agendamentos do dia e reservas do instrutor.
     """
     # Verificar se instrutor existe
     instructor = await user_repo.get_by_id(instructor_id)
@@ -117,8 +132,8 @@ async def get_available_time_slots(
         )
 
     # Não permitir datas passadas
-    today = date.today()
-    if target_date < today:
+    now = datetime.now(DEFAULT_TIMEZONE)
+    if target_date < now.date():
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Não é possível consultar datas passadas",
@@ -143,51 +158,31 @@ async def get_available_time_slots(
             total_available=0,
         )
 
-    # Gerar slots de horário baseados na disponibilidade
-    time_slots: list[TimeSlotResponse] = []
-    
-    # Usar timezone local para comparação correta com agendamentos salvos
-    from zoneinfo import ZoneInfo
-    local_tz = ZoneInfo("America/Sao_Paulo")
-    now = datetime.now(local_tz)
-
-    for availability in day_availabilities:
-        # Gerar slots de hora em hora dentro do período de disponibilidade
-        current_time = availability.start_time
-        slot_duration = timedelta(minutes=duration_minutes)
-
-        while True:
-            # Calcular fim do slot - usar timezone local para comparação correta
-            slot_start_dt = datetime.combine(target_date, current_time, tzinfo=local_tz)
-            slot_end_dt = slot_start_dt + slot_duration
-            slot_end_time = slot_end_dt.time()
-
-            # Verificar se ainda está dentro da disponibilidade
-            if slot_end_time > availability.end_time:
-                break
-
-            # Verificar se não é horário passado (se for hoje)
-            is_past = target_date == today and slot_start_dt <= now
-
-            # Verificar conflito com agendamentos existentes
-            has_conflict = await scheduling_repo.check_conflict(
-                instructor_id=instructor_id,
-                scheduled_datetime=slot_start_dt,
-                duration_minutes=duration_minutes,
-            )
-
-            is_available = not is_past and not has_conflict
-
-            time_slots.append(
-                TimeSlotResponse(
-                    start_time=current_time.strftime("%H:%M"),
-                    end_time=slot_end_time.strftime("%H:%M"),
-                    is_available=is_available,
-                )
-            )
+    # Agendamentos e reservas do dia em uma consulta cada; a disponibilidade
+    # de cada horário é calculada em memória
+    day_start, day_end = day_bounds(target_date)
+    busy = await scheduling_repo.list_busy_intervals(
+        instructor_id=instructor_id,
+        start=day_start,
+        end=day_end,
+    )
+    busy += await slot_holds.list_for_instructor(instructor_id, day_start, day_end)
+    slots = build_day_slots(
+        day=target_date,
+        availabilities=day_availabilities,
+        duration_minutes=duration_minutes,
+        busy=busy,
+        now=now,
+    )
 
-            # Avançar para próximo slot (de hora em hora)
-            current_time = (datetime.combine(target_date, current_time) + timedelta(hours=1)).time()
+    time_slots = [
+        TimeSlotResponse(
+            start_time=slot.start.strftime("%H:%M"),
+            end_time=slot.end.strftime("%H:%M"),
+            is_available=slot.is_available,
+        )
+        for slot in slots
+    ]
 
     # Contar disponíveis
     available_count = sum(1 for slot in time_slots if slot.is_available)
@@ -198,3 +193,105 @@ async def get_available_time_slots(
         time_slots=time_slots,
         total_available=available_count,
     )
+
+
+@router.get(
+    "/{instructor_id}/availability-calendar",
+    response_model=AvailabilityCalendarResponse,
+    summary="Calendário de horários disponíveis",
+    description="Retorna os horários livres de vários dias (até 60) em uma única resposta.",
+)
+async def get_availability_calendar(
+    instructor_id: UUID,
+    current_user: CurrentUser,
+    availability_repo: AvailabilityRepo,
+    scheduling_repo: SchedulingRepo,
+    slot_holds: SlotHolds,
+    user_repo: UserRepo,
+    instructor_repo: InstructorRepo,
+    start_date: date | None = Query(None, description="Primeiro dia (YYYY-MM-DD, padrão: hoje)"),
+    days: int = Query(30, ge=1, le=60, description="Quantidade de dias"),
+    duration_minutes: int = Query(60, ge=30, le=120, description="Duração da aula em minutos"),
+) -> AvailabilityCalendarResponse:
+    """
+    Busca os horários livres de um período.
+
+    Mesmas regras de /available-slots, aplicadas a cada dia, com consultas
+    constantes: a disponibilidade semanal, os agendamentos e as reservas de
+    carrinho de todo o período são carregados uma vez e cruzados em memória.
+    """
+    # Verificar se instrutor existe
+    instructor = await user_repo.get_by_id(instructor_id)
+    if instructor is None or not instructor.is_instructor:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Instrutor não encontrado",
+        )
+
+    # Verificar se instrutor está disponível
+    instructor_profile = await instructor_repo.get_by_user_id(instructor_id)
+    if instructor_profile is None or not instructor_profile.is_available:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Instrutor não está aceitando novos alunos no momento",
+        )
+
+    # Não permitir datas passadas
+    now = datetime.now(DEFAULT_TIMEZONE)
+    first_day = start_date or now.date()
+    if first_day < now.date():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Não é possível consultar datas passadas",
+        )
+
+    availabilities = await availability_repo.list_by_instructor(
+        instructor_id=instructor_id,
+        only_active=True,
+    )
+
+    busy = []
+    if availabilities:
+        range_start, range_end = range_bounds(first_day, days)
+        busy = await scheduling_repo.list_busy_intervals(
+            instructor_id=instructor_id,
+            start=range_start,
+            end=range_end,
+        )
+        busy += await slot_holds.list_for_instructor(instructor_id, range_start, range_end)
+
+    calendar = build_calendar(
+        first_day=first_day,
+        days=days,
+        availabilities=availabilities,
+        duration_minutes=duration_minutes,
+        busy=busy,
+        now=now,
+    )
+
+    # Dias com os mesmos horários compartilham o padrão
+    patterns: dict[tuple[time, ...], int] = {}
+    day_responses = []
+    for calendar_day in calendar:
+        pattern = patterns.setdefault(calendar_day.start_times, len(patterns))
+        day_responses.append(
+            AvailabilityCalendarDayResponse(
+                date=calendar_day.day.isoformat(),
+                pattern=pattern,
+                available_mask=calendar_day.available_mask,
+            )
+        )
+
+    return AvailabilityCalendarResponse(
+        instructor_id=instructor_id,
+        start_date=first_day.isoformat(),
+        end_date=(first_day + timedelta(days=days - 1)).isoformat(),
+        duration_minutes=duration_minutes,
+        timezone=DEFAULT_TIMEZONE.key,
+        slot_patterns=[
+            [start.strftime("%H:%M") for start in start_times]
+            for start_times in patterns
+        ],
+        days=day_responses,
+        total_available=sum(bin(day.available_mask).count("1") for day in calendar),
+    )
@@ -0,0 +1,174 @@
+"""
+Student Cart Router
+
+Endpoints do carrinho de reservas temporárias de horários.
+
+Adicionar ao carrinho segura o horário no Redis (sem gravar no banco); os
+agendamentos são criados apenas no checkout.
+"""
+
+from fastapi import APIRouter, HTTPException, status
+
+from src.application.dtos.payment_dtos import CheckoutResponseDTO, CreateCheckoutDTO
+from src.application.dtos.scheduling_dtos import CreateSchedulingDTO
+from src.application.use_cases.scheduling import (
+    CheckoutSlotHoldsUseCase,
+    CreateSchedulingUseCase,
+    HoldSlotUseCase,
+)
+from src.interface.api.dependencies import (
+    AvailabilityRepo,
+    CurrentStudent,
+    DBSession,
+    InstructorRepo,
+    SchedulingRepo,
+    SlotHolds,
+    UserRepo,
+)
+from src.interface.api.routers.student.payments import execute_checkout
+from src.interface.api.schemas.scheduling_schemas import (
+    CartCheckoutRequest,
+    CreateSchedulingRequest,
+    SlotHoldListResponse,
+    SlotHoldResponse,
+)
+
+router = APIRouter(prefix="/cart", tags=["Student - Cart"])
+
+
+@router.post(
+    "/holds",
+    response_model=SlotHoldResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Reservar horário no carrinho",
+    description="Segura o horário por alguns minutos sem criar o agendamento.",
+)
+async def hold_slot(
+    request: CreateSchedulingRequest,
+    current_user: CurrentStudent,
+    scheduling_repo: SchedulingRepo,
+    availability_repo: AvailabilityRepo,
+    user_repo: UserRepo,
+    instructor_repo: InstructorRepo,
+    slot_holds: SlotHolds,
+) -> SlotHoldResponse:
+    """Reserva um horário no carrinho do aluno."""
+    use_case = HoldSlotUseCase(
+        create_scheduling=CreateSchedulingUseCase(
+            user_repository=user_repo,
+            instructor_repository=instructor_repo,
+            scheduling_repository=scheduling_repo,
+            availability_repository=availability_repo,
+            slot_hold_service=slot_holds,
+        ),
+        slot_hold_service=slot_holds,
+    )
+
+    result = await use_case.execute(
+        CreateSchedulingDTO(
+            student_id=current_user.id,
+            instructor_id=request.instructor_id,
+            scheduled_datetime=request.scheduled_datetime,
+            duration_minutes=request.duration_minutes,
+            lesson_category=request.lesson_category,
+            vehicle_ownership=request.vehicle_ownership,
+        )
+    )
+    return SlotHoldResponse.model_validate(result)
+
+
+@router.get(
+    "/holds",
+    response_model=SlotHoldListResponse,
+    summary="Listar reservas do carrinho",
+)
+async def list_slot_holds(
+    current_user: CurrentStudent,
+    slot_holds: SlotHolds,
+) -> SlotHoldListResponse:
+    """Lista as reservas válidas do carrinho do aluno."""
+    holds = await slot_holds.list_for_student(current_user.id)
+    return SlotHoldListResponse(
+        holds=[
+            SlotHoldResponse(
+                hold_id=hold.hold_id,
+                instructor_id=hold.instructor_id,
+                scheduled_datetime=hold.scheduled_datetime,
+                duration_minutes=hold.duration_minutes,
+                lesson_category=hold.lesson_category,
+                vehicle_ownership=hold.vehicle_ownership,
+                price=hold.price,
+                expires_at=hold.expires_at,
+            )
+            for hold in holds
+        ],
+        expires_at=min((hold.expires_at for hold in holds), default=None),
+    )
+
+
+@router.delete(
+    "/holds/{hold_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Remover reserva do carrinho",
+)
+async def release_slot_hold(
+    hold_id: str,
+    current_user: CurrentStudent,
+    slot_holds: SlotHolds,
+) -> None:
+    """Libera uma reserva do carrinho do aluno."""
+    if not await slot_holds.release(current_user.id, hold_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Reserva não encontrada",
+        )
+
+
+@router.post(
+    "/checkout",
+    response_model=CheckoutResponseDTO,
+    status_code=status.HTTP_201_CREATED,
+    summary="Checkout do carrinho de reservas",
+    description="Cria os agendamentos das reservas e o checkout de pagamento.",
+)
+async def checkout_slot_holds(
+    request: CartCheckoutRequest,
+    current_user: CurrentStudent,
+    db: DBSession,
+    scheduling_repo: SchedulingRepo,
+    availability_repo: AvailabilityRepo,
+    user_repo: UserRepo,
+    instructor_repo: InstructorRepo,
+    slot_holds: SlotHolds,
+) -> CheckoutResponseDTO:
+    """
+    Materializa as reservas em agendamentos e cria o checkout.
+
+    As reservas só são liberadas após o commit: até lá continuam bloqueando
+    o horário para outros alunos.
+    """
+    use_case = CheckoutSlotHoldsUseCase(
+        create_scheduling=CreateSchedulingUseCase(
+            user_repository=user_repo,
+            instructor_repository=instructor_repo,
+            scheduling_repository=scheduling_repo,
+            availability_repository=availability_repo,
+            slot_hold_service=slot_holds,
+        ),
+        slot_hold_service=slot_holds,
+    )
+
+    schedulings, holds = await use_case.execute(current_user.id)
+    result = await execute_checkout(
+        db,
+        CreateCheckoutDTO(
+            scheduling_ids=[scheduling.id for scheduling in schedulings],
+            student_id=current_user.id,
+            student_email=request.student_email or current_user.email,
+            return_url=request.return_url,
+        ),
+    )
+
+    await db.commit()
+    await use_case.release(current_user.id, holds)
+    return result
@@ -4,15 +4,24 @@ Student Instructors Router
 Endpoints para busca de instrutores (exclusivo para alunos).
 """
 
-from fastapi import APIRouter, HTTPException, status
+from datetime import datetime
 
-from src.application.dtos.profile_dtos import InstructorSearchDTO
+from fastapi import APIRouter, HTTPException, Query, status
+
+from src.application.dtos.profile_dtos import InstructorFeedDTO, InstructorSearchDTO
+from src.application.use_cases.student.get_instructor_feed import GetInstructorFeedUseCase
 from src.application.use_cases.student.get_nearby_instructors import (
     GetNearbyInstructorsUseCase,
 )
-from src.domain.exceptions import InvalidLocationException
-from src.interface.api.dependencies import CacheService, CurrentStudent, InstructorRepo
-from src.interface.api.schemas.profiles import InstructorSearchResponse
+from src.domain.exceptions import InvalidCursorException, InvalidLocationException
+from src.interface.api.dependencies import (
+    CacheService,
+    CurrentStudent,
+    InstructorRepo,
+    InstructorSearchIndexRepo,
+    SlotHolds,
+)
+from src.interface.api.schemas.profiles import InstructorFeedResponse, InstructorSearchResponse
 
 router = APIRouter(prefix="/instructors", tags=["Student - Instructors"])
 
@@ -21,19 +30,26 @@ router = APIRouter(prefix="/instructors", tags=["Student - Instructors"])
     "/search",
     response_model=InstructorSearchResponse,
     summary="Buscar instrutores próximos",
-    description="Busca instrutores disponíveis dentro de um raio (km).",
+    description=(
+        "Busca instrutores disponíveis dentro de um raio (km). Com free_from, "
+        "retorna apenas os livres de free_from até free_from + free_minutes."
+    ),
 )
 async def search_instructors(
     latitude: float,
     longitude: float,
     instructor_repo: InstructorRepo,
+    search_index_repo: InstructorSearchIndexRepo,
     cache_service: CacheService,
+    slot_holds: SlotHolds,
     _current_student: CurrentStudent,  # Guard: Apenas alunos podem buscar
     radius_km: float = 10.0,
     biological_sex: str | None = None,
     license_category: str | None = None,
     search: str | None = None,
     limit: int = 50,
+    free_from: datetime | None = Query(None, description="Início do horário desejado (ISO 8601)"),
+    free_minutes: int = Query(50, ge=30, le=240, description="Duração do horário desejado"),
 ) -> InstructorSearchResponse:
     """
     Busca instrutores próximos à localização fornecida.
@@ -41,6 +57,8 @@ async def search_instructors(
     use_case = GetNearbyInstructorsUseCase(
         instructor_repository=instructor_repo,
         cache_service=cache_service,
+        search_index_repository=search_index_repo,
+        slot_hold_service=slot_holds,
     )
 
     dto = InstructorSearchDTO(
@@ -52,6 +70,8 @@ async def search_instructors(
         search_query=search,
         only_available=True,
         limit=limit,
+        free_from=free_from,
+        free_minutes=free_minutes,
     )
 
     try:
@@ -62,3 +82,51 @@ async def search_instructors(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         ) from e
+
+
+@router.get(
+    "/feed",
+    response_model=InstructorFeedResponse,
+    summary="Feed de instrutores próximos (paginado)",
+    description=(
+        "Lista instrutores disponíveis dentro de um raio (km), do mais próximo "
+        "ao mais distante, em páginas. Envie o next_cursor da resposta para "
+        "obter a página seguinte com os mesmos filtros."
+    ),
+)
+async def get_instructor_feed(
+    latitude: float,
+    longitude: float,
+    instructor_repo: InstructorRepo,
+    _current_student: CurrentStudent,  # Guard: Apenas alunos podem buscar
+    radius_km: float = 10.0,
+    biological_sex: str | None = None,
+    license_category: str | None = None,
+    search: str | None = None,
+    limit: int = Query(20, ge=1, le=50, description="Instrutores por página"),
+    cursor: str | None = Query(None, description="next_cursor da página anterior"),
+) -> InstructorFeedResponse:
+    """
+    Retorna uma página do feed de instrutores (paginação por cursor).
+    """
+    use_case = GetInstructorFeedUseCase(instructor_repository=instructor_repo)
+
+    dto = InstructorFeedDTO(
+        latitude=latitude,
+        longitude=longitude,
+        radius_km=radius_km,
+        biological_sex=biological_sex,
+        license_category=license_category,
+        search_query=search,
+        limit=limit,
+        cursor=cursor,
+    )
+
+    try:
+        result = await use_case.execute(dto)
+        return InstructorFeedResponse.model_validate(result)
+    except (InvalidLocationException, InvalidCursorException) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
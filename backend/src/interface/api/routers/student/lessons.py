@@ -11,15 +11,23 @@ import structlog
 from fastapi import APIRouter, HTTPException, Query, status
 
 from src.application.dtos.scheduling_dtos import (
+    BookLessonPackageDTO,
     CancelSchedulingDTO,
     CompleteSchedulingDTO,
     CreateSchedulingDTO,
+    PackageLessonDTO,
     RequestRescheduleDTO,
     RespondRescheduleDTO,
     StartSchedulingDTO,
 )
+from src.application.services.cursor_codec import (
+    cursor_scope,
+    decode_list_position,
+    encode_list_position,
+)
 from src.application.use_cases.create_review_use_case import CreateReviewUseCase
 from src.application.use_cases.scheduling import (
+    BookLessonPackageUseCase,
     CancelSchedulingUseCase,
     ClearStudentCartUseCase,
     CompleteSchedulingUseCase,
@@ -30,12 +38,14 @@ from src.application.use_cases.scheduling import (
     StartSchedulingUseCase,
 )
 from src.application.use_cases.scheduling.scheduling_notification_decorators import (
+    NotifyOnBookLessonPackage,
     NotifyOnCancelScheduling,
     NotifyOnCreateScheduling,
     NotifyOnRequestReschedule,
     NotifyOnRespondReschedule,
 )
 from src.domain.entities.scheduling_status import SchedulingStatus
+from src.domain.entities.search_position import ListPosition
 from src.interface.api.dependencies import (
     AvailabilityRepo,
     CurrentStudent,
@@ -44,14 +54,17 @@ from src.interface.api.dependencies import (
     NotificationServiceDep,
     ReviewRepo,
     SchedulingRepo,
+    SlotHolds,
     UserRepo,
     PaymentRepo,
 )
 from src.interface.api.schemas.scheduling_schemas import (
+    BookLessonPackageRequest,
     CancellationResultResponse,
     CancelSchedulingRequest,
     CreateReviewRequest,
     CreateSchedulingRequest,
+    LessonPackageResponse,
     RequestRescheduleRequest,
     RespondRescheduleRequest,
     ReviewResponse,
@@ -84,6 +97,7 @@ async def create_scheduling(
     user_repo: UserRepo,
     instructor_repo: InstructorRepo,
     notification_svc: NotificationServiceDep,
+    slot_holds: SlotHolds,
 ) -> SchedulingResponse:
     """Solicita um novo agendamento de aula."""
     use_case = NotifyOnCreateScheduling(
@@ -92,6 +106,7 @@ async def create_scheduling(
             instructor_repository=instructor_repo,
             scheduling_repository=scheduling_repo,
             availability_repository=availability_repo,
+            slot_hold_service=slot_holds,
         ),
         _notification_service=notification_svc,
     )
@@ -118,6 +133,68 @@ async def create_scheduling(
     return SchedulingResponse.model_validate(result)
 
 
+@router.post(
+    "/package",
+    response_model=LessonPackageResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Agendar pacote de aulas",
+    description=(
+        "Agenda várias aulas com o mesmo instrutor em uma chamada. "
+        "Aulas com horário indisponível voltam em `failed` com o motivo; as demais são criadas."
+    ),
+)
+async def book_lesson_package(
+    request: BookLessonPackageRequest,
+    current_user: CurrentStudent,
+    scheduling_repo: SchedulingRepo,
+    availability_repo: AvailabilityRepo,
+    user_repo: UserRepo,
+    instructor_repo: InstructorRepo,
+    notification_svc: NotificationServiceDep,
+    slot_holds: SlotHolds,
+) -> LessonPackageResponse:
+    """Agenda um pacote de aulas."""
+    use_case = NotifyOnBookLessonPackage(
+        _wrapped=BookLessonPackageUseCase(
+            create_scheduling=CreateSchedulingUseCase(
+                user_repository=user_repo,
+                instructor_repository=instructor_repo,
+                scheduling_repository=scheduling_repo,
+                availability_repository=availability_repo,
+                slot_hold_service=slot_holds,
+            ),
+        ),
+        _notification_service=notification_svc,
+    )
+
+    dto = BookLessonPackageDTO(
+        student_id=current_user.id,
+        instructor_id=request.instructor_id,
+        lesson_category=request.lesson_category,
+        vehicle_ownership=request.vehicle_ownership,
+        lessons=[
+            PackageLessonDTO(
+                scheduled_datetime=lesson.scheduled_datetime,
+                duration_minutes=lesson.duration_minutes,
+            )
+            for lesson in request.lessons
+        ],
+    )
+
+    result = await use_case.execute(dto)
+
+    # Emitir eventos em tempo real para o instrutor
+    dispatcher = get_event_dispatcher()
+    if dispatcher:
+        for created in result.created:
+            try:
+                await dispatcher.emit_scheduling_created(created)
+            except Exception as e:
+                logger.error("event_dispatch_error", dispatch_event="scheduling_created", error=str(e))
+
+    return LessonPackageResponse.model_validate(result)
+
+
 @router.get(
     "",
     response_model=SchedulingListResponse,
@@ -131,6 +208,7 @@ async def list_student_schedulings(
     payment_status_filter: str | None = Query(None, description="Filter by payment status: 'pending' (cart items), 'completed' (paid), 'none' (no payment)"),
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=50),
+    cursor: str | None = Query(None, description="next_cursor da página anterior (substitui page)"),
 ) -> SchedulingListResponse:
     """Lista agendamentos do aluno."""
     # Parse multiple statuses if provided
@@ -144,19 +222,22 @@ async def list_student_schedulings(
                 detail=f"Invalid status in filter: {status_filter}",
             )
 
-    offset = (page - 1) * limit
-    schedulings = await scheduling_repo.list_by_student(
-        student_id=current_user.id,
-        status=statuses,
-        limit=limit,
-        offset=offset,
-        payment_status_filter=payment_status_filter,
-    )
-    total = await scheduling_repo.count_by_student(
+    # Com cursor a página continua do último agendamento da anterior (keyset)
+    scope = cursor_scope("student_schedulings", current_user.id, status_filter, payment_status_filter)
+    after = decode_list_position(cursor, scope) if cursor else None
+    offset = (after.ordinal or 0) if after else (page - 1) * limit
+
+    # Um item extra indica se existe próxima página; o total vem na mesma consulta
+    schedulings, total = await scheduling_repo.page_by_student(
         student_id=current_user.id,
         status=statuses,
+        limit=limit + 1,
+        offset=0 if after else offset,
         payment_status_filter=payment_status_filter,
+        after=after,
     )
+    has_more = len(schedulings) > limit
+    schedulings = schedulings[:limit]
 
     # P3: Calcular cart_expires_at para itens do carrinho
     cart_expires_at = None
@@ -168,12 +249,20 @@ async def list_student_schedulings(
                 oldest_created_at = oldest_created_at.replace(tzinfo=timezone.utc)
             cart_expires_at = oldest_created_at + timedelta(minutes=CART_TIMEOUT_MINUTES)
 
+    next_cursor = None
+    if has_more:
+        last = schedulings[-1]
+        next_cursor = encode_list_position(
+            ListPosition(last.scheduled_datetime, last.id, ordinal=offset + limit), scope
+        )
+
     return SchedulingListResponse(
         schedulings=[SchedulingResponse.model_validate(s) for s in schedulings],
         total_count=total,
         limit=limit,
         offset=offset,
-        has_more=(offset + limit) < total,
+        has_more=has_more,
+        next_cursor=next_cursor,
         cart_expires_at=cart_expires_at,
     )
 
@@ -68,7 +68,15 @@ async def checkout(
             detail="Não autorizado a processar pagamento para outro usuário",
         )
 
-    # Dependências
+    return await execute_checkout(db, dto)
+
+
+async def execute_checkout(db: AsyncSession, dto: CreateCheckoutDTO) -> CheckoutResponseDTO:
+    """
+    Cria o checkout dos agendamentos e traduz as falhas em respostas HTTP.
+
+    Compartilhado com o checkout do carrinho de reservas (routers/student/cart.py).
+    """
     settings = Settings()
     use_case = CreateCheckoutUseCase(
         scheduling_repository=SchedulingRepositoryImpl(db),
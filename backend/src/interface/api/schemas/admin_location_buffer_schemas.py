@@ -0,0 +1,26 @@
+"""
+Admin Location Buffer Schemas
+
+Schemas Pydantic das métricas do buffer de escrita de localização.
+"""
+
+from pydantic import BaseModel
+
+
+class LocationBufferMetricsResponse(BaseModel):
+    """Métricas do buffer de escrita de localização (todas as instâncias)."""
+
+    enabled: bool
+    pending: int
+    accepted: int
+    coalesced: int
+    rejected: int
+    flushes: int
+    flushed_rows: int
+    flush_errors: int
+    last_flush_at: float | None = None
+    last_flush_ms: float | None = None
+    last_flush_rows: int | None = None
+    last_flush_max_lag_ms: float | None = None
+    heartbeat_age_seconds: float | None = None
+    max_staleness_seconds: float
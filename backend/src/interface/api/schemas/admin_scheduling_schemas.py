@@ -64,7 +64,10 @@ class SchedulingListResponse(BaseModel):
     """Schema de resposta para lista paginada de agendamentos."""
 
     schedulings: list[SchedulingAdminResponse]
-    total_count: int
+    total_count: int = Field(..., description="Total da listagem (estimado quando não há filtros)")
     limit: int
     offset: int
     has_more: bool
+    next_cursor: str | None = Field(
+        None, description="Cursor da próxima página (None se não houver mais)"
+    )
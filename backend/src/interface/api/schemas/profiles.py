@@ -132,3 +132,17 @@ class InstructorSearchResponse(BaseModel):
     center_longitude: float
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class InstructorFeedResponse(BaseModel):
+    """Schema de resposta para uma página do feed de instrutores."""
+
+    instructors: list[InstructorProfileResponse]
+    next_cursor: str | None = Field(
+        None, description="Cursor da próxima página (None se não houver mais)"
+    )
+    radius_km: float
+    center_latitude: float
+    center_longitude: float
+
+    model_config = ConfigDict(from_attributes=True)
@@ -40,6 +40,25 @@ class UpdateAvailabilityRequest(BaseModel):
     is_active: bool | None = None
 
 
+class WeeklySlotRequest(BaseModel):
+    """Schema de um slot da semana desejada."""
+
+    day_of_week: int = Field(..., ge=0, le=6, description="Dia da semana (0=Segunda, 6=Domingo)")
+    start_time: str = Field(..., pattern=r"^\d{2}:\d{2}$", description="Hora de início (HH:MM)")
+    end_time: str = Field(..., pattern=r"^\d{2}:\d{2}$", description="Hora de término (HH:MM)")
+    is_active: bool = True
+
+
+class ReplaceWeeklyAvailabilityRequest(BaseModel):
+    """Schema para substituir toda a disponibilidade semanal."""
+
+    slots: list[WeeklySlotRequest] = Field(
+        ...,
+        max_length=168,
+        description="Semana completa; slots ausentes são removidos",
+    )
+
+
 class AvailabilityResponse(BaseModel):
     """Schema de resposta para disponibilidade."""
 
@@ -80,6 +99,36 @@ class AvailableTimeSlotsResponse(BaseModel):
     total_available: int = Field(..., description="Quantidade de horários disponíveis")
 
 
+class AvailabilityCalendarDayResponse(BaseModel):
+    """Schema de um dia do calendário de disponibilidade."""
+
+    date: str = Field(..., description="Data (YYYY-MM-DD)")
+    pattern: int = Field(..., description="Índice em slot_patterns com os horários do dia")
+    available_mask: int = Field(
+        ...,
+        description="Bit i ligado = horário slot_patterns[pattern][i] livre",
+    )
+
+
+class AvailabilityCalendarResponse(BaseModel):
+    """
+    Schema do calendário de disponibilidade de vários dias.
+
+    Os horários de início de cada dia são agrupados em padrões (em geral um
+    por dia da semana) e cada dia informa apenas o padrão e a máscara de
+    horários livres.
+    """
+
+    instructor_id: UUID
+    start_date: str = Field(..., description="Primeiro dia (YYYY-MM-DD)")
+    end_date: str = Field(..., description="Último dia (YYYY-MM-DD)")
+    duration_minutes: int
+    timezone: str = Field(..., description="Timezone dos horários")
+    slot_patterns: list[list[str]] = Field(..., description="Listas de horários de início (HH:MM)")
+    days: list[AvailabilityCalendarDayResponse]
+    total_available: int = Field(..., description="Quantidade de horários disponíveis no período")
+
+
 # =============================================================================
 # Scheduling Schemas
 # =============================================================================
@@ -102,6 +151,30 @@ class CreateSchedulingRequest(BaseModel):
     )
 
 
+class PackageLessonRequest(BaseModel):
+    """Schema de uma aula do pacote."""
+
+    scheduled_datetime: datetime
+    duration_minutes: int = Field(50, ge=30, le=120)
+
+
+class BookLessonPackageRequest(BaseModel):
+    """Schema para agendar um pacote de aulas com o mesmo instrutor."""
+
+    instructor_id: UUID
+    lesson_category: str = Field(
+        ...,
+        pattern=r"^(A|B|AB)$",
+        description="Categoria da CNH (A, B ou AB)",
+    )
+    vehicle_ownership: str = Field(
+        ...,
+        pattern=r"^(instructor|student)$",
+        description="Propriedade do veículo (instructor ou student)",
+    )
+    lessons: list[PackageLessonRequest] = Field(..., min_length=1, max_length=20)
+
+
 class CancelSchedulingRequest(BaseModel):
     """Schema para cancelar agendamento."""
 
@@ -165,6 +238,9 @@ class SchedulingListResponse(BaseModel):
     limit: int
     offset: int
     has_more: bool
+    next_cursor: str | None = Field(
+        None, description="Cursor da próxima página (None se não houver mais)"
+    )
     cart_expires_at: datetime | None = Field(
         None,
         description="Timestamp ISO 8601 (UTC) de expiração do carrinho. "
@@ -173,6 +249,58 @@ class SchedulingListResponse(BaseModel):
     )
 
 
+class PackageLessonFailureResponse(BaseModel):
+    """Schema de uma aula do pacote que não pôde ser agendada."""
+
+    scheduled_datetime: datetime
+    duration_minutes: int
+    reason: str = Field(..., description="unavailable_slot, scheduling_conflict ou slot_held")
+    message: str
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class LessonPackageResponse(BaseModel):
+    """Schema de resposta do agendamento de um pacote de aulas."""
+
+    created: list[SchedulingResponse]
+    failed: list[PackageLessonFailureResponse]
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class SlotHoldResponse(BaseModel):
+    """Schema de horário reservado no carrinho."""
+
+    hold_id: str = Field(..., description="Identificador da reserva")
+    instructor_id: UUID
+    scheduled_datetime: datetime
+    duration_minutes: int
+    lesson_category: str
+    vehicle_ownership: str
+    price: Decimal = Field(..., description="Preço cotado (recalculado no checkout)")
+    expires_at: datetime = Field(..., description="Expiração da reserva (UTC)")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class SlotHoldListResponse(BaseModel):
+    """Schema do carrinho de reservas."""
+
+    holds: list[SlotHoldResponse]
+    expires_at: datetime | None = Field(
+        None,
+        description="Expiração da primeira reserva a vencer (UTC)",
+    )
+
+
+class CartCheckoutRequest(BaseModel):
+    """Schema para checkout do carrinho de reservas."""
+
+    student_email: str | None = None
+    return_url: str | None = None
+
+
 class CancellationResultResponse(BaseModel):
     """Schema de resultado de cancelamento."""
     
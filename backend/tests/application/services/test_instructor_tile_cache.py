@@ -0,0 +1,310 @@
+"""
+Testes para o cache de candidatos por tile da busca de instrutores.
+"""
+
+import fnmatch
+import random
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.application.dtos.profile_dtos import InstructorSearchDTO, UpdateLocationDTO
+from src.application.services.instructor_tile_cache import (
+    RADIUS_BUCKETS_KM,
+    InstructorTileCache,
+    TileCandidate,
+    radius_bucket,
+    select_candidates,
+    tile_center,
+    tile_index,
+    tile_key,
+    tile_reach_km,
+    tiles_reaching,
+)
+from src.application.use_cases.instructor.update_instructor_location import (
+    UpdateInstructorLocationUseCase,
+)
+from src.application.use_cases.student.get_nearby_instructors import (
+    GetNearbyInstructorsUseCase,
+)
+from src.domain.entities.instructor_profile import InstructorProfile
+from src.domain.entities.instructor_search_entry import InstructorSearchEntry
+from src.domain.entities.location import Location
+
+
+class FakeCache:
+    """Cache em memória com a mesma interface do RedisCacheService."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, str] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: str, ttl_seconds: int = 60) -> None:
+        self.data[key] = value
+
+    async def delete(self, key: str) -> None:
+        self.data.pop(key, None)
+
+    async def delete_many(self, keys: list[str]) -> int:
+        return sum(1 for key in keys if self.data.pop(key, None) is not None)
+
+    async def delete_pattern(self, pattern: str) -> int:
+        matched = [k for k in self.data if fnmatch.fnmatch(k, pattern)]
+        for key in matched:
+            del self.data[key]
+        return len(matched)
+
+
+def _candidate(lat=None, lon=None, **overrides) -> TileCandidate:
+    defaults = dict(
+        id=str(uuid4()),
+        user_id=str(uuid4()),
+        city="São Paulo",
+        vehicle_type="Hatch",
+        license_category="B",
+        hourly_rate="89.90",
+        rating=4.0,
+        total_reviews=3,
+        is_available=True,
+        full_name="João Silva",
+        biological_sex="male",
+        latitude=lat,
+        longitude=lon,
+    )
+    defaults.update(overrides)
+    return TileCandidate(**defaults)
+
+
+def _profile(lat: float, lon: float) -> InstructorProfile:
+    return InstructorProfile(
+        user_id=uuid4(),
+        location=Location(latitude=lat, longitude=lon),
+        hourly_rate=Decimal("80.00"),
+        full_name="Maria Souza",
+    )
+
+
+def _entry(lat: float, lon: float) -> InstructorSearchEntry:
+    return InstructorSearchEntry(
+        profile_id=uuid4(),
+        user_id=uuid4(),
+        first_name="Maria",
+        last_name="Souza",
+        biological_sex="female",
+        city="São Paulo",
+        vehicle_type="Hatch",
+        license_category="B",
+        location=Location(latitude=lat, longitude=lon),
+        is_available=True,
+        has_mp_account=True,
+        rating=4.5,
+        total_reviews=10,
+        hourly_rate=Decimal("94.90"),
+        price_cat_b_student_vehicle=Decimal("84.90"),
+    )
+
+
+def test_radius_bucket():
+    assert radius_bucket(3) == 5.0
+    assert radius_bucket(10) == 10.0
+    assert radius_bucket(10.5) == 25.0
+    assert radius_bucket(RADIUS_BUCKETS_KM[-1] + 1) is None
+
+
+def test_nearby_centers_share_tile_key():
+    """Dois alunos a poucos metros um do outro compartilham a entrada."""
+    a = Location(latitude=-23.5505, longitude=-46.6333)
+    b = Location(latitude=-23.5506, longitude=-46.6334)
+    assert tile_key(tile_index(a, 10.0), 10.0) == tile_key(tile_index(b, 10.0), 10.0)
+
+
+def test_tiles_reaching_covers_every_tile_within_reach():
+    """Todo tile cujo centro alcança o ponto deve estar no conjunto invalidado."""
+    rng = random.Random(42)
+    for _ in range(20):
+        point = Location(latitude=rng.uniform(-33, 5), longitude=rng.uniform(-73, -35))
+        for bucket in RADIUS_BUCKETS_KM:
+            reaching = set(tiles_reaching(point, bucket))
+            row, col = tile_index(point, bucket)
+            for dr in range(-6, 7):
+                for dc in range(-8, 9):
+                    index = (row + dr, col + dc)
+                    if tile_center(index, bucket).distance_to(point) <= tile_reach_km(bucket):
+                        assert index in reaching
+
+
+def test_select_candidates_filters_and_orders_in_memory():
+    center = Location(latitude=-23.55, longitude=-46.63)
+    near = _candidate(-23.551, -46.631)
+    far = _candidate(-23.60, -46.63)
+    out_of_radius = _candidate(-23.90, -46.63)
+    female = _candidate(-23.552, -46.632, biological_sex="female")
+    unlocated_low = _candidate(rating=3.0)
+    unlocated_high = _candidate(rating=5.0)
+
+    selected = select_candidates(
+        [far, unlocated_low, out_of_radius, near, female, unlocated_high],
+        center=center,
+        radius_km=10.0,
+        biological_sex="Masculino",
+    )
+
+    assert [c for c, _ in selected] == [near, far, unlocated_high, unlocated_low]
+    assert selected[0][1] < selected[1][1]
+    assert selected[2][1] is None
+
+
+@pytest.mark.asyncio
+async def test_get_candidates_is_read_through():
+    cache = FakeCache()
+    repo = MagicMock()
+    repo.search_by_location = AsyncMock(return_value=[_profile(-23.551, -46.631)])
+    tile_cache = InstructorTileCache(cache_service=cache, instructor_repository=repo)
+    center = Location(latitude=-23.55, longitude=-46.63)
+
+    first = await tile_cache.get_candidates(center, 8.0)
+    second = await tile_cache.get_candidates(
+        Location(latitude=-23.5501, longitude=-46.6301), 8.0
+    )
+
+    assert len(first) == 1
+    assert first == second
+    repo.search_by_location.assert_awaited_once()
+    assert repo.search_by_location.await_args.kwargs["radius_km"] == tile_reach_km(10.0)
+
+
+@pytest.mark.asyncio
+async def test_get_candidates_skips_truncated_tiles():
+    cache = FakeCache()
+    repo = MagicMock()
+    repo.search_by_location = AsyncMock(
+        return_value=[_profile(-23.551, -46.631) for _ in range(3)]
+    )
+    tile_cache = InstructorTileCache(
+        cache_service=cache, instructor_repository=repo, max_candidates=3
+    )
+    center = Location(latitude=-23.55, longitude=-46.63)
+
+    assert await tile_cache.get_candidates(center, 10.0) is None
+    assert await tile_cache.get_candidates(center, 10.0) is None
+    repo.search_by_location.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_invalidate_instructor_drops_old_and_new_tiles():
+    cache = FakeCache()
+    tile_cache = InstructorTileCache(cache_service=cache)
+    user_id = uuid4()
+    old = Location(latitude=-23.55, longitude=-46.63)
+    new = Location(latitude=-22.90, longitude=-43.17)
+    old_key = tile_key(tile_index(old, 10.0), 10.0)
+    new_key = tile_key(tile_index(new, 10.0), 10.0)
+    unrelated_key = tile_key(tile_index(Location(latitude=-15.79, longitude=-47.88), 10.0), 10.0)
+    for key in (old_key, new_key, unrelated_key):
+        cache.data[key] = "{}"
+
+    await tile_cache.invalidate_instructor(user_id, new, previous_location=old)
+
+    assert old_key not in cache.data
+    assert new_key not in cache.data
+    assert unrelated_key in cache.data
+
+
+@pytest.mark.asyncio
+async def test_invalidate_instructor_without_previous_location_drops_all_tiles():
+    """Instrutor que não tinha localização aparecia em todos os tiles."""
+    cache = FakeCache()
+    tile_cache = InstructorTileCache(cache_service=cache)
+    cache.data["instructors:tile:10:1:1"] = "{}"
+
+    await tile_cache.invalidate_instructor(uuid4(), Location(latitude=-23.5, longitude=-46.6))
+
+    assert not any(k.startswith("instructors:tile:") for k in cache.data)
+
+
+@pytest.mark.asyncio
+async def test_location_update_leaves_tiles_until_the_invalidation_is_applied():
+    """Os tiles só são limpos por quem faz o commit, depois dele."""
+    cache = FakeCache()
+    old = Location(latitude=-23.55, longitude=-46.63)
+    new = Location(latitude=-23.56, longitude=-46.64)
+    key = tile_key(tile_index(new, 10.0), 10.0)
+    cache.data[key] = "{}"
+    repo = MagicMock()
+    repo.update_location = AsyncMock(return_value=(True, old))
+    use_case = UpdateInstructorLocationUseCase(instructor_repository=repo)
+
+    invalidation = await use_case.execute(
+        UpdateLocationDTO(user_id=uuid4(), latitude=new.latitude, longitude=new.longitude)
+    )
+    assert key in cache.data
+    assert invalidation.previous_location == old  # lida pela própria escrita
+
+    await invalidation.apply(cache)
+    assert key not in cache.data
+    assert cache.data == {}  # só tiles removidos, nenhuma posição guardada
+
+
+@pytest.mark.asyncio
+async def test_nearby_use_case_serves_second_search_from_tile():
+    cache = FakeCache()
+    repo = MagicMock()
+    repo.search_by_location = AsyncMock(return_value=[_profile(-23.551, -46.631)])
+    use_case = GetNearbyInstructorsUseCase(instructor_repository=repo, cache_service=cache)
+
+    first = await use_case.execute(InstructorSearchDTO(latitude=-23.55, longitude=-46.63))
+    second = await use_case.execute(InstructorSearchDTO(latitude=-23.5502, longitude=-46.6302))
+
+    assert repo.search_by_location.await_count == 1
+    assert first.total_count == second.total_count == 1
+    assert first.instructors[0].full_name == "Maria Souza"
+    assert first.instructors[0].distance_km is not None
+
+
+@pytest.mark.asyncio
+async def test_nearby_use_case_text_search_bypasses_tiles():
+    cache = FakeCache()
+    repo = MagicMock()
+    repo.search_by_location = AsyncMock(return_value=[_profile(-23.551, -46.631)])
+    use_case = GetNearbyInstructorsUseCase(instructor_repository=repo, cache_service=cache)
+
+    await use_case.execute(
+        InstructorSearchDTO(latitude=-23.55, longitude=-46.63, search_query="maria")
+    )
+
+    assert repo.search_by_location.await_args.kwargs["search_query"] == "maria"
+    assert cache.data == {}
+
+
+@pytest.mark.asyncio
+async def test_nearby_use_case_reads_projection_with_stored_final_prices():
+    """Com a projeção, tiles e busca direta não usam o repositório de perfis."""
+    cache = FakeCache()
+    repo = MagicMock()
+    repo.search_by_location = AsyncMock()
+    search_index = MagicMock()
+    search_index.search = AsyncMock(return_value=[_entry(-23.551, -46.631)])
+    use_case = GetNearbyInstructorsUseCase(
+        instructor_repository=repo,
+        cache_service=cache,
+        search_index_repository=search_index,
+    )
+
+    tiled = await use_case.execute(InstructorSearchDTO(latitude=-23.55, longitude=-46.63))
+    direct = await use_case.execute(
+        InstructorSearchDTO(latitude=-23.55, longitude=-46.63, search_query="maria")
+    )
+
+    repo.search_by_location.assert_not_awaited()
+    assert search_index.search.await_count == 2
+    for result in (tiled, direct):
+        instructor = result.instructors[0]
+        assert instructor.full_name == "Maria Souza"
+        assert instructor.hourly_rate == Decimal("94.90")
+        assert instructor.price_cat_b_student_vehicle == Decimal("84.90")
+        assert instructor.price_cat_a_student_vehicle is None
+        assert instructor.has_mp_account
@@ -0,0 +1,297 @@
+"""
+Testes para a geração de horários em memória (slot_engine) e para o endpoint
+de horários disponíveis, que passa a fazer uma única consulta de agendamentos.
+"""
+
+from datetime import date, datetime, time, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects.postgresql.asyncpg import PGDialect_asyncpg
+
+from src.application.services.slot_engine import (
+    build_calendar,
+    build_day_slots,
+    day_bounds,
+    local_datetime,
+    mark_busy,
+    range_bounds,
+)
+from src.core.helpers.timezone_utils import DEFAULT_TIMEZONE
+from src.domain.entities.availability import Availability
+from src.infrastructure.repositories.scheduling_repository_impl import (
+    SchedulingRepositoryImpl,
+)
+from src.interface.api.routers.student.availability import (
+    get_availability_calendar,
+    get_available_time_slots,
+)
+
+TZ = DEFAULT_TIMEZONE
+DAY = date(2030, 3, 11)
+PAST = datetime(2000, 1, 1, tzinfo=timezone.utc)
+
+
+def _at(hour: int, minute: int = 0, day: date = DAY) -> datetime:
+    return datetime.combine(day, time(hour, minute), tzinfo=TZ)
+
+
+def _availability(start: time, end: time, day: date = DAY, day_of_week: int | None = None) -> Availability:
+    return Availability(
+        instructor_id=uuid4(),
+        day_of_week=day.weekday() if day_of_week is None else day_of_week,
+        start_time=start,
+        end_time=end,
+    )
+
+
+def test_mark_busy_detects_partial_and_touching_overlaps():
+    slots = [(_at(h), _at(h + 1)) for h in range(8, 13)]
+    busy = [
+        (_at(9, 30), _at(10, 30)),   # sobrepõe 09h e 10h
+        (_at(12), _at(12, 45)),      # dentro de 12h
+        (_at(7), _at(8)),            # termina quando 08h começa
+    ]
+
+    assert mark_busy(slots, busy) == [False, True, True, False, True]
+
+
+def test_mark_busy_handles_long_interval_spanning_many_slots():
+    slots = [(_at(h), _at(h + 1)) for h in range(8, 12)]
+
+    assert mark_busy(slots, [(_at(8, 15), _at(11, 1))]) == [True, True, True, True]
+    assert mark_busy(slots, []) == [False] * 4
+
+
+def test_build_day_slots_stops_when_lesson_does_not_fit_the_period():
+    slots = build_day_slots(
+        day=DAY,
+        availabilities=[_availability(time(8), time(11))],
+        duration_minutes=90,
+        busy=[],
+        now=PAST,
+    )
+
+    assert [(s.start.time(), s.end.time()) for s in slots] == [
+        (time(8), time(9, 30)),
+        (time(9), time(10, 30)),
+    ]
+    assert all(s.is_available for s in slots)
+
+
+def test_build_day_slots_marks_past_and_busy_slots():
+    slots = build_day_slots(
+        day=DAY,
+        availabilities=[_availability(time(8), time(12))],
+        duration_minutes=60,
+        busy=[(_at(10, 30).astimezone(timezone.utc), _at(11, 30).astimezone(timezone.utc))],
+        now=_at(8, 30),
+    )
+
+    assert [s.is_available for s in slots] == [False, True, False, False]
+
+
+def test_build_day_slots_does_not_wrap_past_midnight():
+    slots = build_day_slots(
+        day=DAY,
+        availabilities=[_availability(time(22), time(23, 59))],
+        duration_minutes=60,
+        busy=[],
+        now=PAST,
+    )
+
+    assert [s.start.time() for s in slots] == [time(22)]
+
+
+def test_local_datetime_normalizes_nonexistent_dst_time():
+    # Horário de verão histórico: 2018-11-04 00:00 pulou para 01:00
+    moved = local_datetime(date(2018, 11, 4), time(0, 30))
+
+    assert moved.time() == time(1, 30)
+    assert moved.utcoffset() == timedelta(hours=-2)
+
+
+def test_day_bounds_cover_the_whole_local_day():
+    start, end = day_bounds(DAY)
+
+    assert start == _at(0)
+    assert end == _at(0, day=DAY + timedelta(days=1))
+
+
+@pytest.mark.asyncio
+async def test_list_busy_intervals_selects_overlapping_non_cancelled_rows():
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=MagicMock(all=MagicMock(return_value=[])))
+    repo = SchedulingRepositoryImpl(session)
+
+    assert await repo.list_busy_intervals(uuid4(), *day_bounds(DAY)) == []
+
+    sql = str(session.execute.await_args.args[0].compile(dialect=PGDialect_asyncpg()))
+    assert "schedulings.status != 'cancelled'" in sql
+    assert "tstzrange(schedulings.scheduled_datetime, schedulings.end_datetime, '[)') && tstzrange($" in sql
+    assert "ORDER BY schedulings.scheduled_datetime" in sql
+
+
+@pytest.mark.asyncio
+async def test_endpoint_loads_schedulings_once_regardless_of_slot_count():
+    instructor_id = uuid4()
+    target = date.today() + timedelta(days=7)
+    user_repo = MagicMock()
+    user_repo.get_by_id = AsyncMock(return_value=MagicMock(is_instructor=True))
+    instructor_repo = MagicMock()
+    instructor_repo.get_by_user_id = AsyncMock(return_value=MagicMock(is_available=True))
+    availability_repo = MagicMock()
+    availability_repo.get_by_instructor_and_day = AsyncMock(return_value=[
+        _availability(time(6), time(12), target),
+        _availability(time(14), time(22), target),
+    ])
+    busy_start = datetime.combine(target, time(9), tzinfo=TZ)
+    scheduling_repo = MagicMock()
+    scheduling_repo.list_busy_intervals = AsyncMock(return_value=[
+        (busy_start, busy_start + timedelta(hours=1)),
+    ])
+    scheduling_repo.check_conflict = AsyncMock()
+    held_start = datetime.combine(target, time(15), tzinfo=TZ)
+    slot_holds = MagicMock()
+    slot_holds.list_for_instructor = AsyncMock(return_value=[
+        (held_start, held_start + timedelta(minutes=50)),
+    ])
+
+    response = await get_available_time_slots(
+        instructor_id=instructor_id,
+        current_user=MagicMock(),
+        availability_repo=availability_repo,
+        scheduling_repo=scheduling_repo,
+        slot_holds=slot_holds,
+        user_repo=user_repo,
+        instructor_repo=instructor_repo,
+        target_date=target,
+        duration_minutes=60,
+    )
+
+    assert len(response.time_slots) == 14
+    assert response.total_available == 12
+    assert response.time_slots[3].start_time == "09:00"
+    assert response.time_slots[3].is_available is False
+    # Horário segurado no carrinho de um aluno
+    assert response.time_slots[7].start_time == "15:00"
+    assert response.time_slots[7].is_available is False
+    scheduling_repo.list_busy_intervals.assert_awaited_once()
+    slot_holds.list_for_instructor.assert_awaited_once()
+    scheduling_repo.check_conflict.assert_not_awaited()
+
+
+def test_build_calendar_masks_each_day_with_a_single_sweep():
+    # DAY é uma segunda-feira: segunda 08-11h e quarta 14-16h
+    availabilities = [
+        _availability(time(14), time(16), day_of_week=2),
+        _availability(time(8), time(11), day_of_week=0),
+    ]
+    wednesday = DAY + timedelta(days=2)
+    busy = [
+        (_at(9), _at(10)),
+        (_at(15, 30, wednesday), _at(16, 30, wednesday)),
+    ]
+
+    calendar = build_calendar(DAY, 8, availabilities, 60, busy, now=PAST)
+
+    assert [d.day for d in calendar] == [DAY + timedelta(days=i) for i in range(8)]
+    assert calendar[0].start_times == (time(8), time(9), time(10))
+    assert calendar[0].available_mask == 0b101
+    assert calendar[1].start_times == ()
+    assert calendar[2].start_times == (time(14), time(15))
+    assert calendar[2].available_mask == 0b01
+    assert calendar[7].available_mask == 0b111
+
+
+def test_build_calendar_skips_slots_that_already_started():
+    calendar = build_calendar(DAY, 1, [_availability(time(8), time(11))], 60, [], now=_at(9))
+
+    assert calendar[0].available_mask == 0b100
+
+
+def test_build_calendar_keeps_local_hours_across_dst_change():
+    # Fim do horário de verão histórico: 2019-02-17 00:00 voltou para 23:00
+    saturday = date(2019, 2, 16)
+    availabilities = [
+        _availability(time(8), time(10), day_of_week=weekday) for weekday in range(7)
+    ]
+
+    calendar = build_calendar(saturday, 2, availabilities, 60, [], now=PAST)
+    first_start, range_end = range_bounds(saturday, 2)
+
+    assert [d.start_times for d in calendar] == [(time(8), time(9))] * 2
+    assert range_end.astimezone(timezone.utc) - first_start.astimezone(timezone.utc) == timedelta(hours=49)
+
+
+@pytest.mark.asyncio
+async def test_calendar_endpoint_returns_patterns_and_masks_with_constant_queries():
+    instructor_id = uuid4()
+    first_day = date.today() + timedelta(days=1)
+    user_repo = MagicMock()
+    user_repo.get_by_id = AsyncMock(return_value=MagicMock(is_instructor=True))
+    instructor_repo = MagicMock()
+    instructor_repo.get_by_user_id = AsyncMock(return_value=MagicMock(is_available=True))
+    availability_repo = MagicMock()
+    availability_repo.list_by_instructor = AsyncMock(return_value=[
+        _availability(time(8), time(10), day_of_week=weekday) for weekday in range(5)
+    ])
+    busy_start = datetime.combine(first_day, time(8), tzinfo=TZ)
+    scheduling_repo = MagicMock()
+    scheduling_repo.list_busy_intervals = AsyncMock(return_value=[
+        (busy_start, busy_start + timedelta(hours=1)),
+    ])
+    slot_holds = MagicMock()
+    slot_holds.list_for_instructor = AsyncMock(return_value=[
+        (busy_start + timedelta(hours=1), busy_start + timedelta(hours=2)),
+    ])
+
+    response = await get_availability_calendar(
+        instructor_id=instructor_id,
+        current_user=MagicMock(),
+        availability_repo=availability_repo,
+        scheduling_repo=scheduling_repo,
+        slot_holds=slot_holds,
+        user_repo=user_repo,
+        instructor_repo=instructor_repo,
+        start_date=first_day,
+        days=60,
+        duration_minutes=60,
+    )
+
+    assert len(response.days) == 60
+    assert response.end_date == (first_day + timedelta(days=59)).isoformat()
+    assert sorted(map(tuple, response.slot_patterns)) == [(), ("08:00", "09:00")]
+    weekdays = [d for d in response.days if date.fromisoformat(d.date).weekday() < 5]
+    # 08h agendado e 09h segurado no carrinho, se o primeiro dia for útil
+    assert response.total_available == 2 * len(weekdays) - (2 if first_day.weekday() < 5 else 0)
+    scheduling_repo.list_busy_intervals.assert_awaited_once()
+    window = scheduling_repo.list_busy_intervals.await_args.kwargs
+    assert window["end"] - window["start"] >= timedelta(days=60) - timedelta(hours=1)
+    assert slot_holds.list_for_instructor.await_args.args[1:] == (window["start"], window["end"])
+
+
+@pytest.mark.asyncio
+async def test_calendar_endpoint_rejects_past_start_date():
+    user_repo = MagicMock()
+    user_repo.get_by_id = AsyncMock(return_value=MagicMock(is_instructor=True))
+    instructor_repo = MagicMock()
+    instructor_repo.get_by_user_id = AsyncMock(return_value=MagicMock(is_available=True))
+
+    with pytest.raises(HTTPException) as exc_info:
+        await get_availability_calendar(
+            instructor_id=uuid4(),
+            current_user=MagicMock(),
+            availability_repo=MagicMock(),
+            scheduling_repo=MagicMock(),
+            slot_holds=MagicMock(),
+            user_repo=user_repo,
+            instructor_repo=instructor_repo,
+            start_date=date.today() - timedelta(days=2),
+            days=30,
+            duration_minutes=60,
+        )
+
+    assert exc_info.value.status_code == 400
@@ -11,6 +11,7 @@ from decimal import Decimal
 from src.application.use_cases.scheduling.auto_complete_lessons import AutoCompleteLessonsUseCase
 from src.domain.entities.scheduling import Scheduling
 from src.domain.entities.scheduling_status import SchedulingStatus
+from src.domain.entities.scheduling_transition import SchedulingTransition
 
 
 def _make_overdue_scheduling(**overrides) -> Scheduling:
@@ -29,62 +30,34 @@ def _make_overdue_scheduling(**overrides) -> Scheduling:
 
 @pytest.mark.asyncio
 async def test_auto_complete_processes_overdue_lessons():
-    """Deve auto-completar aulas atrasadas com sucesso."""
+    """Deve auto-completar aulas atrasadas em lote, sem carregar nem atualizar uma a uma."""
     mock_repo = MagicMock()
     s1 = _make_overdue_scheduling()
     s2 = _make_overdue_scheduling()
-    mock_repo.get_overdue_confirmed = AsyncMock(return_value=[s1, s2])
-    mock_repo.update = AsyncMock(side_effect=lambda s: s)
+    mock_repo.complete_overdue_confirmed = AsyncMock(
+        return_value=[
+            SchedulingTransition(s.id, s.student_id, s.instructor_id, s.scheduled_datetime)
+            for s in (s1, s2)
+        ]
+    )
 
     use_case = AutoCompleteLessonsUseCase(scheduling_repository=mock_repo)
     result = await use_case.execute(hours_threshold=24)
 
     assert result == 2
-    assert s1.status == SchedulingStatus.COMPLETED
-    assert s2.status == SchedulingStatus.COMPLETED
-    assert mock_repo.update.call_count == 2
+    mock_repo.complete_overdue_confirmed.assert_awaited_once_with(hours_threshold=24)
+    mock_repo.get_overdue_confirmed.assert_not_called()
+    mock_repo.update.assert_not_called()
 
 
 @pytest.mark.asyncio
 async def test_auto_complete_returns_zero_when_no_overdue():
     """Deve retornar 0 quando não há aulas atrasadas."""
     mock_repo = MagicMock()
-    mock_repo.get_overdue_confirmed = AsyncMock(return_value=[])
+    mock_repo.complete_overdue_confirmed = AsyncMock(return_value=[])
 
     use_case = AutoCompleteLessonsUseCase(scheduling_repository=mock_repo)
     result = await use_case.execute()
 
     assert result == 0
     mock_repo.update.assert_not_called()
-
-
-@pytest.mark.asyncio
-async def test_auto_complete_continues_on_error():
-    """Deve continuar processando mesmo se uma aula falhar."""
-    mock_repo = MagicMock()
-    s1 = _make_overdue_scheduling(status=SchedulingStatus.CANCELLED)  # vai falhar
-    s2 = _make_overdue_scheduling()  # vai funcionar
-    mock_repo.get_overdue_confirmed = AsyncMock(return_value=[s1, s2])
-    mock_repo.update = AsyncMock(side_effect=lambda s: s)
-
-    use_case = AutoCompleteLessonsUseCase(scheduling_repository=mock_repo)
-    result = await use_case.execute()
-
-    assert result == 1  # apenas s2 foi auto-completada
-    assert s2.status == SchedulingStatus.COMPLETED
-
-
-@pytest.mark.asyncio
-async def test_auto_complete_does_not_process_disputed():
-    """Aulas DISPUTED não devem ser retornadas pelo repo (filtro no SQL),
-    mas se chegarem, auto_complete() deve rejeitar."""
-    mock_repo = MagicMock()
-    disputed = _make_overdue_scheduling(status=SchedulingStatus.DISPUTED)
-    mock_repo.get_overdue_confirmed = AsyncMock(return_value=[disputed])
-    mock_repo.update = AsyncMock(side_effect=lambda s: s)
-
-    use_case = AutoCompleteLessonsUseCase(scheduling_repository=mock_repo)
-    result = await use_case.execute()
-
-    assert result == 0  # falhou porque é DISPUTED
-    assert disputed.status == SchedulingStatus.DISPUTED  # não mudou
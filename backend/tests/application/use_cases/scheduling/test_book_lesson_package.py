@@ -0,0 +1,227 @@
+"""
+Testes para o agendamento de pacotes de aulas (BookLessonPackageUseCase e
+SchedulingRepositoryImpl.create_many).
+"""
+
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects.postgresql.asyncpg import PGDialect_asyncpg
+from sqlalchemy.exc import IntegrityError
+
+from src.application.dtos.scheduling_dtos import BookLessonPackageDTO, PackageLessonDTO
+from src.application.use_cases.scheduling import BookLessonPackageUseCase, CreateSchedulingUseCase
+from src.core.helpers.timezone_utils import DEFAULT_TIMEZONE
+from src.domain.entities.availability import Availability
+from src.domain.entities.scheduling import Scheduling
+from src.domain.entities.user_type import UserType
+from src.domain.exceptions import MixedInstructorsException
+from src.infrastructure.repositories.scheduling_repository_impl import (
+    MONTH_SUMMARY_UPSERT_SQL,
+    SchedulingRepositoryImpl,
+)
+
+INSTRUCTOR_ID = uuid4()
+STUDENT_ID = uuid4()
+MONDAY = datetime(2030, 3, 4, 8, 0, tzinfo=DEFAULT_TIMEZONE)
+
+
+def _repos(busy=(), held=False, cart=()):
+    user_repo = AsyncMock()
+    user_repo.get_by_id.side_effect = [
+        MagicMock(user_type=UserType.STUDENT, is_active=True, full_name="Aluno"),
+        MagicMock(user_type=UserType.INSTRUCTOR, is_active=True, full_name="Instrutor"),
+    ]
+    instructor_repo = AsyncMock()
+    instructor_repo.get_by_user_id.return_value = MagicMock(
+        is_available=True,
+        price_cat_b_instructor_vehicle=Decimal("100.00"),
+        final_prices_signature=None,
+    )
+    scheduling_repo = AsyncMock()
+    scheduling_repo.list_by_student.return_value = list(cart)
+    scheduling_repo.list_busy_intervals.return_value = list(busy)
+    scheduling_repo.create_many.side_effect = lambda schedulings: (schedulings, [])
+    availability_repo = AsyncMock()
+    availability_repo.list_by_instructor.return_value = [
+        Availability(INSTRUCTOR_ID, d, time(8, 0), time(12, 0)) for d in range(5)
+    ]
+    holds = AsyncMock()
+    holds.is_held_by_other.return_value = held
+    use_case = BookLessonPackageUseCase(
+        create_scheduling=CreateSchedulingUseCase(
+            user_repository=user_repo,
+            instructor_repository=instructor_repo,
+            scheduling_repository=scheduling_repo,
+            availability_repository=availability_repo,
+            slot_hold_service=holds,
+        )
+    )
+    return use_case, scheduling_repo, availability_repo, holds
+
+
+def _dto(*starts: datetime) -> BookLessonPackageDTO:
+    return BookLessonPackageDTO(
+        student_id=STUDENT_ID,
+        instructor_id=INSTRUCTOR_ID,
+        lesson_category="B",
+        vehicle_ownership="instructor",
+        lessons=[PackageLessonDTO(scheduled_datetime=start) for start in starts],
+    )
+
+
+@pytest.mark.asyncio
+async def test_package_validates_once_and_inserts_accepted_lessons_together():
+    taken = MONDAY + timedelta(days=1)
+    use_case, scheduling_repo, availability_repo, _ = _repos(
+        busy=[(taken, taken + timedelta(minutes=50))]
+    )
+
+    result = await use_case.execute(_dto(
+        MONDAY + timedelta(days=2),
+        MONDAY,
+        taken,                                   # ocupado por outro agendamento
+        MONDAY + timedelta(minutes=30),          # sobrepõe outra aula do pacote
+        MONDAY + timedelta(days=5),              # sábado: sem disponibilidade
+        MONDAY + timedelta(days=3, hours=1),
+    ))
+
+    assert [c.scheduled_datetime for c in result.created] == [
+        MONDAY, MONDAY + timedelta(days=2), MONDAY + timedelta(days=3, hours=1),
+    ]
+    assert {c.price for c in result.created} == {result.created[0].applied_final_price}
+    assert [c.student_name for c in result.created] == ["Aluno"] * 3
+    assert [(f.scheduled_datetime, f.reason) for f in result.failed] == [
+        (MONDAY + timedelta(minutes=30), "scheduling_conflict"),
+        (taken, "scheduling_conflict"),
+        (MONDAY + timedelta(days=5), "unavailable_slot"),
+    ]
+
+    scheduling_repo.create_many.assert_awaited_once()
+    scheduling_repo.list_busy_intervals.assert_awaited_once_with(
+        INSTRUCTOR_ID, MONDAY, MONDAY + timedelta(days=5, minutes=50)
+    )
+    scheduling_repo.list_by_student.assert_awaited_once()
+    availability_repo.list_by_instructor.assert_awaited_once()
+    scheduling_repo.check_conflict.assert_not_called()
+    scheduling_repo.create.assert_not_called()
+    availability_repo.is_time_available.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_package_reports_slots_held_by_other_students():
+    use_case, scheduling_repo, _, holds = _repos(held=True)
+
+    result = await use_case.execute(_dto(MONDAY))
+
+    assert result.created == []
+    assert [f.reason for f in result.failed] == ["slot_held"]
+    holds.is_held_by_other.assert_awaited_once_with(
+        instructor_id=INSTRUCTOR_ID,
+        student_id=STUDENT_ID,
+        start=MONDAY,
+        end=MONDAY + timedelta(minutes=50),
+    )
+    scheduling_repo.create_many.assert_awaited_once_with([])
+
+
+@pytest.mark.asyncio
+async def test_package_reports_lessons_lost_to_a_concurrent_booking():
+    use_case, scheduling_repo, _, _ = _repos()
+    scheduling_repo.create_many.side_effect = lambda schedulings: (schedulings[:1], schedulings[1:])
+
+    result = await use_case.execute(_dto(MONDAY, MONDAY + timedelta(days=1)))
+
+    assert [c.scheduled_datetime for c in result.created] == [MONDAY]
+    assert [(f.scheduled_datetime, f.reason) for f in result.failed] == [
+        (MONDAY + timedelta(days=1), "scheduling_conflict"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_package_level_errors_abort_the_whole_package():
+    use_case, scheduling_repo, _, _ = _repos(cart=[MagicMock(instructor_id=uuid4())])
+
+    with pytest.raises(MixedInstructorsException):
+        await use_case.execute(_dto(MONDAY, MONDAY + timedelta(days=1)))
+    scheduling_repo.create_many.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# SchedulingRepositoryImpl.create_many
+# ---------------------------------------------------------------------------
+
+
+def _scheduling(start: datetime) -> Scheduling:
+    return Scheduling(
+        student_id=STUDENT_ID,
+        instructor_id=INSTRUCTOR_ID,
+        scheduled_datetime=start,
+        duration_minutes=50,
+        price=Decimal("100.00"),
+    )
+
+
+OVERLAP = IntegrityError(
+    "INSERT", {}, Exception('conflicting key value violates exclusion constraint "ex_schedulings_instructor_no_overlap"'),
+)
+
+
+def _session(*results) -> MagicMock:
+    """Sessão cujos execute devolvem (ou levantam) os resultados, com savepoints."""
+    session = MagicMock()
+    session.execute = AsyncMock(side_effect=list(results))
+    session.begin_nested.return_value.__aexit__ = AsyncMock(return_value=False)
+    return session
+
+
+@pytest.mark.asyncio
+async def test_create_many_uses_one_insert_and_one_summary_batch():
+    session = _session(None, None)
+    schedulings = [
+        _scheduling(MONDAY),
+        _scheduling(MONDAY + timedelta(hours=2)),
+        _scheduling(MONDAY + timedelta(days=1)),
+    ]
+
+    created, conflicting = await SchedulingRepositoryImpl(session).create_many(schedulings)
+
+    assert (created, conflicting) == (schedulings, [])
+    session.begin_nested.assert_called_once()
+    insert_call, summary_call = session.execute.await_args_list
+    insert_stmt = insert_call.args[0]
+    sql = str(insert_stmt.compile(dialect=PGDialect_asyncpg()))
+    assert sql.startswith("INSERT INTO schedulings")
+    assert sql.count("), (") == 2  # três linhas no mesmo VALUES
+    assert summary_call.args[0] is MONTH_SUMMARY_UPSERT_SQL
+    assert sorted((p["day"], p["delta"]) for p in summary_call.args[1]) == [(4, 2), (5, 1)]
+
+
+@pytest.mark.asyncio
+async def test_create_many_retries_row_by_row_after_a_concurrent_overlap():
+    winner, loser = _scheduling(MONDAY), _scheduling(MONDAY + timedelta(days=1))
+    session = _session(OVERLAP, None, OVERLAP, None)
+
+    created, conflicting = await SchedulingRepositoryImpl(session).create_many([winner, loser])
+
+    assert (created, conflicting) == ([winner], [loser])
+    assert session.begin_nested.call_count == 3  # lote + uma por aula
+    *inserts, summary_call = session.execute.await_args_list
+    assert len(inserts) == 3
+    assert [(p["day"], p["delta"]) for p in summary_call.args[1]] == [(4, 1)]
+
+
+@pytest.mark.asyncio
+async def test_create_many_keeps_other_integrity_errors_and_skips_empty_batches():
+    session = _session(IntegrityError(
+        "INSERT", {}, Exception('violates foreign key constraint "schedulings_student_id_fkey"'),
+    ))
+    repo = SchedulingRepositoryImpl(session)
+
+    assert await repo.create_many([]) == ([], [])
+    session.execute.assert_not_called()
+    with pytest.raises(IntegrityError):
+        await repo.create_many([_scheduling(MONDAY)])
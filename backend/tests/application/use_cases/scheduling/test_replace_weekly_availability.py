@@ -0,0 +1,142 @@
+"""
+Testes para a substituição em lote da disponibilidade semanal
+(ManageAvailabilityUseCase.replace_week e apply_week_changes).
+"""
+
+from datetime import time
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects.postgresql.asyncpg import PGDialect_asyncpg
+
+from src.application.dtos.scheduling_dtos import ReplaceWeeklyAvailabilityDTO, WeeklySlotDTO
+from src.application.use_cases.scheduling import ManageAvailabilityUseCase
+from src.domain.entities.availability import Availability
+from src.domain.entities.user_type import UserType
+from src.domain.exceptions import (
+    AvailabilityOverlapException,
+    InvalidAvailabilityTimeException,
+)
+from src.infrastructure.repositories.availability_repository_impl import (
+    AvailabilityRepositoryImpl,
+)
+
+INSTRUCTOR_ID = uuid4()
+
+
+def _use_case(current: list[Availability]) -> tuple[ManageAvailabilityUseCase, AsyncMock]:
+    availability_repo = AsyncMock()
+    availability_repo.list_by_instructor.return_value = current
+    user_repo = AsyncMock()
+    user_repo.get_by_id.return_value = MagicMock(user_type=UserType.INSTRUCTOR)
+    return (
+        ManageAvailabilityUseCase(availability_repository=availability_repo, user_repository=user_repo),
+        availability_repo,
+    )
+
+
+def _dto(*slots: WeeklySlotDTO) -> ReplaceWeeklyAvailabilityDTO:
+    return ReplaceWeeklyAvailabilityDTO(instructor_id=INSTRUCTOR_ID, slots=list(slots))
+
+
+@pytest.mark.asyncio
+async def test_replace_week_applies_only_the_diff():
+    unchanged = Availability(INSTRUCTOR_ID, 0, time(8, 0), time(12, 0))
+    extended = Availability(INSTRUCTOR_ID, 0, time(14, 0), time(16, 0))
+    removed = Availability(INSTRUCTOR_ID, 1, time(8, 0), time(12, 0))
+    use_case, repo = _use_case([unchanged, extended, removed])
+
+    result = await use_case.replace_week(_dto(
+        WeeklySlotDTO(2, time(9, 0), time(11, 0)),
+        WeeklySlotDTO(0, time(14, 0), time(18, 0)),
+        WeeklySlotDTO(0, time(8, 0), time(12, 0)),
+    ))
+
+    changes = repo.apply_week_changes.await_args.kwargs
+    assert [(a.day_of_week, a.start_time) for a in changes["created"]] == [(2, time(9, 0))]
+    assert [a.id for a in changes["updated"]] == [extended.id]
+    assert changes["updated"][0].end_time == time(18, 0)
+    assert changes["deleted_ids"] == [removed.id]
+    repo.create.assert_not_called()
+    repo.check_overlap.assert_not_called()
+
+    assert result.total_count == 3
+    assert [(a.day_of_week, a.start_time, a.end_time) for a in result.availabilities] == [
+        (0, "08:00", "12:00"), (0, "14:00", "18:00"), (2, "09:00", "11:00"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_replace_week_with_empty_list_clears_the_week():
+    current = [Availability(INSTRUCTOR_ID, d, time(8, 0), time(12, 0)) for d in range(3)]
+    use_case, repo = _use_case(current)
+
+    result = await use_case.replace_week(_dto())
+
+    assert sorted(repo.apply_week_changes.await_args.kwargs["deleted_ids"]) == sorted(a.id for a in current)
+    assert result.total_count == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "slots",
+    [
+        (WeeklySlotDTO(0, time(8, 0), time(12, 0)), WeeklySlotDTO(0, time(11, 0), time(13, 0))),
+        (WeeklySlotDTO(3, time(8, 0), time(12, 0)), WeeklySlotDTO(3, time(8, 0), time(9, 0))),
+        (WeeklySlotDTO(4, time(9, 0), time(10, 0)), WeeklySlotDTO(4, time(8, 0), time(18, 0), False)),
+    ],
+)
+async def test_replace_week_rejects_overlaps_before_touching_the_database(slots):
+    use_case, repo = _use_case([])
+
+    with pytest.raises(AvailabilityOverlapException):
+        await use_case.replace_week(_dto(*slots))
+    repo.apply_week_changes.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_replace_week_accepts_adjacent_slots_and_rejects_inverted_ones():
+    use_case, repo = _use_case([])
+
+    await use_case.replace_week(_dto(
+        WeeklySlotDTO(0, time(12, 0), time(14, 0)),
+        WeeklySlotDTO(0, time(8, 0), time(12, 0)),
+        WeeklySlotDTO(1, time(8, 0), time(12, 0)),
+    ))
+    assert len(repo.apply_week_changes.await_args.kwargs["created"]) == 3
+
+    with pytest.raises(InvalidAvailabilityTimeException):
+        await use_case.replace_week(_dto(WeeklySlotDTO(0, time(12, 0), time(8, 0))))
+
+
+@pytest.mark.asyncio
+async def test_apply_week_changes_uses_one_statement_per_change_type():
+    session = MagicMock()
+    session.execute = AsyncMock()
+    repo = AvailabilityRepositoryImpl(session)
+    created = [Availability(INSTRUCTOR_ID, d, time(8, 0), time(12, 0)) for d in range(5)]
+    updated = [Availability(INSTRUCTOR_ID, 5, time(8, 0), time(10, 0)) for _ in range(3)]
+
+    await repo.apply_week_changes(INSTRUCTOR_ID, created, updated, [uuid4(), uuid4()])
+
+    statements = [
+        str(c.args[0].compile(dialect=PGDialect_asyncpg())).split()[0:3]
+        for c in session.execute.await_args_list
+    ]
+    assert statements == [
+        ["DELETE", "FROM", "instructor_availability"],
+        ["UPDATE", "instructor_availability", "SET"],
+        ["INSERT", "INTO", "instructor_availability"],
+        ["UPDATE", "instructor_profiles", "SET"],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_apply_week_changes_without_changes_does_nothing():
+    session = MagicMock()
+    session.execute = AsyncMock()
+
+    await AvailabilityRepositoryImpl(session).apply_week_changes(INSTRUCTOR_ID, [], [], [])
+
+    session.execute.assert_not_called()
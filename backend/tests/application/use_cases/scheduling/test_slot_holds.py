@@ -0,0 +1,454 @@
+"""
+Testes para as reservas temporárias do carrinho (RedisSlotHoldService),
+HoldSlotUseCase, CheckoutSlotHoldsUseCase e o bloqueio de horários
+reservados em CreateSchedulingUseCase.
+"""
+
+import json
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import fakeredis
+import pytest
+
+from src.application.dtos.scheduling_dtos import CreateSchedulingDTO
+from src.application.use_cases.scheduling import (
+    CheckoutSlotHoldsUseCase,
+    CreateSchedulingUseCase,
+    HoldSlotUseCase,
+)
+from src.domain.entities.scheduling import Scheduling
+from src.domain.entities.slot_hold import SlotHold
+from src.domain.exceptions import (
+    MixedInstructorsException,
+    SchedulingConflictException,
+    SchedulingNotFoundException,
+)
+from src.infrastructure.external.redis_slot_holds import (
+    HOLD_SCRIPT,
+    RELEASE_SCRIPT,
+    RedisSlotHoldService,
+    instructor_key,
+    student_key,
+)
+
+START = datetime(2030, 3, 4, 13, 0, tzinfo=timezone.utc)
+
+
+def _service(client: MagicMock) -> RedisSlotHoldService:
+    service = RedisSlotHoldService(redis_url="redis://test")
+    service._client = client
+    return service
+
+
+def _hold(instructor_id=None, student_id=None, start=START, minutes_left=15) -> SlotHold:
+    return SlotHold(
+        instructor_id=instructor_id or uuid4(),
+        student_id=student_id or uuid4(),
+        scheduled_datetime=start,
+        duration_minutes=50,
+        lesson_category="B",
+        vehicle_ownership="instructor",
+        price=Decimal("120.00"),
+        expires_at=datetime.now(timezone.utc) + timedelta(minutes=minutes_left),
+    )
+
+
+def _stored(hold: SlotHold, expires_ms: float) -> str:
+    return json.dumps({
+        "instructor_id": str(hold.instructor_id),
+        "start": hold.scheduled_datetime.timestamp(),
+        "duration_minutes": hold.duration_minutes,
+        "lesson_category": hold.lesson_category,
+        "vehicle_ownership": hold.vehicle_ownership,
+        "price": str(hold.price),
+        "expires_ms": expires_ms,
+    })
+
+
+# ---------------------------------------------------------------------------
+# RedisSlotHoldService
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_hold_runs_the_atomic_script_on_both_hashes():
+    client = MagicMock()
+    client.eval = AsyncMock(return_value=1)
+    hold = _hold()
+
+    assert await _service(client).hold(hold) is True
+
+    args = client.eval.await_args.args
+    assert args[0] == HOLD_SCRIPT
+    assert args[1:4] == (2, instructor_key(hold.instructor_id), student_key(hold.student_id))
+    assert args[4] == str(hold.student_id)
+    assert args[5:7] == (int(START.timestamp()), int(hold.end_datetime.timestamp()))
+    assert args[8] == int(hold.expires_at.timestamp() * 1000)
+    assert args[9] == hold.hold_id
+    assert json.loads(args[10])["price"] == "120.00"
+
+
+@pytest.mark.asyncio
+async def test_hold_reports_contention_and_skips_already_expired_holds():
+    client = MagicMock()
+    client.eval = AsyncMock(return_value=0)
+    service = _service(client)
+
+    assert await service.hold(_hold()) is False
+    client.eval.reset_mock()
+
+    assert await service.hold(_hold(minutes_left=-1)) is False
+    client.eval.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_release_checks_ownership_in_the_script():
+    client = MagicMock()
+    client.eval = AsyncMock(return_value=1)
+    hold = _hold()
+
+    assert await _service(client).release(hold.student_id, hold.hold_id) is True
+    assert client.eval.await_args.args == (
+        RELEASE_SCRIPT, 2,
+        instructor_key(hold.instructor_id), student_key(hold.student_id),
+        str(hold.student_id), str(int(START.timestamp())), hold.hold_id,
+    )
+
+
+@pytest.mark.asyncio
+async def test_release_rejects_malformed_hold_id():
+    client = MagicMock()
+    client.eval = AsyncMock()
+
+    assert await _service(client).release(uuid4(), "not-a-hold") is False
+    client.eval.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_list_for_student_sorts_and_prunes_expired_or_invalid_entries():
+    student_id = uuid4()
+    instructor_id = uuid4()
+    later = _hold(instructor_id, student_id, START + timedelta(hours=2))
+    earlier = _hold(instructor_id, student_id, START)
+    expired = _hold(instructor_id, student_id, START + timedelta(hours=4))
+    now_ms = time.time() * 1000
+
+    client = MagicMock()
+    client.hgetall = AsyncMock(return_value={
+        later.hold_id: _stored(later, now_ms + 60_000),
+        earlier.hold_id: _stored(earlier, now_ms + 60_000),
+        expired.hold_id: _stored(expired, now_ms - 1),
+        "broken": "{}",
+    })
+    client.hdel = AsyncMock()
+
+    holds = await _service(client).list_for_student(student_id)
+
+    assert [h.hold_id for h in holds] == [earlier.hold_id, later.hold_id]
+    assert holds[0].scheduled_datetime == START
+    assert holds[0].price == Decimal("120.00")
+    client.hdel.assert_awaited_once_with(student_key(student_id), expired.hold_id, "broken")
+
+
+@pytest.mark.asyncio
+async def test_is_held_by_other_ignores_own_expired_and_adjacent_holds():
+    instructor_id = uuid4()
+    student_id = uuid4()
+    other = uuid4()
+    start = int(START.timestamp())
+    future_ms = int(time.time() * 1000) + 60_000
+    client = MagicMock()
+    service = _service(client)
+
+    async def held(entries: dict[str, str]) -> bool:
+        client.hgetall = AsyncMock(return_value=entries)
+        return await service.is_held_by_other(
+            instructor_id, student_id, START, START + timedelta(minutes=50)
+        )
+
+    assert await held({str(start): f"{other}|{start + 3000}|{future_ms}"}) is True
+    assert await held({str(start): f"{student_id}|{start + 3000}|{future_ms}"}) is False
+    assert await held({str(start): f"{other}|{start + 3000}|{future_ms - 120_000}"}) is False
+    assert await held({str(start + 3000): f"{other}|{start + 6000}|{future_ms}"}) is False
+
+
+@pytest.mark.asyncio
+async def test_list_for_instructor_returns_valid_overlapping_holds_in_order():
+    instructor_id = uuid4()
+    start = int(START.timestamp())
+    future_ms = int(time.time() * 1000) + 60_000
+    client = MagicMock()
+    client.hgetall = AsyncMock(return_value={
+        str(start + 7200): f"{uuid4()}|{start + 10_200}|{future_ms}",
+        str(start): f"{uuid4()}|{start + 3000}|{future_ms}",
+        str(start + 3600): f"{uuid4()}|{start + 6600}|{future_ms - 120_000}",  # expirada
+        str(start + 86_400): f"{uuid4()}|{start + 89_400}|{future_ms}",  # fora do período
+    })
+
+    intervals = await _service(client).list_for_instructor(
+        instructor_id, START, START + timedelta(hours=12)
+    )
+
+    assert intervals == [
+        (START, START + timedelta(minutes=50)),
+        (START + timedelta(hours=2), START + timedelta(hours=2, minutes=50)),
+    ]
+    client.hgetall.assert_awaited_once_with(instructor_key(instructor_id))
+
+
+@pytest.mark.asyncio
+async def test_held_instructors_reads_every_hash_in_one_pipeline():
+    held, free = uuid4(), uuid4()
+    start = int(START.timestamp())
+    future_ms = int(time.time() * 1000) + 60_000
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[{str(start): f"{uuid4()}|{start + 3000}|{future_ms}"}, {}])
+    client = MagicMock()
+    client.pipeline.return_value.__aenter__ = AsyncMock(return_value=pipe)
+    client.pipeline.return_value.__aexit__ = AsyncMock(return_value=False)
+
+    result = await _service(client).held_instructors(
+        [held, free], START, START + timedelta(minutes=50)
+    )
+
+    assert result == {held}
+    assert [c.args[0] for c in pipe.hgetall.call_args_list] == [instructor_key(held), instructor_key(free)]
+    pipe.execute.assert_awaited_once()
+
+
+# ---------------------------------------------------------------------------
+# Scripts Lua executados em um Redis embutido (fakeredis + Lua)
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def redis_service() -> RedisSlotHoldService:
+    service = RedisSlotHoldService(redis_url="redis://test")
+    service._client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    return service
+
+
+@pytest.mark.asyncio
+async def test_script_rejects_overlapping_hold_from_another_student(redis_service):
+    instructor_id = uuid4()
+    first = _hold(instructor_id)
+
+    assert await redis_service.hold(first) is True
+    assert await redis_service.hold(_hold(instructor_id, start=START + timedelta(minutes=30))) is False
+    assert await redis_service.hold(_hold(instructor_id, start=START)) is False
+    # Horário adjacente (começa quando a aula segurada termina) e outro instrutor
+    assert await redis_service.hold(_hold(instructor_id, start=first.end_datetime)) is True
+    assert await redis_service.hold(_hold(start=START)) is True
+
+    stored = await redis_service._client.hgetall(instructor_key(instructor_id))
+    assert sorted(stored) == [str(int(START.timestamp())), str(int(first.end_datetime.timestamp()))]
+    assert stored[str(int(START.timestamp()))].startswith(f"{first.student_id}|")
+
+
+@pytest.mark.asyncio
+async def test_script_lets_the_owner_refresh_the_hold(redis_service):
+    instructor_id, student_id = uuid4(), uuid4()
+    client = redis_service._client
+
+    assert await redis_service.hold(_hold(instructor_id, student_id, minutes_left=5)) is True
+    ttl_before = await client.pttl(instructor_key(instructor_id))
+    assert await redis_service.hold(_hold(instructor_id, student_id, minutes_left=15)) is True
+
+    assert await client.hlen(instructor_key(instructor_id)) == 1
+    assert await client.pttl(instructor_key(instructor_id)) > ttl_before
+    assert len(await redis_service.list_for_student(student_id)) == 1
+    # Outro horário sobreposto do mesmo aluno continua recusado
+    assert await redis_service.hold(
+        _hold(instructor_id, student_id, start=START + timedelta(minutes=30))
+    ) is False
+
+
+@pytest.mark.asyncio
+async def test_script_prunes_expired_holds(redis_service):
+    instructor_id = uuid4()
+    client = redis_service._client
+    start = int(START.timestamp())
+    expired_ms = int(time.time() * 1000) - 1_000
+    await client.hset(instructor_key(instructor_id), str(start), f"{uuid4()}|{start + 3000}|{expired_ms}")
+    await client.hset(instructor_key(instructor_id), str(start + 7200), f"{uuid4()}|{start + 10_200}|{expired_ms}")
+
+    student_id = uuid4()
+    assert await redis_service.hold(_hold(instructor_id, student_id)) is True
+
+    stored = await client.hgetall(instructor_key(instructor_id))
+    assert list(stored) == [str(start)]
+    assert stored[str(start)].startswith(f"{student_id}|")
+
+
+@pytest.mark.asyncio
+async def test_script_release_only_frees_the_owners_hold(redis_service):
+    instructor_id = uuid4()
+    hold = _hold(instructor_id)
+    await redis_service.hold(hold)
+
+    assert await redis_service.release(uuid4(), hold.hold_id) is False
+    assert await redis_service.is_held_by_other(
+        instructor_id, uuid4(), START, START + timedelta(minutes=50)
+    ) is True
+
+    assert await redis_service.release(hold.student_id, hold.hold_id) is True
+    assert await redis_service.list_for_instructor(
+        instructor_id, START, START + timedelta(minutes=50)
+    ) == []
+
+
+# ---------------------------------------------------------------------------
+# Casos de uso
+# ---------------------------------------------------------------------------
+
+
+def _dto(instructor_id, student_id) -> CreateSchedulingDTO:
+    return CreateSchedulingDTO(
+        student_id=student_id,
+        instructor_id=instructor_id,
+        scheduled_datetime=START,
+        lesson_category="B",
+        vehicle_ownership="instructor",
+        duration_minutes=50,
+    )
+
+
+def _create_scheduling(instructor_id, student_id) -> MagicMock:
+    create = MagicMock(spec=CreateSchedulingUseCase)
+    scheduling = Scheduling(
+        student_id=student_id,
+        instructor_id=instructor_id,
+        scheduled_datetime=START,
+        duration_minutes=50,
+        price=Decimal("120.00"),
+    )
+    create.prepare = AsyncMock(return_value=(scheduling, MagicMock(), MagicMock()))
+    create.execute = AsyncMock(side_effect=lambda dto: MagicMock(id=uuid4()))
+    return create
+
+
+@pytest.mark.asyncio
+async def test_hold_slot_returns_hold_with_quoted_price():
+    instructor_id, student_id = uuid4(), uuid4()
+    holds = AsyncMock()
+    holds.list_for_student.return_value = []
+    holds.hold.return_value = True
+    use_case = HoldSlotUseCase(
+        create_scheduling=_create_scheduling(instructor_id, student_id),
+        slot_hold_service=holds,
+        ttl_minutes=15,
+    )
+
+    result = await use_case.execute(_dto(instructor_id, student_id))
+
+    stored = holds.hold.await_args.args[0]
+    assert result.hold_id == stored.hold_id
+    assert result.price == Decimal("120.00")
+    assert timedelta(minutes=14) < result.expires_at - datetime.now(timezone.utc) <= timedelta(minutes=15)
+
+
+@pytest.mark.asyncio
+async def test_hold_slot_rejects_contended_slot():
+    instructor_id, student_id = uuid4(), uuid4()
+    holds = AsyncMock()
+    holds.list_for_student.return_value = []
+    holds.hold.return_value = False
+    use_case = HoldSlotUseCase(
+        create_scheduling=_create_scheduling(instructor_id, student_id),
+        slot_hold_service=holds,
+    )
+
+    with pytest.raises(SchedulingConflictException):
+        await use_case.execute(_dto(instructor_id, student_id))
+
+
+@pytest.mark.asyncio
+async def test_hold_slot_rejects_second_instructor_in_cart():
+    instructor_id, student_id = uuid4(), uuid4()
+    holds = AsyncMock()
+    holds.list_for_student.return_value = [_hold(uuid4(), student_id)]
+    use_case = HoldSlotUseCase(
+        create_scheduling=_create_scheduling(instructor_id, student_id),
+        slot_hold_service=holds,
+    )
+
+    with pytest.raises(MixedInstructorsException):
+        await use_case.execute(_dto(instructor_id, student_id))
+    holds.hold.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_checkout_materializes_each_hold_and_releases_after():
+    instructor_id, student_id = uuid4(), uuid4()
+    cart = [
+        _hold(instructor_id, student_id, START),
+        _hold(instructor_id, student_id, START + timedelta(hours=1)),
+    ]
+    holds = AsyncMock()
+    holds.list_for_student.return_value = cart
+    holds.release.side_effect = [True, RuntimeError("redis down")]
+    create = _create_scheduling(instructor_id, student_id)
+    use_case = CheckoutSlotHoldsUseCase(create_scheduling=create, slot_hold_service=holds)
+
+    schedulings, materialized = await use_case.execute(student_id)
+
+    assert len(schedulings) == 2
+    assert materialized == cart
+    assert [c.args[0].scheduled_datetime for c in create.execute.await_args_list] == [
+        START, START + timedelta(hours=1),
+    ]
+    holds.release.assert_not_called()
+
+    await use_case.release(student_id, materialized)
+    assert holds.release.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_checkout_with_empty_cart_raises():
+    holds = AsyncMock()
+    holds.list_for_student.return_value = []
+    use_case = CheckoutSlotHoldsUseCase(
+        create_scheduling=_create_scheduling(uuid4(), uuid4()),
+        slot_hold_service=holds,
+    )
+
+    with pytest.raises(SchedulingNotFoundException):
+        await use_case.execute(uuid4())
+
+
+@pytest.mark.asyncio
+async def test_create_scheduling_rejects_slot_held_by_other_student():
+    instructor_id, student_id = uuid4(), uuid4()
+    user_repo = AsyncMock()
+    user_repo.get_by_id.side_effect = [
+        MagicMock(user_type="student", is_active=True),
+        MagicMock(user_type="instructor", is_active=True),
+    ]
+    scheduling_repo = AsyncMock()
+    scheduling_repo.list_by_student.return_value = []
+    scheduling_repo.check_conflict.return_value = False
+    availability_repo = AsyncMock()
+    availability_repo.is_time_available.return_value = True
+    holds = AsyncMock()
+    holds.is_held_by_other.return_value = True
+    use_case = CreateSchedulingUseCase(
+        user_repository=user_repo,
+        instructor_repository=AsyncMock(),
+        scheduling_repository=scheduling_repo,
+        availability_repository=availability_repo,
+        slot_hold_service=holds,
+    )
+
+    with pytest.raises(SchedulingConflictException):
+        await use_case.execute(_dto(instructor_id, student_id))
+    holds.is_held_by_other.assert_awaited_once_with(
+        instructor_id=instructor_id,
+        student_id=student_id,
+        start=START,
+        end=START + timedelta(minutes=50),
+    )
+    scheduling_repo.create.assert_not_called()
@@ -0,0 +1,105 @@
+"""
+Testes para GetInstructorFeedUseCase (feed paginado por cursor).
+"""
+
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.application.dtos.profile_dtos import InstructorFeedDTO
+from src.application.services.cursor_codec import encode_cursor
+from src.application.use_cases.student.get_instructor_feed import GetInstructorFeedUseCase
+from src.domain.entities.instructor_profile import InstructorProfile
+from src.domain.entities.location import Location
+from src.domain.entities.search_position import InstructorSearchPosition
+from src.domain.exceptions import InvalidCursorException
+
+
+def _row(distance: float | None, rating: str = "4.00"):
+    location = Location(latitude=-23.551, longitude=-46.631) if distance is not None else None
+    profile = InstructorProfile(
+        id=uuid4(),
+        user_id=uuid4(),
+        location=location,
+        hourly_rate=Decimal("80.00"),
+        rating=float(rating),
+        full_name="Ana Maria Souza",
+    )
+    position = InstructorSearchPosition(
+        profile_id=profile.id, rating=Decimal(rating), distance=distance
+    )
+    return profile, position
+
+
+def _use_case(rows):
+    repo = MagicMock()
+    repo.search_page_by_location = AsyncMock(return_value=rows)
+    return GetInstructorFeedUseCase(instructor_repository=repo), repo
+
+
+@pytest.mark.asyncio
+async def test_returns_next_cursor_when_more_results_exist():
+    rows = [_row(100.0), _row(200.0), _row(300.0)]
+    use_case, repo = _use_case(rows)
+
+    result = await use_case.execute(InstructorFeedDTO(latitude=-23.55, longitude=-46.63, limit=2))
+
+    assert len(result.instructors) == 2
+    assert result.instructors[0].full_name == "Ana Souza"
+    assert result.next_cursor is not None
+    assert repo.search_page_by_location.await_args.kwargs["limit"] == 3
+    assert repo.search_page_by_location.await_args.kwargs["after"] is None
+
+
+@pytest.mark.asyncio
+async def test_last_page_has_no_cursor():
+    use_case, _ = _use_case([_row(100.0)])
+
+    result = await use_case.execute(InstructorFeedDTO(latitude=-23.55, longitude=-46.63, limit=2))
+
+    assert result.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_cursor_round_trips_exact_position():
+    rows = [_row(100.123456789), _row(None, rating="3.75"), _row(None)]
+    use_case, repo = _use_case(rows)
+    dto = InstructorFeedDTO(latitude=-23.55, longitude=-46.63, limit=2)
+
+    first = await use_case.execute(dto)
+    await use_case.execute(
+        InstructorFeedDTO(latitude=-23.55, longitude=-46.63, limit=2, cursor=first.next_cursor)
+    )
+
+    after = repo.search_page_by_location.await_args.kwargs["after"]
+    assert after == rows[1][1]
+    assert not after.is_located
+
+
+@pytest.mark.asyncio
+async def test_cursor_from_another_search_is_rejected():
+    use_case, _ = _use_case([_row(1.0), _row(2.0)])
+    first = await use_case.execute(
+        InstructorFeedDTO(latitude=-23.55, longitude=-46.63, limit=1)
+    )
+
+    with pytest.raises(InvalidCursorException):
+        await use_case.execute(
+            InstructorFeedDTO(
+                latitude=-23.55, longitude=-46.63, limit=1,
+                license_category="A", cursor=first.next_cursor,
+            )
+        )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cursor", ["not-base64!!", encode_cursor({"k": "x"}), "W10"])
+async def test_malformed_cursor_is_rejected(cursor):
+    use_case, _ = _use_case([])
+
+    with pytest.raises(InvalidCursorException):
+        await use_case.execute(
+            InstructorFeedDTO(latitude=-23.55, longitude=-46.63, cursor=cursor)
+        )
@@ -0,0 +1,113 @@
+"""
+Testes para os cursores das listagens por data (histórico de pagamentos e
+agendamentos do admin).
+"""
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.application.dtos.admin_scheduling_dtos import ListAllSchedulingsDTO
+from src.application.dtos.payment_dtos import GetPaymentHistoryDTO
+from src.application.services.cursor_codec import (
+    cursor_scope,
+    decode_list_position,
+    encode_list_position,
+)
+from src.application.use_cases.admin_schedulings.list_all_schedulings import ListAllSchedulingsUseCase
+from src.application.use_cases.payment import GetPaymentHistoryUseCase
+from src.domain.entities.payment import Payment
+from src.domain.entities.scheduling import Scheduling
+from src.domain.entities.scheduling_status import SchedulingStatus
+from src.domain.entities.search_position import ListPosition
+from src.domain.entities.user_type import UserType
+from src.domain.exceptions import InvalidCursorException
+
+USER_ID = uuid4()
+NOW = datetime(2030, 3, 11, 12, 0)
+
+
+def _payment(minutes: int) -> Payment:
+    return Payment(
+        scheduling_id=uuid4(),
+        student_id=USER_ID,
+        instructor_id=uuid4(),
+        amount=Decimal("100.00"),
+        platform_fee_percentage=Decimal("10.00"),
+        created_at=NOW - timedelta(minutes=minutes),
+    )
+
+
+def _history(payments):
+    user_repo = AsyncMock()
+    user_repo.get_by_id.return_value = MagicMock(user_type=UserType.STUDENT)
+    payment_repo = AsyncMock()
+    payment_repo.list_by_student.return_value = payments
+    payment_repo.count_by_student.return_value = 10
+    scheduling_repo = AsyncMock()
+    scheduling_repo.get_by_id.return_value = None
+    use_case = GetPaymentHistoryUseCase(
+        user_repository=user_repo,
+        payment_repository=payment_repo,
+        scheduling_repository=scheduling_repo,
+    )
+    return use_case, payment_repo
+
+
+def test_list_position_round_trips_within_its_scope():
+    position = ListPosition(at=NOW, id=uuid4())
+    scope = cursor_scope("payment_history", USER_ID)
+
+    cursor = encode_list_position(position, scope)
+
+    assert decode_list_position(cursor, scope) == position
+    with pytest.raises(InvalidCursorException):
+        decode_list_position(cursor, cursor_scope("payment_history", uuid4()))
+
+
+@pytest.mark.asyncio
+async def test_payment_history_pages_by_cursor():
+    payments = [_payment(1), _payment(2), _payment(3)]
+    use_case, payment_repo = _history(payments)
+
+    first = await use_case.execute(GetPaymentHistoryDTO(user_id=USER_ID, limit=2))
+
+    assert [p.id for p in first.payments] == [payments[0].id, payments[1].id]
+    assert first.has_more is True
+    assert payment_repo.list_by_student.await_args.kwargs["limit"] == 3
+    assert payment_repo.list_by_student.await_args.kwargs["after"] is None
+
+    payment_repo.list_by_student.return_value = payments[2:]
+    second = await use_case.execute(
+        GetPaymentHistoryDTO(user_id=USER_ID, limit=2, offset=80, cursor=first.next_cursor)
+    )
+
+    kwargs = payment_repo.list_by_student.await_args.kwargs
+    assert kwargs["after"] == ListPosition(at=payments[1].created_at, id=payments[1].id)
+    assert kwargs["offset"] == 0
+    assert (second.has_more, second.next_cursor) == (False, None)
+
+
+@pytest.mark.asyncio
+async def test_admin_list_rejects_cursor_from_other_filters():
+    scheduling = Scheduling(
+        student_id=uuid4(),
+        instructor_id=uuid4(),
+        scheduled_datetime=NOW,
+        duration_minutes=50,
+        price=Decimal("100.00"),
+    )
+    repo = AsyncMock()
+    repo.page_all.return_value = ([scheduling, scheduling], 2)
+    use_case = ListAllSchedulingsUseCase(scheduling_repository=repo)
+
+    first = await use_case.execute(ListAllSchedulingsDTO(status=SchedulingStatus.PENDING, limit=1))
+
+    assert first.next_cursor is not None
+    with pytest.raises(InvalidCursorException):
+        await use_case.execute(
+            ListAllSchedulingsDTO(status=SchedulingStatus.CONFIRMED, limit=1, cursor=first.next_cursor)
+        )
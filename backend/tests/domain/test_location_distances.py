@@ -0,0 +1,58 @@
+"""
+Testes do cálculo de distâncias em lote (Location e LocationServiceImpl).
+"""
+
+import math
+import random
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from src.domain.entities.location import Location
+from src.infrastructure.services.location_service_impl import LocationServiceImpl
+
+CENTER = Location(latitude=-23.5505, longitude=-46.6333)
+
+
+def _random_points(count: int, seed: int = 3) -> list[Location | None]:
+    rng = random.Random(seed)
+    return [
+        None if rng.random() < 0.1 else Location(
+            latitude=rng.uniform(-34, 5), longitude=rng.uniform(-74, -34)
+        )
+        for _ in range(count)
+    ]
+
+
+def test_distances_to_many_matches_scalar_distance():
+    points = _random_points(500)
+
+    distances = CENTER.distances_to_many(points)
+
+    assert distances.shape == (500,)
+    for point, distance in zip(points, distances):
+        if point is None:
+            assert math.isnan(distance)
+        else:
+            assert math.isclose(distance, CENTER.distance_to(point), rel_tol=1e-9, abs_tol=1e-9)
+
+
+def test_distances_to_many_empty():
+    assert CENTER.distances_to_many([]).shape == (0,)
+
+
+def test_filter_within_radius_returns_sorted_indices_and_distances():
+    service = LocationServiceImpl(MagicMock())
+    points = _random_points(2000)
+
+    indices, distances = service.filter_within_radius(points, CENTER, 300.0)
+
+    expected = sorted(
+        (i for i, p in enumerate(points) if p is not None and CENTER.distance_to(p) <= 300.0),
+        key=lambda i: CENTER.distance_to(points[i]),
+    )
+    assert indices.tolist() == expected
+    assert np.all(np.diff(distances) >= 0)
+    assert all(
+        service.is_within_radius(points[i], CENTER, 300.0) for i in indices.tolist()
+    )
@@ -0,0 +1,106 @@
+"""
+Fixtures dos testes de repositórios sem banco.
+
+Os repositórios recebem uma AsyncSession simulada; os testes conferem o SQL
+emitido compilando o statement no dialeto asyncpg.
+"""
+
+from collections.abc import Callable
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects.postgresql.asyncpg import PGDialect_asyncpg
+
+from src.domain.entities.payment_status import PaymentStatus
+from src.domain.entities.scheduling_status import SchedulingStatus
+from src.infrastructure.db.models.scheduling_model import SchedulingModel
+
+LIST_ROW_START = datetime(2030, 3, 11, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def query_result() -> Callable[..., MagicMock]:
+    """
+    Resultado de session.execute com os retornos informados por método.
+
+    Ex: query_result(all=[row]) ou query_result(scalar_one=3).
+    """
+
+    def build(**returns: Any) -> MagicMock:
+        result = MagicMock()
+        for method, value in returns.items():
+            getattr(result, method).return_value = value
+        return result
+
+    return build
+
+
+@pytest.fixture
+def mock_session() -> Callable[..., MagicMock]:
+    """
+    Sessão simulada cujo execute devolve os resultados informados.
+
+    Com um resultado, toda execução o devolve; com vários, um por execução,
+    na ordem.
+    """
+
+    def build(*results: MagicMock) -> MagicMock:
+        session = MagicMock()
+        if len(results) > 1:
+            session.execute = AsyncMock(side_effect=list(results))
+        else:
+            session.execute = AsyncMock(return_value=results[0] if results else MagicMock())
+        return session
+
+    return build
+
+
+@pytest.fixture
+def compiled_sql() -> Callable[..., str]:
+    """SQL (asyncpg) do statement executado; por padrão, o da última execução."""
+
+    def compile_(session: MagicMock, call: int = -1) -> str:
+        stmt = session.execute.await_args_list[call].args[0]
+        return str(stmt.compile(dialect=PGDialect_asyncpg()))
+
+    return compile_
+
+
+@pytest.fixture
+def list_row() -> Callable[..., SimpleNamespace]:
+    """
+    Linha da listagem de agendamentos (colunas do agendamento mais os campos
+    de exibição); os campos de exibição podem ser sobrescritos.
+    """
+
+    def build(**extra: Any) -> SimpleNamespace:
+        columns = {
+            "id": uuid4(),
+            "student_id": uuid4(),
+            "instructor_id": uuid4(),
+            "scheduled_datetime": LIST_ROW_START,
+            "duration_minutes": 50,
+            "price": Decimal("120.00"),
+            "status": SchedulingStatus.CONFIRMED,
+            "created_at": LIST_ROW_START,
+        }
+        values = {
+            "student_name": "Aluno",
+            "instructor_name": "Instrutor",
+            "instructor_rating": Decimal("4.50"),
+            "instructor_review_count": 12,
+            "has_review": True,
+            "payment_status": PaymentStatus.COMPLETED,
+            **extra,
+        }
+        return SimpleNamespace(
+            _mapping={c: columns.get(c.key) for c in SchedulingModel.__table__.columns},
+            **values,
+        )
+
+    return build
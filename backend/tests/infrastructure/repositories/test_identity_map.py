@@ -0,0 +1,137 @@
+"""
+Testes para o identity map por requisição compartilhado pelos repositórios
+de agendamentos, pagamentos e avaliações.
+"""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.domain.entities.payment import Payment
+from src.domain.entities.scheduling import Scheduling
+from src.domain.entities.scheduling_status import SchedulingStatus
+from src.infrastructure.db.identity_map import IdentityMap
+from src.infrastructure.db.models.payment_model import PaymentModel
+from src.infrastructure.db.models.scheduling_model import SchedulingModel
+from src.infrastructure.repositories.payment_repository_impl import PaymentRepositoryImpl
+from src.infrastructure.repositories.scheduling_repository_impl import SchedulingRepositoryImpl
+
+START = datetime(2030, 3, 11, 12, 0, tzinfo=timezone.utc)
+
+
+def _scheduling() -> Scheduling:
+    return Scheduling(
+        student_id=uuid4(),
+        instructor_id=uuid4(),
+        scheduled_datetime=START,
+        duration_minutes=50,
+        price=Decimal("100.00"),
+        status=SchedulingStatus.CONFIRMED,
+    )
+
+
+def _session(model) -> MagicMock:
+    result = MagicMock()
+    result.unique.return_value.scalar_one_or_none.return_value = model
+    result.scalar_one_or_none.return_value = model
+    result.all.return_value = []
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=result)
+    session.flush = AsyncMock()
+    return session
+
+
+@pytest.mark.asyncio
+async def test_repeated_get_by_id_is_served_from_memory():
+    model = SchedulingModel.from_entity(_scheduling())
+    session = _session(model)
+    repo = SchedulingRepositoryImpl(session, identity_map=IdentityMap())
+
+    first = await repo.get_by_id(model.id)
+    first.status = SchedulingStatus.CANCELLED  # alteração ainda não gravada
+    second = await repo.get_by_id(model.id)
+
+    session.execute.assert_awaited_once()
+    assert second is not first
+    assert second.status == SchedulingStatus.CONFIRMED
+
+
+@pytest.mark.asyncio
+async def test_without_identity_map_every_lookup_queries():
+    model = SchedulingModel.from_entity(_scheduling())
+    session = _session(model)
+    repo = SchedulingRepositoryImpl(session)
+
+    await repo.get_by_id(model.id)
+    await repo.get_by_id(model.id)
+
+    assert session.execute.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_update_refreshes_the_cached_scheduling():
+    model = SchedulingModel.from_entity(_scheduling())
+    session = _session(model)
+    repo = SchedulingRepositoryImpl(session, identity_map=IdentityMap())
+
+    scheduling = await repo.get_by_id(model.id)
+    scheduling.cancellation_reason = "Imprevisto"
+    await repo.update(scheduling)
+    session.execute.reset_mock()
+
+    assert (await repo.get_by_id(model.id)).cancellation_reason == "Imprevisto"
+    session.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_bulk_transition_discards_the_changed_rows():
+    model = SchedulingModel.from_entity(_scheduling())
+    session = _session(model)
+    identity_map = IdentityMap()
+    repo = SchedulingRepositoryImpl(session, identity_map=identity_map)
+    await repo.get_by_id(model.id)
+
+    session.execute.return_value.all.return_value = [
+        SimpleNamespace(
+            id=model.id,
+            student_id=model.student_id,
+            instructor_id=model.instructor_id,
+            scheduled_datetime=START,
+            previous_status=SchedulingStatus.CONFIRMED,
+        )
+    ]
+    await repo.complete_overdue_confirmed()
+
+    assert identity_map.get(Scheduling, model.id) is None
+
+
+@pytest.mark.asyncio
+async def test_payment_write_refreshes_payment_and_drops_its_scheduling():
+    scheduling = _scheduling()
+    payment = Payment(
+        scheduling_id=scheduling.id,
+        student_id=scheduling.student_id,
+        instructor_id=scheduling.instructor_id,
+        amount=Decimal("100.00"),
+        platform_fee_percentage=Decimal("10.00"),
+    )
+    model = PaymentModel.from_entity(payment)
+    session = _session(model)
+    session.get = AsyncMock(return_value=model)
+    identity_map = IdentityMap()
+    identity_map.put(scheduling)
+    repo = PaymentRepositoryImpl(session, identity_map=identity_map)
+
+    loaded = await repo.get_by_scheduling_id(scheduling.id)
+    assert (await repo.get_by_scheduling_id(scheduling.id)).id == loaded.id
+    session.execute.assert_awaited_once()
+
+    await repo.update(loaded)
+
+    assert identity_map.get(Scheduling, scheduling.id) is None
+    assert await repo.get_by_id(payment.id) is not None
+    session.get.assert_awaited_once()  # update; a leitura veio do mapa
@@ -0,0 +1,255 @@
+"""
+Testes para InstructorRepositoryImpl.search_by_location (geography + KNN)
+e a busca de instrutores livres em um horário (search_free_by_location).
+"""
+
+from datetime import datetime, time, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.application.dtos.profile_dtos import InstructorSearchDTO
+from src.application.use_cases.student.get_nearby_instructors import (
+    GetNearbyInstructorsUseCase,
+)
+from src.core.helpers.timezone_utils import DEFAULT_TIMEZONE
+from src.domain.entities.instructor_profile import InstructorProfile
+from src.domain.entities.location import Location
+from src.infrastructure.repositories.instructor_repository_impl import (
+    InstructorRepositoryImpl,
+)
+
+CENTER = Location(latitude=-23.55, longitude=-46.63)
+
+
+def _compile(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def _profile() -> InstructorProfile:
+    return InstructorProfile(user_id=uuid4(), location=CENTER, hourly_rate=Decimal("80.00"))
+
+
+def _result(rows):
+    result = MagicMock()
+    result.all.return_value = rows
+    return result
+
+
+def test_located_branch_keeps_indexed_column_untouched():
+    """O ramo espacial não deve reprojetar a coluna e deve ordenar por KNN."""
+    repo = InstructorRepositoryImpl(MagicMock())
+    sql = _compile(
+        repo._located_search_stmt(
+            center=CENTER,
+            radius_km=10.0,
+            biological_sex=None,
+            license_category=None,
+            search_query=None,
+            only_available=True,
+            limit=50,
+        )
+    )
+
+    assert "ST_Transform" not in sql
+    assert "ST_DWithin(geography(instructor_profiles.location)" in sql
+    assert "ORDER BY geography(instructor_profiles.location) <->" in sql
+    assert "location IS NULL" not in sql
+
+
+def test_unlocated_branch_filters_only_profiles_without_location():
+    repo = InstructorRepositoryImpl(MagicMock())
+    sql = _compile(
+        repo._unlocated_search_stmt(
+            biological_sex=None,
+            license_category="B",
+            search_query=None,
+            only_available=True,
+            limit=5,
+        )
+    )
+
+    assert "instructor_profiles.location IS NULL" in sql
+    assert "ORDER BY instructor_profiles.rating DESC" in sql
+
+
+@pytest.mark.asyncio
+async def test_unlocated_branch_skipped_when_limit_filled():
+    """Se o ramo espacial preenche o limite, o ramo sem localização não roda."""
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=_result([MagicMock(), MagicMock()]))
+    repo = InstructorRepositoryImpl(session)
+    repo._search_row_to_entity = MagicMock(side_effect=lambda row: row)
+
+    profiles = await repo.search_by_location(center=CENTER, limit=2)
+
+    assert len(profiles) == 2
+    assert session.execute.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_unlocated_branch_completes_remaining_slots():
+    """Instrutores sem localização completam o limite após os localizados."""
+    located, unlocated = MagicMock(), MagicMock()
+    session = MagicMock()
+    session.execute = AsyncMock(side_effect=[_result([located]), _result([unlocated])])
+    repo = InstructorRepositoryImpl(session)
+    repo._search_row_to_entity = MagicMock(side_effect=lambda row: row)
+
+    profiles = await repo.search_by_location(center=CENTER, limit=3)
+
+    assert profiles == [located, unlocated]
+    assert session.execute.await_count == 2
+    unlocated_sql = _compile(session.execute.await_args_list[1].args[0])
+    assert "LIMIT" in unlocated_sql
+
+
+def test_text_search_uses_trigram_indexed_expression_and_ranks_by_similarity():
+    """Busca textual usa f_unaccent (índice trigram) e ordena por similaridade."""
+    repo = InstructorRepositoryImpl(MagicMock())
+    located_sql = _compile(
+        repo._located_search_stmt(
+            center=CENTER,
+            radius_km=10.0,
+            biological_sex=None,
+            license_category=None,
+            search_query="joão",
+            only_available=True,
+            limit=50,
+        )
+    )
+    unlocated_sql = _compile(
+        repo._unlocated_search_stmt(
+            biological_sex=None,
+            license_category=None,
+            search_query="joão",
+            only_available=True,
+            limit=50,
+        )
+    )
+
+    for sql in (located_sql, unlocated_sql):
+        # Cada lado do OR vira uma subquery servida pelo seu índice trigram
+        assert "instructor_profiles.user_id IN (SELECT users_1.id" in sql
+        assert "f_unaccent(users_1.full_name) ILIKE f_unaccent(" in sql
+        assert "UNION SELECT instructor_profiles_1.user_id" in sql
+        assert "f_unaccent(instructor_profiles_1.city) ILIKE f_unaccent(" in sql
+        assert " unaccent(" not in sql
+        assert "ORDER BY greatest(word_similarity(" in sql
+    assert ") DESC, geography(instructor_profiles.location) <->" in located_sql
+    assert ") DESC, instructor_profiles.rating DESC" in unlocated_sql
+
+
+# ---------------------------------------------------------------------------
+# Busca "livre perto de mim no horário"
+# ---------------------------------------------------------------------------
+
+SATURDAY_9AM = datetime(2030, 3, 9, 9, 0, tzinfo=DEFAULT_TIMEZONE)
+
+
+@pytest.mark.asyncio
+async def test_free_search_combines_spatial_availability_and_overlap_in_one_query():
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=_result([]))
+    repo = InstructorRepositoryImpl(session)
+
+    await repo.search_free_by_location(
+        CENTER, SATURDAY_9AM, SATURDAY_9AM + timedelta(minutes=50), radius_km=5.0
+    )
+
+    session.execute.assert_awaited_once()
+    stmt = session.execute.await_args.args[0]
+    sql = _compile(stmt)
+    assert "ST_DWithin(geography(instructor_profiles.location)" in sql
+    assert "ORDER BY geography(instructor_profiles.location) <->" in sql
+    assert "EXISTS (SELECT instructor_availability.id" in sql
+    assert "instructor_availability.instructor_id = instructor_profiles.user_id" in sql
+    assert "NOT (EXISTS (SELECT schedulings.id" in sql
+    assert "schedulings.instructor_id = instructor_profiles.user_id" in sql
+    assert "tstzrange(schedulings.scheduled_datetime, schedulings.end_datetime, '[)') &&" in sql
+
+    params = stmt.compile(dialect=postgresql.dialect()).params
+    assert params["day_of_week_1"] == 5
+    assert params["start_time_1"] == time(9, 0)
+    assert params["end_time_1"] == time(9, 50)
+
+
+@pytest.mark.asyncio
+async def test_free_search_window_crossing_midnight_returns_nothing():
+    session = MagicMock()
+    session.execute = AsyncMock()
+    late = datetime(2030, 3, 9, 23, 30, tzinfo=DEFAULT_TIMEZONE)
+
+    profiles = await InstructorRepositoryImpl(session).search_free_by_location(
+        CENTER, late, late + timedelta(minutes=50)
+    )
+
+    assert profiles == []
+    session.execute.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_nearby_use_case_with_window_skips_tile_cache():
+    instructor_repo = AsyncMock()
+    instructor_repo.search_free_by_location.return_value = []
+    cache = AsyncMock()
+    use_case = GetNearbyInstructorsUseCase(instructor_repository=instructor_repo, cache_service=cache)
+
+    result = await use_case.execute(InstructorSearchDTO(
+        latitude=CENTER.latitude,
+        longitude=CENTER.longitude,
+        radius_km=5.0,
+        free_from=SATURDAY_9AM.astimezone(timezone.utc).replace(tzinfo=None),  # naive = UTC
+        free_minutes=90,
+    ))
+
+    assert result.instructors == []
+    kwargs = instructor_repo.search_free_by_location.await_args.kwargs
+    assert kwargs["start"] == SATURDAY_9AM
+    assert kwargs["end"] - kwargs["start"] == timedelta(minutes=90)
+    cache.get.assert_not_called()
+    instructor_repo.search_by_location.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_free_search_excludes_instructors_with_held_slots():
+    free, held = _profile(), _profile()
+    replacement = _profile()
+    instructor_repo = AsyncMock()
+    instructor_repo.search_free_by_location.side_effect = [[held, free], [free, replacement]]
+    slot_holds = AsyncMock()
+    slot_holds.held_instructors.side_effect = [{held.user_id}, set()]
+    use_case = GetNearbyInstructorsUseCase(
+        instructor_repository=instructor_repo, slot_hold_service=slot_holds
+    )
+
+    result = await use_case.execute(InstructorSearchDTO(
+        latitude=CENTER.latitude,
+        longitude=CENTER.longitude,
+        free_from=SATURDAY_9AM,
+        free_minutes=50,
+    ))
+
+    assert [i.user_id for i in result.instructors] == [free.user_id, replacement.user_id]
+    second = instructor_repo.search_free_by_location.await_args_list[1].kwargs
+    assert second["exclude_instructor_ids"] == {held.user_id}
+    start, end = slot_holds.held_instructors.await_args_list[0].args[1:]
+    assert end - start == timedelta(minutes=50)
+
+
+@pytest.mark.asyncio
+async def test_free_search_sql_excludes_given_instructors():
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=_result([]))
+    excluded = uuid4()
+
+    await InstructorRepositoryImpl(session).search_free_by_location(
+        CENTER, SATURDAY_9AM, SATURDAY_9AM + timedelta(minutes=50),
+        exclude_instructor_ids={excluded},
+    )
+
+    sql = _compile(session.execute.await_args.args[0])
+    assert "instructor_profiles.user_id NOT IN" in sql
@@ -0,0 +1,258 @@
+"""
+Testes para a projeção de busca (InstructorSearchIndexRepositoryImpl).
+"""
+
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.domain.entities.location import Location
+from src.infrastructure.db.models.instructor_search_index_model import (
+    InstructorSearchIndexModel,
+)
+from src.infrastructure.repositories.instructor_repository_impl import (
+    InstructorRepositoryImpl,
+)
+from src.infrastructure.repositories.instructor_search_index_repository_impl import (
+    InstructorSearchIndexRepositoryImpl,
+    split_name,
+)
+
+CENTER = Location(latitude=-23.55, longitude=-46.63)
+
+
+def _compile(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def _source_row(**overrides):
+    values = {
+        "id": uuid4(),
+        "user_id": uuid4(),
+        "full_name": "Ana Maria Souza",
+        "biological_sex": "female",
+        "city": "São Paulo",
+        "vehicle_type": "Hatch",
+        "license_category": "B",
+        "is_available": True,
+        "has_mp_account": False,
+        "rating": Decimal("4.80"),
+        "total_reviews": 12,
+        "lat": -23.55,
+        "lon": -46.63,
+        "hourly_rate": Decimal("80.00"),
+        "price_cat_a_instructor_vehicle": None,
+        "price_cat_a_student_vehicle": None,
+        "price_cat_b_instructor_vehicle": Decimal("90.00"),
+        "price_cat_b_student_vehicle": None,
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def test_split_name():
+    assert split_name("Ana Maria Souza") == ("Ana", "Souza")
+    assert split_name("Ana") == ("Ana", None)
+    assert split_name("  ") == (None, None)
+
+
+def test_located_branch_reads_only_the_projection():
+    """Busca em tabela única: sem JOIN e KNN direto na coluna geography."""
+    repo = InstructorSearchIndexRepositoryImpl(MagicMock())
+    sql = _compile(repo._located_stmt(CENTER, 10.0, "Feminino", "B", None, True, 50))
+
+    assert "JOIN" not in sql
+    assert "FROM instructor_search_index" in sql
+    assert "ST_DWithin(instructor_search_index.location" in sql
+    assert "ORDER BY instructor_search_index.location <->" in sql
+    assert "instructor_search_index.biological_sex = %(biological_sex_1)s" in sql
+
+
+def test_text_search_filters_both_columns_of_the_same_table():
+    repo = InstructorSearchIndexRepositoryImpl(MagicMock())
+    sql = _compile(repo._unlocated_stmt(None, None, "joao", True, 5))
+
+    assert "JOIN" not in sql
+    assert "f_unaccent(instructor_search_index.full_name) ILIKE" in sql
+    assert "f_unaccent(instructor_search_index.city) ILIKE" in sql
+    assert "ORDER BY greatest(word_similarity(" in sql
+    assert "instructor_search_index.location IS NULL" in sql
+
+
+def test_source_reads_stored_final_prices():
+    """Preços da projeção são os finais gravados no perfil, sem recálculo."""
+    sql = _compile(InstructorSearchIndexRepositoryImpl(MagicMock())._source_stmt())
+
+    assert "instructor_profiles.final_hourly_rate AS hourly_rate" in sql
+    assert (
+        "instructor_profiles.final_price_cat_b_student_vehicle AS price_cat_b_student_vehicle"
+        in sql
+    )
+    assert "instructor_profiles.hourly_rate" not in sql
+
+
+def test_row_values_copy_final_prices_and_name_parts():
+    repo = InstructorSearchIndexRepositoryImpl(MagicMock())
+    row = _source_row()
+
+    values = repo._row_values(row)
+
+    assert values["profile_id"] == row.id
+    assert (values["first_name"], values["last_name"]) == ("Ana", "Souza")
+    assert values["hourly_rate"] == Decimal("80.00")
+    assert values["price_cat_b_instructor_vehicle"] == Decimal("90.00")
+    assert values["price_cat_a_student_vehicle"] is None
+    assert values["location"] == "SRID=4326;POINT(-46.63 -23.55)"
+    assert set(values) == {c.name for c in InstructorSearchIndexModel.__table__.columns} - {
+        "updated_at"
+    }
+
+
+def test_row_values_without_location():
+    repo = InstructorSearchIndexRepositoryImpl(MagicMock())
+
+    values = repo._row_values(_source_row(lat=None, lon=None))
+
+    assert values["location"] is None
+    assert values["latitude"] is None
+
+
+@pytest.mark.asyncio
+async def test_sync_instructor_deletes_row_when_profile_is_gone():
+    session = MagicMock()
+    empty = MagicMock()
+    empty.all.return_value = []
+    session.execute = AsyncMock(return_value=empty)
+    repo = InstructorSearchIndexRepositoryImpl(session)
+
+    await repo.sync_instructor(uuid4())
+
+    assert session.execute.await_count == 2
+    assert _compile(session.execute.await_args_list[1].args[0]).startswith(
+        "DELETE FROM instructor_search_index"
+    )
+
+
+@pytest.mark.asyncio
+async def test_rebuild_upserts_every_profile_in_keyset_batches():
+    session = MagicMock()
+    rows = [_source_row(), _source_row()]
+    batch, empty = MagicMock(), MagicMock()
+    batch.all.return_value = rows
+    empty.all.return_value = []
+    session.execute = AsyncMock(side_effect=[batch, None, empty])
+    repo = InstructorSearchIndexRepositoryImpl(session)
+
+    assert await repo.rebuild(batch_size=2) == 2
+
+    first_sql = _compile(session.execute.await_args_list[0].args[0])
+    assert "instructor_profiles.id >" not in first_sql
+    upsert_sql = _compile(session.execute.await_args_list[1].args[0])
+    assert "ON CONFLICT (profile_id) DO UPDATE" in upsert_sql
+    next_stmt = session.execute.await_args_list[2].args[0]
+    assert "instructor_profiles.id > %(id_1)s" in _compile(next_stmt)
+    assert next_stmt.compile(dialect=postgresql.dialect()).params["id_1"] == rows[-1].id
+
+
+@pytest.mark.asyncio
+async def test_sync_prices_copies_stored_final_prices():
+    session = MagicMock()
+    session.execute = AsyncMock()
+    repo = InstructorSearchIndexRepositoryImpl(session)
+
+    await repo.sync_prices([uuid4()])
+
+    sql = _compile(session.execute.await_args.args[0])
+    assert sql.startswith("UPDATE instructor_search_index SET")
+    assert "hourly_rate=instructor_profiles.final_hourly_rate" in sql
+    assert "FROM instructor_profiles" in sql
+    assert "instructor_search_index.profile_id = instructor_profiles.id" in sql
+
+
+@pytest.mark.asyncio
+async def test_profile_writes_skip_projection_when_sync_is_disabled():
+    session = MagicMock()
+    result = MagicMock()
+    result.first.return_value = SimpleNamespace(previous_lat=None, previous_lon=None)
+    session.execute = AsyncMock(return_value=result)
+    session.flush = AsyncMock()
+
+    assert await InstructorRepositoryImpl(session).update_location(uuid4(), CENTER) == (True, None)
+
+    session.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("search_projection_sync")
+async def test_location_update_is_mirrored_in_projection():
+    """update_location do repositório de instrutores replica na projeção."""
+    session = MagicMock()
+    result = MagicMock()
+    result.first.return_value = SimpleNamespace(previous_lat=None, previous_lon=None)
+    session.execute = AsyncMock(return_value=result)
+    session.flush = AsyncMock()
+    repo = InstructorRepositoryImpl(session)
+    user_id = uuid4()
+
+    assert await repo.update_location(user_id, CENTER, city="São Paulo") == (True, None)
+
+    mirrored_sql = _compile(session.execute.await_args_list[1].args[0])
+    assert mirrored_sql.startswith("UPDATE instructor_search_index SET")
+    assert "latitude=" in mirrored_sql
+    assert "city=" in mirrored_sql
+
+
+@pytest.mark.asyncio
+async def test_recompute_final_prices_updates_stale_profiles_in_batches():
+    """Preços finais do perfil: um UPDATE ... FROM (VALUES) por lote."""
+    session = MagicMock()
+    batch, empty = MagicMock(), MagicMock()
+    batch.all.return_value = [_source_row(), _source_row(hourly_rate=Decimal("0.00"))]
+    empty.all.return_value = []
+    session.execute = AsyncMock(side_effect=[batch, None, empty])
+    repo = InstructorRepositoryImpl(session)
+
+    with patch(
+        "src.infrastructure.repositories.instructor_repository_impl.PricingService"
+    ) as pricing:
+        pricing.fee_signature.return_value = "15:4.98"
+        pricing.calculate_final_prices.side_effect = lambda row: {
+            "hourly_rate": row.hourly_rate + 10,
+            "price_cat_a_instructor_vehicle": None,
+            "price_cat_a_student_vehicle": None,
+            "price_cat_b_instructor_vehicle": None,
+            "price_cat_b_student_vehicle": None,
+        }
+        recomputed = await repo.recompute_final_prices(batch_size=2)
+
+    assert recomputed == 2
+    stale_sql = _compile(session.execute.await_args_list[0].args[0])
+    assert "instructor_profiles.final_prices_signature IS DISTINCT FROM" in stale_sql
+    update_sql = _compile(session.execute.await_args_list[1].args[0])
+    assert update_sql.startswith("UPDATE instructor_profiles SET")
+    assert "final_hourly_rate=CAST(prices.final_hourly_rate AS NUMERIC(10, 2))" in update_sql
+    assert "updated_at=instructor_profiles.updated_at" in update_sql
+    assert "FROM (VALUES" in update_sql
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("search_projection_sync")
+async def test_recompute_final_prices_copies_batch_to_projection():
+    session = MagicMock()
+    rows = [_source_row(), _source_row()]
+    batch, empty = MagicMock(), MagicMock()
+    batch.all.return_value = rows
+    empty.all.return_value = []
+    session.execute = AsyncMock(side_effect=[batch, None, None, empty])
+    repo = InstructorRepositoryImpl(session)
+
+    assert await repo.recompute_final_prices(batch_size=2) == 2
+
+    projection_stmt = session.execute.await_args_list[2].args[0]
+    assert _compile(projection_stmt).startswith("UPDATE instructor_search_index SET")
+    params = projection_stmt.compile(dialect=postgresql.dialect()).params
+    assert params["id_1"] == [row.id for row in rows]
@@ -0,0 +1,98 @@
+"""
+Testes para a paginação keyset do feed (InstructorRepositoryImpl.search_page_by_location).
+"""
+
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import column
+from sqlalchemy.dialects import postgresql
+
+from src.domain.entities.location import Location
+from src.domain.entities.search_position import InstructorSearchPosition
+from src.infrastructure.db.pagination import keyset_after
+from src.infrastructure.repositories.instructor_repository_impl import (
+    InstructorRepositoryImpl,
+)
+
+CENTER = Location(latitude=-23.55, longitude=-46.63)
+
+
+def _compile(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+def _result(rows):
+    result = MagicMock()
+    result.all.return_value = rows
+    return result
+
+
+def test_keyset_after_builds_lexicographic_seek_predicate():
+    a, b, c = column("a"), column("b"), column("c")
+
+    sql = _compile(keyset_after([(a, 1, False), (b, 2, True), (c, 3, False)]))
+
+    assert sql == "a >= 1 AND (a > 1 OR a = 1 AND b < 2 OR a = 1 AND b = 2 AND c > 3)"
+
+
+def test_located_first_page_orders_by_knn_rating_and_id():
+    repo = InstructorRepositoryImpl(MagicMock())
+    sql = _compile(repo._located_page_stmt(CENTER, 10.0, None, None, None, 21, None))
+
+    assert "ORDER BY (geography(instructor_profiles.location) <-> geography(" in sql
+    assert ") ASC, instructor_profiles.rating DESC, instructor_profiles.id ASC" in sql
+    assert "OFFSET" not in sql
+    assert ">=" not in sql
+
+
+def test_located_next_page_seeks_after_position():
+    repo = InstructorRepositoryImpl(MagicMock())
+    after = InstructorSearchPosition(profile_id=uuid4(), rating=Decimal("4.50"), distance=1234.5)
+
+    sql = _compile(repo._located_page_stmt(CENTER, 10.0, None, None, None, 21, after))
+
+    assert "ST_MakePoint(-46.63, -23.55), 4326))) >= 1234.5" in sql
+    assert "instructor_profiles.rating < 4.50" in sql
+    assert f"instructor_profiles.id > '{after.profile_id}'" in sql
+    assert "OFFSET" not in sql
+
+
+def test_unlocated_next_page_seeks_on_rating():
+    repo = InstructorRepositoryImpl(MagicMock())
+    after = InstructorSearchPosition(profile_id=uuid4(), rating=Decimal("3.10"))
+
+    sql = _compile(repo._unlocated_page_stmt(None, "B", None, 5, after))
+
+    assert "instructor_profiles.location IS NULL" in sql
+    assert "instructor_profiles.rating <= 3.10" in sql
+    assert "ORDER BY instructor_profiles.rating DESC, instructor_profiles.id ASC" in sql
+
+
+def test_text_search_page_ranks_by_similarity_first():
+    repo = InstructorRepositoryImpl(MagicMock())
+    after = InstructorSearchPosition(
+        profile_id=uuid4(), rating=Decimal("4.00"), distance=10.0, rank=0.8
+    )
+
+    sql = _compile(repo._located_page_stmt(CENTER, 10.0, None, None, "ana", 21, after))
+
+    assert "ORDER BY greatest(word_similarity(" in sql
+    assert "AS rank" in sql
+
+
+@pytest.mark.asyncio
+async def test_page_after_unlocated_position_skips_located_branch():
+    """Se o cursor já está no ramo sem localização, só esse ramo é consultado."""
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=_result([]))
+    repo = InstructorRepositoryImpl(session)
+    after = InstructorSearchPosition(profile_id=uuid4(), rating=Decimal("2.00"))
+
+    page = await repo.search_page_by_location(CENTER, limit=10, after=after)
+
+    assert page == []
+    assert session.execute.await_count == 1
+    assert "location IS NULL" in _compile(session.execute.await_args.args[0])
@@ -0,0 +1,70 @@
+"""
+Testes para a paginação por cursor (keyset) das listagens de agendamentos e
+pagamentos (timeline_page).
+"""
+
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from src.domain.entities.scheduling_status import SchedulingStatus
+from src.domain.entities.search_position import ListPosition
+from src.infrastructure.repositories.payment_repository_impl import PaymentRepositoryImpl
+from src.infrastructure.repositories.scheduling_repository_impl import SchedulingRepositoryImpl
+
+AFTER = ListPosition(at=datetime(2030, 3, 11, 12, 0, tzinfo=timezone.utc), id=uuid4())
+
+
+@pytest.fixture
+def session(mock_session, query_result):
+    return mock_session(query_result(all=[], scalars=[]))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("call", "direction"),
+    [
+        (lambda repo, after: repo.list_by_student(uuid4(), after=after), "ASC"),
+        (lambda repo, after: repo.list_by_student(uuid4(), status=[SchedulingStatus.COMPLETED], after=after), "DESC"),
+        (lambda repo, after: repo.list_by_instructor(uuid4(), after=after), "DESC"),
+        (lambda repo, after: repo.list_all(after=after), "DESC"),
+    ],
+)
+async def test_scheduling_lists_order_by_date_and_id(call, direction, session, compiled_sql):
+    await call(SchedulingRepositoryImpl(session), None)
+
+    sql = compiled_sql(session)
+    assert f"ORDER BY schedulings.scheduled_datetime {direction}, schedulings.id {direction}" in sql
+    assert "OFFSET" in sql
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("call", "bound"),
+    [
+        (lambda repo, after: repo.list_by_student(uuid4(), offset=40, after=after), ">="),
+        (lambda repo, after: repo.list_by_instructor(uuid4(), offset=40, after=after), "<="),
+        (lambda repo, after: repo.list_all(offset=40, after=after), "<="),
+    ],
+)
+async def test_scheduling_lists_seek_past_the_cursor_without_offset(call, bound, session, compiled_sql):
+    await call(SchedulingRepositoryImpl(session), AFTER)
+
+    sql = compiled_sql(session)
+    assert f"schedulings.scheduled_datetime {bound} $" in sql
+    assert "schedulings.id" in sql.split("WHERE", 1)[1]
+    assert "OFFSET" not in sql
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("method", ["list_by_student", "list_by_instructor"])
+async def test_payment_lists_seek_by_created_at_and_id(method, session, compiled_sql):
+    repo = PaymentRepositoryImpl(session)
+
+    await getattr(repo, method)(uuid4(), offset=40, after=AFTER)
+
+    sql = compiled_sql(session)
+    assert "ORDER BY payments.created_at DESC, payments.id DESC" in sql
+    assert "payments.created_at <= $" in sql
+    assert "OFFSET" not in sql
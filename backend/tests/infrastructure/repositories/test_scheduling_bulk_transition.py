@@ -0,0 +1,95 @@
+"""
+Testes para as transições de status em lote (SchedulingRepositoryImpl.bulk_transition,
+cancel_expired_cart_items e complete_overdue_confirmed).
+"""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from src.domain.entities.scheduling_status import SchedulingStatus
+from src.infrastructure.repositories.scheduling_repository_impl import (
+    MONTH_SUMMARY_UPSERT_SQL,
+    SchedulingRepositoryImpl,
+)
+
+INSTRUCTOR_ID = uuid4()
+
+
+def _row(scheduled: datetime, previous_status: SchedulingStatus) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid4(),
+        student_id=uuid4(),
+        instructor_id=INSTRUCTOR_ID,
+        scheduled_datetime=scheduled,
+        previous_status=previous_status,
+    )
+
+
+@pytest.mark.asyncio
+async def test_overdue_lessons_complete_in_one_update_returning_ids(mock_session, query_result, compiled_sql):
+    rows = [
+        _row(datetime(2030, 3, 4, 12, 0, tzinfo=timezone.utc), SchedulingStatus.CONFIRMED),
+        _row(datetime(2030, 3, 4, 15, 0, tzinfo=timezone.utc), SchedulingStatus.CONFIRMED),
+        _row(datetime(2030, 3, 5, 12, 0, tzinfo=timezone.utc), SchedulingStatus.CONFIRMED),
+    ]
+    session = mock_session(query_result(all=rows))
+
+    completed = await SchedulingRepositoryImpl(session).complete_overdue_confirmed(hours_threshold=24)
+
+    assert [c.id for c in completed] == [r.id for r in rows]
+    sql = compiled_sql(session, 0)
+    assert sql.startswith("UPDATE schedulings SET status=")
+    assert "completed_at=" in sql
+    assert "FROM schedulings AS previous" in sql
+    assert "schedulings.status = 'confirmed'" in sql
+    assert "RETURNING schedulings.id, schedulings.student_id, schedulings.instructor_id" in sql
+
+    # Resumo mensal: um executemany com as saídas agregadas por dia
+    summary_call = session.execute.await_args_list[1]
+    assert summary_call.args[0] is MONTH_SUMMARY_UPSERT_SQL
+    assert sorted((p["day"], p["delta"]) for p in summary_call.args[1]) == [(4, -2), (5, -1)]
+    assert session.execute.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_auto_complete_does_not_process_disputed(mock_session, query_result, compiled_sql):
+    """Aulas DISPUTED ficam fora do UPDATE: o WHERE exige status CONFIRMED."""
+    session = mock_session(query_result(all=[]))
+
+    await SchedulingRepositoryImpl(session).complete_overdue_confirmed()
+
+    sql = compiled_sql(session, 0)
+    where = sql.split(" WHERE ", 1)[1].split(" RETURNING ", 1)[0]
+    assert "schedulings.status = 'confirmed' AND schedulings.end_datetime <=" in where
+    assert " OR " not in where
+    assert "disputed" not in sql
+
+
+@pytest.mark.asyncio
+async def test_expired_cart_items_cancel_with_payment_rules_in_the_where(mock_session, query_result, compiled_sql):
+    session = mock_session(query_result(all=[]))
+
+    cancelled = await SchedulingRepositoryImpl(session).cancel_expired_cart_items(
+        reason="Carrinho expirado", student_id=uuid4()
+    )
+
+    assert cancelled == []
+    sql = compiled_sql(session, 0)
+    assert "cancelled_by=schedulings.student_id" in sql
+    assert "schedulings.status IN ('pending', 'confirmed')" in sql  # índice parcial ix_schedulings_cart_created
+    assert "NOT (EXISTS (SELECT payments.id" in sql
+    assert "schedulings.student_id = $" in sql
+    session.execute.assert_awaited_once()  # nada afetado, resumo intocado
+
+
+@pytest.mark.asyncio
+async def test_transition_from_hidden_status_does_not_touch_the_summary(mock_session, query_result):
+    row = _row(datetime(2030, 3, 4, 12, 0, tzinfo=timezone.utc), SchedulingStatus.COMPLETED)
+    session = mock_session(query_result(all=[row]))
+
+    await SchedulingRepositoryImpl(session).complete_overdue_confirmed()
+
+    session.execute.assert_awaited_once()
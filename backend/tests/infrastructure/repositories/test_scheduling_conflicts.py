@@ -0,0 +1,130 @@
+"""
+Testes para o término persistido (end_datetime) e a verificação de conflito
+pela exclusion constraint de agendamentos (SchedulingRepositoryImpl).
+"""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from src.domain.entities.scheduling import Scheduling
+from src.domain.exceptions import SchedulingConflictException
+from src.infrastructure.db.models.scheduling_model import SchedulingModel
+from src.infrastructure.repositories.scheduling_repository_impl import (
+    SchedulingRepositoryImpl,
+)
+
+START = datetime(2030, 3, 11, 12, 0, tzinfo=timezone.utc)
+
+
+def _scheduling() -> Scheduling:
+    return Scheduling(
+        student_id=uuid4(),
+        instructor_id=uuid4(),
+        scheduled_datetime=START,
+        duration_minutes=50,
+        price=Decimal("100.00"),
+    )
+
+
+def test_from_entity_persists_lesson_end():
+    model = SchedulingModel.from_entity(_scheduling())
+
+    assert model.end_datetime == START + timedelta(minutes=50)
+
+
+@pytest.mark.asyncio
+async def test_check_conflict_probes_the_exclusion_constraint_index(mock_session, query_result, compiled_sql):
+    session = mock_session(query_result(first=None))
+    repo = SchedulingRepositoryImpl(session)
+
+    assert await repo.check_conflict(uuid4(), START, 60, exclude_scheduling_id=uuid4()) is False
+
+    sql = compiled_sql(session)
+    assert "make_interval" not in sql
+    assert "schedulings.status != 'cancelled'" in sql
+    assert "tstzrange(schedulings.scheduled_datetime, schedulings.end_datetime, '[)') && tstzrange($" in sql
+    assert sql.endswith("LIMIT $5::INTEGER")
+
+
+@pytest.mark.asyncio
+async def test_overdue_confirmed_filters_on_persisted_end(mock_session, compiled_sql):
+    result = MagicMock()
+    result.unique.return_value.scalars.return_value.all.return_value = []
+    session = mock_session(result)
+    repo = SchedulingRepositoryImpl(session)
+
+    assert await repo.get_overdue_confirmed(hours_threshold=24) == []
+
+    sql = compiled_sql(session)
+    assert "schedulings.status = 'confirmed'" in sql
+    assert "schedulings.end_datetime <= $1" in sql
+    assert "make_interval" not in sql
+
+
+def _failing_flush_session(error: IntegrityError) -> MagicMock:
+    session = MagicMock()
+    session.flush = AsyncMock(side_effect=error)
+    session.begin_nested.return_value.__aexit__ = AsyncMock(return_value=False)
+    return session
+
+
+OVERLAP = IntegrityError(
+    "INSERT", {}, Exception('conflicting key value violates exclusion constraint "ex_schedulings_instructor_no_overlap"'),
+)
+
+
+@pytest.mark.asyncio
+async def test_create_translates_overlap_violation_into_conflict():
+    session = _failing_flush_session(OVERLAP)
+    repo = SchedulingRepositoryImpl(session)
+
+    with pytest.raises(SchedulingConflictException):
+        await repo.create(_scheduling())
+
+    # O INSERT acontece dentro do savepoint, que é desfeito sozinho
+    names = [name for name, _, _ in session.mock_calls]
+    assert names.index("begin_nested().__aenter__") < names.index("add") < names.index("flush")
+    assert names[-1] == "begin_nested().__aexit__"
+
+
+@pytest.mark.asyncio
+async def test_create_keeps_other_integrity_errors():
+    session = _failing_flush_session(IntegrityError(
+        "INSERT", {}, Exception('violates foreign key constraint "schedulings_student_id_fkey"'),
+    ))
+    repo = SchedulingRepositoryImpl(session)
+
+    with pytest.raises(IntegrityError):
+        await repo.create(_scheduling())
+
+
+@pytest.mark.asyncio
+async def test_update_changes_the_row_inside_a_savepoint(mock_session):
+    scheduling = _scheduling()
+    model = SchedulingModel.from_entity(scheduling)
+    result = MagicMock()
+    result.unique.return_value.scalar_one_or_none.return_value = model
+    session = mock_session(result)
+    session.flush = AsyncMock(side_effect=OVERLAP)
+    savepoint = MagicMock()
+    savepoint.__aexit__ = AsyncMock(return_value=False)
+    start_when_opened = []
+
+    def begin_nested():
+        start_when_opened.append(model.scheduled_datetime)
+        return savepoint
+
+    session.begin_nested.side_effect = begin_nested
+    scheduling.scheduled_datetime = START + timedelta(hours=1)
+
+    with pytest.raises(SchedulingConflictException):
+        await SchedulingRepositoryImpl(session).update(scheduling)
+
+    # begin_nested faz flush do que está pendente: as alterações vêm depois
+    assert start_when_opened == [START]
+    session.flush.assert_awaited_once()
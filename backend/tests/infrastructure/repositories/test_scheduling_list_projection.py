@@ -0,0 +1,67 @@
+"""
+Testes para as listagens de agendamentos por projeção
+(scheduling_list_stmt e scheduling_from_list_row).
+"""
+
+from datetime import date
+from uuid import uuid4
+
+import pytest
+
+from src.domain.entities.scheduling_status import SchedulingStatus
+from src.infrastructure.db.models.scheduling_model import SchedulingModel
+from src.infrastructure.repositories.scheduling_repository_impl import (
+    SchedulingRepositoryImpl,
+    scheduling_from_list_row,
+)
+
+
+def test_list_row_becomes_entity_with_display_fields(list_row):
+    row = list_row()
+
+    scheduling = scheduling_from_list_row(row)
+
+    assert scheduling.id == row._mapping[SchedulingModel.__table__.c.id]
+    assert scheduling.status == SchedulingStatus.CONFIRMED
+    assert (scheduling.student_name, scheduling.instructor_name) == ("Aluno", "Instrutor")
+    assert scheduling.instructor_rating == 4.5
+    assert scheduling.instructor_review_count == 12
+    assert scheduling.has_review is True
+    assert scheduling.payment_status == "completed"
+
+
+def test_list_row_without_profile_or_payment(list_row):
+    scheduling = scheduling_from_list_row(
+        list_row(instructor_rating=None, instructor_review_count=None, has_review=False, payment_status=None)
+    )
+
+    assert scheduling.instructor_rating is None
+    assert scheduling.payment_status is None
+    assert scheduling.has_review is False
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "call",
+    [
+        lambda repo: repo.list_by_student(uuid4(), payment_status_filter="pending"),
+        lambda repo: repo.list_by_instructor(uuid4(), status=[SchedulingStatus.CONFIRMED]),
+        lambda repo: repo.list_by_instructor_and_date(uuid4(), date(2030, 3, 11)),
+        lambda repo: repo.list_all(status=SchedulingStatus.PENDING),
+    ],
+)
+async def test_list_methods_select_only_displayed_columns(
+    call, mock_session, query_result, list_row, compiled_sql
+):
+    session = mock_session(query_result(all=[list_row()]))
+
+    schedulings = await call(SchedulingRepositoryImpl(session))
+
+    assert [s.student_name for s in schedulings] == ["Aluno"]
+    session.execute.assert_awaited_once()
+    sql = compiled_sql(session)
+    assert "instructor_profiles.rating AS instructor_rating" in sql
+    assert "payments.status AS payment_status" in sql
+    assert "EXISTS (SELECT reviews.id" in sql
+    for heavy in ("mp_access_token", "mp_refresh_token", "instructor_profiles.location", "reviews.comment"):
+        assert heavy not in sql
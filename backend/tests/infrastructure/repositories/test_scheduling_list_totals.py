@@ -0,0 +1,92 @@
+"""
+Testes para o total das listagens de agendamentos calculado na própria
+consulta (SchedulingRepositoryImpl.page_by_student, page_by_instructor e
+page_all).
+"""
+
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from src.domain.entities.scheduling_status import SchedulingStatus
+from src.domain.entities.search_position import ListPosition
+from src.infrastructure.repositories.scheduling_repository_impl import SchedulingRepositoryImpl
+
+START = datetime(2030, 3, 11, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def page_session(mock_session, query_result, list_row):
+    """Sessão cuja listagem devolve uma linha por total informado e cuja contagem devolve count."""
+
+    def build(*totals: int, count: int = 0):
+        return mock_session(
+            query_result(all=[list_row(total_count=total) for total in totals]),
+            query_result(scalar_one=count),
+        )
+
+    return build
+
+
+@pytest.mark.asyncio
+async def test_student_page_counts_in_the_same_statement(page_session, compiled_sql):
+    session = page_session(37, 37)
+
+    schedulings, total = await SchedulingRepositoryImpl(session).page_by_student(
+        uuid4(), limit=2, offset=10, payment_status_filter="pending"
+    )
+
+    assert (len(schedulings), total) == (2, 37)
+    session.execute.assert_awaited_once()
+    assert "count(*) OVER () AS total_count" in compiled_sql(session)
+
+
+@pytest.mark.asyncio
+async def test_cursor_page_adds_the_rows_before_the_position(page_session):
+    session = page_session(5)
+    after = ListPosition(at=START, id=uuid4(), ordinal=20)
+
+    _, total = await SchedulingRepositoryImpl(session).page_by_instructor(uuid4(), after=after)
+
+    assert total == 25
+    session.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_unfiltered_admin_page_uses_the_planner_estimate(page_session, compiled_sql):
+    session = page_session(120_000)
+    after = ListPosition(at=START, id=uuid4(), ordinal=40)
+
+    _, total = await SchedulingRepositoryImpl(session).page_all(after=after)
+
+    assert total == 120_000
+    sql = compiled_sql(session)
+    assert "reltuples" in sql
+    assert "OVER ()" not in sql
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("call", "totals"),
+    [
+        (lambda repo: repo.page_all(), [-1]),  # tabela nunca analisada
+        (lambda repo: repo.page_by_student(uuid4(), offset=500), []),  # offset além do fim
+        (lambda repo: repo.page_all(status=SchedulingStatus.PENDING, offset=500), []),
+    ],
+)
+async def test_total_falls_back_to_a_count_when_the_page_cannot_tell(call, totals, page_session):
+    session = page_session(*totals, count=7)
+
+    _, total = await call(SchedulingRepositoryImpl(session))
+
+    assert total == 7
+    assert session.execute.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_empty_first_page_needs_no_count(page_session):
+    session = page_session()
+
+    assert await SchedulingRepositoryImpl(session).page_by_instructor(uuid4()) == ([], 0)
+    session.execute.assert_awaited_once()
@@ -0,0 +1,117 @@
+"""
+Testes para o calendário mensal da agenda em uma consulta e o resumo mensal
+por instrutor (SchedulingRepositoryImpl.get_scheduling_dates_for_month).
+"""
+
+from datetime import date, datetime, timezone
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.domain.entities.scheduling_status import SchedulingStatus
+from src.infrastructure.repositories.scheduling_repository_impl import (
+    MONTH_SUMMARY_UPSERT_SQL,
+    SchedulingRepositoryImpl,
+    calendar_day,
+    month_bounds,
+)
+
+INSTRUCTOR_ID = uuid4()
+
+
+@pytest.mark.parametrize(
+    ("status", "scheduled", "expected"),
+    [
+        (SchedulingStatus.CONFIRMED, datetime(2030, 3, 1, 2, 30, tzinfo=timezone.utc), date(2030, 2, 28)),
+        (SchedulingStatus.PENDING, datetime(2030, 3, 1, 12, 0), date(2030, 3, 1)),  # naive = UTC
+        (SchedulingStatus.CANCELLED, datetime(2030, 3, 1, 12, 0, tzinfo=timezone.utc), None),
+        (SchedulingStatus.COMPLETED, datetime(2030, 3, 1, 12, 0, tzinfo=timezone.utc), None),
+    ],
+)
+def test_calendar_day_uses_brasilia_date_and_hides_closed_lessons(status, scheduled, expected):
+    assert calendar_day(status, scheduled) == expected
+
+
+def test_month_bounds_are_half_open_in_utc():
+    assert month_bounds(2030, 12) == (
+        datetime(2030, 12, 1, 3, 0, tzinfo=timezone.utc),
+        datetime(2031, 1, 1, 3, 0, tzinfo=timezone.utc),
+    )
+
+
+@pytest.mark.asyncio
+async def test_month_from_schedulings_is_a_single_round_trip(mock_session, query_result, compiled_sql):
+    session = mock_session(
+        query_result(one=MagicMock(dates=[date(2030, 3, 4), date(2030, 3, 9)], has_prev=False, has_next=True))
+    )
+    repo = SchedulingRepositoryImpl(session)
+
+    result = await repo.get_scheduling_dates_for_month(INSTRUCTOR_ID, 2030, 3)
+
+    assert result == {
+        "dates": ["2030-03-04", "2030-03-09"],
+        "year": 2030,
+        "month": 3,
+        "has_prev": False,
+        "has_next": True,
+    }
+    session.execute.assert_awaited_once()
+    sql = compiled_sql(session)
+    assert "array_agg(anon_1.day ORDER BY anon_1.day)" in sql
+    assert sql.count("EXISTS (SELECT schedulings.id") == 2
+    assert "count(" not in sql
+
+
+@pytest.mark.asyncio
+async def test_month_from_summary_reads_one_row_and_skips_days_past_month_end(
+    mock_session, query_result, compiled_sql
+):
+    counts = [0] * 31
+    counts[0], counts[13], counts[29] = 2, 1, 1  # dia 30 não existe em fevereiro
+    session = mock_session(query_result(one=MagicMock(day_counts=counts, has_prev=True, has_next=False)))
+    repo = SchedulingRepositoryImpl(session, use_month_summary=True)
+
+    result = await repo.get_scheduling_dates_for_month(INSTRUCTOR_ID, 2030, 2)
+
+    assert result["dates"] == ["2030-02-01", "2030-02-14"]
+    assert (result["has_prev"], result["has_next"]) == (True, False)
+    session.execute.assert_awaited_once()
+    sql = compiled_sql(session)
+    assert "FROM instructor_month_summaries" in sql
+    assert "schedulings" not in sql
+
+
+@pytest.mark.asyncio
+async def test_month_from_summary_without_row_has_no_dates(mock_session, query_result):
+    session = mock_session(query_result(one=MagicMock(day_counts=None, has_prev=False, has_next=False)))
+
+    result = await SchedulingRepositoryImpl(session, use_month_summary=True).get_scheduling_dates_for_month(
+        INSTRUCTOR_ID, 2030, 2
+    )
+
+    assert result["dates"] == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("old", "new", "expected"),
+    [
+        (None, date(2030, 3, 9), [("2030-03-01", 9, 1)]),  # criação
+        (date(2030, 3, 9), None, [("2030-03-01", 9, -1)]),  # cancelamento/conclusão
+        (date(2030, 3, 31), date(2030, 4, 2), [("2030-03-01", 31, -1), ("2030-04-01", 2, 1)]),  # remarcação
+        (date(2030, 3, 9), date(2030, 3, 9), []),  # mesmo dia
+        (None, None, []),
+    ],
+)
+async def test_move_calendar_day_applies_deltas_to_the_summary(old, new, expected, mock_session):
+    session = mock_session()
+    repo = SchedulingRepositoryImpl(session)
+
+    await repo._move_calendar_day(INSTRUCTOR_ID, old, new)
+
+    calls = session.execute.await_args_list
+    assert all(c.args[0] is MONTH_SUMMARY_UPSERT_SQL for c in calls)
+    assert [
+        (c.args[1]["month"].isoformat(), c.args[1]["day"], c.args[1]["delta"]) for c in calls
+    ] == expected
@@ -0,0 +1,151 @@
+"""
+Testes do índice espacial em memória de instrutores.
+"""
+
+import random
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.domain.entities.instructor_profile import InstructorProfile
+from src.domain.entities.location import Location
+from src.infrastructure.repositories.instructor_repository_impl import (
+    InstructorRepositoryImpl,
+)
+from src.infrastructure.services.instructor_spatial_index import InstructorSpatialIndex
+
+CENTER = Location(latitude=-23.5505, longitude=-46.6333)
+
+
+def _profile(location: Location | None, **overrides) -> InstructorProfile:
+    defaults = dict(
+        user_id=uuid4(),
+        location=location,
+        hourly_rate=Decimal("80.00"),
+        rating=4.0,
+        biological_sex="male",
+        license_category="B",
+        full_name="Instrutor",
+    )
+    defaults.update(overrides)
+    return InstructorProfile(**defaults)
+
+
+def _random_profiles(count: int, seed: int = 7) -> list[InstructorProfile]:
+    rng = random.Random(seed)
+    profiles = []
+    for _ in range(count):
+        location = None
+        if rng.random() > 0.05:
+            location = Location(
+                latitude=CENTER.latitude + rng.uniform(-0.4, 0.4),
+                longitude=CENTER.longitude + rng.uniform(-0.4, 0.4),
+            )
+        profiles.append(
+            _profile(
+                location,
+                rating=round(rng.uniform(0, 5), 2),
+                biological_sex=rng.choice(["male", "female"]),
+                license_category=rng.choice(["A", "B", "AB"]),
+                is_available=rng.random() > 0.1,
+            )
+        )
+    return profiles
+
+
+def _brute_force(profiles, center, radius_km, biological_sex=None, license_category=None, limit=50):
+    eligible = [
+        p for p in profiles
+        if p.is_available
+        and (not biological_sex or p.biological_sex == biological_sex)
+        and (not license_category or p.license_category == license_category)
+    ]
+    located = sorted(
+        (p for p in eligible if p.location and center.distance_to(p.location) <= radius_km),
+        key=lambda p: center.distance_to(p.location),
+    )
+    unlocated = sorted((p for p in eligible if not p.location), key=lambda p: -p.rating)
+    return [p.user_id for p in (located + unlocated)[:limit]]
+
+
+@pytest.mark.parametrize(
+    "radius_km,biological_sex,license_category,limit",
+    [(10.0, None, None, 50), (25.0, "female", None, 100), (5.0, None, "AB", 500), (1.0, "male", "B", 10)],
+)
+def test_search_matches_brute_force(radius_km, biological_sex, license_category, limit):
+    profiles = _random_profiles(2000)
+    index = InstructorSpatialIndex()
+    index.load(profiles)
+
+    result = index.search(CENTER, radius_km, biological_sex, license_category, limit)
+
+    assert [p.user_id for p in result] == _brute_force(
+        profiles, CENTER, radius_km, biological_sex, license_category, limit
+    )
+
+
+def test_incremental_updates_are_visible_before_rebuild():
+    index = InstructorSpatialIndex(rebuild_threshold=1000)
+    far = _profile(Location(latitude=-22.9, longitude=-43.17))
+    near = _profile(Location(latitude=-23.551, longitude=-46.634))
+    index.load([far, near])
+
+    # Instrutor se move para perto do centro
+    moved = _profile(Location(latitude=-23.5506, longitude=-46.6334), user_id=far.user_id)
+    index.upsert(moved)
+    # Novo instrutor e instrutor que ficou indisponível
+    newcomer = _profile(Location(latitude=-23.56, longitude=-46.64))
+    index.upsert(newcomer)
+    index.upsert(_profile(near.location, user_id=near.user_id, is_available=False))
+
+    result = index.search(CENTER, 10.0)
+
+    assert [p.user_id for p in result] == [far.user_id, newcomer.user_id]
+    assert len(index) == 2
+
+
+def test_rebuild_after_threshold_keeps_results():
+    profiles = _random_profiles(300, seed=11)
+    index = InstructorSpatialIndex(rebuild_threshold=16)
+    index.load(profiles[:100])
+    for profile in profiles[100:]:
+        index.upsert(profile)
+    for profile in profiles[:20]:
+        index.remove(profile.user_id)
+
+    remaining = profiles[20:]
+    assert [p.user_id for p in index.search(CENTER, 15.0, limit=80)] == _brute_force(
+        remaining, CENTER, 15.0, limit=80
+    )
+
+
+@pytest.mark.asyncio
+async def test_repository_uses_index_when_ready():
+    index = InstructorSpatialIndex()
+    profile = _profile(Location(latitude=-23.551, longitude=-46.634), biological_sex="female")
+    index.load([profile])
+    session = MagicMock()
+    session.execute = AsyncMock()
+    repo = InstructorRepositoryImpl(session, spatial_index=index)
+
+    result = await repo.search_by_location(CENTER, radius_km=5.0, biological_sex="Feminino")
+
+    assert [p.user_id for p in result] == [profile.user_id]
+    session.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_repository_falls_back_to_sql_for_text_search():
+    index = InstructorSpatialIndex()
+    index.load([_profile(Location(latitude=-23.551, longitude=-46.634))])
+    session = MagicMock()
+    result = MagicMock()
+    result.all.return_value = []
+    session.execute = AsyncMock(return_value=result)
+    repo = InstructorRepositoryImpl(session, spatial_index=index)
+
+    await repo.search_by_location(CENTER, radius_km=5.0, search_query="joão")
+
+    session.execute.assert_awaited()
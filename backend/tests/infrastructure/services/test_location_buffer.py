@@ -0,0 +1,262 @@
+"""
+Testes para o buffer de escrita de localização (RedisLocationWriteBuffer),
+o flusher em lote (LocationBufferFlusher) e o modo buffer do
+UpdateInstructorLocationUseCase.
+"""
+
+import json
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects.postgresql.asyncpg import PGDialect_asyncpg
+
+from src.application.dtos.profile_dtos import UpdateLocationDTO
+from src.application.use_cases.instructor.update_instructor_location import (
+    UpdateInstructorLocationUseCase,
+)
+from src.domain.entities.location import Location
+from src.infrastructure.external.redis_location_buffer import (
+    BUFFER_KEY,
+    FLUSHING_KEY,
+    RedisLocationWriteBuffer,
+)
+from src.infrastructure.repositories.instructor_repository_impl import (
+    InstructorRepositoryImpl,
+)
+from src.infrastructure.services.location_buffer_flusher import LocationBufferFlusher
+
+CENTER = Location(latitude=-23.55, longitude=-46.63)
+
+
+def _buffer(client: MagicMock) -> RedisLocationWriteBuffer:
+    buffer = RedisLocationWriteBuffer(redis_url="redis://test", max_staleness_seconds=30)
+    buffer._client = client
+    return buffer
+
+
+def _session_factory() -> MagicMock:
+    @asynccontextmanager
+    async def begin():
+        yield
+
+    session = MagicMock()
+    session.begin = begin
+
+    @asynccontextmanager
+    async def factory():
+        yield session
+
+    return factory
+
+
+@pytest.mark.asyncio
+async def test_enqueue_reports_whether_the_flusher_is_alive():
+    client = MagicMock()
+    client.eval = AsyncMock(side_effect=[1, 0])
+    buffer = _buffer(client)
+    user_id = uuid4()
+
+    assert await buffer.enqueue(user_id, CENTER, "São Paulo") is True
+    assert await buffer.enqueue(user_id, CENTER) is False
+
+    args = client.eval.await_args_list[0].args
+    assert args[2] == BUFFER_KEY
+    assert args[5] == str(user_id)
+    payload = json.loads(args[6])
+    assert (payload["lat"], payload["lon"], payload["city"]) == (-23.55, -46.63, "São Paulo")
+    assert args[8] == 30
+
+
+@pytest.mark.asyncio
+async def test_drain_parses_entries_and_discards_invalid_ones():
+    user_id = uuid4()
+    client = MagicMock()
+    client.eval = AsyncMock(return_value=[
+        str(user_id), json.dumps({"lat": -23.55, "lon": -46.63, "city": None, "ts": 100.0}),
+        "not-a-uuid", json.dumps({"lat": 0, "lon": 0, "ts": 1}),
+        str(uuid4()), json.dumps({"lat": 200, "lon": 0, "ts": 1}),
+    ])
+    client.hdel = AsyncMock()
+    buffer = _buffer(client)
+
+    pending = await buffer.drain()
+
+    assert pending == {user_id: (CENTER, None, 100.0)}
+    assert client.hdel.await_args.args[0] == FLUSHING_KEY
+    assert len(client.hdel.await_args.args) == 3
+
+
+@pytest.mark.asyncio
+async def test_metrics_combine_counters_and_pending_entries():
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[
+        {"accepted": "10", "coalesced": "7", "flushes": "2", "last_flush_ms": "3.5"},
+        2,
+        1,
+        None,
+    ])
+    client = MagicMock()
+    client.pipeline.return_value.__aenter__ = AsyncMock(return_value=pipe)
+    client.pipeline.return_value.__aexit__ = AsyncMock(return_value=False)
+    buffer = _buffer(client)
+
+    metrics = await buffer.metrics()
+
+    assert metrics["accepted"] == 10
+    assert metrics["coalesced"] == 7
+    assert metrics["flush_errors"] == 0
+    assert metrics["pending"] == 3
+    assert metrics["last_flush_ms"] == 3.5
+    assert metrics["last_flush_at"] is None
+    assert metrics["heartbeat_age_seconds"] is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("search_projection_sync")
+async def test_bulk_update_locations_updates_profiles_and_projection():
+    session = MagicMock()
+    user_id = uuid4()
+    result = MagicMock()
+    result.all.return_value = [SimpleNamespace(user_id=user_id, previous_lat=-23.5, previous_lon=-46.6)]
+    session.execute = AsyncMock(side_effect=[result, None])
+    session.flush = AsyncMock()
+    repo = InstructorRepositoryImpl(session)
+
+    updated = await repo.bulk_update_locations([(user_id, CENTER, None), (uuid4(), CENTER, "X")])
+
+    assert updated == {user_id: Location(latitude=-23.5, longitude=-46.6)}
+    assert session.execute.await_count == 2
+    profile_sql = str(session.execute.await_args_list[0].args[0].compile(dialect=PGDialect_asyncpg()))
+    assert profile_sql.startswith("UPDATE instructor_profiles SET location=ST_SetSRID(ST_MakePoint(pings.lon, pings.lat)")
+    assert "city=coalesce(pings.city, instructor_profiles.city)" in profile_sql
+    assert "FROM (VALUES ($2::UUID, $3::FLOAT, $4::FLOAT, NULL), ($5::UUID, $6::FLOAT, $7::FLOAT, $8::VARCHAR))" in profile_sql
+    assert "AS pings (user_id, lon, lat, city), instructor_profiles AS previous" in profile_sql
+    assert profile_sql.endswith(
+        "RETURNING instructor_profiles.user_id, ST_Y(previous.location) AS previous_lat, "
+        "ST_X(previous.location) AS previous_lon"
+    )
+    projection_sql = str(session.execute.await_args_list[1].args[0].compile(dialect=PGDialect_asyncpg()))
+    assert projection_sql.startswith("UPDATE instructor_search_index SET")
+    assert "location=geography(ST_SetSRID(ST_MakePoint(pings.lon, pings.lat)" in projection_sql
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_locations_with_empty_batch_is_a_noop():
+    session = MagicMock()
+    session.execute = AsyncMock()
+    repo = InstructorRepositoryImpl(session)
+
+    assert await repo.bulk_update_locations([]) == {}
+    session.execute.assert_not_awaited()
+
+
+def _flusher_buffer(pending: dict) -> MagicMock:
+    buffer = MagicMock(spec=RedisLocationWriteBuffer)
+    buffer.max_staleness_seconds = 30
+    buffer.acquire_flush_lock = AsyncMock(return_value=True)
+    buffer.drain = AsyncMock(return_value=pending)
+    for name in ("heartbeat", "release_flush_lock", "ack", "record_flush", "record_flush_error"):
+        setattr(buffer, name, AsyncMock())
+    return buffer
+
+
+@pytest.mark.asyncio
+async def test_flush_writes_batches_acks_and_propagates():
+    existing, missing, other = uuid4(), uuid4(), uuid4()
+    buffer = _flusher_buffer({
+        existing: (CENTER, "São Paulo", 1.0),
+        missing: (CENTER, None, 1.0),
+        other: (CENTER, None, 1.0),
+    })
+    pubsub = MagicMock()
+    pubsub.publish = AsyncMock()
+    flusher = LocationBufferFlusher(
+        buffer=buffer,
+        session_factory=_session_factory(),
+        pubsub=pubsub,
+        flush_interval_seconds=5,
+        batch_size=2,
+    )
+
+    with patch(
+        "src.infrastructure.services.location_buffer_flusher.InstructorRepositoryImpl"
+    ) as repo_cls:
+        repo_cls.return_value.bulk_update_locations = AsyncMock(side_effect=[{existing: None}, {other: CENTER}])
+        written = await flusher.flush()
+
+    assert written == 2
+    batches = [call.args[0] for call in repo_cls.return_value.bulk_update_locations.await_args_list]
+    assert [len(batch) for batch in batches] == [2, 1]
+    acked = [user_id for call in buffer.ack.await_args_list for user_id in call.args[0]]
+    assert sorted(map(str, acked)) == sorted(map(str, (existing, missing, other)))
+    assert pubsub.publish.await_count == 2
+    buffer.heartbeat.assert_awaited_once()
+    assert buffer.record_flush.await_args.kwargs["rows"] == 2
+    buffer.release_flush_lock.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_flush_keeps_entries_when_the_batch_fails():
+    buffer = _flusher_buffer({uuid4(): (CENTER, None, 1.0)})
+    flusher = LocationBufferFlusher(buffer=buffer, session_factory=_session_factory())
+
+    with patch(
+        "src.infrastructure.services.location_buffer_flusher.InstructorRepositoryImpl"
+    ) as repo_cls:
+        repo_cls.return_value.bulk_update_locations = AsyncMock(side_effect=RuntimeError("db"))
+        with pytest.raises(RuntimeError):
+            await flusher.flush()
+
+    buffer.ack.assert_not_awaited()
+    buffer.heartbeat.assert_not_awaited()
+    buffer.record_flush_error.assert_awaited_once()
+    buffer.release_flush_lock.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_flush_skips_when_another_instance_holds_the_lock():
+    buffer = _flusher_buffer({})
+    buffer.acquire_flush_lock = AsyncMock(return_value=False)
+    flusher = LocationBufferFlusher(buffer=buffer, session_factory=_session_factory())
+
+    assert await flusher.flush() == 0
+    buffer.drain.assert_not_awaited()
+
+
+def test_flush_interval_must_be_below_max_staleness():
+    buffer = _flusher_buffer({})
+
+    with pytest.raises(ValueError):
+        LocationBufferFlusher(buffer=buffer, session_factory=_session_factory(), flush_interval_seconds=30)
+
+
+@pytest.mark.asyncio
+async def test_use_case_enqueues_instead_of_writing():
+    repo = MagicMock()
+    repo.update_location = AsyncMock(return_value=(True, None))
+    buffer = MagicMock()
+    buffer.enqueue = AsyncMock(return_value=True)
+    use_case = UpdateInstructorLocationUseCase(instructor_repository=repo, location_buffer=buffer)
+    dto = UpdateLocationDTO(user_id=uuid4(), latitude=-23.55, longitude=-46.63)
+
+    assert await use_case.execute(dto) is None
+    repo.update_location.assert_not_awaited()
+    assert buffer.enqueue.await_args.kwargs["location"] == CENTER
+
+
+@pytest.mark.asyncio
+async def test_use_case_writes_directly_when_buffer_refuses():
+    repo = MagicMock()
+    repo.update_location = AsyncMock(return_value=(True, None))
+    buffer = MagicMock()
+    buffer.enqueue = AsyncMock(return_value=False)
+    use_case = UpdateInstructorLocationUseCase(instructor_repository=repo, location_buffer=buffer)
+    dto = UpdateLocationDTO(user_id=uuid4(), latitude=-23.55, longitude=-46.63)
+
+    invalidation = await use_case.execute(dto)
+
+    repo.update_location.assert_awaited_once()
+    assert (invalidation.user_id, invalidation.location) == (dto.user_id, CENTER)
@@ -2,6 +2,8 @@
 import pytest
 from decimal import Decimal
 from unittest.mock import patch, MagicMock
+from uuid import uuid4
+from src.domain.entities.instructor_profile import InstructorProfile
 from src.infrastructure.services.pricing_service import PricingService
 from src.infrastructure.config import settings
 
@@ -100,3 +102,37 @@ class TestPricingService:
         assert PricingService.calculate_final_price(Decimal("0")) == Decimal("0.00")
         assert PricingService.calculate_final_price(Decimal("-10")) == Decimal("0.00")
 
+
+    def test_apply_final_prices_stores_prices_and_fee_signature(self, mock_settings):
+        profile = InstructorProfile(
+            user_id=uuid4(),
+            hourly_rate=Decimal("100.00"),
+            price_cat_b_instructor_vehicle=Decimal("65.00"),
+        )
+
+        PricingService.apply_final_prices(profile)
+
+        assert profile.final_hourly_rate == Decimal("129.90")
+        assert profile.final_price_cat_b_instructor_vehicle == Decimal("85.00")
+        assert profile.final_price_cat_a_student_vehicle is None
+        assert profile.final_prices_signature == "20:4.98"
+
+    def test_final_prices_read_stored_values_without_recalculating(self, mock_settings):
+        profile = InstructorProfile(user_id=uuid4(), hourly_rate=Decimal("100.00"))
+        PricingService.apply_final_prices(profile)
+
+        with patch.object(PricingService, "calculate_final_price") as calculate:
+            prices = PricingService.final_prices(profile)
+
+        calculate.assert_not_called()
+        assert prices["hourly_rate"] == Decimal("129.90")
+        assert prices["price_cat_b_student_vehicle"] is None
+
+    def test_final_prices_recalculate_after_fee_change(self, mock_settings):
+        profile = InstructorProfile(user_id=uuid4(), hourly_rate=Decimal("100.00"))
+        PricingService.apply_final_prices(profile)
+
+        mock_settings.platform_fee_percentage = 10.0
+
+        # 100 * 1.1 / 0.9502 = 115.76 -> 120.00 -> 119.90
+        assert PricingService.final_prices(profile)["hourly_rate"] == Decimal("119.90")
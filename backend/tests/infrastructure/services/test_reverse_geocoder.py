@@ -0,0 +1,101 @@
+"""
+Testes para a geocodificação reversa offline (OfflineReverseGeocoder) e o
+fallback do LocationServiceImpl.
+"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import shapely
+
+from src.domain.entities.location import Location
+from src.infrastructure.services.location_service_impl import LocationServiceImpl
+from src.infrastructure.services.reverse_geocoder import OfflineReverseGeocoder
+
+# Dois "municípios" quadrados lado a lado (lon -47..-46 e -46..-45)
+WEST = shapely.box(-47.0, -24.0, -46.0, -23.0)
+EAST = shapely.box(-46.0, -24.0, -45.0, -23.0)
+
+
+def _geocoder(**kwargs) -> OfflineReverseGeocoder:
+    geocoder = OfflineReverseGeocoder(**kwargs)
+    geocoder.load([WEST, EAST], ["Oeste", "Leste"])
+    return geocoder
+
+
+def test_city_at_resolves_point_in_polygon():
+    geocoder = _geocoder()
+
+    assert geocoder.city_at(Location(latitude=-23.5, longitude=-46.5)) == "Oeste"
+    assert geocoder.city_at(Location(latitude=-23.5, longitude=-45.5)) == "Leste"
+    assert geocoder.city_at(Location(latitude=-10.0, longitude=-46.5)) is None
+
+
+def test_point_on_border_is_deterministic():
+    geocoder = _geocoder()
+
+    assert geocoder.city_at(Location(latitude=-23.5, longitude=-46.0)) == "Oeste"
+
+
+def test_not_ready_before_load():
+    geocoder = OfflineReverseGeocoder()
+
+    assert not geocoder.is_ready
+    assert geocoder.city_at(Location(latitude=-23.5, longitude=-46.5)) is None
+
+
+def test_lru_cache_is_keyed_by_rounded_coordinates():
+    geocoder = _geocoder(cache_size=2, precision=2)
+    geocoder._resolve = MagicMock(wraps=geocoder._resolve)
+
+    geocoder.city_at(Location(latitude=-23.501, longitude=-46.501))
+    geocoder.city_at(Location(latitude=-23.502, longitude=-46.499))
+    assert geocoder._resolve.call_count == 1
+
+    # Duas novas chaves expulsam a mais antiga
+    geocoder.city_at(Location(latitude=-23.6, longitude=-46.6))
+    geocoder.city_at(Location(latitude=-23.7, longitude=-46.7))
+    geocoder.city_at(Location(latitude=-23.5, longitude=-46.5))
+    assert geocoder._resolve.call_count == 4
+
+
+def test_load_geojson(tmp_path):
+    path = tmp_path / "municipalities.geojson"
+    path.write_text(json.dumps({
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "properties": {"name": "São Paulo", "code": "3550308"},
+                "geometry": json.loads(shapely.to_geojson(WEST)),
+            },
+            {"type": "Feature", "properties": {}, "geometry": None},
+        ],
+    }), encoding="utf-8")
+    geocoder = OfflineReverseGeocoder()
+
+    geocoder.load_geojson(path)
+
+    assert len(geocoder) == 1
+    assert geocoder.city_at(Location(latitude=-23.5, longitude=-46.5)) == "São Paulo"
+
+
+@pytest.mark.asyncio
+async def test_location_service_skips_nominatim_when_resolved_offline():
+    nominatim = MagicMock()
+    nominatim.get_city_name = AsyncMock(return_value="Remoto")
+    service = LocationServiceImpl(MagicMock(), reverse_geocoder=_geocoder(), nominatim=nominatim)
+
+    assert await service.get_city_name(Location(latitude=-23.5, longitude=-46.5)) == "Oeste"
+    nominatim.get_city_name.assert_not_awaited()
+
+    assert await service.get_city_name(Location(latitude=-10.0, longitude=-46.5)) == "Remoto"
+    nominatim.get_city_name.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_location_service_without_fallback_returns_none_on_miss():
+    service = LocationServiceImpl(MagicMock(), reverse_geocoder=_geocoder())
+
+    assert await service.get_city_name(Location(latitude=-10.0, longitude=-46.5)) is None
@@ -0,0 +1,210 @@
+"""
+Testes para o cache da semana de disponibilidade (WeeklyAvailabilityCache)
+e o uso dele pelo AvailabilityRepositoryImpl.
+"""
+
+from datetime import datetime, time, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects.postgresql.asyncpg import PGDialect_asyncpg
+
+from src.core.helpers.timezone_utils import DEFAULT_TIMEZONE
+from src.domain.entities.availability import Availability
+from src.infrastructure.db.models.availability_model import AvailabilityModel
+from src.infrastructure.repositories.availability_repository_impl import (
+    AvailabilityRepositoryImpl,
+)
+from src.infrastructure.services.weekly_availability_cache import (
+    WeeklyAvailability,
+    WeeklyAvailabilityCache,
+    week_key,
+)
+
+INSTRUCTOR_ID = uuid4()
+MONDAY = datetime(2030, 3, 4).date()
+
+
+class FakeCache:
+    """Cache em memória com a mesma interface do RedisCacheService."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, str] = {}
+        self.reads = 0
+
+    async def get(self, key: str) -> str | None:
+        self.reads += 1
+        return self.data.get(key)
+
+    async def set(self, key: str, value: str, ttl_seconds: int = 60) -> None:
+        self.data[key] = value
+
+
+SLOTS = [
+    Availability(INSTRUCTOR_ID, 0, time(14, 0), time(18, 0)),
+    Availability(INSTRUCTOR_ID, 0, time(8, 0), time(12, 0)),
+    Availability(INSTRUCTOR_ID, 2, time(8, 30), time(9, 45, 30)),
+    Availability(INSTRUCTOR_ID, 3, time(8, 0), time(12, 0), is_active=False),
+]
+
+
+def _week(version: int = 1) -> WeeklyAvailability:
+    return WeeklyAvailability.from_availabilities(INSTRUCTOR_ID, version, SLOTS)
+
+
+def _local(day, hour, minute=0) -> datetime:
+    return datetime.combine(day, time(hour, minute), tzinfo=DEFAULT_TIMEZONE)
+
+
+# ---------------------------------------------------------------------------
+# WeeklyAvailability
+# ---------------------------------------------------------------------------
+
+
+def test_week_keeps_active_slots_sorted_by_day_and_start():
+    week = _week()
+
+    assert [(a.day_of_week, a.start_time) for a in week.all()] == [
+        (0, time(8, 0)), (0, time(14, 0)), (2, time(8, 30)),
+    ]
+    assert [a.end_time for a in week.for_day(2)] == [time(9, 45, 30)]
+    assert week.for_day(3) == []
+    assert all(a.instructor_id == INSTRUCTOR_ID and a.is_active for a in week.all())
+
+
+def test_week_survives_json_round_trip():
+    week = _week(7)
+
+    assert WeeklyAvailability.from_json(INSTRUCTOR_ID, 7, week.to_json()) == week
+
+
+@pytest.mark.parametrize(
+    ("start", "minutes", "expected"),
+    [
+        (_local(MONDAY, 8), 50, True),
+        (_local(MONDAY, 11, 10), 50, True),
+        (_local(MONDAY, 11, 30), 50, False),  # passa do fim do slot
+        (_local(MONDAY, 12, 30), 50, False),  # entre slots
+        (_local(MONDAY + timedelta(days=2), 8, 30), 75, True),
+        (_local(MONDAY + timedelta(days=3), 8), 50, False),  # slot inativo
+        (_local(MONDAY, 23, 30), 50, False),  # cruza a meia-noite
+        (_local(MONDAY, 8).astimezone(timezone.utc), 50, True),
+        (_local(MONDAY, 8).astimezone(timezone.utc).replace(tzinfo=None), 50, True),  # naive = UTC
+    ],
+)
+def test_covers_matches_repository_rule(start, minutes, expected):
+    assert _week().covers(start, minutes) is expected
+
+
+# ---------------------------------------------------------------------------
+# WeeklyAvailabilityCache
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_local_lru_answers_without_redis_and_redis_fills_other_processes():
+    redis = FakeCache()
+    cache = WeeklyAvailabilityCache(redis)
+    await cache.put(_week(3))
+
+    assert await cache.get(INSTRUCTOR_ID, 3) == _week(3)
+    assert redis.reads == 0
+
+    other_process = WeeklyAvailabilityCache(redis)
+    assert await other_process.get(INSTRUCTOR_ID, 3) == _week(3)
+    assert await other_process.get(INSTRUCTOR_ID, 3) == _week(3)
+    assert redis.reads == 1
+
+
+@pytest.mark.asyncio
+async def test_new_version_misses_and_replaces_local_entry():
+    redis = FakeCache()
+    cache = WeeklyAvailabilityCache(redis)
+    await cache.put(_week(3))
+
+    assert await cache.get(INSTRUCTOR_ID, 4) is None
+    await cache.put(_week(4))
+    await cache.put(_week(3))  # leitura atrasada não volta a versão
+
+    assert cache._local[INSTRUCTOR_ID].version == 4
+    assert set(redis.data) == {week_key(INSTRUCTOR_ID, 3), week_key(INSTRUCTOR_ID, 4)}
+
+
+@pytest.mark.asyncio
+async def test_lru_is_bounded_and_redis_errors_fall_back():
+    redis = MagicMock()
+    redis.get = AsyncMock(side_effect=ConnectionError("down"))
+    redis.set = AsyncMock(side_effect=ConnectionError("down"))
+    cache = WeeklyAvailabilityCache(redis, local_size=2)
+
+    for _ in range(3):
+        await cache.put(WeeklyAvailability(uuid4(), 1, ()))
+
+    assert len(cache._local) == 2
+    assert await cache.get(uuid4(), 1) is None
+
+
+# ---------------------------------------------------------------------------
+# AvailabilityRepositoryImpl
+# ---------------------------------------------------------------------------
+
+
+def _result(scalar=None, rows=()) -> MagicMock:
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = scalar
+    result.scalars.return_value.all.return_value = list(rows)
+    return result
+
+
+def _sql(stmt) -> str:
+    return str(stmt.compile(dialect=PGDialect_asyncpg()))
+
+
+@pytest.mark.asyncio
+async def test_repository_reads_slots_once_per_version():
+    rows = [AvailabilityModel.from_entity(a) for a in _week(5).all()]
+    session = MagicMock()
+    session.execute = AsyncMock(side_effect=[
+        _result(scalar=5), _result(rows=rows),  # 1ª leitura: versão + slots
+        _result(scalar=5),                      # 2ª leitura: só a versão
+    ])
+    repo = AvailabilityRepositoryImpl(session, week_cache=WeeklyAvailabilityCache(FakeCache()))
+
+    assert await repo.is_time_available(INSTRUCTOR_ID, _local(MONDAY, 9), 50) is True
+    day_slots = await repo.get_by_instructor_and_day(INSTRUCTOR_ID, 0)
+
+    assert [a.start_time for a in day_slots] == [time(8, 0), time(14, 0)]
+    statements = [_sql(c.args[0]) for c in session.execute.await_args_list]
+    assert "availability_version" in statements[0]
+    assert "instructor_availability" in statements[1]
+    assert "instructor_availability" not in statements[2]
+
+
+@pytest.mark.asyncio
+async def test_repository_without_profile_or_cache_reads_slots():
+    session = MagicMock()
+    session.execute = AsyncMock(side_effect=[_result(scalar=None), _result(rows=[])])
+    repo = AvailabilityRepositoryImpl(session, week_cache=WeeklyAvailabilityCache(FakeCache()))
+
+    assert await repo.list_by_instructor(INSTRUCTOR_ID) == []
+    assert "instructor_availability" in _sql(session.execute.await_args_list[1].args[0])
+
+
+@pytest.mark.asyncio
+async def test_writes_bump_the_instructor_version():
+    availability = Availability(INSTRUCTOR_ID, 0, time(8, 0), time(12, 0))
+    session = MagicMock()
+    session.add = MagicMock()
+    session.flush = AsyncMock()
+    session.refresh = AsyncMock()
+    session.execute = AsyncMock()
+    repo = AvailabilityRepositoryImpl(session)
+
+    await repo.create(availability)
+
+    bump = session.execute.await_args.args[0]
+    sql = _sql(bump)
+    assert sql.startswith("UPDATE instructor_profiles SET availability_version=")
+    assert "instructor_profiles.availability_version + " in sql
+    assert bump.compile().params["user_id_1"] == INSTRUCTOR_ID